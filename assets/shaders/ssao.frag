@@ -13,7 +13,9 @@ uniform sampler2D texNoise;   // Random rotation vectors
 
 // SSAO parameters
 uniform vec3 samples[64];     // Sample kernel
-uniform int kernelSize;
+uniform int kernelSize;       // Active samples per frame (<= 64)
+uniform int sampleOffset;     // Rotates through the kernel across frames (temporal mode)
+uniform vec2 noiseOffset;     // Per-frame jitter of the rotation noise (temporal mode)
 uniform float radius;
 uniform float bias;
 uniform mat4 projection;
@@ -25,7 +27,7 @@ void main() {
     vec3 normal = normalize(texture(gNormal, texCoord).xyz);
 
     // Get random rotation vector from noise texture
-    vec3 randomVec = normalize(texture(texNoise, texCoord * noiseScale).xyz);
+    vec3 randomVec = normalize(texture(texNoise, texCoord * noiseScale + noiseOffset).xyz);
 
     // Create TBN matrix to transform samples from tangent to view space
     // Gramm-Schmidt process to create orthonormal basis
@@ -37,7 +39,7 @@ void main() {
     float occlusion = 0.0;
     for(int i = 0; i < kernelSize; ++i) {
         // Transform sample from tangent to view space
-        vec3 samplePos = TBN * samples[i];
+        vec3 samplePos = TBN * samples[(i + sampleOffset) % 64];
         samplePos = fragPos + samplePos * radius;
 
         // Project sample position to screen space
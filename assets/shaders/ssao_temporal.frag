@@ -0,0 +1,53 @@
+#version 410
+
+// SSAO Temporal Accumulation Fragment Shader
+// Reprojects last frame's occlusion into the current frame and blends it with
+// the new (low sample count) result. History is rejected when the reprojected
+// texel falls off-screen or its stored depth disagrees with the expected one.
+
+in vec2 texCoord;
+out vec2 fragHistory;  // R = accumulated occlusion, G = linear view depth
+
+uniform sampler2D currentAO;   // This frame's blurred occlusion
+uniform sampler2D historyAO;   // Previous frame's accumulated occlusion (RG)
+uniform sampler2D gPosition;   // View-space position
+
+uniform mat4 inverseView;      // Current view -> world
+uniform mat4 prevView;         // World -> previous view
+uniform mat4 projection;
+uniform float blendFactor;     // Weight of the current frame (0-1)
+uniform float depthTolerance;  // Relative depth difference that rejects history
+uniform bool historyValid;
+
+void main() {
+    vec3 viewPos = texture(gPosition, texCoord).xyz;
+    float current = texture(currentAO, texCoord).r;
+    float depth = -viewPos.z;
+
+    fragHistory = vec2(current, depth);
+    if (!historyValid || depth <= 0.0) {
+        return;
+    }
+
+    // Reproject into the previous frame
+    vec4 worldPos = inverseView * vec4(viewPos, 1.0);
+    vec4 prevViewPos = prevView * worldPos;
+    vec4 prevClip = projection * prevViewPos;
+    if (prevClip.w <= 0.0) {
+        return;
+    }
+
+    vec2 prevUV = prevClip.xy / prevClip.w * 0.5 + 0.5;
+    if (any(lessThan(prevUV, vec2(0.0))) || any(greaterThan(prevUV, vec2(1.0)))) {
+        return;
+    }
+
+    vec2 history = texture(historyAO, prevUV).rg;
+    float expectedDepth = -prevViewPos.z;
+    float relativeDiff = abs(history.g - expectedDepth) / max(expectedDepth, 1e-3);
+    if (relativeDiff > depthTolerance) {
+        return;
+    }
+
+    fragHistory = vec2(mix(history.r, current, blendFactor), depth);
+}
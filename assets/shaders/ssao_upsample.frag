@@ -0,0 +1,48 @@
+#version 410
+
+// SSAO Bilateral Upsample Fragment Shader
+// Reconstructs full-resolution occlusion from a reduced-resolution SSAO
+// buffer. Each of the four surrounding low-res texels is weighted by its
+// bilinear footprint and by how closely its depth matches this fragment,
+// so occlusion does not bleed across silhouette edges.
+
+in vec2 texCoord;
+out float fragOcclusion;
+
+uniform sampler2D ssaoInput;   // Low-resolution occlusion
+uniform sampler2D gPosition;   // Full-resolution view-space position
+uniform float depthSharpness;  // Higher = stricter depth matching
+
+void main() {
+    vec2 lowSize = vec2(textureSize(ssaoInput, 0));
+    vec2 halfTexel = 0.5 / lowSize;
+    float centerDepth = texture(gPosition, texCoord).z;
+
+    // Top-left texel of the 2x2 low-res block surrounding this fragment
+    vec2 lowCoord = texCoord * lowSize - 0.5;
+    vec2 base = floor(lowCoord);
+    vec2 f = lowCoord - base;
+
+    float result = 0.0;
+    float totalWeight = 0.0;
+    for (int y = 0; y < 2; ++y) {
+        for (int x = 0; x < 2; ++x) {
+            vec2 sampleUV = (base + vec2(float(x), float(y)) + 0.5) / lowSize;
+            sampleUV = clamp(sampleUV, halfTexel, 1.0 - halfTexel);
+
+            float bilinear = (x == 0 ? 1.0 - f.x : f.x) * (y == 0 ? 1.0 - f.y : f.y);
+
+            // The SSAO pass sampled gPosition at this same UV, so the full-res
+            // G-buffer gives us the depth the low-res texel was computed at.
+            float sampleDepth = texture(gPosition, sampleUV).z;
+            float relativeDiff = abs(centerDepth - sampleDepth) / max(abs(centerDepth), 1e-3);
+            float depthWeight = exp(-relativeDiff * depthSharpness);
+
+            float w = bilinear * depthWeight + 1e-5;
+            result += texture(ssaoInput, sampleUV).r * w;
+            totalWeight += w;
+        }
+    }
+
+    fragOcclusion = result / totalWeight;
+}
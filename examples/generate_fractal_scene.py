@@ -21,7 +21,7 @@ from src.gamelib.fractal_perlin import generate_noise_grid, save_heightmap, expo
 
 def make_scene_json(scene_path: str, heightmap_relpath: str, metadata: dict):
     # Create the terrain object entry
-    # Note: collision_mesh is auto-generated from heightmap by physics system
+    # Note: the heightfield collider reads the heights straight from the heightmap
     terrain_object = {
         'name': 'Fractal Terrain',
         'type': 'primitive',
@@ -31,7 +31,7 @@ def make_scene_json(scene_path: str, heightmap_relpath: str, metadata: dict):
         'heightmap': heightmap_relpath,
         'physics': {
             'type': 'static',
-            'shape': 'mesh',
+            'shape': 'heightfield',
             'friction': 0.6,
             'restitution': 0.1
         }
@@ -54,7 +54,8 @@ from src.gamelib.config.settings import (
 )
 
 # Physics
-from src.gamelib.physics import PhysicsWorld
+from src.gamelib.physics import PhysicsWorld, PhysicsWorldSettings
+from src.gamelib.config.settings import PHYSICS_THREADED
 
 # Debug overlay
 from src.gamelib.debug import DebugOverlay
@@ -116,7 +117,7 @@ class Game(mglw.WindowConfig):
 
         # Setup physics world (PyBullet)
         try:
-            self.physics_world = PhysicsWorld()
+            self.physics_world = PhysicsWorld(PhysicsWorldSettings(threaded=PHYSICS_THREADED))
         except RuntimeError as exc:  # pragma: no cover - environment dependent
             logger.warning("Physics world disabled: %s", exc)
             self.physics_world = None
@@ -158,6 +159,12 @@ class Game(mglw.WindowConfig):
             display_name="Incline Test",
             description="Test scene for slope physics",
         )
+        self.scene_manager.register_scene(
+            "streaming_terrain",
+            "assets/scenes/streaming_terrain_scene.json",
+            display_name="Streaming Terrain",
+            description="Open world terrain streamed in tiles around the player",
+        )
 
         # Initialize menus
         self.main_menu = MainMenu(self.scene_manager)
@@ -289,6 +296,12 @@ class Game(mglw.WindowConfig):
             if self.player is not None:
                 self.scene.add_object(self.player.model)
 
+            # Streamed terrain needs colliders under the player before the first physics step
+            terrain_streamer = self.scene_manager.terrain_streamer
+            if terrain_streamer is not None:
+                focus = self.player.get_position() if self.player is not None else self.camera.position
+                terrain_streamer.update(focus, wait_for_collision=True)
+
             # Setup HUD
             if HUD_ENABLED:
                 self.player_hud = PlayerHUD(self.render_pipeline)
@@ -685,15 +698,23 @@ class Game(mglw.WindowConfig):
         if self.player is not None:
             self.player.update(frametime)
 
+        # Stream terrain tiles (and their colliders) around the player
+        terrain_streamer = self.scene_manager.terrain_streamer
+        if terrain_streamer is not None:
+            focus = self.player.get_position() if self.player is not None else self.camera.position
+            terrain_streamer.update(focus)
+
+        # Camera collision rays go before the step: a query after it waits for
+        # the physics worker, which then no longer overlaps rendering
+        if self.camera_rig is not None:
+            self.camera_rig.update(frametime)
+
         if self.physics_world is not None:
             self.physics_world.step_simulation(frametime)
 
         if self.player is not None:
             self.player.update_post_physics(frametime)
 
-        if self.camera_rig is not None:
-            self.camera_rig.update(frametime)
-
         # Update animations for all models in the scene
         animated_this_frame = False
         for obj in self.scene.objects:
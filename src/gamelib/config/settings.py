@@ -35,6 +35,19 @@ GL_VERSION = (4, 1)
 # Rendering mode
 RENDERING_MODE = "deferred"  # "forward" or "deferred"
 
+# Dynamic resolution (deferred mode, F11 toggles): G-Buffer, lighting and post
+# passes render at a scaled internal resolution chosen from smoothed GPU frame
+# time, then get upscaled to the window before the UI
+DYNAMIC_RESOLUTION_ENABLED = False
+DYNAMIC_RESOLUTION_TARGET_MS = 16.6          # GPU frame-time budget
+DYNAMIC_RESOLUTION_MIN_SCALE = 0.5           # Lowest internal scale (per axis)
+DYNAMIC_RESOLUTION_MAX_SCALE = 1.0
+DYNAMIC_RESOLUTION_STEP = 0.05               # Scale quantization / upscale step
+DYNAMIC_RESOLUTION_SMOOTHING = 0.1           # EMA factor for GPU frame time
+DYNAMIC_RESOLUTION_DOWNSCALE_THRESHOLD = 1.05  # Lower res above budget * this
+DYNAMIC_RESOLUTION_UPSCALE_THRESHOLD = 0.85    # Raise res below budget * this
+DYNAMIC_RESOLUTION_COOLDOWN_FRAMES = 30      # Frames between scale changes
+
 # Shadow mapping
 SHADOW_MAP_SIZE = 2048  # Resolution of shadow maps (2048x2048) - default/high quality
 MAX_LIGHTS = 3          # Number of shadow-casting lights (only for forward rendering)
@@ -245,7 +258,7 @@ PLAYER_SLOPE_ACCELERATION_MULTIPLIER = 1.2  # Extra force when climbing slopes
 PLAYER_COLLISION_MARGIN = 0.04  # Collision margin to prevent edge snagging (default 0.04, try 0.06-0.08 if snagging occurs)
 PLAYER_MIN_DEPENETRATION_DISTANCE = 0.001  # Minimum penetration depth to resolve (meters)
 PLAYER_CCD_ENABLED = True  # Enable Continuous Collision Detection to prevent tunneling at high speeds
-PLAYER_CCD_SWEEP_STEPS = 5  # Number of steps to subdivide movement for swept collision detection
+PLAYER_CCD_SWEEP_STEPS = 5  # Maximum capsule sweeps per frame (each hit slides along the surface and sweeps again)
 
 # Step-up and ground snapping settings
 PLAYER_STEP_UP_EXTRA_HEIGHT = 0.05  # Extra height to lift when stepping (prevents edge catching)
@@ -261,6 +274,18 @@ PLAYER_THIRD_PERSON_MAX_DISTANCE = 10.0
 
 PLAYER_DEBUG_DRAW_CAPSULE = False
 
+# ============================================================================
+# Physics Settings
+# ============================================================================
+
+# Step PyBullet on a worker thread (PhysicsWorker): frame N+1's step overlaps
+# the rest of frame N, at one frame of extra latency
+PHYSICS_THREADED = False
+
+# Processes building missing collision meshes while a scene loads
+# (1 = build them one at a time on a background thread)
+COLLISION_BUILD_JOBS = 4
+
 # ============================================================================
 # Lighting Defaults
 # ============================================================================
@@ -292,6 +317,13 @@ DEBUG_MODE = False
 SHOW_FPS = True
 LOG_LEVEL = "INFO"  # "DEBUG", "INFO", "WARNING", "ERROR"
 
+# Per-pass CPU/GPU profiler (F10 toggles, F12 exports a Chrome trace)
+PROFILER_ENABLED = False
+PROFILER_LATENCY_FRAMES = 2       # Read GPU queries this many frames late (avoids stalls)
+PROFILER_HISTORY_FRAMES = 300     # Resolved frames kept for averaging / trace export
+PROFILER_OVERLAY_AVERAGE_FRAMES = 30  # Frames averaged for the debug overlay
+PROFILER_TRACE_PATH = "profiler_trace.json"  # Relative to PROJECT_ROOT
+
 # Frustum culling debug
 DEBUG_FRUSTUM_CULLING = False  # Print culling statistics (very spammy - only enable for debugging)
 DEBUG_SHOW_CULLED_OBJECTS = False  # Print names of culled objects (requires DEBUG_FRUSTUM_CULLING)
@@ -303,6 +335,21 @@ DEBUG_SHOW_CULLED_OBJECTS = False  # Print names of culled objects (requires DEB
 # Frustum culling (skip rendering objects outside camera view)
 ENABLE_FRUSTUM_CULLING = True  # Highly recommended for performance
 
+# Chunked terrain (donut_terrain / heightmap_terrain primitives): quadtree chunks
+# with per-chunk culling and LOD picked by screen-space error
+TERRAIN_CHUNKING_ENABLED = True
+TERRAIN_CHUNK_SIZE = 32           # Max quads per chunk edge
+TERRAIN_LOD_PIXEL_ERROR = 2.0     # Refine chunks whose error exceeds this many pixels
+TERRAIN_SHADOW_LOD_BIAS = 4.0     # Error tolerance multiplier in shadow passes (coarser LODs)
+
+# Streamed terrain (scene metadata "terrain_streaming"): tiles built around the player
+TERRAIN_STREAM_TILE_SIZE = 128          # Quads per tile edge
+TERRAIN_STREAM_VIEW_RADIUS = 1024.0     # Tiles within this distance are drawn
+TERRAIN_STREAM_COLLISION_RADIUS = 128.0 # Tiles within this distance get colliders
+TERRAIN_STREAM_VRAM_BUDGET_MB = 256.0   # Chunk VAO memory kept for tiles out of view
+TERRAIN_STREAM_CACHE_TILES = 16         # Built tiles kept out of view
+TERRAIN_STREAM_WORKERS = 2              # Tile build threads
+
 # Target frame rate (0 = unlimited)
 # TARGET_FPS = 60
 
@@ -322,6 +369,19 @@ SSAO_RADIUS = 0.5
 SSAO_BIAS = 0.025
 SSAO_INTENSITY = 1.5
 
+# SSAO quality/performance (switchable at runtime; F6 cycles SSAO_QUALITY_PRESETS)
+SSAO_RESOLUTION_SCALE = 0.5         # Internal SSAO resolution (1.0 = full, 0.5 = half, 0.25 = quarter)
+SSAO_UPSAMPLE_DEPTH_SHARPNESS = 32.0  # Bilateral upsample edge preservation (higher = sharper edges)
+SSAO_TEMPORAL_ENABLED = True        # Blend with reprojected previous frames
+SSAO_TEMPORAL_KERNEL_SIZE = 16      # Samples per frame when temporal accumulation is on
+SSAO_TEMPORAL_BLEND = 0.15          # Weight of the current frame in the accumulated result
+SSAO_TEMPORAL_DEPTH_TOLERANCE = 0.1  # Relative depth mismatch that rejects history (disocclusion)
+SSAO_QUALITY_PRESETS = (
+    {"name": "Full (64 samples)", "resolution_scale": 1.0, "temporal": False},
+    {"name": "Half + Temporal", "resolution_scale": 0.5, "temporal": True},
+    {"name": "Quarter + Temporal", "resolution_scale": 0.25, "temporal": True},
+)
+
 # CSM (Cascaded Shadow Maps)
 CSM_ENABLED = False
 CSM_NUM_CASCADES = 3
@@ -6,6 +6,7 @@ from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 import math
 
+import numpy as np
 from pyrr import Vector3
 
 from ..config.settings import (
@@ -131,12 +132,25 @@ class ThirdPersonRig(CameraRig):
 
         desired_camera_pos = target_position - forward * self.desired_distance
 
-        hit = None
+        hit_fraction = None
         if self.physics_world is not None:
-            hit = self.physics_world.ray_test(tuple(target_position), tuple(desired_camera_pos))
-
-        if hit:
-            safe_distance = max(self.min_distance, self.desired_distance * hit["hit_fraction"] - self.collision_margin)
+            # Centre ray plus four rays offset by the margin, cast as one batch,
+            # so thin geometry beside the view line also pulls the camera in
+            side = np.array([-forward.z, 0.0, forward.x]) * self.collision_margin
+            up = np.array([0.0, self.collision_margin, 0.0])
+            offsets = np.array([np.zeros(3), side, -side, up, -up])
+            player_body = getattr(self.player, "physics_body", None)
+            probes = self.physics_world.ray_test_batch(
+                np.asarray(target_position) + offsets,
+                np.asarray(desired_camera_pos) + offsets,
+                ignore_body=player_body.body_id if player_body is not None else None,
+            )
+            closest = probes.closest()
+            if closest is not None:
+                hit_fraction = float(probes.fractions[closest])
+
+        if hit_fraction is not None:
+            safe_distance = max(self.min_distance, self.desired_distance * hit_fraction - self.collision_margin)
             self.current_distance += (safe_distance - self.current_distance) * self.spring
         else:
             self.current_distance += (self.desired_distance - self.current_distance) * self.spring
@@ -123,3 +123,38 @@ class Frustum:
             True if point is inside frustum
         """
         return self.contains_sphere(point, 0.0)
+
+    def contains_aabbs(self, mins: np.ndarray, maxs: np.ndarray) -> np.ndarray:
+        """
+        Test many axis-aligned boxes against the frustum at once.
+
+        Args:
+            mins: (N, 3) box minimum corners
+            maxs: (N, 3) box maximum corners
+
+        Returns:
+            (N,) bool array, True where the box is inside or intersecting the frustum
+        """
+        planes = np.asarray(self.planes, dtype='f8')
+        normals = planes[:, :3]
+
+        # For each plane take the box corner furthest along its normal; if even
+        # that corner is behind the plane the whole box is outside
+        mins = np.asarray(mins, dtype='f8')[:, None, :]
+        maxs = np.asarray(maxs, dtype='f8')[:, None, :]
+        corners = np.where(normals[None, :, :] >= 0.0, maxs, mins)
+        distances = np.einsum('npk,pk->np', corners, normals) + planes[:, 3]
+        return np.all(distances >= 0.0, axis=1)
+
+    def contains_aabb(self, box_min, box_max) -> bool:
+        """
+        Test if an axis-aligned box is inside or intersects the frustum.
+
+        Args:
+            box_min: Minimum corner (x, y, z)
+            box_max: Maximum corner (x, y, z)
+
+        Returns:
+            True if box is visible (inside or intersecting frustum)
+        """
+        return bool(self.contains_aabbs(np.reshape(box_min, (1, 3)), np.reshape(box_max, (1, 3)))[0])
@@ -4,11 +4,18 @@ Custom Geometry Utilities
 Provides additional geometry primitives not available in moderngl_window.geometry
 """
 
+import hashlib
+import json
+import os
+from pathlib import Path
+
 import numpy as np
 from moderngl_window.opengl.vao import VAO
 from moderngl_window.meta import ProgramDescription
 from .terrain_generation import generate_donut_height_data
 
+MESH_CACHE_VERSION = 1  # Bump when _grid_mesh_data output changes
+
 
 def pyramid(base_size=1.0, height=1.0):
     """
@@ -203,86 +210,7 @@ def donut_terrain(resolution=128, outer_radius=200.0, inner_radius=80.0, height=
     spacing = world_size / (resolution - 1)
     offset = world_size / 2
 
-    # Generate vertices and calculate normals
-    vertices = []
-    normals = []
-    indices = []
-
-    # Create vertex grid with positions and calculate normals
-    for x in range(resolution):
-        for z in range(resolution):
-            # World position
-            world_x = (x * spacing) - offset
-            world_z = (z * spacing) - offset
-            world_y = heights[x][z]
-
-            vertices.append([world_x, world_y, world_z])
-
-            # Calculate normal using finite differences (central differences when possible)
-            # Get neighboring heights for normal calculation
-            dx = 0.0
-            dz = 0.0
-
-            if x > 0 and x < resolution - 1:
-                dx = (heights[x + 1][z] - heights[x - 1][z]) / (2 * spacing)
-            elif x > 0:
-                dx = (heights[x][z] - heights[x - 1][z]) / spacing
-            elif x < resolution - 1:
-                dx = (heights[x + 1][z] - heights[x][z]) / spacing
-
-            if z > 0 and z < resolution - 1:
-                dz = (heights[x][z + 1] - heights[x][z - 1]) / (2 * spacing)
-            elif z > 0:
-                dz = (heights[x][z] - heights[x][z - 1]) / spacing
-            elif z < resolution - 1:
-                dz = (heights[x][z + 1] - heights[x][z]) / spacing
-
-            # Normal is perpendicular to the tangent plane
-            # Tangent vectors: (1, dx, 0) and (0, dz, 1)
-            # Normal = cross product = (-dx, 1, -dz)
-            normal = np.array([-dx, 1.0, -dz], dtype='f4')
-            norm = np.linalg.norm(normal)
-            if norm > 0:
-                normal = normal / norm
-            else:
-                normal = np.array([0.0, 1.0, 0.0], dtype='f4')
-
-            normals.append(normal)
-
-    # Generate indices for triangles (two triangles per quad)
-    # Grid layout: each quad is defined by 4 vertices
-    # Triangle winding: counter-clockwise from above
-    for x in range(resolution - 1):
-        for z in range(resolution - 1):
-            # Vertex indices for this quad
-            top_left = x * resolution + z
-            top_right = (x + 1) * resolution + z
-            bottom_left = x * resolution + (z + 1)
-            bottom_right = (x + 1) * resolution + (z + 1)
-
-            # First triangle: top-left, bottom-left, top-right
-            indices.append(top_left)
-            indices.append(bottom_left)
-            indices.append(top_right)
-
-            # Second triangle: top-right, bottom-left, bottom-right
-            indices.append(top_right)
-            indices.append(bottom_left)
-            indices.append(bottom_right)
-
-    # Convert to numpy arrays
-    vertices = np.array(vertices, dtype='f4')
-    normals = np.array(normals, dtype='f4')
-    indices = np.array(indices, dtype='i4')
-
-    # Interleave vertex positions and normals
-    vertex_data = np.zeros(len(vertices) * 6, dtype='f4')
-    vertex_data[0::6] = vertices[:, 0]  # x
-    vertex_data[1::6] = vertices[:, 1]  # y
-    vertex_data[2::6] = vertices[:, 2]  # z
-    vertex_data[3::6] = normals[:, 0]   # nx
-    vertex_data[4::6] = normals[:, 1]   # ny
-    vertex_data[5::6] = normals[:, 2]   # nz
+    vertex_data, indices = _grid_mesh_data(heights, spacing, offset)
 
     # Create VAO with indexed rendering
     vao = VAO(name="donut_terrain")
@@ -292,117 +220,160 @@ def donut_terrain(resolution=128, outer_radius=200.0, inner_radius=80.0, height=
     return vao
 
 
-def heightmap_terrain(heightmap_path):
+def grid_normals(heights, spacing):
     """
-    Create a terrain mesh from a pre-generated heightmap file.
+    Per-vertex normals for a square height grid.
 
-    Loads a .npz heightmap (generated by fractal_perlin module) and builds
-    a renderable mesh with vertices, normals, and indices.
+    Uses finite differences of the heights (central differences inside the
+    grid, one-sided at the edges).
+
+    Args:
+        heights: 2D array of heights (resolution x resolution)
+        spacing: Distance between neighbouring samples in world units
+
+    Returns:
+        (rows, cols, 3) float32 array of unit normals
+    """
+    # Gradients in the heights' own precision, as a per-vertex loop would compute them
+    grad_x, grad_z = np.gradient(heights, heights.dtype.type(spacing))
+
+    # Normal is perpendicular to the tangent plane
+    # Tangent vectors: (1, dx, 0) and (0, dz, 1)
+    # Normal = cross product = (-dx, 1, -dz)
+    normals = np.empty(heights.shape + (3,), dtype='f4')
+    normals[..., 0] = -grad_x
+    normals[..., 1] = 1.0
+    normals[..., 2] = -grad_z
+    normals /= np.sqrt(np.einsum('...i,...i->...', normals, normals))[..., None]
+    return normals
+
+
+def grid_indices(rows, cols):
+    """
+    Triangle indices for a row-major grid of rows x cols vertices.
+
+    Two triangles per quad, counter-clockwise from above:
+    (i, j), (i, j+1), (i+1, j) and (i+1, j), (i, j+1), (i+1, j+1).
+
+    Returns:
+        Flat int32 index array
+    """
+    v0 = (np.arange(rows - 1, dtype='i4')[:, None] * cols + np.arange(cols - 1, dtype='i4')[None, :]).ravel()
+    v1 = v0 + cols
+    v2 = v1 + 1
+    v3 = v0 + 1
+    return np.stack([v0, v3, v1, v1, v3, v2], axis=1).ravel()
+
+
+def _grid_mesh_data(heights, spacing, offset):
+    """
+    Build interleaved vertex data and triangle indices for a square height grid.
+
+    Vertex (i, j) sits at (i * spacing - offset, heights[i, j], j * spacing - offset).
+
+    Args:
+        heights: 2D array of heights (resolution x resolution)
+        spacing: Distance between neighbouring samples in world units
+        offset: Half the world size (centres the grid on the origin)
+
+    Returns:
+        Tuple of (vertex_data, indices): '3f 3f' position/normal floats and i4 indices
+    """
+    resolution = heights.shape[0]
+
+    # Positions
+    coords = (np.arange(resolution) * spacing) - offset
+    grid_x, grid_z = np.meshgrid(coords, coords, indexing='ij')
+
+    # Interleave vertex positions and normals
+    vertex_data = np.empty((resolution, resolution, 6), dtype='f4')
+    vertex_data[..., 0] = grid_x
+    vertex_data[..., 1] = heights
+    vertex_data[..., 2] = grid_z
+    vertex_data[..., 3:] = grid_normals(heights, spacing)
+
+    return vertex_data.ravel(), grid_indices(resolution, resolution)
+
+
+def heightmap_mesh_data(heightmap_path, cache=True):
+    """
+    Load a .npz heightmap and build its terrain mesh buffers.
+
+    With ``cache`` enabled the buffers are stored next to the heightmap in
+    ``<name>.mesh.npz``, keyed on a SHA-256 of the heightmap file, and reused
+    on later loads until the heightmap changes.
 
     Args:
         heightmap_path: Path to .npz heightmap file
+        cache: Read and write the mesh cache beside the heightmap
 
     Returns:
-        VAO object compatible with moderngl_window rendering
+        Tuple of (vertex_data, indices, meta)
     """
-    import numpy as np
-    import json
-    
+    path = Path(heightmap_path)
+    cache_path = path.with_name(path.stem + '.mesh.npz')
+    digest = None
+
+    if cache:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        if cache_path.exists():
+            try:
+                with np.load(cache_path) as cached:
+                    if (int(cached['version']) == MESH_CACHE_VERSION
+                            and str(cached['source_hash']) == digest):
+                        return cached['vertex_data'], cached['indices'], json.loads(str(cached['meta']))
+            except (OSError, KeyError, ValueError):
+                pass  # Unreadable or stale cache; rebuild below
+
     # Load heightmap data
-    data = np.load(heightmap_path)
-    heights = data['heights']
-    meta = json.loads(str(data['meta']))
-    
+    with np.load(path) as data:
+        heights = data['heights']
+        meta = json.loads(str(data['meta']))
+
     resolution = meta['resolution']
     world_size = meta['world_size']
-    
-    # Calculate spacing
-    dx = world_size / (resolution - 1)
-    dz = world_size / (resolution - 1)
-    offset = world_size / 2.0
-    
-    # Build vertices
-    vertices = []
-    for i in range(resolution):
-        for j in range(resolution):
-            x = -offset + i * dx
-            z = -offset + j * dz
-            y = float(heights[i, j])
-            vertices.append([x, y, z])
-    
-    vertices = np.array(vertices, dtype='f4')
-    
-    # Calculate normals using finite differences (gradient method)
-    # This matches the approach used in donut_terrain for smooth, accurate normals
-    normals = []
+    heights = heights.reshape(resolution, resolution)
+
+    vertex_data, indices = _grid_mesh_data(heights, world_size / (resolution - 1), world_size / 2.0)
+
+    if cache:
+        tmp_path = path.with_name(path.stem + '.mesh.tmp.npz')
+        try:
+            np.savez(
+                tmp_path,
+                version=MESH_CACHE_VERSION,
+                source_hash=digest,
+                meta=json.dumps(meta),
+                vertex_data=vertex_data,
+                indices=indices,
+            )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Read-only asset directories just skip the cache
+
+    return vertex_data, indices, meta
+
+
+def heightmap_terrain(heightmap_path, cache=True):
+    """
+    Create a terrain mesh from a pre-generated heightmap file.
+
+    Loads a .npz heightmap (generated by fractal_perlin module) and builds
+    a renderable mesh with vertices, normals, and indices. Built buffers are
+    cached beside the heightmap (see heightmap_mesh_data).
+
+    Args:
+        heightmap_path: Path to .npz heightmap file
+        cache: Reuse/write the ``<name>.mesh.npz`` buffer cache
+
+    Returns:
+        VAO object compatible with moderngl_window rendering
+    """
+    vertex_data, indices, meta = heightmap_mesh_data(heightmap_path, cache=cache)
 
-    def idx(i, j):
-        return i * resolution + j
-
-    for i in range(resolution):
-        for j in range(resolution):
-            # Calculate gradients using finite differences
-            di = 0.0
-            dj = 0.0
-
-            # Central differences when possible, forward/backward at edges
-            if i > 0 and i < resolution - 1:
-                di = (heights[i + 1, j] - heights[i - 1, j]) / (2 * dx)
-            elif i > 0:
-                di = (heights[i, j] - heights[i - 1, j]) / dx
-            elif i < resolution - 1:
-                di = (heights[i + 1, j] - heights[i, j]) / dx
-
-            if j > 0 and j < resolution - 1:
-                dj = (heights[i, j + 1] - heights[i, j - 1]) / (2 * dz)
-            elif j > 0:
-                dj = (heights[i, j] - heights[i, j - 1]) / dz
-            elif j < resolution - 1:
-                dj = (heights[i, j + 1] - heights[i, j]) / dz
-
-            # Normal is perpendicular to the tangent plane
-            # Tangent vectors: (1, di, 0) in i-direction and (0, dj, 1) in j-direction
-            # Normal = cross product = (-di, 1, -dj)
-            normal = np.array([-di, 1.0, -dj], dtype='f4')
-            norm = np.linalg.norm(normal)
-            if norm > 0:
-                normal = normal / norm
-            else:
-                normal = np.array([0.0, 1.0, 0.0], dtype='f4')
-
-            normals.append(normal)
-
-    normals = np.array(normals, dtype='f4')
-    
-    # Build indices (two triangles per quad)
-    # Using counter-clockwise winding when viewed from above
-    indices = []
-    for i in range(resolution - 1):
-        for j in range(resolution - 1):
-            v0 = idx(i, j)
-            v1 = idx(i + 1, j)
-            v2 = idx(i + 1, j + 1)
-            v3 = idx(i, j + 1)
-
-            # Triangle 1: v0, v3, v1 (counter-clockwise from above)
-            indices.extend([v0, v3, v1])
-            # Triangle 2: v1, v3, v2 (counter-clockwise from above)
-            indices.extend([v1, v3, v2])
-    
-    indices = np.array(indices, dtype='i4')
-    
-    # Interleave vertex positions and normals
-    vertex_data = np.zeros(len(vertices) * 6, dtype='f4')
-    vertex_data[0::6] = vertices[:, 0]  # x
-    vertex_data[1::6] = vertices[:, 1]  # y
-    vertex_data[2::6] = vertices[:, 2]  # z
-    vertex_data[3::6] = normals[:, 0]   # nx
-    vertex_data[4::6] = normals[:, 1]   # ny
-    vertex_data[5::6] = normals[:, 2]   # nz
-    
     # Create VAO with indexed rendering
     vao = VAO(name=f"heightmap_terrain_{meta.get('preset', 'unknown')}")
     vao.buffer(vertex_data, '3f 3f', ['in_position', 'in_normal'])
     vao.index_buffer(indices)
-    
+
     return vao
@@ -163,14 +163,15 @@ class SceneObject:
             name: Debug name for this object
         """
         self.geometry = geom
-        self.position = Vector3(position)
+        # Owned float64 copies: physics sync writes into them in place
+        self.position = Vector3(np.array(position, dtype=np.float64))
         self.color = color
         self.bounding_radius = bounding_radius if bounding_radius is not None else 1.0
         self.name = name
         if isinstance(rotation, Quaternion):
-            self.rotation = Quaternion(rotation)
+            self.rotation = Quaternion(np.array(rotation, dtype=np.float64))
         elif rotation is not None:
-            self.rotation = Quaternion.from_eulers(rotation)
+            self.rotation = Quaternion.from_eulers(rotation, dtype=np.float64)
         else:
             self.rotation = Quaternion()
         self.scale = Vector3(scale) if scale is not None else Vector3([1.0, 1.0, 1.0])
@@ -194,10 +195,11 @@ class SceneObject:
         position: Tuple[float, float, float],
         orientation: Tuple[float, float, float, float],
     ) -> None:
-        """Apply a transform received from the physics simulation."""
+        """Apply a transform received from the physics simulation (in place, no allocation)."""
 
-        self.position = Vector3(position)
-        self.rotation = Quaternion(orientation).normalised
+        self.position[:] = position
+        self.rotation[:] = orientation
+        self.rotation /= np.linalg.norm(self.rotation)
 
     def is_visible(self, frustum: Frustum) -> bool:
         """
@@ -240,6 +242,22 @@ class Scene:
         """
         self.objects.append(obj)
 
+    def remove_object(self, obj: SceneObject) -> bool:
+        """
+        Remove an object from the scene.
+
+        Args:
+            obj: SceneObject to remove
+
+        Returns:
+            True if the object was in the scene
+        """
+        try:
+            self.objects.remove(obj)
+        except ValueError:
+            return False
+        return True
+
     def set_skybox(self, skybox: Optional[Skybox]):
         """Assign a skybox to the scene."""
         self.skybox = skybox
@@ -470,8 +488,21 @@ class Scene:
         # self.add_object(cone14)
 
 
+    def update_terrain_lod(self, camera_position, projection_scale: float):
+        """
+        Pick chunk LODs of chunked terrains for the coming frame.
+
+        Args:
+            camera_position: Camera position in world space
+            projection_scale: Viewport height in pixels / (2 * tan(fov / 2))
+        """
+        for obj in self.objects:
+            if getattr(obj, 'is_terrain', False):
+                obj.update_lod(camera_position, projection_scale)
+
     def render_all(self, program, frustum: Optional[Frustum] = None, debug_label: str = "",
-                   textured_program=None, unlit_program=None, textured_skinned_program=None):
+                   textured_program=None, unlit_program=None, textured_skinned_program=None,
+                   lod_bias: float = 1.0):
         """
         Render all objects in the scene.
 
@@ -482,12 +513,16 @@ class Scene:
             textured_program: Optional shader program for textured models
             unlit_program: Optional shader program for unlit materials (KHR_materials_unlit)
             textured_skinned_program: Optional shader program for skinned meshes
+            lod_bias: Screen-space error multiplier for chunked terrain (shadow passes
+                      pass > 1 to draw coarser chunks)
         """
         from ..config.settings import DEBUG_FRUSTUM_CULLING, DEBUG_SHOW_CULLED_OBJECTS
 
         rendered_count = 0
         culled_count = 0
         culled_objects: List[str] = []
+        chunks_rendered = 0
+        chunks_culled = 0
 
         for obj in self.objects:
             # Frustum culling (skip if outside view)
@@ -575,6 +610,16 @@ class Scene:
                     # Render each mesh with its local transform
                     for mesh in obj.meshes:
                         mesh.render(active_program, parent_transform=parent_matrix, ctx=self.ctx)
+            elif getattr(obj, 'is_terrain', False):
+                # Chunked terrain: one model matrix, then per-chunk LOD and culling
+                active_program = program
+                active_program['model'].write(obj.get_model_matrix().astype('f4').tobytes())
+                if 'object_color' in active_program:
+                    active_program['object_color'].write(Vector3(obj.color).astype('f4').tobytes())
+
+                rendered, culled = obj.render_chunks(active_program, frustum=frustum, lod_bias=lod_bias)
+                chunks_rendered += rendered
+                chunks_culled += culled
             else:
                 # Use primitive shader for regular SceneObjects
                 active_program = program
@@ -600,6 +645,8 @@ class Scene:
             'culled': culled_count,
             'culled_objects': culled_objects if DEBUG_SHOW_CULLED_OBJECTS else None,
             'frustum_applied': frustum is not None,
+            'terrain_chunks': chunks_rendered,
+            'terrain_chunks_culled': chunks_culled,
         }
 
         if DEBUG_FRUSTUM_CULLING and frustum is not None:
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 from pyrr import Vector3, vector
@@ -37,6 +37,7 @@ class ActiveScene:
     lights: list[Light]
     metadata: Dict[str, object]
     physics_bodies: List[PhysicsBodyHandle]
+    terrain_streamer: Optional[Any] = None
 
 
 class SceneManager:
@@ -79,6 +80,11 @@ class SceneManager:
     def physics_bodies(self) -> List[PhysicsBodyHandle]:
         return self._active.physics_bodies if self._active else []
 
+    @property
+    def terrain_streamer(self):
+        """TerrainStreamer of the active scene, if it streams its terrain."""
+        return self._active.terrain_streamer if self._active else None
+
     @property
     def camera_position(self) -> Optional[Vector3]:
         return self._camera_position
@@ -148,6 +154,7 @@ class SceneManager:
         if name not in self._registry:
             raise KeyError(f"Scene '{name}' has not been registered")
 
+        self._shutdown_streaming()
         if self.physics_world is not None:
             self.physics_world.reset()
 
@@ -159,6 +166,7 @@ class SceneManager:
             lights=result.lights,
             metadata=result.metadata,
             physics_bodies=result.physics_bodies,
+            terrain_streamer=result.terrain_streamer,
         )
 
         self._camera_position = result.camera_position
@@ -182,7 +190,13 @@ class SceneManager:
             camera.update_vectors()
             camera.target = Vector3(self._camera_target)
 
+    def _shutdown_streaming(self):
+        if self._active is not None and self._active.terrain_streamer is not None:
+            self._active.terrain_streamer.shutdown()
+            self._active.terrain_streamer = None
+
     def clear(self):
+        self._shutdown_streaming()
         self._active = None
         self._camera_position = None
         self._camera_target = None
@@ -0,0 +1,344 @@
+"""
+Chunked Terrain
+
+Splits a height grid into a quadtree of chunks so large terrains can be
+culled and level-of-detailed per chunk instead of drawn as one VAO:
+
+ - Every quadtree node is a chunk with its own grid mesh (at most
+   ``chunk_size`` quads per edge, so coarser nodes sample the heights with a
+   wider stride), an axis-aligned bounding box and a geometric error (how far
+   its mesh strays from the full-resolution heights).
+ - Each frame the camera picks chunks top-down: a node is refined while its
+   error, projected to the screen, is above the pixel tolerance. Shadow
+   passes select with a larger tolerance and so draw coarser chunks.
+ - Chunks are frustum-culled by their boxes in every pass.
+ - Each chunk mesh hangs a skirt below its border so neighbours at different
+   LODs don't show cracks.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from moderngl_window.opengl.vao import VAO
+
+from .frustum import Frustum
+from .geometry_utils import grid_indices, grid_normals
+from .scene import SceneObject
+
+
+class TerrainChunk:
+    """One quadtree node: a grid mesh over a block of the terrain's height grid."""
+
+    def __init__(self, terrain: "ChunkedTerrain", index: int, level: int,
+                 rows: np.ndarray, cols: np.ndarray):
+        """
+        Args:
+            terrain: Owning terrain (holds the height grid)
+            index: Position in the terrain's chunk arrays
+            level: Depth in the quadtree (0 = root)
+            rows: Height-grid row indices sampled by this chunk's mesh
+            cols: Height-grid column indices sampled by this chunk's mesh
+        """
+        self.terrain = terrain
+        self.index = index
+        self.level = level
+        self.rows = rows
+        self.cols = cols
+        self.children: List["TerrainChunk"] = []
+        self.error = 0.0
+        self.skirt_depth = 0.0
+        self.vao: Optional[VAO] = None
+        self.nbytes = 0  # GPU buffer size while the VAO exists
+
+    @property
+    def is_leaf(self) -> bool:
+        return not self.children
+
+    def mesh_data(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Interleaved '3f 3f' vertex data and indices, including the skirt."""
+        terrain = self.terrain
+        block = np.ix_(self.rows, self.cols)
+        n_rows, n_cols = len(self.rows), len(self.cols)
+
+        grid_x, grid_z = np.meshgrid(terrain.coords[self.rows], terrain.coords[self.cols], indexing='ij')
+        top = np.empty((n_rows, n_cols, 6), dtype='f4')
+        top[..., 0] = grid_x
+        top[..., 1] = terrain.heights[block]
+        top[..., 2] = grid_z
+        top[..., 3:] = terrain.normals[block]
+        top = top.reshape(-1, 6)
+
+        # Border loop around the chunk: top row, right column, bottom row, left column
+        grid = np.arange(n_rows * n_cols, dtype='i4').reshape(n_rows, n_cols)
+        ring = np.concatenate([grid[0, :], grid[1:, -1], grid[-1, -2::-1], grid[-2:0:-1, 0]])
+
+        # Skirt vertices hang straight down from the border and keep its normals
+        skirt = top[ring].copy()
+        skirt[:, 1] -= self.skirt_depth
+
+        count = len(ring)
+        upper = ring
+        upper_next = np.roll(ring, -1)
+        lower = np.arange(count, dtype='i4') + n_rows * n_cols
+        lower_next = np.roll(lower, -1)
+        # Both windings, so the skirt is visible from either side with culling on
+        skirt_indices = np.stack([
+            upper, lower, upper_next, upper_next, lower, lower_next,
+            upper, upper_next, lower, upper_next, lower_next, lower,
+        ], axis=1).ravel()
+
+        vertex_data = np.concatenate([top, skirt]).ravel()
+        indices = np.concatenate([grid_indices(n_rows, n_cols), skirt_indices]).astype('i4')
+        return vertex_data, indices
+
+    def build(self) -> VAO:
+        """Create the chunk's VAO (done lazily the first time it is drawn)."""
+        if self.vao is None:
+            vertex_data, indices = self.mesh_data()
+            self.vao = VAO(name=f"{self.terrain.name}_chunk_{self.index}")
+            self.vao.buffer(vertex_data, '3f 3f', ['in_position', 'in_normal'])
+            self.vao.index_buffer(indices)
+            self.nbytes = vertex_data.nbytes + indices.nbytes
+        return self.vao
+
+    def render(self, program):
+        self.build().render(program)
+
+    def release(self):
+        if self.vao is not None:
+            self.vao.release()
+            self.vao = None
+            self.nbytes = 0
+
+
+def _interpolation_weights(coarse: np.ndarray, fine: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Segment index and blend factor placing each fine sample between coarse samples."""
+    segment = np.clip(np.searchsorted(coarse, fine, side='right') - 1, 0, len(coarse) - 2)
+    t = (fine - coarse[segment]) / (coarse[segment + 1] - coarse[segment])
+    return segment, t
+
+
+def _chunk_error(heights: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> float:
+    """Largest height difference between a chunk's coarse grid and the full grid below it."""
+    if len(rows) == rows[-1] - rows[0] + 1 and len(cols) == cols[-1] - cols[0] + 1:
+        return 0.0  # Full resolution
+
+    region = heights[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
+    coarse = heights[np.ix_(rows, cols)]
+
+    # Bilinear interpolation of the coarse grid at every full-resolution sample
+    segment, t = _interpolation_weights(cols, np.arange(cols[0], cols[-1] + 1))
+    along_cols = coarse[:, segment] * (1.0 - t) + coarse[:, segment + 1] * t
+    segment, t = _interpolation_weights(rows, np.arange(rows[0], rows[-1] + 1))
+    approx = along_cols[segment] * (1.0 - t)[:, None] + along_cols[segment + 1] * t[:, None]
+
+    return float(np.abs(approx - region).max())
+
+
+class ChunkedTerrain(SceneObject):
+    """
+    Terrain scene object drawn as quadtree chunks with per-chunk LOD and culling.
+
+    Vertex (i, j) of the height grid sits at
+    (i * spacing - offset, heights[i, j], j * spacing - offset) in object space,
+    the same layout as geometry_utils.donut_terrain / heightmap_terrain.
+    """
+
+    is_terrain = True
+
+    def __init__(
+        self,
+        heights: np.ndarray,
+        spacing: float,
+        position=(0.0, 0.0, 0.0),
+        color: Tuple[float, float, float] = (1.0, 1.0, 1.0),
+        bounding_radius: float = None,
+        name: str = "Terrain",
+        rotation=None,
+        scale=None,
+        offset: Optional[float] = None,
+        chunk_size: int = 32,
+        pixel_error: float = 2.0,
+        normals: Optional[np.ndarray] = None,
+    ):
+        """
+        Args:
+            heights: 2D array of heights (rows x cols)
+            spacing: Distance between neighbouring samples in world units
+            offset: Half the world size (default centres the grid on the origin)
+            chunk_size: Maximum quads per chunk edge
+            pixel_error: Screen-space error (pixels) a chunk may have before it is refined
+            normals: Per-sample normals (rows x cols x 3); computed from the heights if
+                omitted. Tiles of a larger terrain pass these so border normals match
+                their neighbours.
+            (remaining arguments as SceneObject)
+        """
+        super().__init__(None, position, color, bounding_radius=bounding_radius, name=name,
+                         rotation=rotation, scale=scale)
+        if heights.ndim != 2 or min(heights.shape) < 2:
+            raise ValueError(f"Terrain heights must be a 2D grid of at least 2x2 samples, got {heights.shape}")
+
+        self.heights = np.ascontiguousarray(heights)
+        self.spacing = float(spacing)
+        if offset is None:
+            offset = (heights.shape[0] - 1) * self.spacing / 2.0
+        self.offset = float(offset)
+        self.coords = (np.arange(max(heights.shape)) * self.spacing) - self.offset
+        if normals is None:
+            normals = grid_normals(self.heights, self.spacing)
+        elif normals.shape != self.heights.shape + (3,):
+            raise ValueError(f"Terrain normals must have shape {self.heights.shape + (3,)}, got {normals.shape}")
+        self.normals = np.asarray(normals, dtype='f4')
+        self.chunk_size = max(int(chunk_size), 1)
+        self.pixel_error = float(pixel_error)
+
+        self.chunks: List[TerrainChunk] = []
+        self.root = self._build_chunk(0, self.heights.shape[0] - 1, 0, self.heights.shape[1] - 1)
+        self.root.skirt_depth = max(2.0 * self.root.error, self.spacing)
+        self.leaves = [chunk for chunk in self.chunks if chunk.is_leaf]
+
+        # Object-space chunk boxes (skirts included)
+        self.local_mins = np.empty((len(self.chunks), 3))
+        self.local_maxs = np.empty((len(self.chunks), 3))
+        self.errors = np.empty(len(self.chunks))
+        for chunk in self.chunks:
+            block = self.heights[chunk.rows[0]:chunk.rows[-1] + 1, chunk.cols[0]:chunk.cols[-1] + 1]
+            self.local_mins[chunk.index] = (self.coords[chunk.rows[0]], block.min() - chunk.skirt_depth,
+                                            self.coords[chunk.cols[0]])
+            self.local_maxs[chunk.index] = (self.coords[chunk.rows[-1]], block.max(),
+                                            self.coords[chunk.cols[-1]])
+            self.errors[chunk.index] = chunk.error
+
+        # The root chunk stands in wherever the whole terrain is drawn as one mesh
+        # (selection outline, thumbnails)
+        self.geometry = self.root
+
+        self._bounds_key: Optional[bytes] = None
+        self._world_mins = self.local_mins
+        self._world_maxs = self.local_maxs
+        self._error_scale = 1.0
+        self._camera_position: Optional[np.ndarray] = None
+        self._projection_scale = 1.0
+        self._distances: Optional[np.ndarray] = None
+        self._selections: Dict[float, List[TerrainChunk]] = {}
+
+    def _build_chunk(self, r0: int, r1: int, c0: int, c1: int, level: int = 0) -> TerrainChunk:
+        """Build the chunk covering rows r0..r1 and columns c0..c1 (inclusive) and its subtree."""
+        stride = max(1, math.ceil(max(r1 - r0, c1 - c0) / self.chunk_size))
+        rows = np.unique(np.append(np.arange(r0, r1, stride), r1))
+        cols = np.unique(np.append(np.arange(c0, c1, stride), c1))
+        chunk = TerrainChunk(self, len(self.chunks), level, rows, cols)
+        self.chunks.append(chunk)
+
+        if stride > 1:
+            row_splits = [(r0, (r0 + r1) // 2), ((r0 + r1) // 2, r1)] if r1 - r0 > self.chunk_size else [(r0, r1)]
+            col_splits = [(c0, (c0 + c1) // 2), ((c0 + c1) // 2, c1)] if c1 - c0 > self.chunk_size else [(c0, c1)]
+            chunk.children = [
+                self._build_chunk(rs, re, cs, ce, level + 1)
+                for rs, re in row_splits
+                for cs, ce in col_splits
+            ]
+
+        # A parent is never more accurate than its children
+        chunk.error = max([_chunk_error(self.heights, rows, cols)] +
+                          [child.error for child in chunk.children])
+        # Children may border chunks as coarse as this one; their skirts must cover the gap
+        for child in chunk.children:
+            child.skirt_depth = max(2.0 * chunk.error, self.spacing)
+        return chunk
+
+    def _update_world_bounds(self):
+        """Transform the object-space chunk boxes when the model matrix changes."""
+        matrix = np.asarray(self.get_model_matrix(), dtype='f8')
+        key = matrix.tobytes()
+        if key == self._bounds_key:
+            return
+        self._bounds_key = key
+
+        linear = matrix[:3, :3]
+        centers = (self.local_mins + self.local_maxs) * 0.5
+        extents = (self.local_maxs - self.local_mins) * 0.5
+        world_centers = centers @ linear + matrix[3, :3]
+        world_extents = extents @ np.abs(linear)
+        self._world_mins = world_centers - world_extents
+        self._world_maxs = world_centers + world_extents
+        self._error_scale = float(np.abs(np.asarray(self.scale, dtype='f8')).max())
+
+    def update_lod(self, camera_position, projection_scale: float):
+        """
+        Set the viewpoint used to pick chunk LODs for the coming frame.
+
+        Args:
+            camera_position: Camera position in world space
+            projection_scale: Viewport height in pixels / (2 * tan(fov / 2))
+        """
+        self._update_world_bounds()
+        position = np.asarray(camera_position, dtype='f8').reshape(3)
+        # Distance from the camera to the nearest point of each chunk's box
+        gap = np.maximum(np.maximum(self._world_mins - position, position - self._world_maxs), 0.0)
+        self._distances = np.sqrt(np.einsum('ij,ij->i', gap, gap))
+        self._camera_position = position
+        self._projection_scale = float(projection_scale)
+        self._selections.clear()
+
+    def select_chunks(self, lod_bias: float = 1.0) -> List[TerrainChunk]:
+        """
+        Chunks to draw for the current viewpoint.
+
+        Args:
+            lod_bias: Multiplier on the pixel tolerance (> 1 selects coarser chunks)
+
+        Returns:
+            Chunks covering the whole terrain once (leaves if no viewpoint was set)
+        """
+        if self._distances is None:
+            return self.leaves
+        if lod_bias in self._selections:
+            return self._selections[lod_bias]
+
+        tolerance = self.pixel_error * lod_bias
+        error_scale = self._error_scale * self._projection_scale
+        selected: List[TerrainChunk] = []
+        stack = [self.root]
+        while stack:
+            chunk = stack.pop()
+            if chunk.children:
+                distance = max(self._distances[chunk.index], 1e-6)
+                if chunk.error * error_scale / distance > tolerance:
+                    stack.extend(chunk.children)
+                    continue
+            selected.append(chunk)
+
+        self._selections[lod_bias] = selected
+        return selected
+
+    def render_chunks(self, program, frustum: Optional[Frustum] = None,
+                      lod_bias: float = 1.0) -> Tuple[int, int]:
+        """
+        Draw the selected chunks that intersect the frustum.
+
+        The caller sets the model matrix and material uniforms.
+
+        Returns:
+            Tuple of (chunks rendered, chunks culled)
+        """
+        self._update_world_bounds()
+        chunks = self.select_chunks(lod_bias)
+        selected = len(chunks)
+        if frustum is not None:
+            indices = np.fromiter((chunk.index for chunk in chunks), dtype=np.intp, count=len(chunks))
+            visible = frustum.contains_aabbs(self._world_mins[indices], self._world_maxs[indices])
+            chunks = [chunk for chunk, keep in zip(chunks, visible) if keep]
+        for chunk in chunks:
+            chunk.render(program)
+        return len(chunks), selected - len(chunks)
+
+    def gpu_bytes(self) -> int:
+        """Vertex and index buffer bytes of the chunk VAOs built so far."""
+        return sum(chunk.nbytes for chunk in self.chunks)
+
+    def release(self):
+        """Free every chunk VAO built so far."""
+        for chunk in self.chunks:
+            chunk.release()
@@ -5,7 +5,6 @@ Adapted from pandas3d terrain generation for ModernGL.
 """
 
 import numpy as np
-import math
 
 # Optional: Import fractal_perlin for higher-quality Perlin-based noise
 try:
@@ -19,23 +18,23 @@ def simple_noise(x, y, seed=0):
     """Simple pseudo-noise function using sine waves and random-like behavior.
 
     Args:
-        x: X coordinate
-        y: Y coordinate
+        x: X coordinate (float or numpy array)
+        y: Y coordinate (float or numpy array)
         seed: Random seed for variation
 
     Returns:
-        Float value between -1 and 1
+        Value between -1 and 1 (array if x/y are arrays)
     """
     # Use multiple sine waves with different frequencies and phases for more dramatic terrain
     n = (
-        math.sin(x * 0.1 + seed) * 0.6
-        + math.sin(y * 0.1 + seed * 1.1) * 0.6
-        + math.sin((x + y) * 0.05 + seed * 1.3) * 0.4
-        + math.sin((x - y) * 0.08 + seed * 1.7) * 0.3
+        np.sin(x * 0.1 + seed) * 0.6
+        + np.sin(y * 0.1 + seed * 1.1) * 0.6
+        + np.sin((x + y) * 0.05 + seed * 1.3) * 0.4
+        + np.sin((x - y) * 0.08 + seed * 1.7) * 0.3
         +
         # Add sharper features for mountain ridges
-        math.sin(x * 0.03 + y * 0.02 + seed * 2.1) * 0.7
-        + math.sin(math.sqrt(x * x + y * y) * 0.02 + seed * 3.7) * 0.5
+        np.sin(x * 0.03 + y * 0.02 + seed * 2.1) * 0.7
+        + np.sin(np.sqrt(x * x + y * y) * 0.02 + seed * 3.7) * 0.5
     )
     return n / 2.5  # Normalize to roughly -1 to 1
 
@@ -44,8 +43,8 @@ def fractal_noise(x, y, octaves=4, persistence=0.5, lacunarity=2.0, seed=0, use_
     """Generate fractal noise by combining multiple octaves.
 
     Args:
-        x: X coordinate
-        y: Y coordinate
+        x: X coordinate (float or numpy array)
+        y: Y coordinate (float or numpy array)
         octaves: Number of noise layers to combine
         persistence: How much each octave contributes (amplitude multiplier)
         lacunarity: Frequency multiplier for each octave
@@ -54,12 +53,13 @@ def fractal_noise(x, y, octaves=4, persistence=0.5, lacunarity=2.0, seed=0, use_
                    instead of sine-based noise (default: False for backward compatibility)
 
     Returns:
-        Float noise value
+        Float noise value (array if x/y are arrays)
     """
     # Use Perlin-based fBm if requested and available
     if use_perlin and HAS_PERLIN:
-        return float(perlin_fbm(x, y, octaves=octaves, persistence=persistence, 
-                                lacunarity=lacunarity, seed=seed))
+        value = perlin_fbm(x, y, octaves=octaves, persistence=persistence,
+                           lacunarity=lacunarity, seed=seed)
+        return float(value) if np.ndim(value) == 0 else value
     
     # Fall back to sine-based fractal noise (original implementation)
     value = 0.0
@@ -73,6 +73,8 @@ def fractal_noise(x, y, octaves=4, persistence=0.5, lacunarity=2.0, seed=0, use_
         amplitude *= persistence
         frequency *= lacunarity
 
+    if np.ndim(value) == 0:
+        return float(value / max_value)
     return value / max_value
 
 
@@ -85,6 +87,9 @@ def generate_donut_height_data(resolution, outer_radius=200, inner_radius=80, he
     - Procedural noise for natural variation
     - Angular variation for interesting shape
 
+    The whole grid is evaluated at once with numpy; noise is only sampled
+    for the rim cells.
+
     Args:
         resolution: Number of vertices per edge (creates resolution x resolution grid)
         outer_radius: Outer radius of the donut
@@ -103,76 +108,64 @@ def generate_donut_height_data(resolution, outer_radius=200, inner_radius=80, he
     world_size = outer_radius * 2.2  # Add some padding
     spacing = world_size / (resolution - 1)
 
-    for x in range(resolution):
-        for z in range(resolution):
-            # Calculate world position centered at origin
-            world_x = (x * spacing) - (world_size / 2)
-            world_z = (z * spacing) - (world_size / 2)
-
-            # Calculate distance from center
-            center_dist = math.sqrt(world_x * world_x + world_z * world_z)
-
-            # Create donut shape with thick, flat top
-            if center_dist <= outer_radius and center_dist >= inner_radius:
-                # We're in the donut rim area
-
-                # Calculate rim position (0 = inner edge, 1 = outer edge)
-                rim_position = (center_dist - inner_radius) / (outer_radius - inner_radius)
-
-                # Create thick, flat top surface in the middle of the rim
-                inner_rim_start = 0.2  # Start of thick top (20% from inner edge)
-                inner_rim_end = 0.8    # End of thick top (80% from inner edge)
-
-                if rim_position >= inner_rim_start and rim_position <= inner_rim_end:
-                    # We're on the thick top surface - make it flat and walkable
-                    base_height = height
-
-                    # Add very subtle noise for texture (much less than slopes)
-                    noise_height = fractal_noise(
-                        world_x * 0.02,
-                        world_z * 0.02,
-                        octaves=2,
-                        persistence=0.3,
-                        lacunarity=2.0,
-                        seed=seed,
-                        use_perlin=use_perlin
-                    ) * 1  # Very small noise for subtle texture
-
-                    terrain_height = base_height + noise_height
-
-                else:
-                    # We're on the sloping edges of the donut
-                    if rim_position < inner_rim_start:
-                        # Inner slope (from hole to thick top)
-                        slope_factor = rim_position / inner_rim_start
-                        base_height = height * slope_factor
-                    else:
-                        # Outer slope (from thick top to ground)
-                        slope_factor = (1 - rim_position) / (1 - inner_rim_end)
-                        base_height = height * slope_factor
-
-                    # Add more noise on slopes for natural appearance
-                    noise_height = fractal_noise(
-                        world_x * 0.01,
-                        world_z * 0.01,
-                        octaves=3,
-                        persistence=0.5,
-                        lacunarity=2.0,
-                        seed=seed,
-                        use_perlin=use_perlin
-                    ) * 3
-
-                    terrain_height = base_height + noise_height
-
-                # Add subtle angular variation for more interesting shape
-                angle = math.atan2(world_z, world_x)
-                angle_variation = math.sin(angle * 4) * 2  # 4 lobes, smaller variation
-                terrain_height += angle_variation
-
-                heights[x][z] = max(0, terrain_height)
-            else:
-                # Outside the donut - flat ground
-                heights[x][z] = 0
+    # World positions centered at origin; first axis is x, second is z
+    coords = (np.arange(resolution) * spacing) - (world_size / 2)
+    grid_x, grid_z = np.meshgrid(coords, coords, indexing='ij')
+
+    # Calculate distance from center
+    center_dist = np.sqrt(grid_x * grid_x + grid_z * grid_z)
+
+    # Outside the donut stays flat ground
+    rim = (center_dist <= outer_radius) & (center_dist >= inner_radius)
+    world_x = grid_x[rim]
+    world_z = grid_z[rim]
+
+    # Calculate rim position (0 = inner edge, 1 = outer edge)
+    rim_position = (center_dist[rim] - inner_radius) / (outer_radius - inner_radius)
+
+    # Create thick, flat top surface in the middle of the rim
+    inner_rim_start = 0.2  # Start of thick top (20% from inner edge)
+    inner_rim_end = 0.8    # End of thick top (80% from inner edge)
+    top = (rim_position >= inner_rim_start) & (rim_position <= inner_rim_end)
+    slope = ~top
+
+    terrain_height = np.empty(rim_position.shape)
+
+    # Thick top surface: flat and walkable with very subtle noise for texture
+    terrain_height[top] = height + fractal_noise(
+        world_x[top] * 0.02,
+        world_z[top] * 0.02,
+        octaves=2,
+        persistence=0.3,
+        lacunarity=2.0,
+        seed=seed,
+        use_perlin=use_perlin
+    ) * 1
+
+    # Sloping edges: inner slope rises from the hole, outer slope falls to the ground
+    slope_position = rim_position[slope]
+    slope_factor = np.where(
+        slope_position < inner_rim_start,
+        slope_position / inner_rim_start,
+        (1 - slope_position) / (1 - inner_rim_end),
+    )
+
+    # Add more noise on slopes for natural appearance
+    terrain_height[slope] = height * slope_factor + fractal_noise(
+        world_x[slope] * 0.01,
+        world_z[slope] * 0.01,
+        octaves=3,
+        persistence=0.5,
+        lacunarity=2.0,
+        seed=seed,
+        use_perlin=use_perlin
+    ) * 3
+
+    # Add subtle angular variation for more interesting shape
+    angle = np.arctan2(world_z, world_x)
+    terrain_height += np.sin(angle * 4) * 2  # 4 lobes, smaller variation
+
+    heights[rim] = np.where(terrain_height > 0, terrain_height, 0.0)
 
     return heights
 
@@ -0,0 +1,449 @@
+"""
+Terrain Streaming
+
+Streams square terrain tiles in and out around a moving focus point (the
+player) so the world can be far larger than what fits in memory:
+
+ - Tiles come from a TileSource: a memory-mapped ``.npy`` heightmap (e.g.
+   from tools/bake_terrain.py), read one tile at a time, or fBm noise from
+   the fractal_perlin presets, generated on demand for an unbounded world.
+ - Tiles are built off the main thread in a worker pool; each becomes a
+   ChunkedTerrain (its own quadtree LOD and culling) added to the scene.
+ - Tiles that leave the view radius are dropped from the scene but kept in
+   an LRU cache. Least recently seen tiles are evicted once the chunk VAOs
+   exceed the VRAM budget or the cache holds too many tiles.
+ - Tiles close to the focus get a static PyBullet heightfield collider;
+   colliders are destroyed again once the focus moves away.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import math
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..fractal_perlin import fbm, resolve_noise_params
+from ..physics import PhysicsBodyConfig
+from .geometry_utils import grid_normals
+from .terrain_chunks import ChunkedTerrain
+
+logger = logging.getLogger(__name__)
+
+TileKey = Tuple[int, int]
+
+# Colliders are created inside the collision radius and only destroyed past
+# this multiple of it, so walking along the boundary doesn't rebuild them
+_COLLISION_HYSTERESIS = 1.25
+
+
+class TileSource(ABC):
+    """
+    Supplies height samples for square terrain tiles.
+
+    Tile (i, j) covers samples [i * tile_size, (i + 1) * tile_size] along X and
+    [j * tile_size, (j + 1) * tile_size] along Z; neighbouring tiles share
+    their border samples so the meshes meet without gaps.
+    """
+
+    def __init__(self, tile_size: int, spacing: float, origin: Tuple[float, float] = (0.0, 0.0)):
+        """
+        Args:
+            tile_size: Quads per tile edge
+            spacing: Distance between neighbouring samples in world units
+            origin: World (x, z) of sample (0, 0)
+        """
+        if tile_size < 1:
+            raise ValueError(f"Tile size must be at least 1, got {tile_size}")
+        self.tile_size = int(tile_size)
+        self.spacing = float(spacing)
+        self.origin = (float(origin[0]), float(origin[1]))
+
+    @property
+    def tile_extent(self) -> float:
+        """Tile edge length in world units."""
+        return self.tile_size * self.spacing
+
+    def contains(self, tile: TileKey) -> bool:
+        """Whether the source has data for the tile."""
+        return True
+
+    def tile_at(self, x: float, z: float) -> TileKey:
+        """Tile containing the world position (x, z)."""
+        return (int(math.floor((x - self.origin[0]) / self.tile_extent)),
+                int(math.floor((z - self.origin[1]) / self.tile_extent)))
+
+    def tile_shape(self, tile: TileKey) -> Tuple[int, int]:
+        """Samples per axis of the tile's height grid."""
+        return self.tile_size + 1, self.tile_size + 1
+
+    def sample_origin(self, tile: TileKey) -> Tuple[float, float]:
+        """World (x, z) of the tile's first sample."""
+        return (self.origin[0] + tile[0] * self.tile_extent,
+                self.origin[1] + tile[1] * self.tile_extent)
+
+    def tile_bounds(self, tile: TileKey) -> Tuple[float, float, float, float]:
+        """World (min x, min z, max x, max z) covered by the tile."""
+        x0, z0 = self.sample_origin(tile)
+        rows, cols = self.tile_shape(tile)
+        return x0, z0, x0 + (rows - 1) * self.spacing, z0 + (cols - 1) * self.spacing
+
+    @abstractmethod
+    def read(self, tile: TileKey, apron: int = 0) -> np.ndarray:
+        """
+        Height samples of a tile.
+
+        Args:
+            tile: Tile key
+            apron: Extra samples read around the tile on every side (used for
+                normals that match across tile borders)
+
+        Returns:
+            (rows + 2 * apron, cols + 2 * apron) float32 array
+        """
+
+
+class HeightmapTileSource(TileSource):
+    """Tiles read lazily from a memory-mapped ``.npy`` heightmap."""
+
+    def __init__(self, path: str | Path, tile_size: int = 128, world_size: Optional[float] = None):
+        """
+        Args:
+            path: Heightmap (.npy), e.g. written by TileBaker
+            tile_size: Quads per tile edge
+            world_size: World extent of the heightmap; read from the baker's
+                ``.json`` manifest next to the file when omitted
+        """
+        self.path = Path(path)
+        if self.path.suffix != '.npy':
+            raise ValueError(f"Streamed heightmaps must be memory-mappable .npy files: {self.path}")
+        self.heights = np.load(self.path, mmap_mode='r')
+        if self.heights.ndim != 2:
+            raise ValueError(f"Heightmap must be a 2D grid, got shape {self.heights.shape}")
+
+        if world_size is None:
+            manifest_path = self.path.with_suffix('.json')
+            if manifest_path.exists():
+                with manifest_path.open('r', encoding='utf-8') as fh:
+                    world_size = json.load(fh).get('metadata', {}).get('world_size')
+        if world_size is None:
+            raise ValueError(f"No world size given for {self.path} and no manifest records one")
+
+        world_size = float(world_size)
+        spacing = world_size / (self.heights.shape[0] - 1)
+        super().__init__(tile_size, spacing, origin=(-world_size / 2.0, -world_size / 2.0))
+        self.tile_counts = (math.ceil((self.heights.shape[0] - 1) / self.tile_size),
+                            math.ceil((self.heights.shape[1] - 1) / self.tile_size))
+
+    def contains(self, tile: TileKey) -> bool:
+        return 0 <= tile[0] < self.tile_counts[0] and 0 <= tile[1] < self.tile_counts[1]
+
+    def tile_shape(self, tile: TileKey) -> Tuple[int, int]:
+        # Tiles along the far edges may be narrower
+        rows = min((tile[0] + 1) * self.tile_size, self.heights.shape[0] - 1) - tile[0] * self.tile_size
+        cols = min((tile[1] + 1) * self.tile_size, self.heights.shape[1] - 1) - tile[1] * self.tile_size
+        return rows + 1, cols + 1
+
+    def read(self, tile: TileKey, apron: int = 0) -> np.ndarray:
+        if not self.contains(tile):
+            raise KeyError(f"Tile {tile} is outside {self.path}")
+        rows, cols = self.tile_shape(tile)
+        r0, c0 = tile[0] * self.tile_size, tile[1] * self.tile_size
+        # Clamp the apron to the map; missing samples repeat the edge
+        lo_r, hi_r = max(r0 - apron, 0), min(r0 + rows + apron, self.heights.shape[0])
+        lo_c, hi_c = max(c0 - apron, 0), min(c0 + cols + apron, self.heights.shape[1])
+        block = np.asarray(self.heights[lo_r:hi_r, lo_c:hi_c], dtype='f4')
+        pad = ((lo_r - (r0 - apron), (r0 + rows + apron) - hi_r),
+               (lo_c - (c0 - apron), (c0 + cols + apron) - hi_c))
+        return np.pad(block, pad, mode='edge') if any(any(p) for p in pad) else block
+
+
+class ProceduralTileSource(TileSource):
+    """Tiles generated on demand from the fractal_perlin fBm field (unbounded)."""
+
+    def __init__(self, preset: Optional[str] = 'mountainous', seed: int = 42, spacing: float = 2.0,
+                 tile_size: int = 128, scale: Optional[float] = None, octaves: Optional[int] = None,
+                 persistence: Optional[float] = None, lacunarity: Optional[float] = None,
+                 amplitude: Optional[float] = None):
+        """
+        Args:
+            preset: fractal_perlin preset name ('mountainous', 'rolling', 'plateau')
+            seed: Noise seed
+            spacing: Distance between neighbouring samples in world units
+            tile_size: Quads per tile edge
+            (noise overrides as generate_noise_grid)
+        """
+        super().__init__(tile_size, spacing)
+        self.seed = int(seed)
+        self.params = resolve_noise_params(preset, scale=scale, octaves=octaves, persistence=persistence,
+                                           lacunarity=lacunarity, amplitude=amplitude)
+
+    def read(self, tile: TileKey, apron: int = 0) -> np.ndarray:
+        x0, z0 = self.sample_origin(tile)
+        steps = np.arange(-apron, self.tile_size + apron + 1) * self.spacing
+        xv, zv = np.meshgrid(x0 + steps, z0 + steps, indexing='ij')
+
+        # Same field as generate_noise_grid, sampled at world coordinates
+        params = self.params
+        heights = fbm(xv * params['scale'], zv * params['scale'], octaves=params['octaves'],
+                      persistence=params['persistence'], lacunarity=params['lacunarity'], seed=self.seed)
+        return (np.clip(heights, -1.0, 1.0) * params['amplitude']).astype('f4')
+
+
+def build_tile(source: TileSource, tile: TileKey, chunk_size: int = 32, pixel_error: float = 2.0,
+               color: Tuple[float, float, float] = (0.4, 0.6, 0.3)) -> ChunkedTerrain:
+    """
+    Build the terrain object for one tile (safe to run off the main thread).
+
+    Normals are computed with a one-sample apron so they agree with the
+    neighbouring tiles along the shared border.
+    """
+    padded = source.read(tile, apron=1)
+    heights = padded[1:-1, 1:-1]
+    normals = grid_normals(padded, source.spacing)[1:-1, 1:-1]
+
+    half = source.tile_extent / 2.0
+    x0, z0 = source.sample_origin(tile)
+    return ChunkedTerrain(
+        np.ascontiguousarray(heights),
+        source.spacing,
+        position=(x0 + half, 0.0, z0 + half),
+        color=color,
+        bounding_radius=half * math.sqrt(2.0) + float(np.abs(heights).max()),
+        name=f"TerrainTile_{tile[0]}_{tile[1]}",
+        offset=half,
+        chunk_size=chunk_size,
+        pixel_error=pixel_error,
+        normals=normals,
+    )
+
+
+@dataclass
+class StreamedTile:
+    """A built tile and the resources it currently holds."""
+
+    key: TileKey
+    terrain: ChunkedTerrain
+    in_scene: bool = False
+    body_id: Optional[int] = None
+
+
+class TerrainStreamer:
+    """Keeps the terrain tiles around a focus point loaded, drawn and collidable."""
+
+    def __init__(
+        self,
+        scene,
+        source: TileSource,
+        physics_world=None,
+        view_radius: float = 1024.0,
+        collision_radius: float = 128.0,
+        vram_budget_mb: float = 256.0,
+        max_cached_tiles: int = 16,
+        workers: int = 2,
+        chunk_size: int = 32,
+        pixel_error: float = 2.0,
+        color: Tuple[float, float, float] = (0.4, 0.6, 0.3),
+        friction: float = 0.6,
+    ):
+        """
+        Args:
+            scene: Scene the visible tiles are added to
+            source: Where tile heights come from
+            physics_world: PhysicsWorld for tile colliders (None disables collision)
+            view_radius: Tiles within this distance of the focus are drawn
+            collision_radius: Tiles within this distance get a static collider
+            vram_budget_mb: Chunk VAO memory kept for tiles outside the view radius
+            max_cached_tiles: Built tiles kept outside the view radius
+            workers: Worker threads building tiles
+            chunk_size: Max quads per chunk edge within a tile
+            pixel_error: Screen-space error tolerance for chunk LOD
+            color: Terrain color
+            friction: Friction of the tile colliders
+        """
+        self.scene = scene
+        self.source = source
+        self.physics_world = physics_world
+        self.view_radius = float(view_radius)
+        self.collision_radius = float(collision_radius)
+        self.vram_budget = int(vram_budget_mb * 1024 * 1024)
+        self.max_cached_tiles = int(max_cached_tiles)
+        self.chunk_size = int(chunk_size)
+        self.pixel_error = float(pixel_error)
+        self.color = tuple(color)
+        self.friction = float(friction)
+
+        # Least recently seen first
+        self.tiles: OrderedDict[TileKey, StreamedTile] = OrderedDict()
+        self._pending: Dict[TileKey, Future] = {}
+        self._failed: set = set()
+        self._max_pending = max(int(workers), 1) * 2
+        self._executor = ThreadPoolExecutor(max_workers=max(int(workers), 1),
+                                            thread_name_prefix="terrain-tile")
+
+    def tile_distance(self, tile: TileKey, x: float, z: float) -> float:
+        """Horizontal distance from (x, z) to the nearest point of a tile."""
+        x0, z0, x1, z1 = self.source.tile_bounds(tile)
+        dx = max(x0 - x, 0.0, x - x1)
+        dz = max(z0 - z, 0.0, z - z1)
+        return math.hypot(dx, dz)
+
+    def tiles_within(self, x: float, z: float, radius: float) -> List[TileKey]:
+        """Tiles that come within ``radius`` of (x, z), nearest first."""
+        lo_i, lo_j = self.source.tile_at(x - radius, z - radius)
+        hi_i, hi_j = self.source.tile_at(x + radius, z + radius)
+        tiles = []
+        for i in range(lo_i, hi_i + 1):
+            for j in range(lo_j, hi_j + 1):
+                tile = (i, j)
+                if not self.source.contains(tile):
+                    continue
+                distance = self.tile_distance(tile, x, z)
+                if distance <= radius:
+                    tiles.append((distance, tile))
+        tiles.sort()
+        return [tile for _, tile in tiles]
+
+    def update(self, focus, wait_for_collision: bool = False) -> None:
+        """
+        Stream tiles for the current focus position (call once per frame).
+
+        Args:
+            focus: World position to stream around, usually PlayerCharacter.get_position()
+            wait_for_collision: Block until the tiles inside the collision radius
+                are built (e.g. right after spawning, before the first physics step)
+        """
+        x, z = float(focus[0]), float(focus[2])
+        wanted = self.tiles_within(x, z, self.view_radius)
+        wanted_set = set(wanted)
+
+        self._collect_builds()
+        self._request_builds(wanted, wanted_set)
+        if wait_for_collision:
+            near = [key for key in self.tiles_within(x, z, self.collision_radius) if key not in self.tiles]
+            for key in near:
+                if key not in self._pending:
+                    self._pending[key] = self._submit(key)
+            wait([self._pending[key] for key in near])
+            self._collect_builds()
+
+        # Visible tiles go into the scene and become the most recently seen
+        for key, tile in self.tiles.items():
+            visible = key in wanted_set
+            if visible and not tile.in_scene:
+                self.scene.add_object(tile.terrain)
+                tile.in_scene = True
+            elif not visible and tile.in_scene:
+                self.scene.remove_object(tile.terrain)
+                tile.in_scene = False
+        for key in wanted:
+            if key in self.tiles:
+                self.tiles.move_to_end(key)
+
+        if self.physics_world is not None:
+            self._update_colliders(x, z)
+        self._evict(wanted_set)
+
+    def _collect_builds(self):
+        """Take finished tiles from the worker pool."""
+        for key, future in list(self._pending.items()):
+            if not future.done():
+                continue
+            del self._pending[key]
+            if future.cancelled():
+                continue
+            try:
+                terrain = future.result()
+            except Exception as exc:  # pragma: no cover - depends on the source data
+                logger.warning("Terrain tile %s failed to build: %s", key, exc)
+                self._failed.add(key)
+                continue
+            self.tiles[key] = StreamedTile(key, terrain)
+
+    def _request_builds(self, wanted: List[TileKey], wanted_set: set):
+        """Queue the nearest missing tiles and drop queued tiles no longer needed."""
+        for key, future in list(self._pending.items()):
+            if key not in wanted_set and future.cancel():
+                del self._pending[key]
+
+        for key in wanted:
+            if len(self._pending) >= self._max_pending:
+                break
+            if key in self.tiles or key in self._pending or key in self._failed:
+                continue
+            self._pending[key] = self._submit(key)
+
+    def _submit(self, key: TileKey) -> Future:
+        return self._executor.submit(build_tile, self.source, key, self.chunk_size, self.pixel_error, self.color)
+
+    def _update_colliders(self, x: float, z: float):
+        """Create colliders for nearby tiles and destroy far ones."""
+        for key, tile in self.tiles.items():
+            distance = self.tile_distance(key, x, z)
+            if tile.body_id is None and distance <= self.collision_radius:
+                tile.body_id = self._create_collider(tile)
+            elif tile.body_id is not None and distance > self.collision_radius * _COLLISION_HYSTERESIS:
+                self.physics_world.remove_body(tile.body_id)
+                tile.body_id = None
+
+    def _create_collider(self, tile: StreamedTile) -> int:
+        """Static heightfield collider matching the tile's full-resolution grid."""
+        terrain = tile.terrain
+        config = PhysicsBodyConfig(
+            body_type="static",
+            shape="heightfield",
+            heightfield_data=terrain.heights,
+            heightfield_spacing=terrain.spacing,
+            heightfield_origin=(float(terrain.coords[0]), float(terrain.coords[0])),
+            friction=self.friction,
+        )
+        return self.physics_world.create_body(terrain, config).body_id
+
+    def gpu_bytes(self) -> int:
+        """Chunk VAO memory held by all built tiles."""
+        return sum(tile.terrain.gpu_bytes() for tile in self.tiles.values())
+
+    def _evict(self, wanted_set: set):
+        """Drop least recently seen tiles outside the view while over budget."""
+        cached = [key for key in self.tiles if key not in wanted_set]
+        gpu_bytes = self.gpu_bytes()
+        while cached and (gpu_bytes > self.vram_budget or len(cached) > self.max_cached_tiles):
+            tile = self.tiles.pop(cached.pop(0))
+            gpu_bytes -= tile.terrain.gpu_bytes()
+            self._release(tile)
+
+    def _release(self, tile: StreamedTile):
+        if tile.in_scene:
+            self.scene.remove_object(tile.terrain)
+            tile.in_scene = False
+        if tile.body_id is not None and self.physics_world is not None:
+            self.physics_world.remove_body(tile.body_id)
+            tile.body_id = None
+        tile.terrain.release()
+
+    def stats(self) -> Dict[str, float]:
+        """Counts for debug displays."""
+        return {
+            "tiles": len(self.tiles),
+            "visible": sum(tile.in_scene for tile in self.tiles.values()),
+            "pending": len(self._pending),
+            "colliders": sum(tile.body_id is not None for tile in self.tiles.values()),
+            "gpu_mb": self.gpu_bytes() / (1024 * 1024),
+        }
+
+    def shutdown(self):
+        """Stop the workers and release every tile."""
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+        for tile in self.tiles.values():
+            self._release(tile)
+        self.tiles.clear()
@@ -1,9 +1,11 @@
 """
 Debug Module
 
-Provides debugging utilities including on-screen debug overlay.
+Provides debugging utilities including on-screen debug overlay and the
+headless render benchmark.
 """
 
 from .debug_overlay import DebugOverlay
+from .render_benchmark import CameraPath, RenderBenchmark, compare_reports
 
-__all__ = ['DebugOverlay']
+__all__ = ['DebugOverlay', 'CameraPath', 'RenderBenchmark', 'compare_reports']
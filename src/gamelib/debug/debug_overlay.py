@@ -22,6 +22,7 @@ from ..config.settings import (
     DEBUG_SHADOW_RENDERING,
     DEBUG_OVERLAY_BACKGROUND_COLOR,
     DEBUG_OVERLAY_BACKGROUND_PADDING,
+    PROFILER_OVERLAY_AVERAGE_FRAMES,
 )
 
 if TYPE_CHECKING:
@@ -126,8 +127,15 @@ class DebugOverlay:
         from ..config import settings
         render_mode = settings.RENDERING_MODE.capitalize()
         ssao_status = "ON" if settings.SSAO_ENABLED else "OFF"
+        if settings.SSAO_ENABLED:
+            temporal = " +TAA" if settings.SSAO_TEMPORAL_ENABLED else ""
+            ssao_status += f" ({settings.SSAO_RESOLUTION_SCALE:g}x{temporal})"
         lines.append(f"Mode: {render_mode} | SSAO: {ssao_status}")
 
+        resolution_line = self._format_dynamic_resolution()
+        if resolution_line:
+            lines.append(resolution_line)
+
         # Camera info
         cam_pos = camera.position
         lines.append(f"Cam Pos.: [{cam_pos[0]:.1f}, {cam_pos[1]:.1f}, {cam_pos[2]:.1f}]")
@@ -157,6 +165,16 @@ class DebugOverlay:
             lines.append("")
             lines.extend(shadow_lines)
 
+        graph_lines = self._format_render_graph_stats()
+        if graph_lines:
+            lines.append("")
+            lines.extend(graph_lines)
+
+        profiler_lines = self._format_profiler_stats()
+        if profiler_lines:
+            lines.append("")
+            lines.extend(profiler_lines)
+
         # Player movement debug info
         if player:
             player_lines = self._format_player_stats(player)
@@ -166,7 +184,7 @@ class DebugOverlay:
 
         # Controls hint
         lines.append("")
-        lines.append("F3: Toggle overlay | ESC: Release mouse | T: Toggle SSAO")
+        lines.append("F3: Toggle overlay | ESC: Release mouse | T: Toggle SSAO | F6: SSAO quality")
 
         return lines
 
@@ -184,6 +202,10 @@ class DebugOverlay:
             culled = data.get('culled', 0)
             lines.append(f"Frustum[{label}]: {rendered}/{total} rendered (culled {culled})")
 
+            chunks = data.get('terrain_chunks', 0)
+            if chunks:
+                lines.append(f"  Terrain chunks: {chunks} drawn (culled {data.get('terrain_chunks_culled', 0)})")
+
             if DEBUG_SHOW_CULLED_OBJECTS:
                 culled_objects = data.get('culled_objects') or []
                 if culled_objects:
@@ -217,6 +239,51 @@ class DebugOverlay:
 
         return lines
 
+    def _format_dynamic_resolution(self) -> str:
+        controller = getattr(self.pipeline, 'dynamic_resolution', None)
+        if controller is None or not controller.enabled:
+            return ""
+
+        width, height = self.pipeline.render_size
+        smoothed = controller.smoothed_ms
+        gpu = f"{smoothed:.1f}ms" if smoothed is not None else "--"
+        return (
+            f"DynRes: {width}x{height} ({controller.scale:.0%}) | "
+            f"GPU {gpu} / {controller.target_ms:.1f}ms"
+        )
+
+    def _format_render_graph_stats(self) -> List[str]:
+        graph = getattr(self.pipeline, 'deferred_graph', None)
+        if graph is None or not graph.is_compiled or self.pipeline.rendering_mode != "deferred":
+            return []
+
+        stats = graph.memory_stats()
+        mb = 1024 * 1024
+        return [
+            f"RenderGraph: {stats['physical_textures']}/{stats['virtual_textures']} targets"
+            f" | {stats['physical_bytes'] / mb:.1f}MB ({stats['virtual_bytes'] / mb:.1f}MB unaliased)"
+        ]
+
+    def _format_profiler_stats(self) -> List[str]:
+        profiler = getattr(self.pipeline, 'profiler', None)
+        if profiler is None or not getattr(self.pipeline, 'show_profiler', profiler.enabled):
+            return []
+
+        averages = profiler.averages(PROFILER_OVERLAY_AVERAGE_FRAMES)
+        if not averages:
+            return ["Profiler: waiting for GPU results..."]
+
+        total_cpu = sum(data['cpu_ms'] for data in averages.values() if data['depth'] == 0)
+        total_gpu = sum(data['gpu_ms'] for data in averages.values() if data['depth'] == 0)
+        lines = [f"Profiler: CPU {total_cpu:.2f}ms | GPU {total_gpu:.2f}ms"]
+        for name, data in averages.items():
+            indent = "  " * (int(data['depth']) + 1)
+            lines.append(
+                f"{indent}{name}: CPU {data['cpu_ms']:.2f}ms | GPU {data['gpu_ms']:.2f}ms"
+                f" | {int(data['primitives'])} prims"
+            )
+        return lines
+
     def _format_player_stats(self, player: "PlayerCharacter") -> List[str]:
         """
         Format player movement and physics debugging info.
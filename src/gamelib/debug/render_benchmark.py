@@ -0,0 +1,326 @@
+"""
+Render Benchmark
+
+Runs the render pipeline for a fixed number of frames along a scripted camera
+path and summarizes what it measured: frame-time percentiles, per-pass CPU/GPU
+timings from the FrameProfiler, draw calls and frustum culling stats.
+
+Reports are plain JSON so runs on different commits can be diffed, and
+``compare_reports`` flags timings that regressed beyond a threshold. The
+harness itself does not create a GL context; ``tools/benchmark_render.py``
+drives it from a headless (EGL) context.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import moderngl
+import numpy as np
+from pyrr import Vector3
+
+REPORT_VERSION = 1
+PERCENTILES = (50, 95, 99)
+
+
+def summarize(values: Sequence[float]) -> Dict[str, float]:
+    """Mean, min/max and percentiles of a series (all zero when empty)."""
+    if len(values) == 0:
+        return {"mean": 0.0, "min": 0.0, "max": 0.0, **{f"p{p}": 0.0 for p in PERCENTILES}}
+
+    data = np.asarray(values, dtype=np.float64)
+    summary = {
+        "mean": float(data.mean()),
+        "min": float(data.min()),
+        "max": float(data.max()),
+    }
+    for percentile, value in zip(PERCENTILES, np.percentile(data, PERCENTILES)):
+        summary[f"p{percentile}"] = float(value)
+    return summary
+
+
+class DrawCallCounter:
+    """Counts VertexArray.render calls issued while installed."""
+
+    def __init__(self):
+        self.count = 0
+
+    @contextlib.contextmanager
+    def install(self) -> Iterator["DrawCallCounter"]:
+        original = moderngl.VertexArray.render
+        counter = self
+
+        def render(vao, *args, **kwargs):
+            counter.count += 1
+            return original(vao, *args, **kwargs)
+
+        moderngl.VertexArray.render = render
+        try:
+            yield self
+        finally:
+            moderngl.VertexArray.render = original
+
+    def take(self) -> int:
+        """Return the count since the last call and reset it."""
+        count, self.count = self.count, 0
+        return count
+
+
+@dataclass(frozen=True)
+class CameraKeyframe:
+    position: Tuple[float, float, float]
+    target: Tuple[float, float, float]
+
+
+class CameraPath:
+    """
+    Piecewise-linear camera path sampled by normalized time.
+
+    Keyframes are evenly spaced in time; ``sample(0)`` is the first keyframe and
+    ``sample(1)`` the last.
+    """
+
+    def __init__(self, keyframes: Sequence[CameraKeyframe]):
+        if not keyframes:
+            raise ValueError("CameraPath requires at least one keyframe")
+        self.keyframes = list(keyframes)
+
+    @classmethod
+    def orbit(
+        cls,
+        target: Sequence[float],
+        radius: float,
+        height: float,
+        segments: int = 32,
+    ) -> "CameraPath":
+        """One full revolution around ``target`` at the given radius and height."""
+        cx, cy, cz = (float(v) for v in target)
+        keyframes = []
+        for index in range(segments + 1):
+            angle = 2.0 * math.pi * index / segments
+            position = (cx + radius * math.sin(angle), cy + height, cz + radius * math.cos(angle))
+            keyframes.append(CameraKeyframe(position, (cx, cy, cz)))
+        return cls(keyframes)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "CameraPath":
+        """Build from ``{"keyframes": [{"position": [...], "target": [...]}, ...]}``."""
+        keyframes = [
+            CameraKeyframe(tuple(map(float, frame["position"])), tuple(map(float, frame["target"])))
+            for frame in data.get("keyframes", [])
+        ]
+        return cls(keyframes)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "CameraPath":
+        with Path(path).open("r", encoding="utf-8") as handle:
+            return cls.from_dict(json.load(handle))
+
+    def sample(self, t: float) -> CameraKeyframe:
+        """Interpolated keyframe at normalized time ``t`` (clamped to [0, 1])."""
+        if len(self.keyframes) == 1:
+            return self.keyframes[0]
+
+        t = min(max(float(t), 0.0), 1.0)
+        scaled = t * (len(self.keyframes) - 1)
+        index = min(int(scaled), len(self.keyframes) - 2)
+        alpha = scaled - index
+        start, end = self.keyframes[index], self.keyframes[index + 1]
+
+        def lerp(a, b):
+            return tuple(x + (y - x) * alpha for x, y in zip(a, b))
+
+        return CameraKeyframe(lerp(start.position, end.position), lerp(start.target, end.target))
+
+    def apply(self, camera, t: float):
+        """Move a Camera to the path position at ``t``."""
+        frame = self.sample(t)
+        camera.position = Vector3(frame.position)
+        camera.target = Vector3(frame.target)
+
+
+class RenderBenchmark:
+    """
+    Drives RenderPipeline.render_frame for a fixed number of frames.
+
+    Frames use a fixed time step and every frame is finished (``ctx.finish``)
+    before the next starts, so wall times measure the whole frame rather than
+    how far the driver let the CPU run ahead.
+
+    Usage:
+        benchmark = RenderBenchmark(pipeline, scene, lights, camera, path)
+        report = benchmark.run(frames=300, warmup=30)
+    """
+
+    def __init__(self, pipeline, scene, lights, camera, path: CameraPath, time_step: float = 1.0 / 60.0):
+        self.pipeline = pipeline
+        self.scene = scene
+        self.lights = lights
+        self.camera = camera
+        self.path = path
+        self.time_step = time_step
+
+    def _render(self, index: int, t: float):
+        self.path.apply(self.camera, t)
+        self.pipeline.render_frame(self.scene, self.camera, self.lights, time=index * self.time_step)
+
+    def run(self, frames: int, warmup: int = 0) -> Dict[str, object]:
+        """
+        Render ``warmup`` untimed frames then ``frames`` timed ones.
+
+        Returns:
+            Report dictionary (see ``build_report``)
+        """
+        if frames <= 0:
+            raise ValueError("Benchmark requires at least one frame")
+
+        ctx = self.pipeline.ctx
+        profiler = self.pipeline.profiler
+        profiler.enabled = True
+
+        for index in range(warmup):
+            self._render(index, 0.0)
+        ctx.finish()
+        profiler.reset(history_length=frames)
+
+        wall_ms: List[float] = []
+        draw_calls: List[int] = []
+        culling: List[Dict[str, Dict[str, object]]] = []
+        counter = DrawCallCounter()
+
+        with counter.install():
+            for index in range(frames):
+                t = index / (frames - 1) if frames > 1 else 0.0
+                start = time.perf_counter()
+                self._render(warmup + index, t)
+                ctx.finish()
+                wall_ms.append((time.perf_counter() - start) * 1000.0)
+                draw_calls.append(counter.take())
+                culling.append({label: dict(stats) for label, stats in self.scene.last_render_stats.items()})
+
+        profiler.flush()
+        return build_report(list(profiler.history), wall_ms, draw_calls, culling, warmup=warmup)
+
+
+def build_report(
+    timings,
+    wall_ms: Sequence[float],
+    draw_calls: Sequence[int],
+    culling: Sequence[Dict[str, Dict[str, object]]],
+    warmup: int = 0,
+) -> Dict[str, object]:
+    """
+    Summarize raw per-frame measurements.
+
+    Args:
+        timings: FrameTiming list from the profiler
+        wall_ms: Wall-clock time per frame
+        draw_calls: Draw calls per frame
+        culling: Scene.last_render_stats snapshot per frame
+        warmup: Untimed frames rendered before measuring
+    """
+    pass_cpu: Dict[str, List[float]] = {}
+    pass_gpu: Dict[str, List[float]] = {}
+    pass_totals: Dict[str, Dict[str, float]] = {}
+    for frame in timings:
+        frame_cpu: Dict[str, float] = {}
+        frame_gpu: Dict[str, float] = {}
+        for timing in frame.passes:
+            frame_cpu[timing.name] = frame_cpu.get(timing.name, 0.0) + timing.cpu_ms
+            frame_gpu[timing.name] = frame_gpu.get(timing.name, 0.0) + timing.gpu_ms
+            totals = pass_totals.setdefault(
+                timing.name, {"depth": timing.depth, "samples": 0.0, "primitives": 0.0}
+            )
+            totals["samples"] += timing.samples
+            totals["primitives"] += timing.primitives
+        for name, value in frame_cpu.items():
+            pass_cpu.setdefault(name, []).append(value)
+            pass_gpu.setdefault(name, []).append(frame_gpu[name])
+
+    frame_count = max(len(timings), 1)
+    passes = {
+        name: {
+            "depth": totals["depth"],
+            "cpu_ms": summarize(pass_cpu[name]),
+            "gpu_ms": summarize(pass_gpu[name]),
+            "samples": totals["samples"] / frame_count,
+            "primitives": totals["primitives"] / frame_count,
+        }
+        for name, totals in pass_totals.items()
+    }
+
+    culling_summary: Dict[str, Dict[str, float]] = {}
+    for label in (culling[-1] if culling else {}):
+        samples = [frame[label] for frame in culling if label in frame]
+        culling_summary[label] = {
+            "total": float(samples[-1].get("total", 0)),
+            "rendered": float(np.mean([s.get("rendered", 0) for s in samples])),
+            "culled": float(np.mean([s.get("culled", 0) for s in samples])),
+        }
+        if any(s.get("terrain_chunks") for s in samples):
+            culling_summary[label]["terrain_chunks"] = float(np.mean([s.get("terrain_chunks", 0) for s in samples]))
+            culling_summary[label]["terrain_chunks_culled"] = float(
+                np.mean([s.get("terrain_chunks_culled", 0) for s in samples])
+            )
+
+    return {
+        "version": REPORT_VERSION,
+        "frames": len(wall_ms),
+        "warmup": warmup,
+        "frame_ms": {
+            "wall": summarize(wall_ms),
+            "cpu": summarize([frame.cpu_ms for frame in timings]),
+            "gpu": summarize([frame.gpu_ms for frame in timings]),
+        },
+        "passes": passes,
+        "draw_calls": summarize(draw_calls),
+        "culling": culling_summary,
+    }
+
+
+def compare_reports(
+    baseline: Dict[str, object],
+    current: Dict[str, object],
+    threshold: float = 0.10,
+    min_delta_ms: float = 0.05,
+    percentiles: Sequence[str] = ("p50", "p95"),
+) -> List[str]:
+    """
+    List timings in ``current`` that regressed against ``baseline``.
+
+    A value regresses when it is more than ``threshold`` (relative) and more
+    than ``min_delta_ms`` (absolute) slower; the absolute floor keeps
+    sub-millisecond passes from tripping on timer noise.
+
+    Returns:
+        Human-readable regression lines (empty when nothing regressed)
+    """
+    regressions: List[str] = []
+
+    def check(label: str, old: Optional[Dict[str, float]], new: Optional[Dict[str, float]]):
+        if not old or not new:
+            return
+        for key in percentiles:
+            before, after = old.get(key, 0.0), new.get(key, 0.0)
+            delta = after - before
+            if delta > min_delta_ms and delta > before * threshold:
+                change = f"+{delta / before * 100.0:.1f}%" if before > 0 else "new"
+                regressions.append(f"{label} {key}: {before:.3f} -> {after:.3f} ms ({change})")
+
+    for kind in ("wall", "cpu", "gpu"):
+        check(f"frame {kind}", baseline["frame_ms"].get(kind), current["frame_ms"].get(kind))
+
+    for name, timing in current.get("passes", {}).items():
+        old = baseline.get("passes", {}).get(name)
+        if old is None:
+            continue
+        check(f"pass {name} cpu", old.get("cpu_ms"), timing.get("cpu_ms"))
+        check(f"pass {name} gpu", old.get("gpu_ms"), timing.get("gpu_ms"))
+
+    return regressions
@@ -9,6 +9,7 @@ API:
  - perlin(x, y, seed=0): scalar or numpy-array inputs -> noise in [-1,1]
  - fbm(x, y, octaves=4, persistence=0.5, lacunarity=2.0, seed=0)
  - generate_noise_grid(resolution, scale, world_size, preset, seed, amplitude)
+ - resolve_noise_params(preset, ...): preset/default fBm parameters
  - save_heightmap(path, heights, metadata, json_fallback=False)
 
 All functions are pure Python and use numpy for array work.
@@ -22,6 +23,8 @@ import json
 import os
 from typing import Tuple, Dict, Any
 
+from ..physics.mesh_io import write_rows
+
 
 def _make_perm(seed: int) -> np.ndarray:
     rng = np.random.RandomState(seed)
@@ -113,14 +116,10 @@ PRESETS: Dict[str, Dict[str, Any]] = {
 }
 
 
-def generate_noise_grid(resolution: int = 100, *, scale: float = 0.01, world_size: float = 400.0,
-                        preset: str | None = 'mountainous', seed: int = 42,
-                        octaves: int | None = None, persistence: float | None = None,
-                        lacunarity: float | None = None, amplitude: float | None = None) -> Tuple[np.ndarray, Dict[str, Any]]:
-    """Generate a height grid (resolution x resolution) and return heights and metadata.
-
-    The noise field is sampled across [-world_size/2, world_size/2] in X and Z.
-    """
+def resolve_noise_params(preset: str | None = 'mountainous', *, scale: float | None = 0.01,
+                         octaves: int | None = None, persistence: float | None = None,
+                         lacunarity: float | None = None, amplitude: float | None = None) -> Dict[str, Any]:
+    """Fill unset fBm parameters from a preset, then from fallback defaults."""
     if preset and preset in PRESETS:
         p = PRESETS[preset]
         if scale is None or scale == 0.01:  # Use preset if default value
@@ -135,11 +134,30 @@ def generate_noise_grid(resolution: int = 100, *, scale: float = 0.01, world_siz
             amplitude = p['amplitude']
 
     # Fallback defaults
-    scale = float(scale or 0.01)
-    octaves = int(octaves or 4)
-    persistence = float(persistence or 0.5)
-    lacunarity = float(lacunarity or 2.0)
-    amplitude = float(amplitude or 50.0)
+    return dict(
+        scale=float(scale or 0.01),
+        octaves=int(octaves or 4),
+        persistence=float(persistence or 0.5),
+        lacunarity=float(lacunarity or 2.0),
+        amplitude=float(amplitude or 50.0),
+    )
+
+
+def generate_noise_grid(resolution: int = 100, *, scale: float = 0.01, world_size: float = 400.0,
+                        preset: str | None = 'mountainous', seed: int = 42,
+                        octaves: int | None = None, persistence: float | None = None,
+                        lacunarity: float | None = None, amplitude: float | None = None) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """Generate a height grid (resolution x resolution) and return heights and metadata.
+
+    The noise field is sampled across [-world_size/2, world_size/2] in X and Z.
+    """
+    params = resolve_noise_params(preset, scale=scale, octaves=octaves, persistence=persistence,
+                                  lacunarity=lacunarity, amplitude=amplitude)
+    scale = params['scale']
+    octaves = params['octaves']
+    persistence = params['persistence']
+    lacunarity = params['lacunarity']
+    amplitude = params['amplitude']
 
     # Create sample grid in world coordinates
     xs = np.linspace(-world_size / 2.0, world_size / 2.0, resolution)
@@ -191,30 +209,23 @@ def export_obj(path: str, heights: np.ndarray, world_size: float) -> None:
     """Export a simple OBJ mesh for the heightmap. Vertices are laid out on X,Z plane.
 
     Faces are two triangles per grid cell. Normals and UVs are not included (simple mesh).
+    Lines are formatted a block of rows at a time rather than one write per line.
     """
     res_x, res_z = heights.shape
     dx = world_size / (res_x - 1)
     dz = world_size / (res_z - 1)
 
-    with open(path, 'w') as fh:
-        # vertices
-        for i in range(res_x):
-            for j in range(res_z):
-                x = -world_size / 2.0 + i * dx
-                z = -world_size / 2.0 + j * dz
-                y = float(heights[i, j])
-                fh.write(f"v {x:.6f} {y:.6f} {z:.6f}\n")
-
-        # faces (1-based indexing)
-        def idx(i, j):
-            return i * res_z + j + 1
-
-        for i in range(res_x - 1):
-            for j in range(res_z - 1):
-                v0 = idx(i, j)
-                v1 = idx(i + 1, j)
-                v2 = idx(i + 1, j + 1)
-                v3 = idx(i, j + 1)
-                # two triangles v0,v1,v2 and v0,v2,v3
-                fh.write(f"f {v0} {v1} {v2}\n")
-                fh.write(f"f {v0} {v2} {v3}\n")
+    # vertices, row-major over (i, j)
+    x, z = np.meshgrid(-world_size / 2.0 + np.arange(res_x) * dx,
+                       -world_size / 2.0 + np.arange(res_z) * dz, indexing='ij')
+    vertices = np.stack([x, np.asarray(heights, dtype=np.float64), z], axis=-1).reshape(-1, 3)
+
+    # faces (1-based indexing): two triangles v0,v1,v2 and v0,v2,v3 per cell
+    v0 = (np.arange(res_x - 1)[:, None] * res_z + np.arange(res_z - 1)[None, :]).ravel() + 1
+    v1, v2, v3 = v0 + res_z, v0 + res_z + 1, v0 + 1
+    faces = np.stack([np.stack([v0, v1, v2], 1), np.stack([v0, v2, v3], 1)], axis=1).reshape(-1, 3)
+
+    with open(path, 'w', buffering=1 << 20) as fh:
+        write_rows(fh, "v %.6f %.6f %.6f\n", vertices)
+        write_rows(fh, "f %d %d %d\n", faces)
+
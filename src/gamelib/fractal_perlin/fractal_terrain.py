@@ -6,6 +6,8 @@ Description: Generate realistic mountain terrain using fractal Perlin noise
 """
 
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
 from typing import Tuple, Optional
 import math
 
@@ -13,6 +15,10 @@ import math
 class PerlinNoise:
     """Basic Perlin noise implementation for terrain generation."""
     
+    # Gradient directions indexed by ``hash & 3`` (matches _grad).
+    # Multiplying by +-1 is exact, so the lookup gives the same bits as _grad.
+    GRADIENTS = np.array([[1.0, 1.0], [-1.0, 1.0], [1.0, -1.0], [-1.0, -1.0]])
+    
     def __init__(self, seed: int = 42):
         """Initialize Perlin noise with a seed for reproducibility."""
         np.random.seed(seed)
@@ -43,39 +49,49 @@ class PerlinNoise:
     def noise(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
         """Generate 2D Perlin noise."""
         # Find unit grid cell containing point
-        xi = np.floor(x).astype(int) & 255
-        yi = np.floor(y).astype(int) & 255
+        x0 = np.floor(x)
+        y0 = np.floor(y)
+        xi = x0.astype(int) & 255
+        yi = y0.astype(int) & 255
         
         # Find relative x,y of point in cell
-        xf = x - np.floor(x)
-        yf = y - np.floor(y)
+        xf = x - x0
+        yf = y - y0
         
         # Compute fade curves
         u = self._fade(xf)
         v = self._fade(yf)
         
         # Hash coordinates of the 4 cube corners
-        aa = self.permutation[self.permutation[xi] + yi]
-        ab = self.permutation[self.permutation[xi] + yi + 1]
-        ba = self.permutation[self.permutation[xi + 1] + yi]
-        bb = self.permutation[self.permutation[xi + 1] + yi + 1]
+        a = self.permutation[xi] + yi
+        b = self.permutation[xi + 1] + yi
+        aa = self.permutation[a]
+        ab = self.permutation[a + 1]
+        ba = self.permutation[b]
+        bb = self.permutation[b + 1]
         
         # Calculate gradient contributions from each corner
-        result = np.zeros_like(x)
-        for i in range(x.shape[0]):
-            for j in range(x.shape[1]):
-                # Gradients at corners
-                g_aa = self._grad(aa[i, j], xf[i, j], yf[i, j])
-                g_ba = self._grad(ba[i, j], xf[i, j] - 1, yf[i, j])
-                g_ab = self._grad(ab[i, j], xf[i, j], yf[i, j] - 1)
-                g_bb = self._grad(bb[i, j], xf[i, j] - 1, yf[i, j] - 1)
-                
-                # Interpolate
-                x1 = self._lerp(u[i, j], g_aa, g_ba)
-                x2 = self._lerp(u[i, j], g_ab, g_bb)
-                result[i, j] = self._lerp(v[i, j], x1, x2)
+        gradients = self.GRADIENTS.astype(xf.dtype)
+        grad_x = np.ascontiguousarray(gradients[:, 0])
+        grad_y = np.ascontiguousarray(gradients[:, 1])
+        xf1 = xf - 1
+        yf1 = yf - 1
+        g_aa = self._grad_array(grad_x, grad_y, aa, xf, yf)
+        g_ba = self._grad_array(grad_x, grad_y, ba, xf1, yf)
+        g_ab = self._grad_array(grad_x, grad_y, ab, xf, yf1)
+        g_bb = self._grad_array(grad_x, grad_y, bb, xf1, yf1)
         
-        return result
+        # Interpolate
+        x1 = self._lerp(u, g_aa, g_ba)
+        x2 = self._lerp(u, g_ab, g_bb)
+        return self._lerp(v, x1, x2)
+
+    @staticmethod
+    def _grad_array(grad_x: np.ndarray, grad_y: np.ndarray, hash_vals: np.ndarray,
+                    x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Vectorized _grad: look up each corner's gradient by hash."""
+        h = hash_vals & 3
+        return grad_x[h] * x + grad_y[h] * y
 
 
 class FractalTerrain:
@@ -357,6 +373,68 @@ class TerrainErosion:
         
         return self.terrain
     
+    def hydraulic_erosion_batched(self,
+                                  iterations: int = 50000,
+                                  rain_amount: float = 0.01,
+                                  evaporation_rate: float = 0.01,
+                                  sediment_capacity: float = 4.0,
+                                  deposition_rate: float = 0.3,
+                                  erosion_rate: float = 0.3,
+                                  gravity: float = 4.0,
+                                  max_lifetime: int = 30,
+                                  inertia: float = 0.05,
+                                  batch_size: int = 4096,
+                                  seed: Optional[int] = None,
+                                  tile_size: Optional[int] = None,
+                                  workers: Optional[int] = None) -> np.ndarray:
+        """
+        Hydraulic erosion with many droplets advanced in lockstep.
+        
+        Same droplet model and starting positions as hydraulic_erosion, but
+        ``batch_size`` droplets take each lifetime step together as arrays and
+        their erosion/deposition is scattered into the heightmap with
+        np.add.at. Droplets in a batch see the terrain as of the previous step
+        rather than each other's changes from the current one, so results
+        match the serial version statistically, not exactly.
+        
+        Args:
+            iterations .. inertia: As for hydraulic_erosion
+            batch_size: Droplets simulated in lockstep
+            seed: Seed for droplet starting positions (None = global np.random,
+                  consuming it exactly like hydraulic_erosion)
+            tile_size: If set, split the map into tiles of this size (grown to
+                       at least twice the droplet travel distance) and erode
+                       them in a process pool, four non-touching phases at a time
+            workers: Worker processes for the tiled mode (None = CPU count,
+                     1 = run tiles in this process)
+            
+        Returns:
+            Eroded terrain
+        """
+        params = _DropletParams(
+            rain_amount=rain_amount,
+            evaporation_rate=evaporation_rate,
+            sediment_capacity=sediment_capacity,
+            deposition_rate=deposition_rate,
+            erosion_rate=erosion_rate,
+            gravity=gravity,
+            max_lifetime=max_lifetime,
+            inertia=inertia,
+        )
+        
+        # Draw (x, y) per droplet in the same order as the serial loop
+        rng = np.random if seed is None else np.random.RandomState(seed)
+        samples = rng.random_sample((iterations, 2))
+        start_x = 1 + (self.width - 3) * samples[:, 0]
+        start_y = 1 + (self.height - 3) * samples[:, 1]
+        
+        if tile_size is None:
+            _erode_droplets(self.terrain, start_x, start_y, params, batch_size)
+        else:
+            _erode_tiled(self.terrain, start_x, start_y, params, batch_size, tile_size, workers)
+        
+        return self.terrain
+    
     def thermal_erosion(self,
                         iterations: int = 50,
                         talus_angle: float = 0.5,
@@ -407,6 +485,198 @@ class TerrainErosion:
         return self.terrain
 
 
+@dataclass(frozen=True)
+class _DropletParams:
+    """Droplet model constants shared by the batched erosion workers."""
+    rain_amount: float
+    evaporation_rate: float
+    sediment_capacity: float
+    deposition_rate: float
+    erosion_rate: float
+    gravity: float
+    max_lifetime: int
+    inertia: float
+
+
+def _sample_bilinear(flat: np.ndarray, width: int, index: np.ndarray,
+                     cell_x: np.ndarray, cell_y: np.ndarray):
+    """Corner heights at flat ``index`` and the bilinear height between them."""
+    h00 = flat[index]
+    h01 = flat[index + 1]
+    h10 = flat[index + width]
+    h11 = flat[index + width + 1]
+    height = (h00 * (1 - cell_x) + h01 * cell_x) * (1 - cell_y) + \
+             (h10 * (1 - cell_x) + h11 * cell_x) * cell_y
+    return h00, h01, h10, h11, height
+
+
+def _erode_droplets(terrain: np.ndarray, start_x: np.ndarray, start_y: np.ndarray,
+                    params: _DropletParams, batch_size: int) -> np.ndarray:
+    """Run droplets through ``terrain`` in place, ``batch_size`` at a time."""
+    height, width = terrain.shape
+    work = terrain if terrain.flags.c_contiguous else np.ascontiguousarray(terrain)
+    flat = work.reshape(-1)
+    batch_size = max(1, int(batch_size))
+    
+    for begin in range(0, len(start_x), batch_size):
+        pos_x = start_x[begin:begin + batch_size].astype(float)
+        pos_y = start_y[begin:begin + batch_size].astype(float)
+        count = len(pos_x)
+        dir_x = np.zeros(count)
+        dir_y = np.zeros(count)
+        speed = np.ones(count)
+        water = np.full(count, params.rain_amount)
+        sediment = np.zeros(count)
+        
+        for _ in range(params.max_lifetime):
+            grid_x = pos_x.astype(int)
+            grid_y = pos_y.astype(int)
+            inside = (grid_x > 0) & (grid_x < width - 1) & (grid_y > 0) & (grid_y < height - 1)
+            
+            cell_x = pos_x - grid_x
+            cell_y = pos_y - grid_y
+            index = grid_y * width + grid_x
+            index[~inside] = 0
+            h00, h01, h10, h11, current = _sample_bilinear(flat, width, index, cell_x, cell_y)
+            
+            grad_x = (h01 - h00) * (1 - cell_y) + (h11 - h10) * cell_y
+            grad_y = (h10 - h00) * (1 - cell_x) + (h11 - h01) * cell_x
+            
+            # Update direction with inertia and normalize
+            new_dir_x = grad_x * (1 - params.inertia) - dir_x * params.inertia
+            new_dir_y = grad_y * (1 - params.inertia) - dir_y * params.inertia
+            dir_len = np.sqrt(new_dir_x ** 2 + new_dir_y ** 2)
+            moving = dir_len > 0
+            safe_len = np.where(moving, dir_len, 1.0)
+            dir_x = new_dir_x / safe_len
+            dir_y = new_dir_y / safe_len
+            pos_x = pos_x + dir_x
+            pos_y = pos_y + dir_y
+            
+            # Droplets that left the map or stalled stop without eroding
+            alive = inside & moving & (pos_x >= 1) & (pos_x < width - 1) & \
+                    (pos_y >= 1) & (pos_y < height - 1)
+            if not alive.all():
+                pos_x, pos_y = pos_x[alive], pos_y[alive]
+                dir_x, dir_y = dir_x[alive], dir_y[alive]
+                speed, water, sediment = speed[alive], water[alive], sediment[alive]
+                index, cell_x, cell_y = index[alive], cell_x[alive], cell_y[alive]
+                current = current[alive]
+            if len(pos_x) == 0:
+                break
+            
+            new_grid_x = pos_x.astype(int)
+            new_grid_y = pos_y.astype(int)
+            new_height = _sample_bilinear(
+                flat, width, new_grid_y * width + new_grid_x,
+                pos_x - new_grid_x, pos_y - new_grid_y,
+            )[4]
+            height_diff = new_height - current
+            capacity = np.maximum(-height_diff, 0.01) * speed * water * params.sediment_capacity
+            
+            # Positive change deposits, negative erodes (serial branch logic)
+            deposit = (sediment > capacity) | (height_diff > 0)
+            deposited = np.where(
+                height_diff > 0,
+                np.minimum(height_diff, sediment),
+                (sediment - capacity) * params.deposition_rate,
+            )
+            eroded = np.minimum((capacity - sediment) * params.erosion_rate, -height_diff)
+            change = np.where(deposit, deposited, -eroded)
+            sediment = sediment - change
+            
+            weights = np.concatenate([
+                change * (1 - cell_x) * (1 - cell_y),
+                change * cell_x * (1 - cell_y),
+                change * (1 - cell_x) * cell_y,
+                change * cell_x * cell_y,
+            ])
+            np.add.at(flat, np.concatenate([index, index + 1, index + width, index + width + 1]), weights)
+            
+            # Clamp keeps uphill moves that would stop the droplet from going NaN
+            speed = np.sqrt(np.maximum(speed * speed + height_diff * params.gravity, 0.0))
+            water = water * (1 - params.evaporation_rate)
+            
+            if not (water > 0).all():
+                keep = water > 0
+                pos_x, pos_y = pos_x[keep], pos_y[keep]
+                dir_x, dir_y = dir_x[keep], dir_y[keep]
+                speed, water, sediment = speed[keep], water[keep], sediment[keep]
+    
+    if work is not terrain:
+        terrain[...] = work
+    return terrain
+
+
+def _erode_tile(region: np.ndarray, start_x: np.ndarray, start_y: np.ndarray,
+                params: _DropletParams, batch_size: int) -> np.ndarray:
+    """Process-pool entry point: erode one tile (core plus apron)."""
+    return _erode_droplets(region, start_x, start_y, params, batch_size)
+
+
+def _erode_tiled(terrain: np.ndarray, start_x: np.ndarray, start_y: np.ndarray,
+                 params: _DropletParams, batch_size: int, tile_size: int,
+                 workers: Optional[int]) -> np.ndarray:
+    """
+    Erode ``terrain`` in tiles, in parallel where tiles cannot interact.
+    
+    Each droplet belongs to the tile it starts in and is simulated on that
+    tile plus an apron as wide as it can travel, so it behaves as it would on
+    the full map. Tiles are processed in four phases (a 2x2 checkerboard);
+    tiles within a phase are at least one tile apart, so with tiles at least
+    twice the apron their regions never overlap and can be written back
+    directly. Output does not depend on the number of workers.
+    """
+    height, width = terrain.shape
+    apron = params.max_lifetime + 2
+    tile_size = max(int(tile_size), 2 * apron)
+    tiles_x = -(-width // tile_size)
+    tiles_y = -(-height // tile_size)
+    
+    tile_of = (start_y.astype(int) // tile_size) * tiles_x + (start_x.astype(int) // tile_size)
+    
+    def region_of(tx: int, ty: int):
+        x0 = max(tx * tile_size - apron, 0)
+        y0 = max(ty * tile_size - apron, 0)
+        x1 = min((tx + 1) * tile_size + apron, width)
+        y1 = min((ty + 1) * tile_size + apron, height)
+        return x0, y0, x1, y1
+    
+    executor = ProcessPoolExecutor(max_workers=workers) if workers != 1 else None
+    try:
+        for phase_y in range(2):
+            for phase_x in range(2):
+                jobs = []
+                for ty in range(phase_y, tiles_y, 2):
+                    for tx in range(phase_x, tiles_x, 2):
+                        members = np.nonzero(tile_of == ty * tiles_x + tx)[0]
+                        if len(members) == 0:
+                            continue
+                        x0, y0, x1, y1 = region_of(tx, ty)
+                        args = (
+                            terrain[y0:y1, x0:x1].copy(),
+                            start_x[members] - x0,
+                            start_y[members] - y0,
+                            params,
+                            batch_size,
+                        )
+                        if executor is None:
+                            result = _erode_tile(*args)
+                        else:
+                            result = executor.submit(_erode_tile, *args)
+                        jobs.append(((x0, y0, x1, y1), result))
+                
+                for (x0, y0, x1, y1), result in jobs:
+                    if executor is not None:
+                        result = result.result()
+                    terrain[y0:y1, x0:x1] = result
+    finally:
+        if executor is not None:
+            executor.shutdown()
+    
+    return terrain
+
+
 def generate_mountain_terrain(width: int = 512,
                              height: int = 512,
                              seed: int = 42,
@@ -422,6 +692,7 @@ def generate_mountain_terrain(width: int = 512,
                              # Hydraulic erosion
                              hydraulic_iterations: int = 30000,
                              erosion_rate: float = 0.3,
+                             batched_erosion: bool = True,
                              # Thermal erosion  
                              thermal_iterations: int = 20,
                              talus_angle: float = 0.4) -> np.ndarray:
@@ -442,6 +713,7 @@ def generate_mountain_terrain(width: int = 512,
         warp_strength: Strength of domain warping (0.05-0.2)
         hydraulic_iterations: Number of water droplets to simulate
         erosion_rate: Hydraulic erosion strength (0.2-0.5)
+        batched_erosion: Use the lockstep droplet engine (False = serial loop)
         thermal_iterations: Number of thermal erosion passes
         talus_angle: Maximum stable slope (0.3-0.6)
     
@@ -467,7 +739,8 @@ def generate_mountain_terrain(width: int = 512,
     
     # Hydraulic erosion
     if hydraulic_iterations > 0:
-        terrain = erosion.hydraulic_erosion(
+        erode = erosion.hydraulic_erosion_batched if batched_erosion else erosion.hydraulic_erosion
+        terrain = erode(
             iterations=hydraulic_iterations,
             erosion_rate=erosion_rate
         )
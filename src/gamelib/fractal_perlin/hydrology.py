@@ -0,0 +1,244 @@
+"""
+Terrain Hydrology
+Depression filling, D8 flow routing and flow accumulation for heightmaps,
+used to place rivers where water would actually collect.
+
+ - fill_depressions: raises every pit to its spill level (plus a tiny slope
+   so filled flats still drain), so water can reach the map edge from
+   every cell.
+ - flow_directions: D8 steepest-descent receiver of every cell.
+ - flow_accumulation: number of cells (or total weight) draining through
+   every cell.
+ - drainage_outlets: edge cell that each cell finally drains to.
+ - distance_to_mask: Euclidean distance to the nearest masked cell, for
+   carving valleys around river channels.
+
+Everything works on whole arrays (or whole rows of them); a 2048x2048 map
+takes a few seconds.
+"""
+
+import numpy as np
+from typing import Optional, Tuple
+
+# D8 neighbour offsets (row, col) and their distances
+D8_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+D8_DISTANCES = tuple(float(np.hypot(dy, dx)) for dy, dx in D8_OFFSETS)
+
+
+def _sweep(surface: np.ndarray, heights: np.ndarray, epsilon: float) -> None:
+    """Lower ``surface`` line by line along axis 0 (in place)."""
+    for k in range(1, surface.shape[0]):
+        prev = surface[k - 1]
+        # Lowest of the three neighbours on the previous line
+        lowest = prev.copy()
+        np.minimum(lowest[1:], prev[:-1], out=lowest[1:])
+        np.minimum(lowest[:-1], prev[1:], out=lowest[:-1])
+        line = surface[k]
+        np.minimum(line, lowest + epsilon, out=line)
+        np.maximum(line, heights[k], out=line)
+
+
+def fill_depressions(heights: np.ndarray, epsilon: Optional[float] = None,
+                     max_passes: int = 1000) -> np.ndarray:
+    """
+    Fill every depression up to the level where it spills over.
+
+    Computes the same surface as Priority-Flood+epsilon (Barnes et al. 2014):
+    the lowest surface above the terrain in which every cell has a path to
+    the map edge that descends by at least ``epsilon`` per step. It is found
+    Planchon-Darboux style, lowering the surface from +inf with row and column
+    sweeps in all four directions until nothing changes; each sweep processes
+    a whole row or column at once.
+
+    Args:
+        heights: 2D heightmap
+        epsilon: Minimum drop per cell across filled areas (default: 1e-6 of
+            the height range), so D8 routing never meets a flat
+        max_passes: Safety limit on sweep rounds
+
+    Returns:
+        Filled heightmap (float64, >= heights everywhere)
+    """
+    heights = np.asarray(heights, dtype=np.float64)
+    if heights.ndim != 2 or min(heights.shape) < 3:
+        return heights.copy()
+    if epsilon is None:
+        epsilon = 1e-6 * max(float(heights.max() - heights.min()), 1e-9)
+
+    surface = np.full_like(heights, np.inf)
+    surface[0, :] = heights[0, :]
+    surface[-1, :] = heights[-1, :]
+    surface[:, 0] = heights[:, 0]
+    surface[:, -1] = heights[:, -1]
+
+    # Column sweeps run on a transposed copy so every line is contiguous
+    heights_t = np.ascontiguousarray(heights.T)
+    for _ in range(max_passes):
+        before = surface.copy()
+        _sweep(surface, heights, epsilon)
+        _sweep(surface[::-1], heights[::-1], epsilon)
+        surface_t = np.ascontiguousarray(surface.T)
+        _sweep(surface_t, heights_t, epsilon)
+        _sweep(surface_t[::-1], heights_t[::-1], epsilon)
+        surface = np.ascontiguousarray(surface_t.T)
+        if np.array_equal(before, surface):
+            break
+    return surface
+
+
+def flow_directions(surface: np.ndarray) -> np.ndarray:
+    """
+    D8 flow routing: each cell drains to its steepest downhill neighbour.
+
+    Args:
+        surface: Heightmap without depressions (see fill_depressions)
+
+    Returns:
+        Flat index of each cell's receiver, -1 for outlets (edge cells and
+        any remaining pits); same shape as ``surface``
+    """
+    rows, cols = surface.shape
+    padded = np.pad(np.asarray(surface, dtype=np.float64), 1, constant_values=np.inf)
+    best_drop = np.zeros(surface.shape)
+    best = np.full(surface.shape, -1, dtype=np.int64)
+
+    index = np.arange(rows * cols, dtype=np.int64).reshape(rows, cols)
+    for k, ((dy, dx), distance) in enumerate(zip(D8_OFFSETS, D8_DISTANCES)):
+        neighbour = padded[1 + dy:1 + dy + rows, 1 + dx:1 + dx + cols]
+        drop = (surface - neighbour) / distance
+        steeper = drop > best_drop
+        best_drop[steeper] = drop[steeper]
+        best[steeper] = k
+
+    offsets = np.array([dy * cols + dx for dy, dx in D8_OFFSETS], dtype=np.int64)
+    receivers = np.where(best >= 0, index + offsets[best], -1)
+
+    # Water leaves the map at the edge
+    receivers[0, :] = receivers[-1, :] = -1
+    receivers[:, 0] = receivers[:, -1] = -1
+    return receivers
+
+
+def flow_accumulation(receivers: np.ndarray, weights: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Total weight (default: cell count) draining through every cell.
+
+    Cells are processed in waves from the ridges down: each wave holds the
+    cells whose upstream cells are all done, and passes its totals on to the
+    receivers in one scatter-add.
+
+    Args:
+        receivers: Output of flow_directions
+        weights: Per-cell water contribution (e.g. rainfall); default 1
+
+    Returns:
+        Accumulated flow, same shape as ``receivers``
+    """
+    flat = receivers.ravel()
+    size = flat.size
+    accumulation = np.ones(size) if weights is None else np.asarray(weights, dtype=np.float64).ravel().copy()
+
+    draining = flat >= 0
+    pending = np.bincount(flat[draining], minlength=size)
+    wave = np.flatnonzero(pending == 0)
+    while wave.size:
+        wave = wave[draining[wave]]
+        targets = flat[wave]
+        np.add.at(accumulation, targets, accumulation[wave])
+        np.subtract.at(pending, targets, 1)
+        wave = np.unique(targets[pending[targets] == 0])
+
+    return accumulation.reshape(receivers.shape)
+
+
+def drainage_outlets(receivers: np.ndarray) -> np.ndarray:
+    """Flat index of the outlet each cell drains to (pointer jumping)."""
+    flat = receivers.ravel()
+    outlet = np.where(flat >= 0, flat, np.arange(flat.size))
+    while True:
+        jumped = outlet[outlet]
+        if np.array_equal(jumped, outlet):
+            return outlet.reshape(receivers.shape)
+        outlet = jumped
+
+
+def distance_to_mask(mask: np.ndarray, max_distance: float) -> np.ndarray:
+    """
+    Euclidean distance (in cells) from every cell to the nearest True cell.
+
+    Exact up to ``max_distance``; farther cells get inf. Distances along
+    columns come from running maxima/minima of the masked row indices, then
+    each row takes the best column within reach.
+
+    Args:
+        mask: 2D boolean array
+        max_distance: Largest distance of interest
+    """
+    rows, cols = mask.shape
+    row_index = np.arange(rows, dtype=np.float64)[:, None]
+
+    # Distance to the nearest masked cell in the same column
+    above = np.where(mask, row_index, -np.inf)
+    above = np.maximum.accumulate(above, axis=0)
+    below = np.where(mask, row_index, np.inf)
+    below = np.minimum.accumulate(below[::-1], axis=0)[::-1]
+    column = np.minimum(row_index - above, below - row_index)
+    column_sq = column ** 2
+
+    reach = int(np.floor(max_distance))
+    best = column_sq.copy()
+    for dx in range(1, reach + 1):
+        step = dx * dx
+        np.minimum(best[:, dx:], column_sq[:, :-dx] + step, out=best[:, dx:])
+        np.minimum(best[:, :-dx], column_sq[:, dx:] + step, out=best[:, :-dx])
+
+    distance = np.sqrt(best)
+    distance[distance > max_distance] = np.inf
+    return distance
+
+
+def river_channels(heights: np.ndarray, num_rivers: Optional[int] = None,
+                   min_drainage: float = 0.002) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    River channel cells from flow accumulation.
+
+    Args:
+        heights: 2D heightmap
+        num_rivers: Keep only the channels of this many largest drainage
+            basins (None keeps all)
+        min_drainage: Fraction of the map that must drain through a cell for
+            it to be a channel
+
+    Returns:
+        Tuple of (channel mask, flow accumulation)
+    """
+    receivers = flow_directions(fill_depressions(heights))
+    accumulation = flow_accumulation(receivers)
+    channels = accumulation >= max(min_drainage * accumulation.size, 2.0)
+
+    if num_rivers is not None:
+        outlets = drainage_outlets(receivers)
+        flat_acc = accumulation.ravel()
+        candidates = np.unique(outlets[channels])
+        largest = candidates[np.argsort(flat_acc[candidates])[::-1][:max(int(num_rivers), 0)]]
+        channels &= np.isin(outlets, largest)
+
+    return channels, accumulation
+
+
+def carve_rivers(heights: np.ndarray, num_rivers: Optional[int] = 3, river_depth: float = 0.1,
+                 river_width: float = 3.0,
+                 min_drainage: float = 0.002) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Carve river valleys along the channels of river_channels.
+
+    The valleys are cut in one subtraction, ``river_depth`` deep on the
+    channel and fading out linearly to ``river_width`` cells away.
+
+    Returns:
+        Tuple of (carved heightmap, river mask, flow accumulation)
+    """
+    channels, accumulation = river_channels(heights, num_rivers=num_rivers, min_drainage=min_drainage)
+    distance = distance_to_mask(channels, river_width)
+    carved = heights - river_depth * np.clip(1.0 - distance / river_width, 0.0, 1.0)
+    return carved, distance <= 1, accumulation
@@ -5,7 +5,12 @@ Provides preset configurations and additional features for terrain generation.
 
 import numpy as np
 from typing import Dict, Any, Optional, Tuple
-from fractal_terrain import FractalTerrain, TerrainErosion, PerlinNoise
+try:
+    from .fractal_terrain import FractalTerrain, TerrainErosion, PerlinNoise, generate_mountain_terrain
+    from .hydrology import carve_rivers
+except ImportError:  # Run as a script from this directory
+    from fractal_terrain import FractalTerrain, TerrainErosion, PerlinNoise, generate_mountain_terrain
+    from hydrology import carve_rivers
 
 
 class TerrainPresets:
@@ -148,11 +153,10 @@ class AdvancedTerrain:
         self.height = height
         self.seed = seed
         self.terrain = None
+        self.flow_accumulation = None  # Set by add_rivers
         
     def generate_with_preset(self, preset_name: str) -> np.ndarray:
         """Generate terrain using a preset configuration."""
-        from fractal_terrain import generate_mountain_terrain
-        
         params = TerrainPresets.get_preset(preset_name)
         self.terrain = generate_mountain_terrain(
             width=self.width,
@@ -185,14 +189,22 @@ class AdvancedTerrain:
     def add_rivers(self,
                    num_rivers: int = 3,
                    river_depth: float = 0.1,
-                   river_width: float = 3.0) -> Tuple[np.ndarray, np.ndarray]:
+                   river_width: float = 3.0,
+                   min_drainage: float = 0.002) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Carve river valleys into the terrain.
+        Carve river valleys where water collects.
+        
+        Fills depressions, routes flow downhill (D8) and accumulates it; cells
+        draining more than ``min_drainage`` of the map become river channels.
+        The valleys are carved in one pass, deepest on the channel and fading
+        out linearly to ``river_width`` cells away.
         
         Args:
-            num_rivers: Number of rivers to generate
+            num_rivers: Number of rivers to keep (the largest drainage basins)
             river_depth: How deep to carve the rivers
             river_width: Width of river valleys
+            min_drainage: Fraction of the map that must drain through a cell
+                for it to be part of a river
             
         Returns:
             Tuple of (modified terrain, river mask)
@@ -200,56 +212,9 @@ class AdvancedTerrain:
         if self.terrain is None:
             raise ValueError("Generate terrain first")
         
-        river_mask = np.zeros_like(self.terrain, dtype=bool)
-        
-        for _ in range(num_rivers):
-            # Start from a high point
-            high_points = np.where(self.terrain > np.percentile(self.terrain, 80))
-            if len(high_points[0]) == 0:
-                continue
-                
-            idx = np.random.randint(0, len(high_points[0]))
-            y, x = high_points[0][idx], high_points[1][idx]
-            
-            # Flow downhill
-            path = [(y, x)]
-            visited = set([(y, x)])
-            
-            while True:
-                # Find lowest neighbor
-                neighbors = []
-                for dy, dx in [(-1,0), (1,0), (0,-1), (0,1), (-1,-1), (1,1), (-1,1), (1,-1)]:
-                    ny, nx = y + dy, x + dx
-                    if (0 <= ny < self.height and 0 <= nx < self.width and 
-                        (ny, nx) not in visited):
-                        neighbors.append((self.terrain[ny, nx], ny, nx))
-                
-                if not neighbors:
-                    break
-                    
-                # Move to lowest neighbor
-                neighbors.sort()
-                _, y, x = neighbors[0]
-                path.append((y, x))
-                visited.add((y, x))
-                
-                # Stop if we reach a low point
-                if self.terrain[y, x] < np.percentile(self.terrain, 20):
-                    break
-            
-            # Carve the river valley
-            for y, x in path:
-                # Create a wider valley around the river path
-                for dy in range(int(-river_width), int(river_width)+1):
-                    for dx in range(int(-river_width), int(river_width)+1):
-                        ny, nx = y + dy, x + dx
-                        if 0 <= ny < self.height and 0 <= nx < self.width:
-                            dist = np.sqrt(dy**2 + dx**2)
-                            if dist <= river_width:
-                                depth_factor = 1.0 - (dist / river_width)
-                                self.terrain[ny, nx] -= river_depth * depth_factor
-                                if dist <= 1:
-                                    river_mask[ny, nx] = True
+        self.terrain, river_mask, self.flow_accumulation = carve_rivers(
+            self.terrain, num_rivers, river_depth, river_width, min_drainage
+        )
         
         # Ensure terrain stays in valid range
         self.terrain = np.clip(self.terrain, 0, 1)
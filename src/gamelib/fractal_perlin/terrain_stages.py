@@ -0,0 +1,278 @@
+"""Terrain generation as a stage graph with an on-disk cache.
+
+Runs the generate_mountain_terrain pipeline (plus the AdvancedTerrain
+extras) as a chain of stages:
+
+    noise -> warp -> erosion -> terraces -> rivers
+
+Each stage's output is saved as a ``.npy`` keyed by a hash of the
+parameters that feed it and of the previous stage's key. Changing a
+parameter therefore only reruns its own stage and the ones after it:
+tuning ``erosion_rate`` reuses the cached noise and warp outputs.
+
+Unlike generate_mountain_terrain, hydraulic erosion is seeded from the
+terrain seed so cached results are reproducible.
+
+Example:
+    pipeline = TerrainStagePipeline(512, 512, seed=42, cache_dir='.cache/terrain_stages')
+    terrain, reports = pipeline.run(preset='mountain_range', erosion_rate=0.35)
+    for report in reports:
+        print(report.name, report.status, report.seconds)
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .fractal_terrain import FractalTerrain, TerrainErosion
+from .hydrology import carve_rivers
+
+CACHE_VERSION = 1  # Bump to invalidate every cached stage
+
+# Parameters of the whole graph and their defaults (generate_mountain_terrain's,
+# with terraces and rivers off)
+DEFAULT_PARAMS: Dict[str, Any] = {
+    'octaves': 6,
+    'persistence': 0.5,
+    'lacunarity': 2.0,
+    'scale': 100.0,
+    'ridge_noise': True,
+    'apply_warping': True,
+    'warp_strength': 0.1,
+    'warp_scale': 50.0,
+    'hydraulic_iterations': 30000,
+    'erosion_rate': 0.3,
+    'thermal_iterations': 20,
+    'talus_angle': 0.4,
+    'terrace_levels': 0,
+    'terrace_strength': 0.5,
+    'num_rivers': 0,
+    'river_depth': 0.1,
+    'river_width': 3.0,
+    'min_drainage': 0.002,
+}
+
+
+@dataclass(frozen=True)
+class TerrainStage:
+    """One step of the graph: ``run(terrain, params, pipeline) -> terrain``."""
+    name: str
+    params: Tuple[str, ...]
+    run: Callable[[Optional[np.ndarray], Dict[str, Any], 'TerrainStagePipeline'], np.ndarray]
+    enabled: Callable[[Dict[str, Any]], bool] = lambda params: True
+
+
+@dataclass
+class StageReport:
+    """What happened to one stage in a run."""
+    name: str
+    key: str
+    status: str  # 'hit' (loaded), 'miss' (computed), 'reused' (covered by a later hit), 'off'
+    seconds: float = 0.0
+
+
+def _noise(terrain, params, pipeline):
+    generator = FractalTerrain(pipeline.width, pipeline.height, pipeline.seed)
+    return generator.generate_fractal_noise(
+        octaves=int(params['octaves']),
+        persistence=params['persistence'],
+        lacunarity=params['lacunarity'],
+        scale=params['scale'],
+        ridge_noise=bool(params['ridge_noise']),
+    )
+
+
+def _warp(terrain, params, pipeline):
+    generator = FractalTerrain(pipeline.width, pipeline.height, pipeline.seed)
+    generator.terrain = terrain
+    return generator.apply_domain_warping(params['warp_strength'], params['warp_scale'])
+
+
+def _erosion(terrain, params, pipeline):
+    erosion = TerrainErosion(terrain)
+    if params['hydraulic_iterations'] > 0:
+        erosion.hydraulic_erosion_batched(
+            iterations=int(params['hydraulic_iterations']),
+            erosion_rate=params['erosion_rate'],
+            seed=pipeline.seed,
+        )
+    if params['thermal_iterations'] > 0:
+        erosion.thermal_erosion(
+            iterations=int(params['thermal_iterations']),
+            talus_angle=params['talus_angle'],
+        )
+    # Final normalization, as generate_mountain_terrain
+    terrain = erosion.terrain
+    span = terrain.max() - terrain.min()
+    return (terrain - terrain.min()) / span if span > 0 else np.zeros_like(terrain)
+
+
+def _terraces(terrain, params, pipeline):
+    levels = int(params['terrace_levels'])
+    strength = params['terrace_strength']
+    terraced = np.round(terrain * levels) / levels
+    return terrain * (1 - strength) + terraced * strength
+
+
+def _rivers(terrain, params, pipeline):
+    carved, _, _ = carve_rivers(terrain, int(params['num_rivers']), params['river_depth'],
+                                params['river_width'], params['min_drainage'])
+    return np.clip(carved, 0, 1)
+
+
+STAGES: Tuple[TerrainStage, ...] = (
+    TerrainStage('noise', ('octaves', 'persistence', 'lacunarity', 'scale', 'ridge_noise'), _noise),
+    TerrainStage('warp', ('warp_strength', 'warp_scale'), _warp,
+                 enabled=lambda params: bool(params['apply_warping'])),
+    TerrainStage('erosion', ('hydraulic_iterations', 'erosion_rate', 'thermal_iterations', 'talus_angle'),
+                 _erosion),
+    TerrainStage('terraces', ('terrace_levels', 'terrace_strength'), _terraces,
+                 enabled=lambda params: params['terrace_levels'] > 0),
+    TerrainStage('rivers', ('num_rivers', 'river_depth', 'river_width', 'min_drainage'), _rivers,
+                 enabled=lambda params: params['num_rivers'] > 0),
+)
+
+
+def resolve_params(preset: Optional[str] = None, **overrides: Any) -> Dict[str, Any]:
+    """Graph parameters: defaults, then a TerrainPresets preset, then overrides."""
+    params = dict(DEFAULT_PARAMS)
+    if preset is not None:
+        from .terrain_advanced import TerrainPresets
+        params.update(TerrainPresets.get_preset(preset))
+    unknown = set(overrides) - set(DEFAULT_PARAMS)
+    if unknown:
+        raise ValueError(f"Unknown terrain parameters: {sorted(unknown)}")
+    params.update(overrides)
+    return params
+
+
+def _canonical(value: Any) -> Any:
+    """Hashable form of a parameter, so 100 and 100.0 share a cache entry."""
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return float(value)
+    return str(value)
+
+
+class TerrainStageCache:
+    """Stage outputs stored as ``<stage>-<key>.npy`` files in one directory."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def path(self, stage: str, key: str) -> Path:
+        return self.root / f"{stage}-{key}.npy"
+
+    def load(self, stage: str, key: str) -> Optional[np.ndarray]:
+        try:
+            return np.load(self.path(stage, key))
+        except (OSError, ValueError):
+            return None
+
+    def contains(self, stage: str, key: str) -> bool:
+        return self.path(stage, key).exists()
+
+    def save(self, stage: str, key: str, terrain: np.ndarray) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self.path(stage, key)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npy")
+        np.save(tmp, terrain)
+        os.replace(tmp, path)
+
+    def clear(self) -> int:
+        """Delete every cached stage; returns the number of files removed."""
+        removed = 0
+        if self.root.exists():
+            for path in self.root.glob('*.npy'):
+                path.unlink()
+                removed += 1
+        return removed
+
+
+class TerrainStagePipeline:
+    """Run the stage graph, loading the deepest cached stage and computing the rest."""
+
+    def __init__(self,
+                 width: int = 512,
+                 height: int = 512,
+                 seed: int = 42,
+                 cache_dir: Optional[Path] = None,
+                 stages: Sequence[TerrainStage] = STAGES):
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.cache = TerrainStageCache(cache_dir) if cache_dir is not None else None
+        self.stages = tuple(stages)
+
+    def stage_keys(self, params: Dict[str, Any]) -> List[Optional[str]]:
+        """Cache key of every stage (None when disabled); each folds in the previous key."""
+        keys: List[Optional[str]] = []
+        parent = json.dumps([CACHE_VERSION, self.width, self.height, self.seed])
+        for stage in self.stages:
+            if not stage.enabled(params):
+                keys.append(None)
+                continue
+            payload = json.dumps([parent, stage.name, {name: _canonical(params[name]) for name in stage.params}],
+                                 sort_keys=True)
+            parent = hashlib.sha256(payload.encode('utf-8')).hexdigest()[:20]
+            keys.append(parent)
+        return keys
+
+    def run(self, params: Optional[Dict[str, Any]] = None, preset: Optional[str] = None,
+            **overrides: Any) -> Tuple[np.ndarray, List[StageReport]]:
+        """
+        Generate the terrain.
+
+        Args:
+            params: Full parameter dict (e.g. from resolve_params); if omitted
+                it is built from ``preset`` and ``overrides``
+
+        Returns:
+            Tuple of (terrain, one StageReport per stage)
+        """
+        if params is None:
+            params = resolve_params(preset, **overrides)
+        keys = self.stage_keys(params)
+        reports = [StageReport(stage.name, key or '', 'off' if key is None else 'miss')
+                   for stage, key in zip(self.stages, keys)]
+
+        # Start after the deepest stage already on disk
+        terrain = None
+        start = 0
+        if self.cache is not None:
+            for index in range(len(self.stages) - 1, -1, -1):
+                key = keys[index]
+                if key is None or not self.cache.contains(self.stages[index].name, key):
+                    continue
+                began = time.perf_counter()
+                terrain = self.cache.load(self.stages[index].name, key)
+                if terrain is None:
+                    continue
+                reports[index].status = 'hit'
+                reports[index].seconds = time.perf_counter() - began
+                for earlier in reports[:index]:
+                    if earlier.status != 'off':
+                        earlier.status = 'reused'
+                start = index + 1
+                break
+
+        for index in range(start, len(self.stages)):
+            stage, key = self.stages[index], keys[index]
+            if key is None:
+                continue
+            began = time.perf_counter()
+            terrain = stage.run(terrain, params, self)
+            if self.cache is not None:
+                self.cache.save(stage.name, key, terrain)
+            reports[index].seconds = time.perf_counter() - began
+
+        return terrain, reports
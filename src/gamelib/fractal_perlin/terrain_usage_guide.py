@@ -68,6 +68,10 @@ def parameter_tuning_workflow():
     """
     Recommended workflow for tuning parameters from scratch.
     Follow these steps IN ORDER to avoid garbage output!
+    
+    TIP: tools/tune_terrain.py runs these same steps with each one cached
+    on disk, so changing e.g. erosion_rate only re-runs erosion:
+        python tools/tune_terrain.py --preset mountain_range --set erosion_rate=0.35
     """
     
     width, height = 256, 256
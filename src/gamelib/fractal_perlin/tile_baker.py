@@ -0,0 +1,276 @@
+"""Tiled, multi-process heightmap baking.
+
+Bakes worlds too large for one process (8k² and up) by splitting the
+heightmap into square tiles and generating each in a ProcessPoolExecutor:
+
+ - Each tile samples the continuous fBm field (same as generate_noise_grid)
+   over its core plus an apron, optionally erodes that region with the
+   batched droplet engine, and keeps only the core.
+ - Erosion droplets are seeded per fixed world block rather than per tile,
+   so neighbouring tiles simulate the same droplets in their shared apron
+   and the borders line up.
+ - Workers write their cores straight into a memory-mapped ``.npy``; the
+   parent never holds the whole map.
+ - A JSON manifest next to the heightmap records every finished tile, so an
+   interrupted bake resumes where it stopped.
+
+Example:
+    baker = TileBaker('assets/heightmaps/world.npy',
+                      BakeSettings(resolution=8192, world_size=8192.0, erosion_density=0.1))
+    baker.bake()
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from . import fbm, resolve_noise_params, save_heightmap
+from .fractal_terrain import _DropletParams, _erode_droplets
+
+MANIFEST_VERSION = 1
+DROPLET_BLOCK = 32  # Droplet seeding granularity in cells (independent of tile size)
+
+
+@dataclass(frozen=True)
+class BakeSettings:
+    """Everything that determines the baked heightmap (stored in the manifest)."""
+    resolution: int = 4096
+    world_size: float = 4096.0
+    preset: Optional[str] = 'mountainous'
+    seed: int = 42
+    scale: Optional[float] = None
+    octaves: Optional[int] = None
+    persistence: Optional[float] = None
+    lacunarity: Optional[float] = None
+    amplitude: Optional[float] = None
+    tile_size: int = 512
+    apron: Optional[int] = None  # None = as wide as an erosion droplet can reach
+    erosion_density: float = 0.0  # Droplets per cell; 0 disables erosion
+    erosion_rate: float = 0.3
+    max_lifetime: int = 30
+    batch_size: int = 4096
+
+    def noise_params(self) -> Dict[str, Any]:
+        return resolve_noise_params(self.preset, scale=self.scale, octaves=self.octaves,
+                                    persistence=self.persistence, lacunarity=self.lacunarity,
+                                    amplitude=self.amplitude)
+
+    def apron_cells(self) -> int:
+        if self.apron is not None:
+            return int(self.apron)
+        # A droplet moves at most one cell per step; cover the droplets that
+        # can reach the core and the ones that can reach those
+        return 2 * (self.max_lifetime + 2) if self.erosion_density > 0 else 0
+
+
+def _block_droplets(settings: BakeSettings, bi: int, bj: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Droplet starts (row, col) for one world block; identical for every tile."""
+    count = int(round(settings.erosion_density * DROPLET_BLOCK * DROPLET_BLOCK))
+    rng = np.random.default_rng([settings.seed, bi, bj])
+    offsets = rng.random((count, 2)) * DROPLET_BLOCK
+    return bi * DROPLET_BLOCK + offsets[:, 0], bj * DROPLET_BLOCK + offsets[:, 1]
+
+
+def _region_droplets(settings: BakeSettings, r0: int, r1: int, c0: int, c1: int):
+    """Droplet starts inside a region, in local (x=col, y=row) coordinates."""
+    rows: List[np.ndarray] = []
+    cols: List[np.ndarray] = []
+    last = settings.resolution - 2
+    for bi in range(r0 // DROPLET_BLOCK, -(-r1 // DROPLET_BLOCK)):
+        for bj in range(c0 // DROPLET_BLOCK, -(-c1 // DROPLET_BLOCK)):
+            row, col = _block_droplets(settings, bi, bj)
+            # Same start range as the serial engine, and inside the region
+            keep = (row >= max(r0, 1)) & (row < min(r1 - 1, last)) & \
+                   (col >= max(c0, 1)) & (col < min(c1 - 1, last))
+            rows.append(row[keep] - r0)
+            cols.append(col[keep] - c0)
+    if not rows:
+        return np.zeros(0), np.zeros(0)
+    return np.concatenate(cols), np.concatenate(rows)
+
+
+def _bake_tile(path: str, settings: Dict[str, Any], ti: int, tj: int) -> Dict[str, Any]:
+    """Worker entry point: generate one tile and write its core into the heightmap."""
+    settings = BakeSettings(**settings)
+    params = settings.noise_params()
+    size = settings.tile_size
+    apron = settings.apron_cells()
+    res = settings.resolution
+
+    i0, i1 = ti * size, min((ti + 1) * size, res)
+    j0, j1 = tj * size, min((tj + 1) * size, res)
+    r0, r1 = max(i0 - apron, 0), min(i1 + apron, res)
+    c0, c1 = max(j0 - apron, 0), min(j1 + apron, res)
+
+    # Same sample positions as generate_noise_grid's full grid
+    coords = np.linspace(-settings.world_size / 2.0, settings.world_size / 2.0, res)
+    xv, zv = np.meshgrid(coords[r0:r1], coords[c0:c1], indexing='ij')
+    heights = fbm(xv * params['scale'], zv * params['scale'], octaves=params['octaves'],
+                  persistence=params['persistence'], lacunarity=params['lacunarity'],
+                  seed=settings.seed)
+    heights = np.ascontiguousarray(np.clip(heights, -1.0, 1.0))
+
+    if settings.erosion_density > 0:
+        start_x, start_y = _region_droplets(settings, r0, r1, c0, c1)
+        droplet = _DropletParams(
+            rain_amount=0.01,
+            evaporation_rate=0.01,
+            sediment_capacity=4.0,
+            deposition_rate=0.3,
+            erosion_rate=settings.erosion_rate,
+            gravity=4.0,
+            max_lifetime=settings.max_lifetime,
+            inertia=0.05,
+        )
+        _erode_droplets(heights, start_x, start_y, droplet, settings.batch_size)
+
+    core = heights[i0 - r0:i1 - r0, j0 - c0:j1 - c0] * params['amplitude']
+
+    heightmap = np.load(path, mmap_mode='r+')
+    heightmap[i0:i1, j0:j1] = core
+    heightmap.flush()
+    del heightmap
+
+    return {'min': float(core.min()), 'max': float(core.max())}
+
+
+class TileBaker:
+    """Bake a heightmap tile by tile into a memory-mapped .npy with a resumable manifest."""
+
+    def __init__(self, path: str | Path, settings: BakeSettings, workers: Optional[int] = None):
+        """
+        Args:
+            path: Output heightmap (.npy); the manifest is written beside it (.json)
+            settings: Bake parameters; resuming requires identical settings
+            workers: Worker processes (None = CPU count, 1 = bake in this process)
+        """
+        self.path = Path(path).with_suffix('.npy')
+        self.manifest_path = self.path.with_suffix('.json')
+        self.settings = settings
+        self.workers = workers
+
+    @property
+    def tile_grid(self) -> Tuple[int, int]:
+        count = -(-self.settings.resolution // self.settings.tile_size)
+        return count, count
+
+    def tiles(self) -> List[Tuple[int, int]]:
+        rows, cols = self.tile_grid
+        return [(ti, tj) for ti in range(rows) for tj in range(cols)]
+
+    def load_manifest(self) -> Optional[Dict[str, Any]]:
+        if not self.manifest_path.exists():
+            return None
+        with self.manifest_path.open('r', encoding='utf-8') as fh:
+            return json.load(fh)
+
+    def pending_tiles(self) -> List[Tuple[int, int]]:
+        manifest = self.load_manifest()
+        done = set(manifest['tiles']) if manifest and self.path.exists() else set()
+        return [tile for tile in self.tiles() if self._key(tile) not in done]
+
+    def metadata(self) -> Dict[str, Any]:
+        """Heightmap metadata in the generate_noise_grid format, plus tiling info."""
+        params = self.settings.noise_params()
+        return dict(
+            resolution=self.settings.resolution,
+            world_size=self.settings.world_size,
+            preset=self.settings.preset,
+            seed=int(self.settings.seed),
+            tile_size=self.settings.tile_size,
+            erosion_density=self.settings.erosion_density,
+            **params,
+        )
+
+    @staticmethod
+    def _key(tile: Tuple[int, int]) -> str:
+        return f"{tile[0]}_{tile[1]}"
+
+    def _write_manifest(self, manifest: Dict[str, Any]):
+        tmp = self.manifest_path.with_suffix('.json.tmp')
+        with tmp.open('w', encoding='utf-8') as fh:
+            json.dump(manifest, fh, indent=2)
+        os.replace(tmp, self.manifest_path)
+
+    def _prepare(self) -> Dict[str, Any]:
+        """Open an existing bake with matching settings, or start a new one."""
+        settings = asdict(self.settings)
+        manifest = self.load_manifest()
+        if manifest is not None and self.path.exists():
+            if manifest.get('settings') != settings:
+                raise ValueError(
+                    f"{self.manifest_path} was baked with different settings; "
+                    "delete it (and the heightmap) or bake to a new path"
+                )
+            return manifest
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        res = self.settings.resolution
+        heightmap = np.lib.format.open_memmap(self.path, mode='w+', dtype=np.float32, shape=(res, res))
+        del heightmap
+
+        manifest = dict(
+            version=MANIFEST_VERSION,
+            heightmap=self.path.name,
+            settings=settings,
+            metadata=self.metadata(),
+            tiles={},
+            complete=False,
+        )
+        self._write_manifest(manifest)
+        return manifest
+
+    def bake(self, progress: Optional[Callable[[int, int], None]] = None) -> Path:
+        """
+        Bake every tile not yet recorded in the manifest.
+
+        Args:
+            progress: Called as progress(done, total) after each tile
+
+        Returns:
+            Path of the heightmap
+        """
+        manifest = self._prepare()
+        pending = self.pending_tiles()
+        total = len(self.tiles())
+        settings = asdict(self.settings)
+
+        def record(tile: Tuple[int, int], stats: Dict[str, Any]):
+            # The tile is flushed to disk before it is recorded as done
+            manifest['tiles'][self._key(tile)] = stats
+            self._write_manifest(manifest)
+            if progress is not None:
+                progress(len(manifest['tiles']), total)
+
+        if self.workers == 1:
+            for tile in pending:
+                record(tile, _bake_tile(str(self.path), settings, *tile))
+        elif pending:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                futures = {
+                    executor.submit(_bake_tile, str(self.path), settings, *tile): tile
+                    for tile in pending
+                }
+                for future in as_completed(futures):
+                    record(futures[future], future.result())
+
+        manifest['complete'] = True
+        self._write_manifest(manifest)
+        return self.path
+
+    def load(self, mmap_mode: Optional[str] = 'r') -> np.ndarray:
+        """Open the baked heightmap (memory-mapped by default)."""
+        return np.load(self.path, mmap_mode=mmap_mode)
+
+    def export_npz(self, path: str | Path) -> Path:
+        """Write the heightmap as a save_heightmap .npz (loads it fully into memory)."""
+        path = Path(path)
+        save_heightmap(str(path), np.asarray(self.load()), self.metadata())
+        return path
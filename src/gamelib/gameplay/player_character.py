@@ -219,41 +219,29 @@ class PlayerCharacter:
             self.slope_angle = 0.0
             return
 
-        # Use raycast for ground detection (more reliable than contact points for kinematic bodies)
-        # Cast a ray downward from the capsule center to check for ground below
-        capsule_center = self._position
-
-        # Ray starts from capsule center and goes downward
-        ray_start = capsule_center + Vector3([0.0, -0.1, 0.0])  # Slight offset into capsule for robustness
-        # Check down to a reasonable distance below
-        ray_end = ray_start + Vector3([0.0, -(PLAYER_CAPSULE_HEIGHT/2.0 + PLAYER_CAPSULE_RADIUS + PLAYER_GROUND_CHECK_DISTANCE), 0.0])
-
-        # Perform raycast
-        hit_info = self.physics_world.ray_test(tuple(ray_start), tuple(ray_end))
+        # Sweep the capsule a short way down to find the ground it stands on
+        hit = self._sweep(
+            self._position,
+            self._position - Vector3([0.0, PLAYER_GROUND_CHECK_DISTANCE, 0.0]),
+        )
 
         grounded = False
         ground_normal = Vector3([0.0, 1.0, 0.0])  # Default to flat ground
         slope_angle_deg = 0.0
 
-        if hit_info:
-            body_id = hit_info.get("body_id", -1)
-            # Accept hits from any body except ourselves
-            hit_distance = hit_info.get("hit_fraction", 1.0)
-
-            if body_id != self.physics_body.body_id and body_id != -1 and hit_distance <= 1.0:
-                # We hit ground, now check the slope angle
-                hit_normal = hit_info.get("hit_normal", (0.0, 1.0, 0.0))
-                ground_normal = Vector3(hit_normal)
+        if hit is not None:
+            # We hit ground, now check the slope angle
+            ground_normal = Vector3(hit.normal)
 
-                # Calculate slope angle: angle between surface normal and world up
-                world_up = Vector3([0.0, 1.0, 0.0])
-                dot_product = max(-1.0, min(1.0, ground_normal.dot(world_up)))  # Clamp for acos safety
-                slope_angle_rad = math.acos(dot_product)
-                slope_angle_deg = math.degrees(slope_angle_rad)
+            # Calculate slope angle: angle between surface normal and world up
+            world_up = Vector3([0.0, 1.0, 0.0])
+            dot_product = max(-1.0, min(1.0, ground_normal.dot(world_up)))  # Clamp for acos safety
+            slope_angle_rad = math.acos(dot_product)
+            slope_angle_deg = math.degrees(slope_angle_rad)
 
-                # Only consider grounded if slope is walkable
-                if slope_angle_deg <= PLAYER_MAX_SLOPE_ANGLE:
-                    grounded = True
+            # Only consider grounded if slope is walkable
+            if slope_angle_deg <= PLAYER_MAX_SLOPE_ANGLE:
+                grounded = True
 
         # Track grounded state changes
         if grounded and not self.is_grounded:
@@ -358,13 +346,32 @@ class PlayerCharacter:
         }
         print(f"[PlayerDebug] {debug_info}")
 
+    def _sweep(self, start: Vector3, end: Vector3):
+        """Sweep the player's capsule from ``start`` to ``end``, ignoring the player body."""
+        return self.physics_world.sweep_capsule(
+            tuple(start),
+            tuple(end),
+            PLAYER_CAPSULE_RADIUS,
+            PLAYER_CAPSULE_HEIGHT,
+            ignore_body=self.physics_body.body_id,
+            layer=self.physics_body.config.collision_layer,
+        )
+
+    def _move_to(self, position: Vector3) -> None:
+        self._position = Vector3(position)
+        self.physics_world.set_body_transform(
+            self.physics_body.body_id,
+            position=tuple(self._position)
+        )
+
     def _swept_move(self, displacement: Vector3) -> None:
         """
         Perform swept collision detection to prevent tunneling.
 
-        This method subdivides the movement into smaller steps and checks for
-        collisions along the path. If a collision is detected, the movement
-        is stopped at the collision point and the velocity is adjusted.
+        The capsule is swept along the remaining displacement. On a hit it
+        stops just short of the surface, tries to step over low obstacles,
+        and otherwise slides along the surface with what is left; up to
+        PLAYER_CCD_SWEEP_STEPS sweeps per frame.
 
         Args:
             displacement: The desired movement vector for this frame
@@ -373,106 +380,43 @@ class PlayerCharacter:
             # No movement, skip
             return
 
-        start_position = Vector3(self._position)
         remaining_displacement = Vector3(displacement)
 
-        # Subdivide movement into multiple sweep steps to catch collisions
-        sweep_steps = PLAYER_CCD_SWEEP_STEPS
-        step_fraction = 1.0 / sweep_steps
-
-        for step in range(sweep_steps):
-            if remaining_displacement.length < 1e-6:
+        for _ in range(PLAYER_CCD_SWEEP_STEPS):
+            move_length = remaining_displacement.length
+            if move_length < 1e-6:
                 break  # No more movement needed
 
-            # Calculate the step displacement
-            step_displacement = remaining_displacement * step_fraction * (sweep_steps - step)
-            step_length = step_displacement.length
-
-            if step_length < 1e-6:
+            hit = self._sweep(self._position, self._position + remaining_displacement)
+            if hit is None:
+                # Clear path, move the full amount
+                self._move_to(self._position + remaining_displacement)
                 break
 
-            # Perform a raycast along the movement direction
-            # Cast from capsule center, accounting for capsule radius
-            ray_start = self._position
-            ray_end = self._position + step_displacement
-
-            # We need to check if our capsule will hit anything
-            # Use a sphere cast by checking multiple rays around the capsule
-            collision_detected = False
-            collision_normal = Vector3([0.0, 0.0, 0.0])
-            collision_distance = step_length
-
-            # Multi-ray sphere cast: cast rays from different points on the capsule
-            # This approximates a swept capsule test
-            cast_points = [
-                Vector3([0.0, 0.0, 0.0]),  # Center
-                Vector3([PLAYER_CAPSULE_RADIUS, 0.0, 0.0]),  # Right
-                Vector3([-PLAYER_CAPSULE_RADIUS, 0.0, 0.0]),  # Left
-                Vector3([0.0, 0.0, PLAYER_CAPSULE_RADIUS]),  # Forward
-                Vector3([0.0, 0.0, -PLAYER_CAPSULE_RADIUS]),  # Back
-                Vector3([0.0, PLAYER_CAPSULE_HEIGHT / 2.0, 0.0]),  # Top
-                Vector3([0.0, -PLAYER_CAPSULE_HEIGHT / 2.0, 0.0]),  # Bottom
-            ]
-
-            for offset in cast_points:
-                cast_start = ray_start + offset
-                cast_end = ray_end + offset
-
-                hit_info = self.physics_world.ray_test(tuple(cast_start), tuple(cast_end))
-
-                if hit_info:
-                    body_id = hit_info.get("body_id", -1)
-                    if body_id != self.physics_body.body_id and body_id != -1:
-                        hit_fraction = hit_info.get("hit_fraction", 1.0)
-                        hit_distance = step_length * hit_fraction
-
-                        # Found a closer collision
-                        if hit_distance < collision_distance:
-                            collision_detected = True
-                            collision_distance = hit_distance
-                            collision_normal = Vector3(hit_info.get("hit_normal", (0.0, 1.0, 0.0)))
-
-            if collision_detected:
-                # Stop at the collision point, leaving a small margin
-                safe_distance = max(0.0, collision_distance - PLAYER_COLLISION_MARGIN * 2.0)
-                safe_displacement = step_displacement.normalized * safe_distance if safe_distance > 1e-6 else Vector3([0.0, 0.0, 0.0])
-
-                # Move to the safe position
-                self._position += safe_displacement
-                self.physics_world.set_body_transform(
-                    self.physics_body.body_id,
-                    position=tuple(self._position)
-                )
-
-                # Slide along the collision surface
-                # Remove the component of velocity that's pushing into the surface
-                velocity_into_surface = self.velocity.dot(collision_normal)
-                if velocity_into_surface < 0:
-                    self.velocity -= collision_normal * velocity_into_surface
-
-                # Update remaining displacement to slide along surface
-                displacement_into_surface = remaining_displacement.dot(collision_normal)
-                if displacement_into_surface < 0:
-                    remaining_displacement -= collision_normal * displacement_into_surface
+            # Stop at the collision point, leaving a small margin
+            collision_distance = move_length * hit.fraction
+            safe_distance = max(0.0, collision_distance - PLAYER_COLLISION_MARGIN)
+            direction = remaining_displacement / move_length
+            self._move_to(self._position + direction * safe_distance)
+            remaining_displacement = direction * (move_length - safe_distance)
 
-                # Resolve any penetrations at this position
-                self._resolve_collisions()
+            collision_normal = Vector3(hit.normal)
+            if self._try_step_up(collision_normal, 0.0, remaining_displacement):
+                break
 
-                # Continue with the remaining displacement
-                continue
-            else:
-                # No collision detected in this step, move the full amount
-                self._position += step_displacement
-                self.physics_world.set_body_transform(
-                    self.physics_body.body_id,
-                    position=tuple(self._position)
-                )
+            # Slide along the collision surface
+            # Remove the component of velocity that's pushing into the surface
+            velocity_into_surface = self.velocity.dot(collision_normal)
+            if velocity_into_surface < 0:
+                self.velocity -= collision_normal * velocity_into_surface
 
-                # Resolve any penetrations (in case we still ended up inside something)
-                self._resolve_collisions()
+            # Update remaining displacement to slide along surface
+            displacement_into_surface = remaining_displacement.dot(collision_normal)
+            if displacement_into_surface < 0:
+                remaining_displacement -= collision_normal * displacement_into_surface
 
-                # Update remaining displacement
-                remaining_displacement -= step_displacement
+        # Resolve any penetrations (in case we still ended up inside something)
+        self._resolve_collisions()
 
     def _resolve_collisions(self) -> None:
         """
@@ -480,31 +424,18 @@ class PlayerCharacter:
         This implements depenetration and slide-along-wall behavior.
         """
         for _ in range(PLAYER_DEPENETRATION_ITERATIONS):
-            # Get all contacts for the player body
-            contacts = self.physics_world.get_contacts(body_id=self.physics_body.body_id)
-
-            if not contacts:
-                break  # No collisions, we're done
-
-            # Track if any penetration was resolved this iteration
-            resolved_any = False
-
-            for contact in contacts:
-                penetration_depth = contact["distance"]
+            # Contacts for the player body, reported with us as body_a so the
+            # contact normal points from the other body towards us
+            contacts = self.physics_world.get_contacts(body_id=self.physics_body.body_id, as_array=True)
 
-                # Negative distance means penetration
-                if penetration_depth >= -PLAYER_MIN_DEPENETRATION_DISTANCE:
-                    continue  # Not penetrating (or penetration too small to care)
+            # Negative distance means penetration; ignore penetrations too small to care
+            penetrating = contacts[contacts["distance"] < -PLAYER_MIN_DEPENETRATION_DISTANCE]
+            if len(penetrating) == 0:
+                break  # No penetrations, we're done
 
-                resolved_any = True
-
-                # Determine which body is us and which is the other
-                if contact["body_a"] == self.physics_body.body_id:
-                    # We are body_a, contact normal points from b to a
-                    contact_normal = Vector3(contact["normal_on_b"])
-                else:
-                    # We are body_b, need to flip the normal
-                    contact_normal = -Vector3(contact["normal_on_b"])
+            for contact in penetrating:
+                penetration_depth = float(contact["distance"])
+                contact_normal = Vector3(contact["normal_on_b"])
 
                 # Check if this is a step-up situation (hitting a low wall while grounded)
                 if self._try_step_up(contact_normal, -penetration_depth):
@@ -522,22 +453,29 @@ class PlayerCharacter:
                     # Remove the component of velocity pushing into the surface
                     self.velocity -= contact_normal * velocity_into_surface
 
-            if not resolved_any:
-                break  # No penetrations resolved, we're done
-
         # Update physics body position after depenetration
         self.physics_world.set_body_transform(
             self.physics_body.body_id,
             position=tuple(self._position)
         )
 
-    def _try_step_up(self, contact_normal: Vector3, penetration_depth: float) -> bool:
+    def _try_step_up(
+        self,
+        contact_normal: Vector3,
+        penetration_depth: float,
+        step_displacement: Optional[Vector3] = None,
+    ) -> bool:
         """
         Try to step up over a small obstacle (stairs, curbs, etc.).
 
+        Sweeps the capsule up by the step height, forward over the obstacle
+        and back down onto it.
+
         Args:
             contact_normal: Normal of the surface we're colliding with
             penetration_depth: How far we've penetrated (positive value)
+            step_displacement: Movement to carry over the obstacle (defaults
+                to just past the obstacle, against the contact normal)
 
         Returns:
             True if successfully stepped up, False otherwise
@@ -555,91 +493,36 @@ class PlayerCharacter:
         if penetration_depth > PLAYER_CAPSULE_RADIUS:
             return False
 
-        # Calculate how high we need to step up
-        # Start from slightly above our current position
-        step_start_height = self._position.y + PLAYER_STEP_UP_EXTRA_HEIGHT
-        max_step_height = step_start_height + PLAYER_STEP_HEIGHT
-
-        # Cast a ray upward to check for a ceiling
-        ray_start = self._position
-        ray_end = Vector3([self._position.x, max_step_height + PLAYER_CAPSULE_RADIUS, self._position.z])
-        ceiling_hit = self.physics_world.ray_test(tuple(ray_start), tuple(ray_end))
-
-        if ceiling_hit:
-            ceiling_body_id = ceiling_hit.get("body_id", -1)
-            if ceiling_body_id != self.physics_body.body_id and ceiling_body_id != -1:
-                # There's a ceiling, can't step up
-                return False
-
-        # Try stepping up: move position upward and check if we're clear of obstacles
-        original_position = Vector3(self._position)
-
-        # Move up by step height
-        test_position = Vector3([
-            self._position.x,
-            self._position.y + PLAYER_STEP_HEIGHT + PLAYER_STEP_UP_EXTRA_HEIGHT,
-            self._position.z
-        ])
-
-        # Temporarily move to the stepped-up position
-        self._position = test_position
-        self.physics_world.set_body_transform(
-            self.physics_body.body_id,
-            position=tuple(test_position)
-        )
-
-        # Check if we still have collisions at this height
-        contacts_after_step = self.physics_world.get_contacts(body_id=self.physics_body.body_id)
-
-        # Filter for horizontal penetrations
-        has_horizontal_collision = False
-        for contact in contacts_after_step:
-            if contact["distance"] < -PLAYER_MIN_DEPENETRATION_DISTANCE:
-                # Check if it's a horizontal collision
-                if contact["body_a"] == self.physics_body.body_id:
-                    normal = Vector3(contact["normal_on_b"])
-                else:
-                    normal = -Vector3(contact["normal_on_b"])
+        if step_displacement is None:
+            step_displacement = -contact_normal * (penetration_depth + PLAYER_COLLISION_MARGIN * 2.0)
+        forward = Vector3([step_displacement.x, 0.0, step_displacement.z])
+        if forward.length < 1e-6:
+            return False
 
-                if abs(normal.y) < 0.7:  # Horizontal collision
-                    has_horizontal_collision = True
-                    break
+        # Up: a ceiling within the step height blocks the step
+        lift = PLAYER_STEP_HEIGHT + PLAYER_STEP_UP_EXTRA_HEIGHT
+        raised_position = self._position + Vector3([0.0, lift, 0.0])
+        if self._sweep(self._position, raised_position) is not None:
+            return False
 
-        if has_horizontal_collision:
-            # Still colliding horizontally after stepping up, revert
-            self._position = original_position
-            self.physics_world.set_body_transform(
-                self.physics_body.body_id,
-                position=tuple(original_position)
-            )
+        # Forward: the obstacle must be low enough to pass over at this height
+        if self._sweep(raised_position, raised_position + forward) is not None:
             return False
+        stepped_position = raised_position + forward
 
-        # Success! Now find the ground at this new height
-        # Cast a ray downward to find where to land
-        ray_start = Vector3([test_position.x, test_position.y, test_position.z])
-        ray_end = Vector3([test_position.x, original_position.y - PLAYER_GROUND_CHECK_DISTANCE, test_position.z])
-        ground_hit = self.physics_world.ray_test(tuple(ray_start), tuple(ray_end))
-
-        if ground_hit:
-            ground_body_id = ground_hit.get("body_id", -1)
-            if ground_body_id != self.physics_body.body_id and ground_body_id != -1:
-                # Found ground, land on it
-                hit_position = Vector3(ground_hit.get("hit_position", (test_position.x, test_position.y, test_position.z)))
-                # Position capsule bottom at hit point
-                landed_position = Vector3([
-                    hit_position.x,
-                    hit_position.y + PLAYER_CAPSULE_HEIGHT / 2.0 + PLAYER_CAPSULE_RADIUS,
-                    hit_position.z
-                ])
-                self._position = landed_position
-                self.physics_world.set_body_transform(
-                    self.physics_body.body_id,
-                    position=tuple(landed_position)
-                )
-                return True
+        # Down: land on top of the obstacle; it must be walkable
+        ground_hit = self._sweep(
+            stepped_position,
+            stepped_position - Vector3([0.0, lift + PLAYER_GROUND_CHECK_DISTANCE, 0.0]),
+        )
+        if ground_hit is not None:
+            if ground_hit.normal[1] < math.cos(math.radians(PLAYER_MAX_SLOPE_ANGLE)):
+                return False
+            stepped_position = Vector3(ground_hit.position) + Vector3([0.0, PLAYER_COLLISION_MARGIN, 0.0])
 
         # Keep the stepped-up position even if we didn't find ground immediately
         # (we'll fall naturally next frame)
+        self._move_to(stepped_position)
         return True
 
     def _apply_ground_snapping(self) -> None:
@@ -664,21 +547,17 @@ class PlayerCharacter:
         if horizontal_speed < 0.1:
             return  # Not moving, no need to snap
 
-        # Cast a ray downward from current position
-        ray_start = self._position
-        ray_end = self._position + Vector3([0.0, -PLAYER_GROUND_SNAP_DISTANCE, 0.0])
-
-        ground_hit = self.physics_world.ray_test(tuple(ray_start), tuple(ray_end))
+        # Sweep the capsule downward from the current position
+        ground_hit = self._sweep(
+            self._position,
+            self._position - Vector3([0.0, PLAYER_GROUND_SNAP_DISTANCE, 0.0]),
+        )
 
-        if not ground_hit:
+        if ground_hit is None:
             return  # No ground below us
 
-        ground_body_id = ground_hit.get("body_id", -1)
-        if ground_body_id == self.physics_body.body_id or ground_body_id == -1:
-            return  # Hit ourselves or nothing
-
         # Check if the ground is walkable (not too steep)
-        hit_normal = Vector3(ground_hit.get("hit_normal", (0.0, 1.0, 0.0)))
+        hit_normal = Vector3(ground_hit.normal)
         world_up = Vector3([0.0, 1.0, 0.0])
         dot_product = max(-1.0, min(1.0, hit_normal.dot(world_up)))
         slope_angle_rad = math.acos(dot_product)
@@ -687,26 +566,11 @@ class PlayerCharacter:
         if slope_angle_deg > PLAYER_MAX_SLOPE_ANGLE:
             return  # Too steep, don't snap
 
-        # Snap down to the ground
-        hit_position = Vector3(ground_hit.get("hit_position", self._position))
-
-        # Calculate the distance we need to move down
-        snap_distance = self._position.y - hit_position.y
-
         # Only snap if we're actually above the ground (not already on it)
-        if snap_distance > PLAYER_GROUND_CHECK_DISTANCE:
-            # Position capsule bottom at hit point
-            snapped_position = Vector3([
-                hit_position.x,
-                hit_position.y + PLAYER_CAPSULE_HEIGHT / 2.0 + PLAYER_CAPSULE_RADIUS,
-                hit_position.z
-            ])
-
-            self._position = snapped_position
-            self.physics_world.set_body_transform(
-                self.physics_body.body_id,
-                position=tuple(snapped_position)
-            )
+        gap = PLAYER_GROUND_SNAP_DISTANCE * ground_hit.fraction
+        if gap > PLAYER_COLLISION_MARGIN * 2.0:
+            # Rest the capsule on the ground, leaving the collision margin
+            self._move_to(Vector3(ground_hit.position) + Vector3([0.0, PLAYER_COLLISION_MARGIN, 0.0]))
 
             # Zero out downward velocity when snapping
             if self.velocity.y < 0:
@@ -55,6 +55,10 @@ class RenderingController:
             InputCommand.SYSTEM_TOGGLE_SSAO,
             self.toggle_ssao
         )
+        self.input_manager.register_handler(
+            InputCommand.SYSTEM_CYCLE_SSAO_QUALITY,
+            self.cycle_ssao_quality
+        )
         self.input_manager.register_handler(
             InputCommand.SYSTEM_CYCLE_AA_MODE,
             self.cycle_aa_mode
@@ -75,6 +79,18 @@ class RenderingController:
             InputCommand.SYSTEM_TOGGLE_LIGHT_GIZMOS,
             self.toggle_light_gizmos
         )
+        self.input_manager.register_handler(
+            InputCommand.SYSTEM_TOGGLE_PROFILER,
+            self.toggle_profiler
+        )
+        self.input_manager.register_handler(
+            InputCommand.SYSTEM_EXPORT_PROFILER_TRACE,
+            self.export_profiler_trace
+        )
+        self.input_manager.register_handler(
+            InputCommand.SYSTEM_TOGGLE_DYNAMIC_RESOLUTION,
+            self.toggle_dynamic_resolution
+        )
 
     def toggle_debug_overlay(self, delta_time: float = 0.0):
         """
@@ -109,6 +125,15 @@ class RenderingController:
         status = "enabled" if self.ssao_enabled else "disabled"
         print(f"SSAO {status}")
 
+    def cycle_ssao_quality(self, delta_time: float = 0.0):
+        """
+        Cycle SSAO resolution / temporal accumulation presets.
+
+        Args:
+            delta_time: Time since last frame (unused, for handler compatibility)
+        """
+        self.render_pipeline.cycle_ssao_quality()
+
     def cycle_aa_mode(self, delta_time: float = 0.0):
         """
         Cycle through anti-aliasing modes.
@@ -153,3 +178,30 @@ class RenderingController:
             delta_time: Time since last frame (unused, for handler compatibility)
         """
         self.render_pipeline.toggle_light_gizmos()
+
+    def toggle_profiler(self, delta_time: float = 0.0):
+        """
+        Toggle the per-pass frame profiler.
+
+        Args:
+            delta_time: Time since last frame (unused, for handler compatibility)
+        """
+        self.render_pipeline.toggle_profiler()
+
+    def toggle_dynamic_resolution(self, delta_time: float = 0.0):
+        """
+        Toggle frame-time driven dynamic resolution.
+
+        Args:
+            delta_time: Time since last frame (unused, for handler compatibility)
+        """
+        self.render_pipeline.toggle_dynamic_resolution()
+
+    def export_profiler_trace(self, delta_time: float = 0.0):
+        """
+        Export recorded profiler frames as a Chrome trace.
+
+        Args:
+            delta_time: Time since last frame (unused, for handler compatibility)
+        """
+        self.render_pipeline.export_profiler_trace()
@@ -124,11 +124,15 @@ class InputCommand(Enum):
     SYSTEM_TOGGLE_DEBUG_OVERLAY = auto()  # Toggle debug overlay on/off
     SYSTEM_TOGGLE_FULLSCREEN = auto()
     SYSTEM_TOGGLE_SSAO = auto()      # Toggle SSAO on/off
+    SYSTEM_CYCLE_SSAO_QUALITY = auto()  # Cycle SSAO resolution/temporal presets
     SYSTEM_TOGGLE_MSAA = auto()      # Toggle MSAA on/off
     SYSTEM_TOGGLE_FXAA = auto()      # Toggle FXAA on/off
     SYSTEM_TOGGLE_SMAA = auto()      # Toggle SMAA on/off
     SYSTEM_CYCLE_AA_MODE = auto()    # Cycle through AA modes
     SYSTEM_TOGGLE_LIGHT_GIZMOS = auto()  # Toggle debug light gizmos
+    SYSTEM_TOGGLE_PROFILER = auto()  # Toggle per-pass CPU/GPU profiler
+    SYSTEM_EXPORT_PROFILER_TRACE = auto()  # Write profiler history as Chrome trace
+    SYSTEM_TOGGLE_DYNAMIC_RESOLUTION = auto()  # Toggle frame-time driven render scale
     SYSTEM_TOGGLE_DEBUG_CAMERA = auto()  # Toggle free-fly debug camera
     SYSTEM_QUICK_SAVE = auto()
     SYSTEM_QUICK_LOAD = auto()
@@ -233,11 +237,15 @@ COMMAND_TYPES = {
     InputCommand.SYSTEM_TOGGLE_DEBUG: InputType.INSTANT,
     InputCommand.SYSTEM_TOGGLE_DEBUG_OVERLAY: InputType.INSTANT,
     InputCommand.SYSTEM_TOGGLE_SSAO: InputType.INSTANT,
+    InputCommand.SYSTEM_CYCLE_SSAO_QUALITY: InputType.INSTANT,
     InputCommand.SYSTEM_TOGGLE_MSAA: InputType.INSTANT,
     InputCommand.SYSTEM_TOGGLE_FXAA: InputType.INSTANT,
     InputCommand.SYSTEM_TOGGLE_SMAA: InputType.INSTANT,
     InputCommand.SYSTEM_CYCLE_AA_MODE: InputType.INSTANT,
     InputCommand.SYSTEM_TOGGLE_LIGHT_GIZMOS: InputType.INSTANT,
+    InputCommand.SYSTEM_TOGGLE_PROFILER: InputType.INSTANT,
+    InputCommand.SYSTEM_EXPORT_PROFILER_TRACE: InputType.INSTANT,
+    InputCommand.SYSTEM_TOGGLE_DYNAMIC_RESOLUTION: InputType.INSTANT,
     InputCommand.SYSTEM_TOGGLE_DEBUG_CAMERA: InputType.INSTANT,
 
     # Toggle (on/off state)
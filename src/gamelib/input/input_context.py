@@ -113,11 +113,15 @@ class InputContextManager:
                 InputCommand.SYSTEM_QUICK_LOAD,
                 InputCommand.SYSTEM_CYCLE_AA_MODE,
                 InputCommand.SYSTEM_TOGGLE_SSAO,
+                InputCommand.SYSTEM_CYCLE_SSAO_QUALITY,
                 InputCommand.SYSTEM_TOGGLE_MSAA,
                 InputCommand.SYSTEM_TOGGLE_FXAA,
                 InputCommand.SYSTEM_TOGGLE_SMAA,
 
                 InputCommand.SYSTEM_TOGGLE_LIGHT_GIZMOS,
+                InputCommand.SYSTEM_TOGGLE_PROFILER,
+                InputCommand.SYSTEM_EXPORT_PROFILER_TRACE,
+                InputCommand.SYSTEM_TOGGLE_DYNAMIC_RESOLUTION,
                 InputCommand.SYSTEM_TOGGLE_DEBUG_CAMERA,
                 InputCommand.SYSTEM_TOGGLE_DEBUG_OVERLAY,
 
@@ -144,6 +148,9 @@ class InputContextManager:
                 InputCommand.SYSTEM_SCREENSHOT,
                 InputCommand.SYSTEM_TOGGLE_DEBUG,
                 InputCommand.SYSTEM_TOGGLE_LIGHT_GIZMOS,
+                InputCommand.SYSTEM_TOGGLE_PROFILER,
+                InputCommand.SYSTEM_EXPORT_PROFILER_TRACE,
+                InputCommand.SYSTEM_TOGGLE_DYNAMIC_RESOLUTION,
 
                 # Editor mode toggle (to enter LEVEL_EDITOR mode from debug)
                 InputCommand.EDITOR_TOGGLE_MODE,
@@ -203,6 +210,9 @@ class InputContextManager:
                 InputCommand.SYSTEM_SCREENSHOT,
                 InputCommand.SYSTEM_TOGGLE_DEBUG,
                 InputCommand.SYSTEM_TOGGLE_LIGHT_GIZMOS,
+                InputCommand.SYSTEM_TOGGLE_PROFILER,
+                InputCommand.SYSTEM_EXPORT_PROFILER_TRACE,
+                InputCommand.SYSTEM_TOGGLE_DYNAMIC_RESOLUTION,
             },
 
             # ================================================================
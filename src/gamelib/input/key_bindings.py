@@ -87,10 +87,14 @@ class KeyBindings:
         self.keyboard_bindings[self.keys.F4] = InputCommand.SYSTEM_TOGGLE_DEBUG  # F4
         # self.keyboard_bindings[self.keys.F5] = InputCommand.SYSTEM_QUICK_SAVE  # F5
         self.keyboard_bindings[self.keys.T] = InputCommand.SYSTEM_TOGGLE_SSAO   # T
+        self.keyboard_bindings[self.keys.F6] = InputCommand.SYSTEM_CYCLE_SSAO_QUALITY  # F6
         self.keyboard_bindings[self.keys.L] = InputCommand.SYSTEM_TOGGLE_LIGHT_GIZMOS  # L
         self.keyboard_bindings[self.keys.F7] = InputCommand.SYSTEM_CYCLE_AA_MODE # F7
         self.keyboard_bindings[self.keys.F8] = InputCommand.SYSTEM_TOGGLE_MSAA   # F8
         self.keyboard_bindings[self.keys.F9] = InputCommand.SYSTEM_TOGGLE_SMAA   # F9
+        self.keyboard_bindings[self.keys.F10] = InputCommand.SYSTEM_TOGGLE_PROFILER  # F10
+        self.keyboard_bindings[self.keys.F11] = InputCommand.SYSTEM_TOGGLE_DYNAMIC_RESOLUTION  # F11
+        self.keyboard_bindings[self.keys.F12] = InputCommand.SYSTEM_EXPORT_PROFILER_TRACE  # F12
 
         # ====================================================================
         # Tool System (Level Editor)
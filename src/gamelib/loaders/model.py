@@ -5,6 +5,7 @@ Represents a loaded GLTF/GLB model with meshes and materials.
 """
 
 from typing import List, Tuple, Optional, Dict
+import numpy as np
 from pyrr import Matrix44, Vector3, Quaternion
 from .material import Material
 
@@ -110,8 +111,9 @@ class Model:
             name: Model name for debugging
         """
         self.meshes = meshes
-        self.position = position if position is not None else Vector3([0.0, 0.0, 0.0])
-        self.rotation = rotation if rotation is not None else Vector3([0.0, 0.0, 0.0])
+        # Owned float64 copies: physics sync writes into them in place
+        self.position = Vector3(np.array(position if position is not None else (0.0, 0.0, 0.0), dtype=np.float64))
+        self.rotation = Vector3(np.array(rotation if rotation is not None else (0.0, 0.0, 0.0), dtype=np.float64))
         self.scale = scale if scale is not None else Vector3([1.0, 1.0, 1.0])
         self.name = name
         self.orientation: Optional[Quaternion] = None
@@ -178,11 +180,15 @@ class Model:
         position,
         orientation,
     ) -> None:
-        """Apply a transform from the physics simulation to this model."""
+        """Apply a transform from the physics simulation to this model (in place after the first call)."""
 
-        self.position = Vector3(position)
-        self.orientation = Quaternion(orientation).normalised
-        self.rotation = Vector3([0.0, 0.0, 0.0])
+        self.position[:] = position
+        if self.orientation is None:
+            self.orientation = Quaternion(np.array(orientation, dtype=np.float64))
+        else:
+            self.orientation[:] = orientation
+        self.orientation /= np.linalg.norm(self.orientation)
+        self.rotation[:] = 0.0
 
     def render(self, program, ctx=None):
         """
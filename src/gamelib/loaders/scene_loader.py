@@ -6,16 +6,30 @@ import json
 import math
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from moderngl_window import geometry
 from pyrr import Vector3
 
-from ..config.settings import PROJECT_ROOT
+from ..config.settings import (
+    COLLISION_BUILD_JOBS,
+    PROJECT_ROOT,
+    TERRAIN_CHUNKING_ENABLED,
+    TERRAIN_CHUNK_SIZE,
+    TERRAIN_LOD_PIXEL_ERROR,
+    TERRAIN_STREAM_CACHE_TILES,
+    TERRAIN_STREAM_COLLISION_RADIUS,
+    TERRAIN_STREAM_TILE_SIZE,
+    TERRAIN_STREAM_VIEW_RADIUS,
+    TERRAIN_STREAM_VRAM_BUDGET_MB,
+    TERRAIN_STREAM_WORKERS,
+)
 from ..core import geometry_utils
 from ..core.light import Light
 from ..core.scene import Scene, SceneDefinition, SceneNodeDefinition
 from ..physics import PhysicsBodyConfig, PhysicsBodyHandle, PhysicsWorld
+from ..physics.collision_meshes import prebuild_collision_meshes
 from .gltf_loader import GltfLoader
 
 
@@ -30,6 +44,7 @@ class SceneLoadResult:
     player_spawn_position: Optional[Vector3] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     physics_bodies: List[PhysicsBodyHandle] = field(default_factory=list)
+    terrain_streamer: Optional[Any] = None
 
 
 class SceneLoader:
@@ -64,15 +79,31 @@ class SceneLoader:
         scene = Scene(ctx=self.ctx)
 
         base_path = scene_path.parent
-        physics_handles: List[PhysicsBodyHandle] = []
+        physics_bodies: List[Tuple[Any, PhysicsBodyConfig, SceneNodeDefinition, Path]] = []
+
+        # Build missing collision meshes while the nodes load
+        collision_builds = self._start_collision_builds(definition, base_path)
 
         for node in definition.nodes:
             instance = self._instantiate_node(node, base_path)
             if instance is not None:
                 scene.add_object(instance)
-                handle = self._attach_physics(instance, node, base_path)
-                if handle is not None:
-                    physics_handles.append(handle)
+                config = self._physics_config(node)
+                if config is not None:
+                    physics_bodies.append((instance, config, node, base_path))
+
+        if collision_builds is not None:
+            collision_builds.result()
+
+        # One batch, so props sharing a collider are created together
+        physics_handles: List[PhysicsBodyHandle] = (
+            self._physics_world.create_bodies(physics_bodies) if physics_bodies else []
+        )
+
+        terrain_streamer = None
+        streaming_metadata = definition.metadata.get("terrain_streaming")
+        if isinstance(streaming_metadata, dict):
+            terrain_streamer = self._create_terrain_streamer(streaming_metadata, scene, base_path)
 
         lights = [definition_light.instantiate() for definition_light in definition.light_definitions]
 
@@ -88,14 +119,68 @@ class SceneLoader:
             player_spawn_position=player_spawn_position,
             metadata=definition.metadata,
             physics_bodies=physics_handles,
+            terrain_streamer=terrain_streamer,
         )
 
-    def _attach_physics(
-        self,
-        instance,
-        node: SceneNodeDefinition,
-        base_path: Path,
-    ) -> Optional[PhysicsBodyHandle]:
+    def _create_terrain_streamer(self, config: Dict[str, Any], scene: Scene, base_path: Path):
+        """Build the TerrainStreamer described by a scene's "terrain_streaming" metadata."""
+        from ..core.terrain_streaming import HeightmapTileSource, ProceduralTileSource, TerrainStreamer
+
+        tile_size = int(config.get("tile_size", TERRAIN_STREAM_TILE_SIZE))
+        source_type = str(config.get("source", "procedural")).lower()
+        if source_type == "heightmap":
+            heightmap = config.get("heightmap")
+            if not heightmap:
+                raise ValueError("Heightmap terrain streaming requires 'heightmap'")
+            heightmap_path = Path(heightmap)
+            if not heightmap_path.is_absolute():
+                heightmap_path = (base_path / heightmap_path).resolve()
+            source = HeightmapTileSource(heightmap_path, tile_size=tile_size, world_size=config.get("world_size"))
+        elif source_type == "procedural":
+            source = ProceduralTileSource(
+                preset=config.get("preset", "mountainous"),
+                seed=int(config.get("seed", 42)),
+                spacing=float(config.get("spacing", 2.0)),
+                tile_size=tile_size,
+                scale=config.get("scale"),
+                octaves=config.get("octaves"),
+                persistence=config.get("persistence"),
+                lacunarity=config.get("lacunarity"),
+                amplitude=config.get("amplitude"),
+            )
+        else:
+            raise ValueError(f"Unsupported terrain streaming source: {source_type}")
+
+        return TerrainStreamer(
+            scene,
+            source,
+            physics_world=self._physics_world if config.get("collision", True) else None,
+            view_radius=float(config.get("view_radius", TERRAIN_STREAM_VIEW_RADIUS)),
+            collision_radius=float(config.get("collision_radius", TERRAIN_STREAM_COLLISION_RADIUS)),
+            vram_budget_mb=float(config.get("vram_budget_mb", TERRAIN_STREAM_VRAM_BUDGET_MB)),
+            max_cached_tiles=int(config.get("cache_tiles", TERRAIN_STREAM_CACHE_TILES)),
+            workers=int(config.get("workers", TERRAIN_STREAM_WORKERS)),
+            chunk_size=TERRAIN_CHUNK_SIZE,
+            pixel_error=TERRAIN_LOD_PIXEL_ERROR,
+            color=tuple(config.get("color", (0.4, 0.6, 0.3))),
+            friction=float(config.get("friction", 0.6)),
+        )
+
+    def _start_collision_builds(self, definition: SceneDefinition, base_path: Path):
+        """Start building the scene's stale collision meshes; returns a future or None."""
+        if self._physics_world is None:
+            return None
+
+        requests = []
+        for node in definition.nodes:
+            physics_payload = node.extras.get("physics") if node.extras else None
+            if isinstance(physics_payload, dict) and isinstance(physics_payload.get("collision_mesh"), dict):
+                requests.append((physics_payload["collision_mesh"], base_path))
+        if not requests:
+            return None
+        return prebuild_collision_meshes(requests, jobs=COLLISION_BUILD_JOBS)
+
+    def _physics_config(self, node: SceneNodeDefinition) -> Optional[PhysicsBodyConfig]:
         if self._physics_world is None:
             return None
 
@@ -108,13 +193,7 @@ class SceneLoader:
                 f"Physics configuration for node '{node.name}' must be a dictionary"
             )
 
-        config = PhysicsBodyConfig.from_dict(physics_payload)
-        return self._physics_world.create_body(
-            instance,
-            config,
-            node_definition=node,
-            resource_base=base_path,
-        )
+        return PhysicsBodyConfig.from_dict(physics_payload)
 
     def _instantiate_node(self, node: SceneNodeDefinition, base_path: Path):
         node_type = node.node_type.lower()
@@ -138,6 +217,9 @@ class SceneLoader:
 
         geometry_obj = None
         bounding_radius = node.bounding_radius
+        # (heights, spacing, offset) for terrains built as quadtree chunks
+        terrain_grid = None
+        chunked = TERRAIN_CHUNKING_ENABLED and bool(node.extras.get("chunked", True))
 
         if primitive == "cube":
             size = tuple(node.extras.get("size", [1.0, 1.0, 1.0]))
@@ -173,14 +255,28 @@ class SceneLoader:
             height = float(node.extras.get("height", 50.0))
             rim_width = float(node.extras.get("rim_width", 40.0))
             seed = int(node.extras.get("seed", 42))
-            geometry_obj = geometry_utils.donut_terrain(
-                resolution=resolution,
-                outer_radius=outer_radius,
-                inner_radius=inner_radius,
-                height=height,
-                rim_width=rim_width,
-                seed=seed
-            )
+            if chunked:
+                from ..core.terrain_generation import generate_donut_height_data
+
+                heights = generate_donut_height_data(
+                    resolution=resolution,
+                    outer_radius=outer_radius,
+                    inner_radius=inner_radius,
+                    height=height,
+                    rim_width=rim_width,
+                    seed=seed
+                )
+                world_size = outer_radius * 2.2
+                terrain_grid = (heights, world_size / (resolution - 1), world_size / 2)
+            else:
+                geometry_obj = geometry_utils.donut_terrain(
+                    resolution=resolution,
+                    outer_radius=outer_radius,
+                    inner_radius=inner_radius,
+                    height=height,
+                    rim_width=rim_width,
+                    seed=seed
+                )
             if bounding_radius is None:
                 # Bounding sphere needs to encompass the entire terrain mesh
                 # The mesh extends to world_size/2 where world_size = outer_radius * 2.2
@@ -202,16 +298,24 @@ class SceneLoader:
             if not hm_path.exists():
                 raise FileNotFoundError(f"Heightmap not found: {heightmap_path}")
             
-            geometry_obj = geometry_utils.heightmap_terrain(str(hm_path))
+            heights = None
+            if chunked:
+                with np.load(str(hm_path)) as data:
+                    meta = json.loads(str(data['meta']))
+                    resolution = meta['resolution']
+                    heights = data['heights'].reshape(resolution, resolution)
+                world_size = meta['world_size']
+                terrain_grid = (heights, world_size / (resolution - 1), world_size / 2.0)
+            else:
+                geometry_obj = geometry_utils.heightmap_terrain(str(hm_path))
             
             if bounding_radius is None:
-                # Load heightmap metadata to calculate bounding radius
-                import numpy as np
-                import json as json_module
-                data = np.load(str(hm_path))
-                heights = data['heights']
-                meta = json_module.loads(str(data['meta']))
-                world_size = meta.get('world_size', 400.0)
+                if heights is None:
+                    # Load heightmap metadata to calculate bounding radius
+                    with np.load(str(hm_path)) as data:
+                        heights = data['heights']
+                        meta = json.loads(str(data['meta']))
+                    world_size = meta.get('world_size', 400.0)
                 offset = world_size / 2.0
                 diagonal_dist = math.sqrt(offset ** 2 + offset ** 2)
                 max_height = float(np.max(np.abs(heights)))
@@ -219,6 +323,24 @@ class SceneLoader:
         else:
             raise ValueError(f"Unsupported primitive type: {node.primitive}")
 
+        if terrain_grid is not None:
+            from ..core.terrain_chunks import ChunkedTerrain
+
+            heights, spacing, offset = terrain_grid
+            return ChunkedTerrain(
+                heights,
+                spacing,
+                position=position,
+                color=color,
+                bounding_radius=bounding_radius if bounding_radius is not None else 1.0,
+                name=node.name,
+                rotation=rotation,
+                scale=scale,
+                offset=offset,
+                chunk_size=TERRAIN_CHUNK_SIZE,
+                pixel_error=TERRAIN_LOD_PIXEL_ERROR,
+            )
+
         from ..core.scene import SceneObject
 
         return SceneObject(
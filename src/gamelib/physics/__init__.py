@@ -1,15 +1,28 @@
 """Physics integration utilities built on top of PyBullet."""
 
+from .collision_layers import CollisionLayer, CollisionLayers, LayerPairStats
 from .physics_world import (
+    CONTACT_DTYPE,
     PhysicsBodyConfig,
     PhysicsBodyHandle,
     PhysicsWorld,
     PhysicsWorldSettings,
+    RayBatchResult,
+    SweepHit,
 )
+from .physics_worker import PhysicsSnapshot, PhysicsWorker
 
 __all__ = [
+    "CONTACT_DTYPE",
+    "CollisionLayer",
+    "CollisionLayers",
+    "LayerPairStats",
     "PhysicsBodyConfig",
     "PhysicsBodyHandle",
+    "PhysicsSnapshot",
     "PhysicsWorld",
+    "PhysicsWorker",
     "PhysicsWorldSettings",
+    "RayBatchResult",
+    "SweepHit",
 ]
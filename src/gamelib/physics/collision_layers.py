@@ -0,0 +1,198 @@
+"""Named collision layers and the layer-pair matrix, from scene metadata.
+
+Scenes name their layers and say which pairs collide; every body gets a
+layer (explicitly, or by body type) and the layer's pairs become the
+PyBullet group/mask bits of that body, so pairs that never collide are
+dropped in the broadphase.
+
+Bullet skips pairs of static bodies on its own, but only while bodies
+keep their default filter bits. To keep that with explicit bits, every
+layer has two group bits: one for static bodies (mass 0, which includes
+kinematic ones) and one for dynamic bodies. Static masks only hold the
+dynamic bits, so two static bodies never pair up.
+
+Example scene metadata:
+    "physics": {
+        "collision_layers": {
+            "layers": {
+                "terrain": {},
+                "props": {"sleep_threshold": 0.05},
+                "debris": {"sleep_threshold": 0.3},
+                "player": {"enable_sleeping": false}
+            },
+            "defaults": {"static": "terrain", "dynamic": "props", "kinematic": "player"},
+            "ignore": [["debris", "player"], ["debris", "debris"]],
+            "report": true
+        }
+    }
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+MAX_LAYERS = 15  # Two group bits per layer within PyBullet's 32-bit signed ints
+
+
+@dataclass(slots=True)
+class CollisionLayer:
+    """One named layer and its sleeping settings."""
+
+    name: str
+    index: int
+    sleep_threshold: Optional[float] = None  # Kinetic energy below which bodies may sleep
+    enable_sleeping: Optional[bool] = None  # None keeps the body's / world's setting
+
+    @property
+    def dynamic_bit(self) -> int:
+        return 1 << self.index
+
+    @property
+    def static_bit(self) -> int:
+        return 1 << (self.index + MAX_LAYERS)
+
+
+@dataclass(slots=True)
+class LayerPairStats:
+    """Contacts seen between two layers while reporting."""
+
+    layer_a: str
+    layer_b: str
+    contact_points: int = 0  # Summed over steps
+    steps: int = 0  # Steps with at least one contact
+    enabled: bool = True  # Whether the matrix lets the pair collide
+
+
+@dataclass
+class CollisionLayers:
+    """Layers and the symmetric matrix of which layer pairs collide."""
+
+    layers: Dict[str, CollisionLayer] = field(default_factory=dict)
+    defaults: Dict[str, str] = field(default_factory=dict)  # Body type -> layer name
+    report: bool = False  # Collect a LayerPairStats report while stepping
+    _ignored: Set[Tuple[str, str]] = field(default_factory=set)  # Sorted pairs that never collide
+
+    @classmethod
+    def from_metadata(cls, payload: Dict[str, Any]) -> "CollisionLayers":
+        """Build layers from a scene's ``physics.collision_layers`` metadata."""
+
+        if not isinstance(payload, dict):
+            raise TypeError("physics.collision_layers must be a dictionary")
+
+        raw_layers = payload.get("layers", [])
+        if isinstance(raw_layers, dict):
+            items = list(raw_layers.items())
+        else:
+            items = [(name, {}) for name in raw_layers]
+        if not items:
+            raise ValueError("physics.collision_layers requires at least one layer")
+        if len(items) > MAX_LAYERS:
+            raise ValueError(f"At most {MAX_LAYERS} collision layers are supported, got {len(items)}")
+
+        layers = cls()
+        for index, (name, options) in enumerate(items):
+            options = options or {}
+            if not isinstance(options, dict):
+                raise TypeError(f"Collision layer '{name}' options must be a dictionary")
+            layers.layers[str(name)] = CollisionLayer(
+                name=str(name),
+                index=index,
+                sleep_threshold=float(options["sleep_threshold"]) if "sleep_threshold" in options else None,
+                enable_sleeping=bool(options["enable_sleeping"]) if "enable_sleeping" in options else None,
+            )
+
+        for body_type, name in dict(payload.get("defaults", {})).items():
+            layers.defaults[str(body_type).lower()] = layers.layer(name).name
+
+        # "collides" restricts a layer to the listed partners; "ignore" removes pairs
+        for name, partners in dict(payload.get("collides", {})).items():
+            allowed = {layers.layer(partner).name for partner in partners}
+            for other in layers.layers:
+                if other not in allowed:
+                    layers.set_collides(name, other, False)
+        for pair in payload.get("ignore", []):
+            if len(pair) != 2:
+                raise ValueError(f"Collision layer pairs must have two layers, got {pair!r}")
+            layers.set_collides(pair[0], pair[1], False)
+
+        layers.report = bool(payload.get("report", False))
+        return layers
+
+    # ------------------------------------------------------------------
+    # Matrix
+    # ------------------------------------------------------------------
+    def layer(self, name: str) -> CollisionLayer:
+        try:
+            return self.layers[str(name)]
+        except KeyError:
+            raise ValueError(f"Unknown collision layer: {name}") from None
+
+    def set_collides(self, layer_a: str, layer_b: str, collides: bool) -> None:
+        pair = self.pair(layer_a, layer_b)
+        if collides:
+            self._ignored.discard(pair)
+        else:
+            self._ignored.add(pair)
+
+    def collides(self, layer_a: str, layer_b: str) -> bool:
+        return self.pair(layer_a, layer_b) not in self._ignored
+
+    def pairs(self) -> Iterable[Tuple[str, str]]:
+        """Every unordered layer pair, self-pairs included."""
+
+        names = list(self.layers)
+        for i, name_a in enumerate(names):
+            for name_b in names[i:]:
+                yield name_a, name_b
+
+    def pair(self, layer_a: str, layer_b: str) -> Tuple[str, str]:
+        """The pair's key in the matrix and the report (layer order)."""
+
+        a, b = self.layer(layer_a), self.layer(layer_b)
+        return (a.name, b.name) if a.index <= b.index else (b.name, a.name)
+
+    # ------------------------------------------------------------------
+    # Bodies
+    # ------------------------------------------------------------------
+    def layer_for(self, layer: Optional[str], body_type: str) -> CollisionLayer:
+        """A body's layer: its own, else the default for its type, else the first layer."""
+
+        if layer is not None:
+            return self.layer(layer)
+        default = self.defaults.get(body_type)
+        if default is not None:
+            return self.layers[default]
+        return next(iter(self.layers.values()))
+
+    def filter_bits(self, layer: str, static: bool) -> Tuple[int, int]:
+        """PyBullet (group, mask) of a body in ``layer``; ``static`` for mass-0 bodies."""
+
+        own = self.layer(layer)
+        mask = 0
+        for other in self.layers.values():
+            if self.collides(own.name, other.name):
+                mask |= other.dynamic_bit
+                if not static:
+                    mask |= other.static_bit
+        return (own.static_bit if static else own.dynamic_bit), mask
+
+    def empty_report(self) -> Dict[Tuple[str, str], LayerPairStats]:
+        return {
+            (a, b): LayerPairStats(a, b, enabled=self.collides(a, b))
+            for a, b in self.pairs()
+        }
+
+    @staticmethod
+    def format_report(stats: Iterable[LayerPairStats]) -> List[str]:
+        """Report lines, busiest pairs first; enabled pairs without contacts can be pruned."""
+
+        lines = []
+        for entry in sorted(stats, key=lambda item: (-item.contact_points, item.layer_a, item.layer_b)):
+            if entry.contact_points:
+                note = "" if entry.enabled else "  (disabled, raw filter bits)"
+                lines.append(f"{entry.layer_a:>12} x {entry.layer_b:<12} {entry.contact_points:>8} points"
+                             f" in {entry.steps} steps{note}")
+            elif entry.enabled:
+                lines.append(f"{entry.layer_a:>12} x {entry.layer_b:<12}        - no contacts, could be ignored")
+        return lines
@@ -1,12 +1,23 @@
-"""Collision mesh generation and resolution helpers."""
+"""Collision mesh generation and resolution helpers.
+
+Built meshes are recorded in a ``collision_manifest.json`` beside them,
+holding a hash of the definition that built each one and a content hash
+of its inputs. An input newer than its output is only rebuilt from if its
+content changed, so touching a GLTF does not trigger a rebuild.
+"""
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+import hashlib
 import importlib
+import json
+import multiprocessing
+import os
 import sys
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from ..config.settings import ASSETS_DIR, PROJECT_ROOT
 
@@ -24,6 +35,14 @@ else:
 
 COLLISION_DIR = ASSETS_DIR / "collision"
 
+# File suffix for each supported collision_mesh "format"
+_FORMAT_SUFFIXES = {"obj": ".obj", "npz": ".npz"}
+
+MANIFEST_NAME = "collision_manifest.json"
+MANIFEST_VERSION = 1  # Bump to drop every recorded entry
+
+_HASH_CHUNK = 1 << 20
+
 
 class CollisionMeshError(RuntimeError):
     """Raised when collision mesh configuration is invalid."""
@@ -35,6 +54,18 @@ class CollisionMeshResult:
 
     path: Path
     rebuilt: bool
+    convex: bool = False  # The file holds convex hulls (a decomposition), not a triangle mesh
+
+
+@dataclass(frozen=True)
+class _MeshPlan:
+    """Where a definition's mesh goes, what it is built from and how."""
+
+    output_path: Path
+    dependencies: Tuple[Path, ...]
+    recipe: str  # Hash of everything besides the dependencies that shapes the output
+    build: Callable[[], None]
+    convex: bool = False
 
 
 def resolve_collision_mesh(
@@ -47,7 +78,11 @@ def resolve_collision_mesh(
     Resolve (and build if necessary) a collision mesh described by ``definition``.
 
     Args:
-        definition: Dictionary describing how to create the collision mesh.
+        definition: Dictionary describing how to create the collision mesh. An optional
+            ``format`` of ``"npz"`` writes the indexed binary format instead of OBJ.
+            An optional ``decomposition`` of ``"vhacd"`` (several convex hulls) or
+            ``"hull"`` (one simplified hull) also approximates the mesh by convex
+            hulls, with V-HACD parameters in ``decomposition_params``.
         base_path: Base directory used for resolving relative input paths (e.g. scene location).
         force_rebuild: When True, regenerate even if the output appears up-to-date.
 
@@ -55,6 +90,108 @@ def resolve_collision_mesh(
         Path to the generated collision mesh on disk.
     """
 
+    result, entries = _build_collision_mesh(definition, base_path, force_rebuild)
+    _record_builds(entries)
+    return result
+
+
+def collision_mesh_needs_build(definition: Dict[str, Any], *, base_path: Optional[Path] = None) -> bool:
+    """Whether resolve_collision_mesh would build anything for ``definition``."""
+
+    plans = _plan_collision_mesh(definition, base_path)
+    # Later stages are built from earlier outputs, so a stale stage makes the rest stale
+    return any(_needs_rebuild(plan) for plan in plans)
+
+
+def resolve_collision_meshes(
+    requests: Sequence[Tuple[Dict[str, Any], Optional[Path]]],
+    *,
+    jobs: int = 1,
+    force_rebuild: bool = False,
+) -> List[CollisionMeshResult]:
+    """
+    Resolve many collision meshes, building them in up to ``jobs`` processes.
+
+    Args:
+        requests: (definition, base_path) pairs
+        jobs: Worker processes; 1 builds everything in the calling process
+
+    Returns:
+        One result per request, in order
+    """
+
+    # Requests writing the same file are built once
+    keys = [str(_plan_collision_mesh(definition, base_path)[-1].output_path) for definition, base_path in requests]
+    unique: Dict[str, Tuple[Dict[str, Any], Optional[Path]]] = {}
+    for key, request in zip(keys, requests):
+        unique.setdefault(key, request)
+
+    if jobs > 1 and len(unique) > 1:
+        # Spawned rather than forked: the caller may hold a GL context or threads
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=min(jobs, len(unique)), mp_context=context) as pool:
+            futures = {
+                key: pool.submit(_build_collision_mesh, definition, base_path, force_rebuild)
+                for key, (definition, base_path) in unique.items()
+            }
+            builds = {key: future.result() for key, future in futures.items()}
+    else:
+        builds = {
+            key: _build_collision_mesh(definition, base_path, force_rebuild)
+            for key, (definition, base_path) in unique.items()
+        }
+
+    # Workers only build; their manifest entries are written here, once per directory
+    _record_builds([entry for _, entries in builds.values() for entry in entries])
+    return [builds[key][0] for key in keys]
+
+
+def prebuild_collision_meshes(
+    requests: Sequence[Tuple[Dict[str, Any], Optional[Path]]],
+    *,
+    jobs: int = 1,
+) -> Optional[Future[List[CollisionMeshResult]]]:
+    """
+    Start building the requests' missing or stale meshes in the background.
+
+    Lets a scene load build collision meshes while it loads everything
+    else; resolve_collision_mesh then finds them up to date.
+
+    Returns:
+        A future to wait on before creating bodies, or None when nothing needs building
+    """
+
+    stale = [(definition, base_path) for definition, base_path in requests
+             if collision_mesh_needs_build(definition, base_path=base_path)]
+    if not stale:
+        return None
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="CollisionBuild")
+    future = executor.submit(resolve_collision_meshes, stale, jobs=jobs)
+    executor.shutdown(wait=False)
+    return future
+
+
+def _build_collision_mesh(
+    definition: Dict[str, Any],
+    base_path: Optional[Path],
+    force_rebuild: bool,
+) -> Tuple[CollisionMeshResult, List[Tuple[Path, Dict[str, Any]]]]:
+    """Build a definition's stale stages; returns the result and the manifest entries to record."""
+
+    plans = _plan_collision_mesh(definition, base_path)
+    entries = []
+    for plan in plans:
+        if force_rebuild or _needs_rebuild(plan):
+            _ensure_collision_dir(plan.output_path)
+            plan.build()
+            entries.append((plan.output_path, _manifest_entry(plan)))
+    final = plans[-1]
+    return CollisionMeshResult(path=final.output_path, rebuilt=bool(entries), convex=final.convex), entries
+
+
+def _plan_collision_mesh(definition: Dict[str, Any], base_path: Optional[Path]) -> List[_MeshPlan]:
+    """The build stages of a definition: its mesh, then any convex decomposition of it."""
+
     if not isinstance(definition, dict):
         raise CollisionMeshError("collision_mesh definition must be a dictionary")
 
@@ -68,22 +205,50 @@ def resolve_collision_mesh(
         raise CollisionMeshError("collision_mesh definition requires a 'type' field")
 
     if mesh_type == "gltf":
-        return _resolve_gltf_collision(definition, base_path, force_rebuild)
-    if mesh_type in {"generator", "callable"}:
-        return _resolve_generator_collision(definition, base_path, force_rebuild)
+        plans = [_plan_gltf_collision(definition, base_path)]
+    elif mesh_type in {"generator", "callable"}:
+        plans = [_plan_generator_collision(definition, base_path)]
+    else:
+        raise CollisionMeshError(f"Unsupported collision mesh type: {mesh_type}")
+
+    if definition.get("decomposition"):
+        plans.append(_plan_decomposition(definition, plans[0].output_path))
+    return plans
+
 
-    raise CollisionMeshError(f"Unsupported collision mesh type: {mesh_type}")
+def _recipe(*parts: Any) -> str:
+    payload = json.dumps([MANIFEST_VERSION, *parts], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------------
+# Convex decompositions
+# ---------------------------------------------------------------------------
+
+def _plan_decomposition(definition: Dict[str, Any], mesh_path: Path) -> _MeshPlan:
+    method = str(definition["decomposition"]).lower()
+    if method not in _exporter.DECOMPOSITION_METHODS:
+        raise CollisionMeshError(f"Unsupported collision mesh decomposition: {method}")
+    params = dict(definition.get("decomposition_params", {}))
+
+    # Parameters are part of the name, so changing them builds a new file
+    digest = hashlib.sha256(json.dumps([method, params], sort_keys=True).encode("utf-8")).hexdigest()[:8]
+    output_path = mesh_path.with_name(f"{mesh_path.stem}_{method}_{digest}.obj")
+
+    def build() -> None:
+        try:
+            _exporter.export_convex_decomposition(mesh_path, output_path, method=method, **params)
+        except ValueError as exc:
+            raise CollisionMeshError(str(exc)) from exc
+
+    return _MeshPlan(output_path, (mesh_path,), _recipe("decomposition", method, params), build, convex=True)
 
 
 # ---------------------------------------------------------------------------
 # GLTF collision meshes
 # ---------------------------------------------------------------------------
 
-def _resolve_gltf_collision(
-    definition: Dict[str, Any],
-    base_path: Optional[Path],
-    force_rebuild: bool,
-) -> CollisionMeshResult:
+def _plan_gltf_collision(definition: Dict[str, Any], base_path: Optional[Path]) -> _MeshPlan:
     source = definition.get("source")
     if not source:
         raise CollisionMeshError("GLTF collision mesh requires a 'source' path")
@@ -91,18 +256,16 @@ def _resolve_gltf_collision(
     source_path = _resolve_input_path(source, base_path)
     dependencies = [_resolve_input_path(dep, base_path) for dep in definition.get("dependencies", [])]
 
-    default_name = _default_gltf_output_name(source_path)
+    default_name = _default_gltf_output_name(source_path, _output_suffix(definition))
     output_path = _resolve_output_path(definition, default_name)
 
-    needs_rebuild = _needs_rebuild(output_path, [source_path, *dependencies]) or force_rebuild
-    if needs_rebuild:
-        _ensure_collision_dir(output_path)
+    def build() -> None:
         _exporter.export_gltf_collision(source_path, output_path)
 
-    return CollisionMeshResult(path=output_path, rebuilt=needs_rebuild)
+    return _MeshPlan(output_path, (source_path, *dependencies), _recipe("gltf", str(output_path.suffix)), build)
 
 
-def _default_gltf_output_name(source_path: Path) -> str:
+def _default_gltf_output_name(source_path: Path, suffix: str = ".obj") -> str:
     try:
         relative = source_path.resolve().relative_to(ASSETS_DIR)
     except ValueError:
@@ -115,17 +278,13 @@ def _default_gltf_output_name(source_path: Path) -> str:
     if not parts:
         parts = [_slugify(source_path.stem or "mesh")]
     slug = "_".join(parts)
-    return f"{slug}_collision.obj"
+    return f"{slug}_collision{suffix}"
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
-def _resolve_generator_collision(
-    definition: Dict[str, Any],
-    base_path: Optional[Path],
-    force_rebuild: bool,
-) -> CollisionMeshResult:
+def _plan_generator_collision(definition: Dict[str, Any], base_path: Optional[Path]) -> _MeshPlan:
     target = definition.get("generator") or definition.get("callable")
     if not target:
         raise CollisionMeshError("Generator collision mesh requires a 'generator' reference")
@@ -139,15 +298,15 @@ def _resolve_generator_collision(
     dependency_values = definition.get("dependencies", [])
     dependency_paths = [_resolve_input_path(dep, base_path) for dep in dependency_values]
 
-    needs_rebuild = force_rebuild or _needs_rebuild(output_path, dependency_paths)
-    if needs_rebuild:
-        _ensure_collision_dir(output_path)
-        call_kwargs = dict(params)
-        if definition.get("pass_base_path") and base_path is not None:
-            call_kwargs.setdefault("base_path", base_path)
+    call_kwargs = dict(params)
+    if definition.get("pass_base_path") and base_path is not None:
+        call_kwargs.setdefault("base_path", base_path)
+
+    def build() -> None:
         callback(output_path, **call_kwargs)
 
-    return CollisionMeshResult(path=output_path, rebuilt=needs_rebuild)
+    return _MeshPlan(output_path, tuple(dependency_paths), _recipe("generator", str(target), call_kwargs), build)
+
 
 def _resolve_input_path(value: str, base_path: Optional[Path]) -> Path:
     raw_path = Path(value)
@@ -173,29 +332,99 @@ def _resolve_output_path(definition: Dict[str, Any], default_name: str) -> Path:
     else:
         label = _slugify_path(definition.get("name", ""))
         if label:
-            inferred = _ensure_obj_extension(label)
+            inferred = _ensure_extension(label, _output_suffix(definition))
         else:
             inferred = default_name
         output_path = (COLLISION_DIR / inferred).resolve()
     return output_path
 
 
-def _needs_rebuild(output_path: Path, dependencies: Iterable[Path]) -> bool:
-    if not output_path.exists():
-        return True
+def _needs_rebuild(plan: _MeshPlan) -> bool:
+    """Whether a plan's output is missing, built by another recipe, or older than changed inputs."""
+
     try:
-        output_mtime = output_path.stat().st_mtime
+        output_mtime = plan.output_path.stat().st_mtime
     except FileNotFoundError:
         return True
-    for dep in dependencies:
+
+    entry = _load_manifest(plan.output_path.parent).get(plan.output_path.name)
+    if entry is not None and entry.get("recipe") != plan.recipe:
+        return True
+
+    newer = False
+    for dep in plan.dependencies:
         try:
             if dep.stat().st_mtime > output_mtime:
-                return True
+                newer = True
+                break
         except FileNotFoundError:
             continue
+    if not newer:
+        return False
+    if entry is None:
+        return True
+
+    # Touched inputs: rebuild only if their content changed
+    if _hash_inputs(plan.dependencies) != entry.get("inputs"):
+        return True
+    os.utime(plan.output_path)  # So the next check takes the mtime path
     return False
 
 
+def _manifest_entry(plan: _MeshPlan) -> Dict[str, Any]:
+    """A freshly built output's recipe and the content of its inputs."""
+
+    return {"recipe": plan.recipe, "inputs": _hash_inputs(plan.dependencies)}
+
+
+def _record_builds(entries: Sequence[Tuple[Path, Dict[str, Any]]]) -> None:
+    """
+    Write manifest entries for built outputs, one read-modify-write per directory.
+
+    Manifests are rewritten whole, so only one process may write them: the
+    worker processes of resolve_collision_meshes return their entries to
+    the parent instead of recording them.
+    """
+
+    by_directory: Dict[Path, Dict[str, Dict[str, Any]]] = {}
+    for output_path, entry in entries:
+        by_directory.setdefault(output_path.parent, {})[output_path.name] = entry
+    for directory, updates in by_directory.items():
+        manifest = _load_manifest(directory)
+        manifest.update(updates)
+        path = directory / MANIFEST_NAME
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": MANIFEST_VERSION, "entries": manifest}, indent=1, sort_keys=True),
+                       encoding="utf-8")
+        os.replace(tmp, path)
+
+
+def _load_manifest(directory: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        payload = json.loads((directory / MANIFEST_NAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("version") != MANIFEST_VERSION:
+        return {}
+    entries = payload.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _hash_inputs(paths: Iterable[Path]) -> Dict[str, Optional[str]]:
+    return {str(path): _hash_file(path) for path in paths}
+
+
+def _hash_file(path: Path) -> Optional[str]:
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(_HASH_CHUNK), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
 def _ensure_collision_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -217,10 +446,18 @@ def _slugify_path(value: str) -> str:
     return "_".join(_slugify(part) for part in Path(value).parts if part not in {"", "."})
 
 
-def _ensure_obj_extension(label: str) -> str:
-    if label.lower().endswith(".obj"):
+def _output_suffix(definition: Dict[str, Any]) -> str:
+    mesh_format = str(definition.get("format", "obj")).lower()
+    try:
+        return _FORMAT_SUFFIXES[mesh_format]
+    except KeyError:
+        raise CollisionMeshError(f"Unsupported collision mesh format: {mesh_format}") from None
+
+
+def _ensure_extension(label: str, suffix: str) -> str:
+    if label.lower().endswith(tuple(_FORMAT_SUFFIXES.values())):
         return label
-    return f"{label}.obj"
+    return f"{label}{suffix}"
 
 
 def _import_callable(target: str):
@@ -238,7 +475,8 @@ def _import_callable(target: str):
 
 
 def _default_generator_output_name(definition: Dict[str, Any], target: Any) -> str:
+    suffix = _output_suffix(definition)
     name = definition.get("name")
     if name:
-        return _ensure_obj_extension(_slugify_path(str(name)))
-    return f"{_slugify(str(target))}_collision.obj"
+        return _ensure_extension(_slugify_path(str(name)), suffix)
+    return f"{_slugify(str(target))}_collision{suffix}"
@@ -0,0 +1,96 @@
+"""Collision mesh file formats: OBJ text and indexed binary ``.npz``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+MESH_FORMAT_VERSION = 1  # Bump when the .npz layout changes
+
+# PyBullet's createCollisionShape(vertices=..., indices=...) command limits;
+# larger meshes have to be loaded from a file
+MAX_MESH_VERTICES = 131072
+MAX_MESH_INDICES = 524288
+
+_BLOCK_ROWS = 65536  # Rows formatted per write
+
+
+def write_rows(handle, line_format: str, rows: np.ndarray) -> None:
+    """Write ``line_format % row`` for every row, one preformatted block at a time."""
+
+    for start in range(0, len(rows), _BLOCK_ROWS):
+        block = rows[start:start + _BLOCK_ROWS]
+        handle.write((line_format * len(block)) % tuple(block.ravel().tolist()))
+
+
+def _as_mesh_arrays(vertices: Any, indices: Any) -> Tuple[np.ndarray, np.ndarray]:
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+    indices = np.asarray(indices, dtype=np.int64).reshape(-1, 3)
+    if indices.size and (indices.min() < 0 or indices.max() >= len(vertices)):
+        raise ValueError("Mesh indices out of range")
+    return vertices, indices
+
+
+def write_obj(path: Path, vertices: Any, indices: Any, *, comment: str = "Generated collision mesh") -> None:
+    """
+    Write an OBJ file containing only vertices and triangle faces.
+
+    Args:
+        path: Output path
+        vertices: (N, 3) vertex positions
+        indices: (M, 3) zero-based triangle indices (written 1-based)
+        comment: Header comment line
+    """
+
+    vertices, indices = _as_mesh_arrays(vertices, indices)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="ascii", buffering=1 << 20) as handle:
+        handle.write(f"# {comment}\n")
+        handle.write(f"# Vertices: {len(vertices)}\n")
+        handle.write(f"# Faces: {len(indices)}\n")
+        write_rows(handle, "v %.6f %.6f %.6f\n", vertices)
+        write_rows(handle, "f %d %d %d\n", indices + 1)
+
+
+def save_collision_mesh(path: Path, vertices: Any, indices: Any) -> None:
+    """Write an indexed float32/uint32 collision mesh to ``.npz``."""
+
+    vertices, indices = _as_mesh_arrays(vertices, indices)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write through a handle so numpy does not append a second .npz suffix
+    with path.open("wb") as handle:
+        np.savez(
+            handle,
+            vertices=vertices.astype(np.float32),
+            indices=indices.astype(np.uint32),
+            version=np.int32(MESH_FORMAT_VERSION),
+        )
+
+
+def load_collision_mesh(path: Path) -> Tuple[np.ndarray, np.ndarray]:
+    """Read a mesh written by save_collision_mesh: (N, 3) float32 vertices, (M, 3) uint32 indices."""
+
+    with np.load(str(path)) as data:
+        version = int(data["version"]) if "version" in data else 0
+        if version != MESH_FORMAT_VERSION:
+            raise ValueError(f"Unsupported collision mesh version {version} in {path}")
+        return data["vertices"].reshape(-1, 3), data["indices"].reshape(-1, 3)
+
+
+def write_collision_mesh(path: Path, vertices: Any, indices: Any) -> None:
+    """Write a collision mesh in the format given by the path suffix (``.npz`` or ``.obj``)."""
+
+    if Path(path).suffix.lower() == ".npz":
+        save_collision_mesh(path, vertices, indices)
+    else:
+        write_obj(path, vertices, indices)
+
+
+def fits_in_memory_shape(vertices: np.ndarray, indices: Optional[np.ndarray] = None) -> bool:
+    """Whether PyBullet can build the mesh from arrays rather than a file."""
+
+    return len(vertices) <= MAX_MESH_VERTICES and (indices is None or indices.size <= MAX_MESH_INDICES)
@@ -0,0 +1,211 @@
+"""Run PhysicsWorld stepping on a worker thread.
+
+The main thread hands each frame's inputs (kinematic targets, and body
+writes such as impulses, teleports and velocity changes) to the worker
+and applies the worker's previous output (transforms, optional contacts)
+to the scene. Outputs are double-buffered: the worker fills the
+back snapshot while the main thread reads the front one, and the two swap
+when a step completes. Frame N therefore renders the physics state
+computed while frame N-1 was rendering, one frame later than the
+single-threaded path.
+
+The worker drives the world's own PyBullet client. PyBullet holds the GIL
+for the length of every call, stepSimulation included, so physics only
+overlaps main-thread work that releases the GIL (buffer swaps, vsync
+waits, OpenGL calls through ctypes, I/O). Python-side frame work still
+runs between physics calls rather than beside them.
+
+Only one thread may use the client at a time. While a worker runs,
+PhysicsWorld queues body writes for the next step, and queries (rays,
+sweeps, contacts, body state) first wait for the in-flight step. Queries
+therefore see the newest physics state, one step ahead of the scene.
+
+Example:
+    world = PhysicsWorld(PhysicsWorldSettings(threaded=True))
+    ...
+    world.step_simulation(delta_time)  # Applies step N-1, starts step N
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+if TYPE_CHECKING:  # pragma: no cover - import guard for type checking only
+    from .physics_world import PhysicsWorld
+
+# A queued client write: a PhysicsWorld method and its arguments
+BodyWrite = Tuple[Callable[..., None], Tuple[Any, ...]]
+
+
+@dataclass
+class StepInputs:
+    """Everything one worker step consumes, gathered on the main thread."""
+
+    delta_time: float
+    kinematic: List[Tuple[int, Tuple[float, ...], Tuple[float, ...]]] = field(default_factory=list)
+    writes: List[BodyWrite] = field(default_factory=list)  # In call order
+
+
+@dataclass
+class PhysicsSnapshot:
+    """World state after a worker step, as read by the main thread."""
+
+    body_ids: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.int64))
+    previous: np.ndarray = field(default_factory=lambda: np.zeros((0, 7)))
+    current: np.ndarray = field(default_factory=lambda: np.zeros((0, 7)))
+    alpha: Optional[float] = None  # None when the world does not interpolate
+    contacts: Optional[np.ndarray] = None  # CONTACT_DTYPE array when capturing contacts
+    steps: int = 0  # Worker steps completed when this snapshot was taken
+
+
+class PhysicsWorker:
+    """Steps a PhysicsWorld on a daemon thread; driven by PhysicsWorld.step_simulation."""
+
+    def __init__(self, world: "PhysicsWorld", capture_contacts: bool = False):
+        self.world = world
+        self.capture_contacts = capture_contacts
+        self._snapshots = [PhysicsSnapshot(), PhysicsSnapshot()]
+        self._front = 0
+        self._inputs: Optional[StepInputs] = None
+        self._writes: List[BodyWrite] = []
+        self._pending = False  # A step was kicked off and its snapshot not yet applied
+        self._error: Optional[BaseException] = None
+        self._wake = threading.Event()
+        self._done = threading.Event()
+        self._done.set()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name="PhysicsWorker", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Finish the in-flight step, apply it to the scene and join the thread."""
+
+        if self._thread is None:
+            return
+        try:
+            self._apply_pending()
+            self.flush()
+        finally:
+            self._running = False
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+
+    def wait(self) -> None:
+        """Block until the in-flight step (if any) is done; re-raises errors from the worker."""
+
+        self._done.wait()
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    # ------------------------------------------------------------------
+    # Main-thread API
+    # ------------------------------------------------------------------
+    @property
+    def snapshot(self) -> PhysicsSnapshot:
+        """The front snapshot: the state last applied to the scene."""
+
+        return self._snapshots[self._front]
+
+    def queue(self, write: Callable[..., None], *args: Any) -> None:
+        """Call ``write(*args)`` before the next worker step, or at the next flush."""
+
+        self._writes.append((write, args))
+
+    def queue_impulse(self, body_id: int, impulse: Tuple[float, float, float]) -> None:
+        """Apply an impulse before the next worker step."""
+
+        self.queue(self.world._apply_impulse, body_id, tuple(impulse))
+
+    def discard(self) -> None:
+        """Finish the in-flight step and drop its snapshot and any queued writes."""
+
+        try:
+            self.wait()
+        finally:
+            self._pending = False
+            self._writes = []
+            self._snapshots = [PhysicsSnapshot(), PhysicsSnapshot()]
+            self._front = 0
+
+    def flush(self) -> None:
+        """Apply queued writes on the calling thread; only while no step is in flight."""
+
+        writes, self._writes = self._writes, []
+        for write, args in writes:
+            write(*args)
+
+    def step(self, delta_time: float) -> int:
+        """
+        Apply the finished step to the scene and start the next one.
+
+        Returns:
+            Number of scene objects updated
+        """
+
+        updated = self._apply_pending()
+        inputs = StepInputs(delta_time, self.world._kinematic_updates(), self._writes)
+        self._writes = []
+        self._inputs = inputs
+        self._pending = True
+        self._done.clear()
+        self._wake.set()
+        return updated
+
+    def _apply_pending(self) -> int:
+        try:
+            self.wait()
+        except BaseException:
+            self._pending = False  # The back snapshot is incomplete
+            raise
+        if not self._pending:
+            return 0
+        self._pending = False
+        self._front ^= 1
+        front = self._snapshots[self._front]
+        return self.world._write_scene(front.body_ids, front.previous, front.current, front.alpha)
+
+    # ------------------------------------------------------------------
+    # Worker thread
+    # ------------------------------------------------------------------
+    def _loop(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            if not self._running:
+                return
+            inputs, self._inputs = self._inputs, None
+            try:
+                if inputs is not None:
+                    self._run_step(inputs)
+            except BaseException as error:  # Surfaced on the main thread by wait()
+                self._error = error
+            finally:
+                self._done.set()
+
+    def _run_step(self, inputs: StepInputs) -> None:
+        world = self.world
+        world._advance(inputs.delta_time, inputs.kinematic, inputs.writes)
+
+        back = self._snapshots[self._front ^ 1]
+        back.current = world._read_transforms()
+        back.body_ids = world._synced_ids.copy()
+        world._settle_teleports(back.current)
+        back.previous = world._previous_transforms.copy()
+        back.alpha = world.interpolation_alpha if world.settings.interpolate else None
+        back.contacts = world._read_contacts(as_array=True) if self.capture_contacts else None
+        back.steps = self.snapshot.steps + 1
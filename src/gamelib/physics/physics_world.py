@@ -3,12 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+import json
+import logging
 import math
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
 from pyrr import Quaternion, Vector3
 
+from .collision_layers import CollisionLayers, LayerPairStats
 from .collision_meshes import resolve_collision_mesh, CollisionMeshError
+from .mesh_io import fits_in_memory_shape, load_collision_mesh, write_obj
+
+if TYPE_CHECKING:  # pragma: no cover - import guard for type checking only
+    from .physics_worker import BodyWrite, PhysicsWorker
 
 try:  # pragma: no cover - exercised indirectly when PyBullet is available
     import pybullet as _pb
@@ -30,6 +39,42 @@ _CONE_COLLISION_DEFINITION = {
     "name": "cone_collision",
 }
 
+logger = logging.getLogger(__name__)
+
+# Primitives whose collider defaults to a heightfield built from their height grid
+_TERRAIN_PRIMITIVES = {"donut_terrain", "heightmap_terrain"}
+
+# Largest batch rayTestBatch handles in full (it drops the last ray of a
+# 16384-ray batch and rejects anything bigger)
+_RAY_BATCH_LIMIT = 16383
+
+# Shape sweeps stop this far from the surface they hit, and give up refining
+# the time of impact (reporting the conservative one) after this many steps
+_SWEEP_SKIN = 1e-3
+_SWEEP_MAX_ITERATIONS = 32
+
+# Structured dtype of get_contacts(as_array=True): getContactPoints columns 1-13
+CONTACT_DTYPE = np.dtype([
+    ("body_a", np.int32),
+    ("body_b", np.int32),
+    ("link_a", np.int32),
+    ("link_b", np.int32),
+    ("position_on_a", np.float64, (3,)),
+    ("position_on_b", np.float64, (3,)),
+    ("normal_on_b", np.float64, (3,)),
+    ("distance", np.float64),
+    ("normal_force", np.float64),
+    ("lateral_friction_1", np.float64),
+    ("lateral_dir_1", np.float64, (3,)),
+    ("lateral_friction_2", np.float64),
+    ("lateral_dir_2", np.float64, (3,)),
+])
+
+# PyBullet heightfields are Z-up. This rotation maps the grid's X, Y and up
+# axes onto world Z, X and Y, which keeps Bullet's quad diagonals the same as
+# the terrain meshes' (a mirrored mapping would flip them)
+_HEIGHTFIELD_ORIENTATION = (-0.5, -0.5, -0.5, 0.5)
+
 def _vec3(value: Iterable[float] | None) -> Optional[Tuple[float, float, float]]:
     """Convert an iterable to a tuple of three floats."""
 
@@ -55,6 +100,45 @@ def _quat(value: Iterable[float] | None) -> Optional[Tuple[float, float, float,
     raise ValueError(f"Expected 3 or 4 components for quaternion, got {data}")
 
 
+def _blend_transforms(previous: np.ndarray, current: np.ndarray, alpha: float) -> np.ndarray:
+    """Blend (N, 7) position + quaternion rows: lerp positions, nlerp orientations."""
+
+    previous = np.where(np.isnan(previous), current, previous)
+    blended = previous + (current - previous) * alpha
+    # Take the short way round: flip the previous quaternion when it is on the far side
+    flip = np.einsum("ij,ij->i", previous[:, 3:], current[:, 3:]) < 0.0
+    if flip.any():
+        blended[flip, 3:] = -previous[flip, 3:] * (1.0 - alpha) + current[flip, 3:] * alpha
+    blended[:, 3:] /= np.linalg.norm(blended[:, 3:], axis=1, keepdims=True)
+    return blended
+
+
+def _remap_rows(old_ids: np.ndarray, rows: np.ndarray, new_ids: np.ndarray) -> np.ndarray:
+    """Transform rows reordered from ``old_ids`` to ``new_ids`` (NaN for bodies without one)."""
+
+    remapped = np.full((len(new_ids), 7), np.nan)
+    index = {body_id: row for row, body_id in enumerate(old_ids.tolist())}
+    pairs = [(row, index[body_id]) for row, body_id in enumerate(new_ids.tolist()) if body_id in index]
+    if pairs:
+        new_rows, old_rows = (list(column) for column in zip(*pairs))
+        remapped[new_rows] = rows[old_rows]
+    return remapped
+
+
+def _load_heightmap(path: Path) -> Tuple[np.ndarray, float, Tuple[float, float]]:
+    """Heights, sample spacing and (x, z) origin of a save_heightmap ``.npz``.
+
+    The grid is centred on the origin, as heightmap_terrain draws it.
+    """
+
+    with np.load(str(path)) as data:
+        meta = json.loads(str(data["meta"]))
+        resolution = int(meta["resolution"])
+        heights = np.asarray(data["heights"], dtype=np.float32).reshape(resolution, resolution)
+    world_size = float(meta["world_size"])
+    return heights, world_size / (resolution - 1), (-world_size / 2.0, -world_size / 2.0)
+
+
 @dataclass(slots=True)
 class PhysicsWorldSettings:
     """Settings that control global physics simulation behaviour."""
@@ -64,6 +148,9 @@ class PhysicsWorldSettings:
     max_substeps: int = 4
     enable_sleeping: bool = True
     additional_search_paths: Tuple[str, ...] = ()
+    ray_batch_threads: int = 1  # rayTestBatch numThreads (0 = let Bullet decide)
+    interpolate: bool = True  # Blend the last two physics steps when syncing to the scene
+    threaded: bool = False  # Step on a PhysicsWorker thread (see physics_worker.py)
 
 
 @dataclass(slots=True)
@@ -80,6 +167,14 @@ class PhysicsBodyConfig:
     plane_constant: float = 0.0
     mesh_path: Optional[str] = None
     mesh_scale: Optional[Tuple[float, float, float]] = None
+    mesh_vertices: Optional[Any] = None  # In-memory (N, 3) vertices, used instead of mesh_path
+    mesh_indices: Optional[Any] = None   # Triangle indices for mesh_vertices
+    mesh_convex: bool = False  # mesh_path holds convex hulls (e.g. a decomposition); never a static trimesh
+    heightfield_data: Optional[Any] = None  # 2D heights, rows along X and columns along Z
+    heightfield_spacing: Optional[float] = None  # Distance between heightfield samples
+    heightfield_origin: Optional[Tuple[float, float]] = None  # Object-space (x, z) of sample (0, 0)
+    heightfield_path: Optional[str] = None  # .npz heightmap (fractal_perlin save_heightmap format)
+    heightfield_downsample: int = 1  # Keep every n-th sample along each axis
     restitution: float = 0.0
     friction: float = 0.5
     rolling_friction: float = 0.0
@@ -91,6 +186,8 @@ class PhysicsBodyConfig:
     angular_velocity: Optional[Tuple[float, float, float]] = None
     collision_group: Optional[int] = None
     collision_mask: Optional[int] = None
+    collision_layer: Optional[str] = None  # Named layer from the scene's collision_layers
+    sleep_threshold: Optional[float] = None  # Kinetic energy below which the body may sleep
     contact_stiffness: Optional[float] = None
     contact_damping: Optional[float] = None
     enable_sleeping: Optional[bool] = None
@@ -124,6 +221,14 @@ class PhysicsBodyConfig:
             config.mesh_path = str(data["mesh_path"])
         if "mesh_scale" in data:
             config.mesh_scale = _vec3(data["mesh_scale"])
+        if "mesh_convex" in data:
+            config.mesh_convex = bool(data["mesh_convex"])
+        if "heightfield_path" in data:
+            config.heightfield_path = str(data["heightfield_path"])
+        if "heightfield_spacing" in data:
+            config.heightfield_spacing = float(data["heightfield_spacing"])
+        if "heightfield_downsample" in data:
+            config.heightfield_downsample = max(int(data["heightfield_downsample"]), 1)
         if "restitution" in data:
             config.restitution = float(data["restitution"])
         if "friction" in data:
@@ -146,6 +251,11 @@ class PhysicsBodyConfig:
             config.collision_group = int(data["collision_group"])
         if "collision_mask" in data:
             config.collision_mask = int(data["collision_mask"])
+        layer = data.get("collision_layer", data.get("layer"))
+        if layer is not None:
+            config.collision_layer = str(layer)
+        if "sleep_threshold" in data:
+            config.sleep_threshold = float(data["sleep_threshold"])
         if "contact_stiffness" in data:
             config.contact_stiffness = float(data["contact_stiffness"])
         if "contact_damping" in data:
@@ -198,6 +308,55 @@ class PhysicsBodyHandle:
     config: PhysicsBodyConfig
 
 
+@dataclass(slots=True)
+class RayBatchResult:
+    """Closest hit of every ray in a batch, as arrays (misses have body_id -1)."""
+
+    body_ids: np.ndarray   # (N,) int
+    fractions: np.ndarray  # (N,) hit fraction along each ray, 1.0 on a miss
+    positions: np.ndarray  # (N, 3) hit positions
+    normals: np.ndarray    # (N, 3) hit normals
+
+    @property
+    def hit(self) -> np.ndarray:
+        """Boolean mask of rays that hit something."""
+
+        return self.body_ids >= 0
+
+    def __len__(self) -> int:
+        return len(self.body_ids)
+
+    def closest(self) -> Optional[int]:
+        """Index of the nearest hit (by fraction), or None if every ray missed."""
+
+        if not self.hit.any():
+            return None
+        return int(np.argmin(np.where(self.hit, self.fractions, np.inf)))
+
+    def as_dict(self, index: int) -> Optional[Dict[str, Any]]:
+        """One ray's hit in the same form as PhysicsWorld.ray_test."""
+
+        if self.body_ids[index] < 0:
+            return None
+        return {
+            "body_id": int(self.body_ids[index]),
+            "hit_fraction": float(self.fractions[index]),
+            "hit_position": tuple(self.positions[index].tolist()),
+            "hit_normal": tuple(self.normals[index].tolist()),
+        }
+
+
+@dataclass(slots=True)
+class SweepHit:
+    """First contact of a shape swept along a line segment."""
+
+    body_id: int
+    fraction: float  # Time of impact along the sweep (0 = start, 1 = end)
+    position: Tuple[float, float, float]  # Shape position at the time of impact
+    point: Tuple[float, float, float]  # Contact point on the hit body
+    normal: Tuple[float, float, float]  # Surface normal, pointing from the hit body towards the shape
+
+
 class PhysicsWorld:
     """Manage a PyBullet physics world and synchronize it with scene objects."""
 
@@ -211,9 +370,24 @@ class PhysicsWorld:
         self._client = _pb.connect(_pb.DIRECT)
         self._bodies: Dict[int, PhysicsBodyHandle] = {}
         self._angular_factor_overrides: Dict[int, Tuple[float, float, float]] = {}
+        self._sweep_shapes: Dict[Tuple[float, float], int] = {}
+        # Collision shapes shared by bodies with the same geometry (see _shape_cache_key)
+        self._shape_cache: Dict[Tuple[Any, ...], int] = {}
+        # getContactPoints results keyed by (bodyA, bodyB) filter; contacts only
+        # change when the world steps, so this is cleared on every step
+        self._contact_cache: Dict[Tuple[int, int], Tuple[Any, ...]] = {}
+        self._clear_sync_state()
+        # Last transform pushed to each kinematic body
+        self._kinematic_transforms: Dict[int, Tuple[Tuple[float, ...], Tuple[float, ...]]] = {}
+        # Named layers from scene metadata, and contacts per layer pair while reporting
+        self.collision_layers: Optional[CollisionLayers] = None
+        self._layer_report: Optional[Dict[Tuple[str, str], LayerPairStats]] = None
+        self._worker: Optional["PhysicsWorker"] = None
         self._accumulator = 0.0
         self._paused = False
         self._configure_world()
+        if self.settings.threaded:
+            self.start_worker()
 
     # ------------------------------------------------------------------
     # Lifecycle management
@@ -229,9 +403,52 @@ class PhysicsWorld:
         for path in self.settings.additional_search_paths:
             _pb.setAdditionalSearchPath(str(path), physicsClientId=self._client)
 
+    def start_worker(self, capture_contacts: bool = False) -> "PhysicsWorker":
+        """Step the world on a worker thread from now on (see PhysicsWorker)."""
+
+        from .physics_worker import PhysicsWorker
+
+        if self._worker is None:
+            self._worker = PhysicsWorker(self, capture_contacts=capture_contacts)
+            self._worker.start()
+        else:
+            self._worker.capture_contacts = capture_contacts
+        return self._worker
+
+    def stop_worker(self) -> None:
+        """Finish the in-flight step and go back to stepping on the calling thread."""
+
+        if self._worker is not None:
+            self._worker.stop()
+            self._worker = None
+
+    @property
+    def worker(self) -> Optional["PhysicsWorker"]:
+        return self._worker
+
+    def _join_worker(self) -> None:
+        """
+        Wait for an in-flight worker step and apply queued writes.
+
+        Called before any main-thread use of the client while a worker runs.
+        """
+
+        if self._worker is not None:
+            self._worker.wait()
+            self._worker.flush()
+
+    def _write(self, write: Callable[..., None], *args: Any) -> None:
+        """Call a client write now, or queue it for the next step while a worker runs."""
+
+        if self._worker is not None:
+            self._worker.queue(write, *args)
+        else:
+            write(*args)
+
     def shutdown(self) -> None:
         """Disconnect the physics client."""
 
+        self.stop_worker()
         if self._client is not None:
             _pb.disconnect(self._client)
             self._client = None
@@ -241,8 +458,21 @@ class PhysicsWorld:
 
         if self._client is None:
             return
+        if self._worker is not None:
+            # PyBullet reuses body ids, so nothing from the old bodies may reach new ones
+            self._worker.discard()
+        if self._layer_report is not None:
+            for line in CollisionLayers.format_report(self._layer_report.values()):
+                logger.info("Layer contacts: %s", line)
+        self.collision_layers = None
+        self._layer_report = None
         self._bodies.clear()
         self._angular_factor_overrides.clear()
+        self._sweep_shapes.clear()
+        self._shape_cache.clear()
+        self._contact_cache.clear()
+        self._kinematic_transforms.clear()
+        self._clear_sync_state()
         _pb.resetSimulation(physicsClientId=self._client)
         self._configure_world()
         self._accumulator = 0.0
@@ -264,10 +494,12 @@ class PhysicsWorld:
     # Configuration
     # ------------------------------------------------------------------
     def set_gravity(self, gravity: Tuple[float, float, float]) -> None:
+        self._join_worker()
         self.settings.gravity = tuple(float(v) for v in gravity)
         _pb.setGravity(*self.settings.gravity, physicsClientId=self._client)
 
     def set_time_step(self, fixed_time_step: float, max_substeps: Optional[int] = None) -> None:
+        self._join_worker()
         self.settings.fixed_time_step = float(fixed_time_step)
         if max_substeps is not None:
             self.settings.max_substeps = int(max_substeps)
@@ -287,6 +519,33 @@ class PhysicsWorld:
             self.set_time_step(float(time_step), max_substeps=max_substeps)
         if "enable_sleeping" in metadata:
             self.settings.enable_sleeping = bool(metadata["enable_sleeping"])
+        if "interpolate" in metadata:
+            self.settings.interpolate = bool(metadata["interpolate"])
+        if "collision_layers" in metadata:
+            self.set_collision_layers(CollisionLayers.from_metadata(metadata["collision_layers"]))
+
+    def set_collision_layers(self, layers: Optional[CollisionLayers]) -> None:
+        """Use named collision layers for bodies created from now on."""
+
+        self.collision_layers = layers
+        self._layer_report = None
+        if layers is not None and layers.report:
+            self.start_layer_report()
+
+    def start_layer_report(self) -> None:
+        """Count contacts per layer pair on every step from now on."""
+
+        if self.collision_layers is None:
+            raise RuntimeError("No collision layers configured")
+        self._layer_report = self.collision_layers.empty_report()
+
+    def layer_contact_report(self) -> List[LayerPairStats]:
+        """Contacts per layer pair since start_layer_report (empty when not reporting)."""
+
+        self._join_worker()
+        if self._layer_report is None:
+            return []
+        return list(self._layer_report.values())
 
     # ------------------------------------------------------------------
     # Body creation helpers
@@ -301,10 +560,13 @@ class PhysicsWorld:
         """Fill in missing collider information based on the scene definition."""
 
         primitive = getattr(node_definition, "primitive", None)
+        if primitive is not None:
+            primitive = primitive.lower()
 
         if config.shape is None and primitive is not None:
-            primitive = primitive.lower()
-            if primitive in {"cube", "box"}:
+            if primitive in _TERRAIN_PRIMITIVES:
+                config.shape = "heightfield"
+            elif primitive in {"cube", "box"}:
                 config.shape = "box"
             elif primitive == "sphere":
                 config.shape = "sphere"
@@ -345,8 +607,12 @@ class PhysicsWorld:
             if isinstance(scale, Vector3):
                 config.mesh_scale = (float(scale.x), float(scale.y), float(scale.z))
 
-        # For heightmap_terrain primitives, auto-populate collision mesh from heightmap
-        if primitive == "heightmap_terrain" and config.collision_mesh is None:
+        if config.shape == "heightfield" and config.heightfield_data is None:
+            self._populate_heightfield(config, scene_object, node_definition, primitive, resource_base)
+
+        # For heightmap_terrain primitives with an explicit mesh collider, auto-populate
+        # the collision mesh from the heightmap
+        if primitive == "heightmap_terrain" and config.shape == "mesh" and config.collision_mesh is None:
             heightmap_path = None
             if hasattr(node_definition, "extras") and node_definition.extras:
                 heightmap_path = node_definition.extras.get("heightmap")
@@ -354,10 +620,14 @@ class PhysicsWorld:
                 heightmap_path = node_definition.mesh_path
 
             if heightmap_path:
-                # Create collision mesh definition using the heightmap
+                # Create collision mesh definition using the heightmap, stored in the
+                # binary format so it loads without OBJ parsing
                 config.collision_mesh = {
                     "type": "generator",
                     "generator": "tools.export_collision_meshes:export_heightmap_collision",
+                    "name": f"{Path(str(heightmap_path)).stem}_heightmap_collision",
+                    "format": "npz",
+                    "dependencies": [str(heightmap_path)],
                     "params": {
                         "heightmap_path": str(heightmap_path)
                     }
@@ -366,6 +636,7 @@ class PhysicsWorld:
         if config.mesh_path is None and config.collision_mesh is not None:
             mesh_result = resolve_collision_mesh(config.collision_mesh, base_path=resource_base)
             config.mesh_path = str(mesh_result.path)
+            config.mesh_convex = config.mesh_convex or mesh_result.convex
         if config.shape == "cone" and config.mesh_path is None:
             try:
                 mesh_result = resolve_collision_mesh(_CONE_COLLISION_DEFINITION, base_path=resource_base)
@@ -373,6 +644,94 @@ class PhysicsWorld:
                 raise FileNotFoundError(f"Cone collision mesh could not be generated: {exc}") from exc
             config.mesh_path = str(mesh_result.path)
 
+    def _populate_heightfield(
+        self,
+        config: PhysicsBodyConfig,
+        scene_object: Any,
+        node_definition: Any,
+        primitive: Optional[str],
+        resource_base: Optional[Path],
+    ) -> None:
+        """Find the height grid for a heightfield collider."""
+
+        extras = getattr(node_definition, "extras", None) or {}
+
+        heightmap_path = config.heightfield_path
+        if heightmap_path is None and primitive == "heightmap_terrain" and not hasattr(scene_object, "heights"):
+            heightmap_path = extras.get("heightmap") or getattr(node_definition, "mesh_path", None)
+
+        if heightmap_path:
+            path = Path(heightmap_path)
+            if not path.is_absolute() and resource_base is not None:
+                path = (resource_base / path).resolve()
+            if not path.exists():
+                raise FileNotFoundError(f"Heightfield heightmap not found: {heightmap_path}")
+            heights, spacing, origin = _load_heightmap(path)
+        elif hasattr(scene_object, "heights") and hasattr(scene_object, "spacing"):
+            # Chunked terrain keeps its height grid
+            heights = scene_object.heights
+            spacing = scene_object.spacing
+            origin = (float(scene_object.coords[0]), float(scene_object.coords[0]))
+        elif primitive == "donut_terrain":
+            from ..core.terrain_generation import generate_donut_height_data
+
+            resolution = int(extras.get("resolution", 128))
+            outer_radius = float(extras.get("outer_radius", 200.0))
+            heights = generate_donut_height_data(
+                resolution=resolution,
+                outer_radius=outer_radius,
+                inner_radius=float(extras.get("inner_radius", 80.0)),
+                height=float(extras.get("height", 50.0)),
+                rim_width=float(extras.get("rim_width", 40.0)),
+                seed=int(extras.get("seed", 42)),
+            )
+            world_size = outer_radius * 2.2
+            spacing = world_size / (resolution - 1)
+            origin = (-world_size / 2.0, -world_size / 2.0)
+        else:
+            raise ValueError("Heightfield collider requires 'heightfield_data' or 'heightfield_path'")
+
+        config.heightfield_data = heights
+        if config.heightfield_spacing is None:
+            config.heightfield_spacing = float(spacing)
+        if config.heightfield_origin is None:
+            config.heightfield_origin = origin
+
+    def _heightfield_samples(self, config: PhysicsBodyConfig) -> Tuple[np.ndarray, float, Tuple[float, float]]:
+        """Downsampled heights, their spacing and the object-space (x, z) origin."""
+
+        if config.heightfield_data is None:
+            raise ValueError("Heightfield collider requires 'heightfield_data' or 'heightfield_path'")
+        heights = np.asarray(config.heightfield_data, dtype=np.float32)
+        if heights.ndim != 2 or min(heights.shape) < 2:
+            raise ValueError(f"Heightfield data must be a 2D grid of at least 2x2 samples, got {heights.shape}")
+        spacing = float(config.heightfield_spacing or 1.0)
+        origin = config.heightfield_origin
+        if origin is None:
+            # Centred on the object like the terrain meshes
+            origin = (-(heights.shape[0] - 1) * spacing / 2.0, -(heights.shape[1] - 1) * spacing / 2.0)
+        step = max(int(config.heightfield_downsample), 1)
+        return heights[::step, ::step], spacing * step, origin
+
+    def _heightfield_frame(
+        self, config: PhysicsBodyConfig
+    ) -> Tuple[Tuple[float, float, float], Tuple[float, float, float, float]]:
+        """Offset and rotation of the heightfield relative to its scene object.
+
+        PyBullet centres a heightfield on the middle of its grid and of its
+        height range, and ignores collision frames for heightfields, so the
+        offset is applied to the body transform instead.
+        """
+
+        heights, spacing, origin = self._heightfield_samples(config)
+        scale = config.mesh_scale or (1.0, 1.0, 1.0)
+        center = (
+            (origin[0] + (heights.shape[0] - 1) * spacing / 2.0) * scale[0],
+            (float(heights.min()) + float(heights.max())) / 2.0 * scale[1],
+            (origin[1] + (heights.shape[1] - 1) * spacing / 2.0) * scale[2],
+        )
+        return center, _HEIGHTFIELD_ORIENTATION
+
     def _extract_scene_transform(self, scene_object: Any, config: PhysicsBodyConfig) -> Tuple[Tuple[float, float, float], Tuple[float, float, float, float]]:
         """Return the position and orientation of the scene object."""
 
@@ -401,6 +760,83 @@ class PhysicsWorld:
 
         return base_position, orientation
 
+    @staticmethod
+    def _mesh_source(mesh_path: str, concave: bool = False) -> Dict[str, Any]:
+        """createCollisionShape arguments for a mesh file.
+
+        Binary ``.npz`` meshes are passed to PyBullet as arrays, skipping
+        OBJ parsing. PyBullet builds a concave trimesh whenever indices are
+        given, so they are only passed for ``concave`` shapes; otherwise the
+        vertices alone give a convex hull, as an OBJ would. Meshes over
+        PyBullet's array limits are written once to an OBJ beside the
+        ``.npz`` and loaded from there.
+        """
+
+        path = Path(mesh_path)
+        if path.suffix.lower() != ".npz":
+            return {"fileName": str(path)}
+
+        vertices, indices = load_collision_mesh(path)
+        if not concave:
+            if fits_in_memory_shape(vertices):
+                return {"vertices": vertices.tolist()}
+        elif fits_in_memory_shape(vertices, indices):
+            return {"vertices": vertices.tolist(), "indices": indices.ravel().tolist()}
+
+        obj_path = path.with_suffix(".obj")
+        if not obj_path.exists() or obj_path.stat().st_mtime < path.stat().st_mtime:
+            write_obj(obj_path, vertices, indices)
+        return {"fileName": str(obj_path)}
+
+    @staticmethod
+    def _shape_cache_key(config: PhysicsBodyConfig) -> Optional[Tuple[Any, ...]]:
+        """Key identifying a collider's geometry, or None when it cannot be shared.
+
+        Mesh keys include the file's resolved path and mtime, so a rebuilt
+        mesh gets a new shape. In-memory meshes and heightfields are unique
+        per body and are never shared.
+        """
+
+        def freeze(value: Any) -> Any:
+            if value is None or isinstance(value, (int, float)):
+                return None if value is None else float(value)
+            return tuple(float(v) for v in value)
+
+        shape = (config.shape or "box").lower()
+        if shape == "heightfield" or config.mesh_vertices is not None:
+            return None
+        dimensions = {
+            "box": (freeze(config.half_extents),),
+            "sphere": (freeze(config.radius),),
+            "capsule": (freeze(config.radius), freeze(config.height)),
+            "cylinder": (freeze(config.radius), freeze(config.height)),
+            "cone": (freeze(config.radius), freeze(config.height)),
+            "plane": (freeze(config.plane_normal), freeze(config.plane_constant)),
+            # Static meshes are built as concave trimeshes (unless already convex hulls)
+            "mesh": (freeze(config.mesh_scale or (1.0, 1.0, 1.0)), config.is_static and not config.mesh_convex),
+        }.get(shape)
+        if dimensions is None:
+            return None
+        if shape in ("mesh", "cone") and config.mesh_path:
+            path = Path(config.mesh_path)
+            try:
+                dimensions += (str(path.resolve()), path.stat().st_mtime_ns)
+            except OSError:
+                return None
+        return (shape,) + dimensions
+
+    def _collision_shape(self, config: PhysicsBodyConfig) -> Tuple[int, bool]:
+        """A collision shape for ``config`` and whether it is shared, reusing cached shapes."""
+
+        key = self._shape_cache_key(config)
+        if key is None:
+            return self._create_collision_shape(config), False
+        shape = self._shape_cache.get(key)
+        if shape is None:
+            shape = self._create_collision_shape(config)
+            self._shape_cache[key] = shape
+        return shape, True
+
     def _create_collision_shape(self, config: PhysicsBodyConfig) -> int:
         """Create a PyBullet collision shape based on the provided config."""
 
@@ -450,12 +886,12 @@ class PhysicsWorld:
                 raise FileNotFoundError("Cone collider requires generated mesh_path")
             return _pb.createCollisionShape(
                 _pb.GEOM_MESH,
-                fileName=str(config.mesh_path),
                 meshScale=[
                     float(config.radius),
                     float(config.height),
                     float(config.radius),
                 ],
+                **self._mesh_source(config.mesh_path),
                 physicsClientId=self._client,
             )
         if shape == "plane":
@@ -466,41 +902,61 @@ class PhysicsWorld:
                 physicsClientId=self._client,
             )
         if shape == "mesh":
-            if not config.mesh_path:
+            if not config.mesh_path and config.mesh_vertices is None:
                 raise ValueError("Mesh collider requires 'mesh_path'")
             mesh_scale = config.mesh_scale or (1.0, 1.0, 1.0)
             mesh_kwargs = dict(kwargs)
             flags = mesh_kwargs.pop("flags", 0)
+            concave = config.body_type == "static" and not config.mesh_convex
             concave_flag = getattr(_pb, "GEOM_FORCE_CONCAVE_TRIMESH", None)
-            if concave_flag is not None and config.body_type == "static":
+            if concave_flag is not None and concave:
                 flags |= concave_flag
             if flags:
                 mesh_kwargs["flags"] = flags
+            if config.mesh_vertices is not None:
+                # In-memory triangle mesh (e.g. streamed terrain tiles)
+                vertices, indices = config.mesh_vertices, config.mesh_indices
+                mesh_kwargs["vertices"] = vertices.tolist() if hasattr(vertices, "tolist") else list(vertices)
+                if indices is not None:
+                    mesh_kwargs["indices"] = indices.tolist() if hasattr(indices, "tolist") else list(indices)
+            else:
+                mesh_kwargs.update(self._mesh_source(config.mesh_path, concave=concave))
             return _pb.createCollisionShape(
                 _pb.GEOM_MESH,
-                fileName=str(config.mesh_path),
                 meshScale=mesh_scale,
                 **mesh_kwargs,
             )
         if shape == "heightfield":
-            raise NotImplementedError("Heightfield colliders are not yet supported")
+            if config.body_type != "static":
+                raise ValueError("Heightfield colliders must be static")
+            heights, spacing, _ = self._heightfield_samples(config)
+            scale = config.mesh_scale or (1.0, 1.0, 1.0)
+            # Bullet's grid X runs along our columns (world Z) and its Y along our rows (world X)
+            return _pb.createCollisionShape(
+                _pb.GEOM_HEIGHTFIELD,
+                meshScale=[spacing * scale[2], spacing * scale[0], scale[1]],
+                heightfieldData=heights.ravel().tolist(),
+                numHeightfieldRows=heights.shape[1],
+                numHeightfieldColumns=heights.shape[0],
+                physicsClientId=self._client,
+            )
         raise ValueError(f"Unsupported collider shape: {config.shape}")
 
     # ------------------------------------------------------------------
     # Simulation
     # ------------------------------------------------------------------
-    def _pre_step(self) -> None:
-        """Synchronise kinematic bodies before stepping the world."""
+    def _kinematic_updates(self) -> List[Tuple[int, Tuple[float, ...], Tuple[float, ...]]]:
+        """Kinematic bodies whose scene transform changed since the last push, as (id, position, orientation)."""
 
+        updates = []
         for handle in self._bodies.values():
             if handle.config.is_kinematic:
-                position, orientation = self._extract_scene_transform(handle.scene_object, handle.config)
-                _pb.resetBasePositionAndOrientation(
-                    handle.body_id,
-                    position,
-                    orientation,
-                    physicsClientId=self._client,
-                )
+                transform = self._extract_scene_transform(handle.scene_object, handle.config)
+                if self._kinematic_transforms.get(handle.body_id) == transform:
+                    continue
+                self._kinematic_transforms[handle.body_id] = transform
+                updates.append((handle.body_id, transform[0], transform[1]))
+        return updates
 
     def _apply_angular_factor_overrides(self) -> None:
         """Manually clamp angular velocity for bodies without native support."""
@@ -530,36 +986,196 @@ class PhysicsWorld:
 
         if self._client is None or self._paused:
             return
+        if self._worker is not None:
+            self._worker.step(delta_time)
+            return
+
+        self._advance(delta_time, self._kinematic_updates())
+        self.sync_to_scene()
+
+    def _advance(
+        self,
+        delta_time: float,
+        kinematic: Sequence[Tuple[int, Tuple[float, ...], Tuple[float, ...]]] = (),
+        writes: Sequence["BodyWrite"] = (),
+    ) -> None:
+        """Apply step inputs and run the fixed steps due; touches no scene objects."""
+
+        for body_id, position, orientation in kinematic:
+            _pb.resetBasePositionAndOrientation(body_id, position, orientation, physicsClientId=self._client)
+        for write, args in writes:
+            write(*args)
 
         self._accumulator += delta_time
-        substeps = 0
-        while self._accumulator >= self.settings.fixed_time_step and substeps < self.settings.max_substeps:
-            self._pre_step()
+        time_step = self.settings.fixed_time_step
+        substeps = min(int(self._accumulator / time_step), self.settings.max_substeps)
+        for substep in range(substeps):
+            if substep == substeps - 1 and self.settings.interpolate:
+                # Interpolation blends from the state before the last step
+                self._previous_transforms = self._read_transforms()
             _pb.stepSimulation(physicsClientId=self._client)
+            self._contact_cache.clear()
+            if self._layer_report is not None:
+                self._record_layer_contacts()
             self._apply_angular_factor_overrides()
-            self._accumulator -= self.settings.fixed_time_step
-            substeps += 1
+            self._accumulator -= time_step
 
-        self.sync_to_scene()
+    def _record_layer_contacts(self) -> None:
+        """Add this step's contact points to the layer pair report."""
 
-    def sync_to_scene(self) -> None:
-        """Write simulated transforms back to associated scene objects."""
+        points: Dict[Tuple[int, int], int] = {}
+        for contact in self._contact_points():
+            key = (contact[1], contact[2])
+            points[key] = points.get(key, 0) + 1
 
-        for handle in self._bodies.values():
-            if handle.config.is_kinematic or handle.config.is_static:
+        touched = set()
+        for (body_a, body_b), count in points.items():
+            handle_a, handle_b = self._bodies.get(body_a), self._bodies.get(body_b)
+            if handle_a is None or handle_b is None:
                 continue
-            position, orientation = _pb.getBasePositionAndOrientation(
-                handle.body_id,
-                physicsClientId=self._client,
+            layer_a, layer_b = handle_a.config.collision_layer, handle_b.config.collision_layer
+            if layer_a is None or layer_b is None:
+                continue
+            pair = self.collision_layers.pair(layer_a, layer_b)
+            self._layer_report[pair].contact_points += count
+            touched.add(pair)
+        for pair in touched:
+            self._layer_report[pair].steps += 1
+
+    @property
+    def interpolation_alpha(self) -> float:
+        """How far the render time is between the last two physics steps (0-1)."""
+
+        return min(max(self._accumulator / self.settings.fixed_time_step, 0.0), 1.0)
+
+    def _clear_sync_state(self) -> None:
+        """Forget every synced and rendered transform row."""
+
+        # Dynamic bodies' last synced transforms, one (x, y, z, qx, qy, qz, qw)
+        # row per body; rebuilt when bodies are added or removed
+        self._synced_ids = np.zeros(0, dtype=np.int64)
+        self._sync_rows: Dict[int, int] = {}
+        self._transforms = np.zeros((0, 7))
+        # The same rows one physics step earlier
+        self._previous_transforms = np.zeros((0, 7))
+        self._sync_layout_dirty = False
+        # Transforms as last written to the scene, and the bodies they belong to
+        self._rendered_ids = np.zeros(0, dtype=np.int64)
+        self._rendered_transforms = np.zeros((0, 7))
+        # Bodies teleported during the current worker step
+        self._teleported: Set[int] = set()
+
+    def _settle_teleports(self, current: np.ndarray) -> None:
+        """Set teleported bodies' previous rows to ``current`` so the jump is not blended."""
+
+        if not self._teleported:
+            return
+        rows = np.flatnonzero(np.isin(self._synced_ids, list(self._teleported)))
+        self._previous_transforms[rows] = current[rows]
+        self._teleported.clear()
+
+    def _rebuild_sync_layout(self) -> None:
+        """Lay out one transform row per dynamic body, keeping the rows of existing bodies."""
+
+        ids = np.array([body_id for body_id, handle in self._bodies.items() if handle.config.is_dynamic],
+                       dtype=np.int64)
+        self._transforms = _remap_rows(self._synced_ids, self._transforms, ids)
+        self._previous_transforms = _remap_rows(self._synced_ids, self._previous_transforms, ids)
+        self._synced_ids = ids
+        self._sync_rows = {body_id: row for row, body_id in enumerate(ids.tolist())}
+        self._sync_layout_dirty = False
+
+    def _read_transforms(self) -> np.ndarray:
+        """Current (N, 7) transforms of the synced bodies, straight from PyBullet."""
+
+        if self._sync_layout_dirty:
+            self._rebuild_sync_layout()
+        if len(self._synced_ids) == 0:
+            return np.zeros((0, 7))
+        return np.array([
+            position + orientation
+            for position, orientation in (
+                _pb.getBasePositionAndOrientation(body_id, physicsClientId=self._client)
+                for body_id in self._synced_ids.tolist()
             )
-            if hasattr(handle.scene_object, "apply_physics_transform"):
-                handle.scene_object.apply_physics_transform(position, orientation)
+        ])
+
+    def sync_to_scene(self) -> int:
+        """
+        Write simulated transforms back to associated scene objects.
+
+        Every dynamic body's transform is read into one contiguous array. With
+        ``settings.interpolate`` the scene gets a blend of the last two physics
+        steps by ``interpolation_alpha``, so motion stays smooth when the frame
+        rate and physics rate differ. Only bodies whose written transform
+        changed are updated; sleeping bodies keep an identical transform, so
+        they are skipped.
+
+        Returns:
+            Number of scene objects updated
+        """
+
+        self._join_worker()
+        self._transforms = self._read_transforms()
+        alpha = self.interpolation_alpha if self.settings.interpolate else None
+        return self._write_scene(self._synced_ids, self._previous_transforms, self._transforms, alpha)
+
+    def _write_scene(
+        self,
+        body_ids: np.ndarray,
+        previous: np.ndarray,
+        current: np.ndarray,
+        alpha: Optional[float],
+    ) -> int:
+        """Write (blended) transform rows to the bodies' scene objects; returns how many changed."""
+
+        if not np.array_equal(body_ids, self._rendered_ids):
+            self._rendered_transforms = _remap_rows(self._rendered_ids, self._rendered_transforms, body_ids)
+            self._rendered_ids = body_ids
+        if len(body_ids) == 0:
+            return 0
+
+        rendered = current.copy() if alpha is None else _blend_transforms(previous, current, alpha)
+        changed = np.flatnonzero(np.any(rendered != self._rendered_transforms, axis=1))
+        self._rendered_transforms[changed] = rendered[changed]
+
+        for row in changed.tolist():
+            handle = self._bodies.get(int(body_ids[row]))
+            if handle is None:
+                continue  # Removed since these transforms were read
+            scene_object = handle.scene_object
+            position, orientation = rendered[row, :3], rendered[row, 3:]
+            if hasattr(scene_object, "apply_physics_transform"):
+                scene_object.apply_physics_transform(position, orientation)
             else:
                 # Fallback for objects without helper method
-                if hasattr(handle.scene_object, "position"):
-                    handle.scene_object.position = Vector3(position)
-                if hasattr(handle.scene_object, "rotation"):
-                    handle.scene_object.rotation = Quaternion(orientation)
+                if hasattr(scene_object, "position"):
+                    scene_object.position = Vector3(position)
+                if hasattr(scene_object, "rotation"):
+                    scene_object.rotation = Quaternion(orientation)
+        return len(changed)
+
+    def get_body_transforms(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Dynamic bodies' simulated transforms as of the last sync_to_scene (not interpolated).
+
+        With a worker thread these come from the snapshot applied by the last step_simulation.
+
+        Returns:
+            Tuple of (body ids, (N, 7) array of x, y, z, qx, qy, qz, qw rows);
+            read-only views, valid until the next sync
+        """
+
+        if self._worker is not None:
+            snapshot = self._worker.snapshot
+            ids, transforms = snapshot.body_ids.view(), snapshot.current.view()
+        else:
+            if self._sync_layout_dirty:
+                self._rebuild_sync_layout()
+            ids, transforms = self._synced_ids.view(), self._transforms.view()
+        ids.flags.writeable = False
+        transforms.flags.writeable = False
+        return ids, transforms
 
     # ------------------------------------------------------------------
     # Public API
@@ -573,22 +1189,127 @@ class PhysicsWorld:
     ) -> PhysicsBodyHandle:
         """Create a rigid body and attach it to a scene object."""
 
-        self._populate_config_defaults(config, scene_object, node_definition, resource_base)
-
-        if config.enable_sleeping is None:
-            config.enable_sleeping = self.settings.enable_sleeping
-
-        position, orientation = self._extract_scene_transform(scene_object, config)
-        collision_shape = self._create_collision_shape(config)
-        mass = config.resolved_mass()
+        self._join_worker()
+        collision_shape, _, position, orientation = self._prepare_body(
+            scene_object, config, node_definition, resource_base
+        )
         body_id = _pb.createMultiBody(
-            baseMass=mass,
+            baseMass=config.resolved_mass(),
             baseCollisionShapeIndex=collision_shape,
             baseVisualShapeIndex=-1,
             basePosition=position,
             baseOrientation=orientation,
             physicsClientId=self._client,
         )
+        return self._finish_body(body_id, scene_object, config, position, orientation)
+
+    def create_bodies(self, bodies: Iterable[Sequence[Any]]) -> List[PhysicsBodyHandle]:
+        """
+        Create many rigid bodies at once, e.g. while loading a scene.
+
+        Bodies that share a collision shape and mass are created by a single
+        batched ``createMultiBody`` call, which costs a fraction of creating
+        them one at a time.
+
+        Args:
+            bodies: create_body arguments per body: (scene_object, config)
+                optionally followed by node_definition and resource_base
+
+        Returns:
+            One handle per body, in the given order
+        """
+
+        self._join_worker()
+        bodies = [tuple(body) for body in bodies]
+        prepared = [self._prepare_body(*body) for body in bodies]
+
+        body_ids: List[Optional[int]] = [None] * len(bodies)
+        groups: Dict[Tuple[int, float], List[int]] = {}
+        for index, (collision_shape, shared, position, orientation) in enumerate(prepared):
+            mass = bodies[index][1].resolved_mass()
+            if shared:
+                groups.setdefault((collision_shape, mass), []).append(index)
+                continue
+            body_ids[index] = _pb.createMultiBody(
+                baseMass=mass,
+                baseCollisionShapeIndex=collision_shape,
+                baseVisualShapeIndex=-1,
+                basePosition=position,
+                baseOrientation=orientation,
+                physicsClientId=self._client,
+            )
+
+        for (collision_shape, mass), indices in groups.items():
+            first_orientation = prepared[indices[0]][3]
+            if len(indices) == 1:
+                created = [_pb.createMultiBody(
+                    baseMass=mass,
+                    baseCollisionShapeIndex=collision_shape,
+                    baseVisualShapeIndex=-1,
+                    basePosition=prepared[indices[0]][2],
+                    baseOrientation=first_orientation,
+                    physicsClientId=self._client,
+                )]
+            else:
+                created = _pb.createMultiBody(
+                    baseMass=mass,
+                    baseCollisionShapeIndex=collision_shape,
+                    baseVisualShapeIndex=-1,
+                    baseOrientation=first_orientation,
+                    batchPositions=[prepared[index][2] for index in indices],
+                    physicsClientId=self._client,
+                )
+            for index, body_id in zip(indices, created):
+                _, _, position, orientation = prepared[index]
+                if orientation != first_orientation:
+                    # The batch shares one orientation
+                    _pb.resetBasePositionAndOrientation(body_id, position, orientation, physicsClientId=self._client)
+                body_ids[index] = body_id
+
+        return [
+            self._finish_body(body_id, body[0], body[1], position, orientation)
+            for body_id, body, (_, _, position, orientation) in zip(body_ids, bodies, prepared)
+        ]
+
+    def _prepare_body(
+        self,
+        scene_object: Any,
+        config: PhysicsBodyConfig,
+        node_definition: Any = None,
+        resource_base: Optional[Path] = None,
+    ) -> Tuple[int, bool, Tuple[float, ...], Tuple[float, ...]]:
+        """Resolve a body's config; returns (collision shape, shared, position, orientation)."""
+
+        self._populate_config_defaults(config, scene_object, node_definition, resource_base)
+
+        layers = self.collision_layers
+        if layers is not None and config.collision_group is None and config.collision_mask is None:
+            layer = layers.layer_for(config.collision_layer, config.body_type)
+            config.collision_layer = layer.name
+            if config.enable_sleeping is None:
+                config.enable_sleeping = layer.enable_sleeping
+            if config.sleep_threshold is None:
+                config.sleep_threshold = layer.sleep_threshold
+
+        if config.enable_sleeping is None:
+            config.enable_sleeping = self.settings.enable_sleeping
+
+        position, orientation = self._extract_scene_transform(scene_object, config)
+        collision_shape, shared = self._collision_shape(config)
+        if (config.shape or "").lower() == "heightfield":
+            frame_position, frame_orientation = self._heightfield_frame(config)
+            position, orientation = _pb.multiplyTransforms(position, orientation, frame_position, frame_orientation)
+        return collision_shape, shared, tuple(position), tuple(orientation)
+
+    def _finish_body(
+        self,
+        body_id: int,
+        scene_object: Any,
+        config: PhysicsBodyConfig,
+        position: Tuple[float, ...],
+        orientation: Tuple[float, ...],
+    ) -> PhysicsBodyHandle:
+        """Apply a new body's dynamics settings and register it."""
 
         dynamics_kwargs = {
             "lateralFriction": config.friction,
@@ -604,6 +1325,8 @@ class PhysicsWorld:
             dynamics_kwargs["contactStiffness"] = config.contact_stiffness
         if config.contact_damping is not None:
             dynamics_kwargs["contactDamping"] = config.contact_damping
+        if config.sleep_threshold is not None:
+            dynamics_kwargs["sleepThreshold"] = config.sleep_threshold
 
         _pb.changeDynamics(body_id, -1, **dynamics_kwargs)
 
@@ -619,6 +1342,13 @@ class PhysicsWorld:
         if config.collision_group is not None or config.collision_mask is not None:
             group = config.collision_group if config.collision_group is not None else 1
             mask = config.collision_mask if config.collision_mask is not None else -1
+        elif config.collision_layer is not None and self.collision_layers is not None:
+            # Static bodies (mass 0) get their layer's static bit; see collision_layers
+            group, mask = self.collision_layers.filter_bits(
+                config.collision_layer, static=config.resolved_mass() == 0.0)
+        else:
+            group = mask = None
+        if group is not None:
             _pb.setCollisionFilterGroupMask(
                 body_id,
                 -1,
@@ -637,6 +1367,7 @@ class PhysicsWorld:
 
         handle = PhysicsBodyHandle(body_id=body_id, scene_object=scene_object, config=config)
         self._bodies[body_id] = handle
+        self._sync_layout_dirty = True
 
         if config.is_dynamic or config.is_kinematic:
             if hasattr(scene_object, "apply_physics_transform"):
@@ -648,10 +1379,25 @@ class PhysicsWorld:
         """Remove a body from the simulation."""
 
         if body_id in self._bodies:
+            self._join_worker()
             _pb.removeBody(body_id, physicsClientId=self._client)
+            self._contact_cache.clear()
             self._bodies.pop(body_id, None)
+            self._kinematic_transforms.pop(body_id, None)
+            self._forget_transform_rows(body_id)
+            self._sync_layout_dirty = True
             self._angular_factor_overrides.pop(body_id, None)
 
+    def _forget_transform_rows(self, body_id: int) -> None:
+        """Blank a removed body's transform rows; PyBullet reuses body ids."""
+
+        row = self._sync_rows.get(body_id)
+        if row is not None:
+            self._transforms[row] = np.nan
+            self._previous_transforms[row] = np.nan
+        rendered = np.flatnonzero(self._rendered_ids == body_id)
+        self._rendered_transforms[rendered] = np.nan
+
     def get_body(self, body_id: int) -> Optional[PhysicsBodyHandle]:
         return self._bodies.get(body_id)
 
@@ -663,6 +1409,7 @@ class PhysicsWorld:
 
         if body_id not in self._bodies:
             raise ValueError(f"Body {body_id} is not registered")
+        self._join_worker()
         position, _ = _pb.getBasePositionAndOrientation(body_id, physicsClientId=self._client)
         return position
 
@@ -671,6 +1418,7 @@ class PhysicsWorld:
 
         if body_id not in self._bodies:
             raise ValueError(f"Body {body_id} is not registered")
+        self._join_worker()
         _, orientation = _pb.getBasePositionAndOrientation(body_id, physicsClientId=self._client)
         return orientation
 
@@ -680,38 +1428,66 @@ class PhysicsWorld:
         position: Optional[Tuple[float, float, float]] = None,
         orientation: Optional[Tuple[float, float, float, float]] = None,
     ) -> None:
-        """Set the transform of a body, preserving unspecified components."""
+        """Set the transform of a body, preserving unspecified components.
+
+        With a worker thread the change is queued and applied before the next step.
+        """
 
         if body_id not in self._bodies:
             raise ValueError(f"Body {body_id} is not registered")
+        self._write(self._set_body_transform, body_id, position, orientation)
+
+    def _set_body_transform(
+        self,
+        body_id: int,
+        position: Optional[Tuple[float, float, float]],
+        orientation: Optional[Tuple[float, float, float, float]],
+    ) -> None:
         current_position, current_orientation = _pb.getBasePositionAndOrientation(
             body_id,
             physicsClientId=self._client,
         )
+        position = position or current_position
+        orientation = orientation or current_orientation
         _pb.resetBasePositionAndOrientation(
             body_id,
-            position or current_position,
-            orientation or current_orientation,
+            position,
+            orientation,
             physicsClientId=self._client,
         )
+        # Teleports are not interpolated
+        if self._worker is not None:
+            # Rows can be relaid out later in the step; reset when the snapshot is taken
+            self._teleported.add(body_id)
+            return
+        row = None if self._sync_layout_dirty else self._sync_rows.get(body_id)
+        if row is not None:
+            self._previous_transforms[row] = tuple(position) + tuple(orientation)
 
     def get_linear_velocity(self, body_id: int) -> Tuple[float, float, float]:
         """Return the linear velocity of a body."""
 
         if body_id not in self._bodies:
             raise ValueError(f"Body {body_id} is not registered")
+        self._join_worker()
         linear_velocity, _ = _pb.getBaseVelocity(body_id, physicsClientId=self._client)
         return linear_velocity
 
     def set_linear_velocity(self, body_id: int, velocity: Tuple[float, float, float]) -> None:
-        """Set the linear velocity of a body."""
+        """Set the linear velocity of a body.
+
+        With a worker thread the change is queued and applied before the next step.
+        """
 
         if body_id not in self._bodies:
             raise ValueError(f"Body {body_id} is not registered")
+        self._write(self._set_linear_velocity, body_id, _vec3(velocity))
+
+    def _set_linear_velocity(self, body_id: int, velocity: Tuple[float, float, float]) -> None:
         _, angular_velocity = _pb.getBaseVelocity(body_id, physicsClientId=self._client)
         _pb.resetBaseVelocity(
             body_id,
-            linearVelocity=_vec3(velocity),
+            linearVelocity=velocity,
             angularVelocity=angular_velocity,
             physicsClientId=self._client,
         )
@@ -721,6 +1497,7 @@ class PhysicsWorld:
 
         if body_id not in self._bodies:
             raise ValueError(f"Body {body_id} is not registered")
+        self._join_worker()
         _, angular_velocity = _pb.getBaseVelocity(body_id, physicsClientId=self._client)
         return angular_velocity
 
@@ -729,6 +1506,7 @@ class PhysicsWorld:
 
         if body_id not in self._bodies:
             raise ValueError(f"Body {body_id} is not registered")
+        self._join_worker()
 
         factor_vec = _vec3(factor)
         
@@ -766,10 +1544,16 @@ class PhysicsWorld:
             )
 
     def apply_central_impulse(self, body_id: int, impulse: Tuple[float, float, float]) -> None:
-        """Apply an instantaneous impulse at the centre of mass."""
+        """Apply an instantaneous impulse at the centre of mass.
+
+        With a worker thread the impulse is queued and applied before the next step.
+        """
 
         if body_id not in self._bodies:
             raise ValueError(f"Body {body_id} is not registered")
+        self._write(self._apply_impulse, body_id, _vec3(impulse))
+
+    def _apply_impulse(self, body_id: int, impulse: Tuple[float, float, float]) -> None:
         _pb.applyExternalForce(
             body_id,
             -1,
@@ -788,6 +1572,7 @@ class PhysicsWorld:
 
         if self._client is None:
             return None
+        self._join_worker()
         result = _pb.rayTest(_vec3(from_pos), _vec3(to_pos), physicsClientId=self._client)
         if not result:
             return None
@@ -801,6 +1586,195 @@ class PhysicsWorld:
             "hit_normal": result[0][4],
         }
 
+    def ray_test_batch(
+        self,
+        from_positions: Any,
+        to_positions: Any,
+        *,
+        num_threads: Optional[int] = None,
+        ignore_body: Optional[int] = None,
+    ) -> RayBatchResult:
+        """
+        Cast many rays in one rayTestBatch call and return the closest hit of each.
+
+        Args:
+            from_positions: (N, 3) ray starts
+            to_positions: (N, 3) ray ends
+            num_threads: Bullet worker threads (default: settings.ray_batch_threads)
+            ignore_body: Treat hits on this body as misses (e.g. the caster itself)
+        """
+
+        froms = np.ascontiguousarray(from_positions, dtype=np.float64).reshape(-1, 3)
+        tos = np.ascontiguousarray(to_positions, dtype=np.float64).reshape(-1, 3)
+        if froms.shape != tos.shape:
+            raise ValueError("from_positions and to_positions must have the same shape")
+
+        count = len(froms)
+        body_ids = np.full(count, -1, dtype=np.int64)
+        fractions = np.ones(count)
+        positions = np.zeros((count, 3))
+        normals = np.zeros((count, 3))
+        if self._client is None or count == 0:
+            return RayBatchResult(body_ids, fractions, positions, normals)
+
+        self._join_worker()
+        threads = self.settings.ray_batch_threads if num_threads is None else num_threads
+        for start in range(0, count, _RAY_BATCH_LIMIT):
+            stop = min(start + _RAY_BATCH_LIMIT, count)
+            results = _pb.rayTestBatch(
+                froms[start:stop],
+                tos[start:stop],
+                numThreads=int(threads),
+                physicsClientId=self._client,
+            )
+            body_ids[start:stop] = [hit[0] for hit in results]
+            fractions[start:stop] = [hit[2] for hit in results]
+            positions[start:stop] = [hit[3] for hit in results]
+            normals[start:stop] = [hit[4] for hit in results]
+
+        miss = body_ids < 0
+        if ignore_body is not None:
+            miss |= body_ids == ignore_body
+        body_ids[miss] = -1
+        fractions[miss] = 1.0
+        return RayBatchResult(body_ids, fractions, positions, normals)
+
+    def sweep_shape(
+        self,
+        collision_shape: int,
+        bounding_radius: float,
+        from_position: Tuple[float, float, float],
+        to_position: Tuple[float, float, float],
+        *,
+        orientation: Optional[Tuple[float, float, float, float]] = None,
+        ignore_body: Optional[int] = None,
+        layer: Optional[str] = None,
+        max_iterations: int = _SWEEP_MAX_ITERATIONS,
+    ) -> Optional[SweepHit]:
+        """
+        Sweep a convex collision shape along a line and return its first contact, if any.
+
+        Uses conservative advancement. At each position getClosestPoints
+        reports the distance and normal of every feature within reach (every
+        triangle, for meshes and heightfields), and the shape moves as far as
+        it can before it could touch any of them. Features the shape touches
+        but is moving away from are skipped, so a shape resting on the ground
+        can slide along it.
+
+        Args:
+            collision_shape: Shape id from createCollisionShape
+            bounding_radius: Radius of a sphere around the shape's origin that
+                contains it (used to gather candidate bodies)
+            from_position: Shape position at the start of the sweep
+            to_position: Shape position at the end of the sweep
+            orientation: Shape orientation (identity by default)
+            ignore_body: Body to skip (e.g. the body being moved)
+            layer: Collision layer of the shape; bodies on layers it does not
+                collide with are skipped
+        """
+
+        if self._client is None:
+            return None
+        self._join_worker()
+        start = np.array(_vec3(from_position))
+        travel = np.array(_vec3(to_position)) - start
+        length = float(np.linalg.norm(travel))
+        if length < 1e-9:
+            return None
+        direction = travel / length
+        orientation = _quat(orientation) or (0.0, 0.0, 0.0, 1.0)
+
+        # Candidate bodies: broadphase overlaps with the swept bounds
+        reach = bounding_radius + _SWEEP_SKIN
+        overlaps = _pb.getOverlappingObjects(
+            (np.minimum(start, start + travel) - reach).tolist(),
+            (np.maximum(start, start + travel) + reach).tolist(),
+            physicsClientId=self._client,
+        ) or ()
+        bodies = sorted({body for body, _ in overlaps if body != ignore_body})
+        if layer is not None and self.collision_layers is not None:
+            bodies = [body for body in bodies if self._layer_collides(layer, body)]
+        if not bodies:
+            return None
+
+        travelled = 0.0
+        best = None
+        for _ in range(max_iterations):
+            position = (start + direction * travelled).tolist()
+            points = []
+            for body in bodies:
+                points.extend(_pb.getClosestPoints(
+                    bodyA=-1,
+                    bodyB=body,
+                    distance=length - travelled + _SWEEP_SKIN,
+                    collisionShapeA=collision_shape,
+                    collisionShapePositionA=position,
+                    collisionShapeOrientationA=orientation,
+                    physicsClientId=self._client,
+                ))
+            if not points:
+                return None
+
+            distances = np.array([point[8] for point in points])
+            # Rate at which each feature's distance shrinks per unit travelled
+            closing = -(np.array([point[7] for point in points]) @ direction)
+            approaching = closing > 1e-6
+            if not approaching.any():
+                return None
+
+            # Each feature is convex, so the shape cannot reach it before
+            # crossing its separating plane
+            advance = np.full(len(points), np.inf)
+            advance[approaching] = (distances[approaching] - 0.5 * _SWEEP_SKIN) / closing[approaching]
+            best = int(np.argmin(advance))
+            if distances[best] <= _SWEEP_SKIN:
+                break
+            if travelled + advance[best] >= length:
+                return None
+            travelled += max(float(advance[best]), 0.0)
+
+        point = points[best]
+        return SweepHit(
+            body_id=point[2],
+            fraction=travelled / length,
+            position=tuple((start + direction * travelled).tolist()),
+            point=tuple(point[6]),
+            normal=tuple(point[7]),
+        )
+
+    def sweep_capsule(
+        self,
+        from_position: Tuple[float, float, float],
+        to_position: Tuple[float, float, float],
+        radius: float,
+        height: float,
+        *,
+        ignore_body: Optional[int] = None,
+        layer: Optional[str] = None,
+    ) -> Optional[SweepHit]:
+        """Sweep an upright capsule, sized like a ``capsule`` collider (height includes the caps)."""
+
+        key = (float(radius), float(height))
+        shape = self._sweep_shapes.get(key)
+        if shape is None:
+            self._join_worker()
+            shape = self._create_collision_shape(PhysicsBodyConfig(shape="capsule", radius=radius, height=height))
+            self._sweep_shapes[key] = shape
+        return self.sweep_shape(
+            shape,
+            max(radius, height / 2.0),
+            from_position,
+            to_position,
+            ignore_body=ignore_body,
+            layer=layer,
+        )
+
+    def _layer_collides(self, layer: str, body_id: int) -> bool:
+        handle = self._bodies.get(body_id)
+        if handle is None or handle.config.collision_layer is None:
+            return True
+        return self.collision_layers.collides(layer, handle.config.collision_layer)
+
     def ray_test_all(
         self,
         from_pos: Tuple[float, float, float],
@@ -810,6 +1784,7 @@ class PhysicsWorld:
 
         if self._client is None:
             return []
+        self._join_worker()
 
         result = _pb.rayTest(_vec3(from_pos), _vec3(to_pos), physicsClientId=self._client)
         if not result:
@@ -831,59 +1806,91 @@ class PhysicsWorld:
     # ------------------------------------------------------------------
     # Debug helpers
     # ------------------------------------------------------------------
+    def _contact_points(self, body_a: int = -1, body_b: int = -1) -> Tuple[Any, ...]:
+        """Raw getContactPoints rows for a body filter, cached until the next step."""
+
+        key = (body_a, body_b)
+        contacts = self._contact_cache.get(key)
+        if contacts is None:
+            filters = {}
+            if body_a >= 0:
+                filters["bodyA"] = body_a
+            if body_b >= 0:
+                filters["bodyB"] = body_b
+            contacts = tuple(_pb.getContactPoints(physicsClientId=self._client, **filters) or ())
+            self._contact_cache[key] = contacts
+        return contacts
+
     def get_contacts(
         self,
         body_id: Optional[int] = None,
         other_body_id: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
-        """Return contact information for the current simulation step."""
+        *,
+        as_array: bool = False,
+    ) -> Any:
+        """
+        Return contact information for the current simulation step.
+
+        The body filter is passed to PyBullet, which reports each contact with
+        the queried body as ``body_a`` (``normal_on_b`` points towards it).
+        Results are cached until the next step.
+
+        Args:
+            body_id: Only contacts involving this body
+            other_body_id: Only contacts involving this body (with ``body_id``,
+                only contacts between the two)
+            as_array: Return a structured array of CONTACT_DTYPE instead of dicts
+        """
+
+        self._join_worker()
+        return self._read_contacts(body_id, other_body_id, as_array=as_array)
+
+    def _read_contacts(
+        self,
+        body_id: Optional[int] = None,
+        other_body_id: Optional[int] = None,
+        *,
+        as_array: bool = False,
+    ) -> Any:
+        """get_contacts without waiting for the worker (which calls this itself)."""
 
         if self._client is None:
-            return []
+            return np.zeros(0, dtype=CONTACT_DTYPE) if as_array else []
 
-        contacts = _pb.getContactPoints(physicsClientId=self._client)
-        results: List[Dict[str, Any]] = []
-        for contact in contacts:
-            body_a = contact[1]
-            body_b = contact[2]
+        if body_id is None and other_body_id is not None:
+            body_id, other_body_id = other_body_id, None
+        contacts = self._contact_points(
+            -1 if body_id is None else body_id,
+            -1 if other_body_id is None else other_body_id,
+        )
 
-            if body_id is not None and body_a != body_id and body_b != body_id:
-                continue
-            if other_body_id is not None:
-                if body_id is not None:
-                    if not (
-                        (body_a == body_id and body_b == other_body_id)
-                        or (body_a == other_body_id and body_b == body_id)
-                    ):
-                        continue
-                else:
-                    if body_a != other_body_id and body_b != other_body_id:
-                        continue
-
-            results.append(
-                {
-                    "body_a": body_a,
-                    "body_b": body_b,
-                    "link_a": contact[3],
-                    "link_b": contact[4],
-                    "position_on_a": contact[5],
-                    "position_on_b": contact[6],
-                    "normal_on_b": contact[7],
-                    "distance": contact[8],
-                    "normal_force": contact[9],
-                    "lateral_friction_1": contact[10],
-                    "lateral_dir_1": contact[11],
-                    "lateral_friction_2": contact[12],
-                    "lateral_dir_2": contact[13],
-                }
-            )
-        return results
+        if as_array:
+            return np.array([tuple(contact[1:14]) for contact in contacts], dtype=CONTACT_DTYPE)
+        return [
+            {
+                "body_a": contact[1],
+                "body_b": contact[2],
+                "link_a": contact[3],
+                "link_b": contact[4],
+                "position_on_a": contact[5],
+                "position_on_b": contact[6],
+                "normal_on_b": contact[7],
+                "distance": contact[8],
+                "normal_force": contact[9],
+                "lateral_friction_1": contact[10],
+                "lateral_dir_1": contact[11],
+                "lateral_friction_2": contact[12],
+                "lateral_dir_2": contact[13],
+            }
+            for contact in contacts
+        ]
 
     def debug_snapshot(self) -> Dict[str, Any]:
         """Return a snapshot of body transforms and active contacts for diagnostics."""
 
         if self._client is None:
             return {"bodies": [], "contacts": []}
+        self._join_worker()
 
         bodies: List[Dict[str, Any]] = []
         for body_id, handle in self._bodies.items():
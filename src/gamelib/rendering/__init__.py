@@ -10,6 +10,8 @@ from .text_manager import TextManager
 from .ui_renderer import UIRenderer
 from .icon_manager import IconManager
 from .ui_sprite_renderer import UISpriteRenderer
+from .frame_profiler import FrameProfiler, FrameTiming, PassTiming
+from .render_graph import RenderGraph, ResourceDesc, PassResources
 
 __all__ = [
     "RenderPipeline",
@@ -23,4 +25,10 @@ __all__ = [
     "UIRenderer",
     "IconManager",
     "UISpriteRenderer",
+    "FrameProfiler",
+    "FrameTiming",
+    "PassTiming",
+    "RenderGraph",
+    "ResourceDesc",
+    "PassResources",
 ]
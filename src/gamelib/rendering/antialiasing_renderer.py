@@ -76,16 +76,12 @@ class AntiAliasingRenderer:
         # Framebuffers
         self.msaa_fbo: Optional[moderngl.Framebuffer] = None
         self.resolve_fbo: Optional[moderngl.Framebuffer] = None
-        self.fxaa_fbo: Optional[moderngl.Framebuffer] = None
-        self.smaa_fbo: Optional[moderngl.Framebuffer] = None
         
         # Textures
         self.msaa_color: Optional[moderngl.Texture] = None
         self.msaa_depth: Optional[moderngl.Texture] = None
         self.resolve_color: Optional[moderngl.Texture] = None
         self.resolve_depth: Optional[moderngl.Texture] = None
-        self.fxaa_color: Optional[moderngl.Texture] = None
-        self.smaa_color: Optional[moderngl.Texture] = None
         
         # Full-screen quad for FXAA
         self._create_fullscreen_quad()
@@ -126,13 +122,15 @@ class AntiAliasingRenderer:
         
         w, h = self.size
         
-        # Always create resolve framebuffer (single-sampled)
-        self.resolve_color = self.ctx.texture((w, h), 4)
-        self.resolve_depth = self.ctx.depth_texture((w, h))
-        self.resolve_fbo = self.ctx.framebuffer(
-            color_attachments=[self.resolve_color],
-            depth_attachment=self.resolve_depth
-        )
+        # Resolve framebuffer (single-sampled) is only needed when some AA is
+        # active; FXAA/SMAA read it and write straight to the screen
+        if self.is_active:
+            self.resolve_color = self.ctx.texture((w, h), 4)
+            self.resolve_depth = self.ctx.depth_texture((w, h))
+            self.resolve_fbo = self.ctx.framebuffer(
+                color_attachments=[self.resolve_color],
+                depth_attachment=self.resolve_depth
+            )
         
         # Create MSAA framebuffer if needed
         if self.msaa_samples > 0:
@@ -143,20 +141,8 @@ class AntiAliasingRenderer:
                 depth_attachment=self.msaa_depth
             )
         
-        # Create FXAA framebuffer if needed
-        if self.fxaa_enabled:
-            self.fxaa_color = self.ctx.texture((w, h), 4)
-            self.fxaa_fbo = self.ctx.framebuffer(
-                color_attachments=[self.fxaa_color]
-            )
-        
-        # Create SMAA framebuffer if needed
-        if self.smaa_enabled and self.smaa_renderer:
-            self.smaa_color = self.ctx.texture((w, h), 4)
-            self.smaa_fbo = self.ctx.framebuffer(
-                color_attachments=[self.smaa_color]
-            )
-            # Resize SMAA renderer
+        # Keep SMAA metrics in sync (its own targets are allocated lazily)
+        if self.smaa_renderer:
             self.smaa_renderer.resize((w, h))
     
     def _cleanup_framebuffers(self):
@@ -167,12 +153,6 @@ class AntiAliasingRenderer:
         if self.resolve_fbo:
             self.resolve_fbo.release() 
             self.resolve_fbo = None
-        if self.fxaa_fbo:
-            self.fxaa_fbo.release()
-            self.fxaa_fbo = None
-        if self.smaa_fbo:
-            self.smaa_fbo.release()
-            self.smaa_fbo = None
             
         if self.msaa_color:
             self.msaa_color.release()
@@ -186,12 +166,16 @@ class AntiAliasingRenderer:
         if self.resolve_depth:
             self.resolve_depth.release()
             self.resolve_depth = None
-        if self.fxaa_color:
-            self.fxaa_color.release()
-            self.fxaa_color = None
-        if self.smaa_color:
-            self.smaa_color.release()
-            self.smaa_color = None
+    
+    @property
+    def is_active(self) -> bool:
+        """True if any AA technique is enabled (scene renders off-screen)."""
+        return self.msaa_samples > 0 or self.fxaa_enabled or self.smaa_enabled
+
+    @property
+    def uses_smaa(self) -> bool:
+        """True if SMAA is enabled and available."""
+        return self.smaa_enabled and self.smaa_renderer is not None
     
     def set_aa_mode(self, mode: AAMode):
         """
@@ -262,31 +246,37 @@ class AntiAliasingRenderer:
             # No AA - render directly to screen
             return self.ctx.screen
     
-    def resolve_and_present(self):
+    def resolve_and_present(self, smaa_edges=None, smaa_weights=None, target: Optional[moderngl.Framebuffer] = None):
         """
         Resolve MSAA, apply post-processing (FXAA/SMAA), and present to screen.
         Call this after rendering the scene.
+
+        Args:
+            smaa_edges: Optional external (texture, framebuffer) for SMAA edges
+            smaa_weights: Optional external (texture, framebuffer) for SMAA weights
+            target: Output framebuffer (defaults to the screen); must match this
+                renderer's size
         """
+        target = target or self.ctx.screen
+
         # Step 1: Resolve MSAA if enabled
         if self.msaa_samples > 0:
             self.ctx.copy_framebuffer(self.resolve_fbo, self.msaa_fbo)
         
-        # Step 2: Apply post-processing
-        if self.smaa_enabled and self.smaa_renderer:
-            self._apply_smaa()
-            self._present_to_screen(self.smaa_color)
+        # Step 2: Apply post-processing straight into the output
+        if self.uses_smaa:
+            self.smaa_renderer.apply_smaa(
+                self.resolve_color, target, edges=smaa_edges, weights=smaa_weights
+            )
         elif self.fxaa_enabled:
-            self._apply_fxaa()
-            self._present_to_screen(self.fxaa_color)
+            self._apply_fxaa(target)
         else:
-            # Present resolve buffer to screen
-            self._present_to_screen(self.resolve_color)
+            # Present resolve buffer
+            self.present(self.resolve_color, target)
     
-    def _apply_fxaa(self):
-        """Apply FXAA post-processing"""
-        # Render FXAA to fxaa_fbo
-        self.fxaa_fbo.use()
-        self.fxaa_fbo.clear()
+    def _apply_fxaa(self, target: moderngl.Framebuffer):
+        """Apply FXAA post-processing into the target"""
+        target.use()
         
         # Set FXAA uniforms
         w, h = self.size
@@ -300,20 +290,27 @@ class AntiAliasingRenderer:
         # Render full-screen quad
         self.quad_vao.render()
     
-    def _apply_smaa(self):
-        """Apply SMAA post-processing"""
-        if self.smaa_renderer:
-            self.smaa_renderer.apply_smaa(self.resolve_color, self.smaa_fbo)
-    
-    def _present_to_screen(self, texture: moderngl.Texture):
+    def present(
+        self,
+        texture: moderngl.Texture,
+        target: Optional[moderngl.Framebuffer] = None,
+        viewport: Optional[Tuple[int, int, int, int]] = None,
+    ):
         """
-        Present a texture to the screen.
+        Blit a texture to a framebuffer with a full-screen quad.
+
+        Sampling uses the texture's own filter, so a LINEAR texture smaller
+        than the viewport is upscaled bilinearly.
         
         Args:
             texture: Texture to present
+            target: Output framebuffer (defaults to the screen)
+            viewport: Optional viewport override (x, y, width, height)
         """
-        # Use screen framebuffer
-        self.ctx.screen.use()
+        target = target or self.ctx.screen
+        target.use()
+        if viewport is not None:
+            self.ctx.viewport = viewport
         
         # Set up FXAA program for simple blit (FXAA disabled)
         self.fxaa_program['u_fxaa_enabled'].value = False
@@ -0,0 +1,164 @@
+"""
+Dynamic Resolution
+
+Chooses the internal render scale of the deferred path from measured GPU
+frame time, so the frame stays inside a time budget on slower GPUs.
+
+GPU cost of the scaled passes is roughly proportional to pixel count, i.e.
+to ``scale ** 2``. The controller smooths frame time with an exponential
+moving average and only changes resolution when the smoothed time leaves a
+dead band around the target:
+
+- Above ``target * downscale_threshold`` it drops straight to the scale
+  predicted to fit the budget (at least one step).
+- Below ``target * upscale_threshold`` it raises the scale by one step, and
+  only if the predicted time at the new scale still fits the budget.
+
+After every change it waits ``cooldown_frames`` so the new resolution is
+actually measured before deciding again. Together with the dead band this
+keeps the resolution from oscillating.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Optional
+
+
+class DynamicResolutionController:
+    """
+    Frame-time driven render scale controller with hysteresis.
+
+    Usage:
+        controller = DynamicResolutionController(target_ms=16.6, enabled=True)
+        scale = controller.update(gpu_frame_ms)
+    """
+
+    def __init__(
+        self,
+        target_ms: float = 16.6,
+        min_scale: float = 0.5,
+        max_scale: float = 1.0,
+        step: float = 0.05,
+        smoothing: float = 0.1,
+        downscale_threshold: float = 1.05,
+        upscale_threshold: float = 0.85,
+        cooldown_frames: int = 30,
+        enabled: bool = False,
+    ):
+        """
+        Initialize controller.
+
+        Args:
+            target_ms: GPU frame-time budget in milliseconds
+            min_scale: Lowest render scale
+            max_scale: Highest render scale
+            step: Scale quantization; scales are multiples of this
+            smoothing: EMA factor for new samples (0-1, higher reacts faster)
+            downscale_threshold: Lower resolution when smoothed/target exceeds this
+            upscale_threshold: Raise resolution when smoothed/target is below this
+            cooldown_frames: Samples to wait after a change before deciding again
+            enabled: Start enabled (disabled controllers hold max_scale)
+        """
+        if not 0.0 < min_scale <= max_scale:
+            raise ValueError("Dynamic resolution requires 0 < min_scale <= max_scale")
+        if upscale_threshold >= downscale_threshold:
+            raise ValueError("upscale_threshold must be below downscale_threshold")
+
+        self.target_ms = float(target_ms)
+        self.min_scale = float(min_scale)
+        self.max_scale = float(max_scale)
+        self.step = float(step)
+        self.smoothing = float(smoothing)
+        self.downscale_threshold = float(downscale_threshold)
+        self.upscale_threshold = float(upscale_threshold)
+        self.cooldown_frames = int(cooldown_frames)
+
+        self._enabled = enabled
+        self.scale = self.max_scale
+        self.smoothed_ms: Optional[float] = None
+        self._frames_since_change = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        value = bool(value)
+        if value != self._enabled:
+            self._enabled = value
+            self.reset()
+
+    def toggle(self) -> bool:
+        """Toggle the controller. Returns the new state."""
+        self.enabled = not self._enabled
+        return self._enabled
+
+    def reset(self):
+        """Return to full scale and forget the frame-time history."""
+        self.scale = self.max_scale
+        self.smoothed_ms = None
+        self._frames_since_change = 0
+
+    def update(self, gpu_ms: Optional[float]) -> float:
+        """
+        Feed one GPU frame-time sample and return the scale to render at.
+
+        Args:
+            gpu_ms: Measured GPU time of a frame (None = no new sample)
+
+        Returns:
+            Render scale in [min_scale, max_scale]
+        """
+        if not self._enabled or gpu_ms is None or gpu_ms <= 0.0:
+            return self.scale
+
+        if self.smoothed_ms is None:
+            self.smoothed_ms = gpu_ms
+        else:
+            self.smoothed_ms += self.smoothing * (gpu_ms - self.smoothed_ms)
+
+        self._frames_since_change += 1
+        if self._frames_since_change < self.cooldown_frames:
+            return self.scale
+
+        ratio = self.smoothed_ms / self.target_ms
+        new_scale = self.scale
+
+        if ratio > self.downscale_threshold:
+            # Jump to the scale predicted to fit the budget
+            fit = self._quantize_down(self.scale / math.sqrt(ratio))
+            new_scale = max(self.min_scale, min(fit, self.scale - self.step))
+        elif ratio < self.upscale_threshold:
+            candidate = min(self.max_scale, self.scale + self.step)
+            predicted = ratio * (candidate / self.scale) ** 2
+            if predicted < 1.0:
+                new_scale = candidate
+
+        new_scale = round(new_scale, 4)
+        if new_scale != self.scale:
+            # Re-seed the average with the expected cost at the new scale
+            self.smoothed_ms *= (new_scale / self.scale) ** 2
+            self.scale = new_scale
+            self._frames_since_change = 0
+
+        return self.scale
+
+    def _quantize_down(self, scale: float) -> float:
+        return math.floor(scale / self.step + 1e-6) * self.step
+
+    def render_size(self, size, scale: Optional[float] = None):
+        """
+        Internal render size for an output size at the given (or current) scale.
+
+        Scaled sizes are rounded to even numbers so half-res effects divide cleanly.
+        """
+        scale = self.scale if scale is None else scale
+        width, height = size
+        if scale >= 1.0:
+            return (width, height)
+        return (
+            max(2, int(round(width * scale / 2.0)) * 2),
+            max(2, int(round(height * scale / 2.0)) * 2),
+        )
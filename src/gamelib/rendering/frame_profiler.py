@@ -0,0 +1,423 @@
+"""
+Frame Profiler
+
+Measures CPU and GPU cost of each render pass using moderngl ``Query``
+objects (time elapsed, samples passed, primitives generated).
+
+Query results are read ``latency`` frames after they were issued: each frame
+writes into its own slot of a small ring, and a slot is only resolved right
+before it is reused. By then the GPU has long finished those commands, so
+reading the results does not stall the pipeline.
+
+OpenGL does not allow two elapsed-time queries to be active at once, so
+nested scopes (e.g. bloom running inside the lighting pass) split the parent's
+query into segments around each child. Reported GPU times are inclusive:
+a parent's time is its own segments plus all of its children.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Deque, Dict, Iterator, List, Optional
+
+import moderngl
+
+_INVALID_ELAPSED = 0xFFFFFFFF
+
+
+@dataclass
+class PassTiming:
+    """Resolved timing for one profiled scope."""
+
+    name: str
+    depth: int
+    cpu_start_ms: float  # Relative to the start of the frame
+    cpu_ms: float
+    gpu_ms: float = 0.0
+    samples: int = 0
+    primitives: int = 0
+
+
+@dataclass
+class FrameTiming:
+    """All scopes recorded during one frame."""
+
+    frame: int
+    cpu_start: float  # perf_counter() seconds
+    cpu_ms: float
+    passes: List[PassTiming] = field(default_factory=list)
+
+    @property
+    def gpu_ms(self) -> float:
+        """Total GPU time of top-level scopes."""
+        return sum(p.gpu_ms for p in self.passes if p.depth == 0)
+
+
+class _ScopeRecord:
+    """In-flight scope data kept until the frame's queries are resolved."""
+
+    __slots__ = ("name", "depth", "parent", "cpu_start", "cpu_end", "queries")
+
+    def __init__(self, name: str, depth: int, parent: Optional[int], cpu_start: float):
+        self.name = name
+        self.depth = depth
+        self.parent = parent
+        self.cpu_start = cpu_start
+        self.cpu_end = cpu_start
+        self.queries: List[moderngl.Query] = []
+
+
+class _FrameSlot:
+    """Queries and scope records for one frame in the ring."""
+
+    def __init__(self):
+        self.frame = -1
+        self.cpu_start = 0.0
+        self.cpu_end = 0.0
+        self.records: List[_ScopeRecord] = []
+        self.pool: List[moderngl.Query] = []
+        self.used = 0
+        self.pending = False
+
+    def acquire(self, ctx: moderngl.Context) -> moderngl.Query:
+        if self.used == len(self.pool):
+            self.pool.append(ctx.query(samples=True, time=True, primitives=True))
+        query = self.pool[self.used]
+        self.used += 1
+        return query
+
+
+class FrameProfiler:
+    """
+    Per-pass CPU/GPU frame profiler.
+
+    Usage:
+        profiler = FrameProfiler(ctx, enabled=True)
+        profiler.begin_frame()
+        with profiler.scope("shadows"):
+            shadow_renderer.render_shadow_maps(lights, scene)
+        profiler.end_frame()
+
+        profiler.averages()  # {"shadows": {"cpu_ms": ..., "gpu_ms": ...}}
+        profiler.export_chrome_trace("trace.json")
+    """
+
+    def __init__(
+        self,
+        ctx: moderngl.Context,
+        enabled: bool = False,
+        latency: int = 2,
+        history: int = 300,
+    ):
+        """
+        Initialize profiler.
+
+        Args:
+            ctx: ModernGL context used to create queries
+            enabled: Start recording immediately
+            latency: Frames between issuing queries and reading them (>= 1)
+            history: Number of resolved frames kept for averaging/export
+        """
+        self.ctx = ctx
+        self.latency = max(1, int(latency))
+        self.history: Deque[FrameTiming] = deque(maxlen=max(1, int(history)))
+
+        self._enabled = enabled
+        self._slots = [_FrameSlot() for _ in range(self.latency)]
+        self._frame_index = 0
+        self._current: Optional[_FrameSlot] = None
+        self._stack: List[int] = []
+        self._open_query: Optional[moderngl.Query] = None
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        value = bool(value)
+        if value == self._enabled:
+            return
+        if not value:
+            # Drain outstanding queries so their results are not lost
+            self.flush()
+        self._enabled = value
+
+    def toggle(self) -> bool:
+        """Toggle recording on/off. Returns the new state."""
+        self.enabled = not self._enabled
+        return self._enabled
+
+    @property
+    def latest(self) -> Optional[FrameTiming]:
+        """Most recently resolved frame, if any."""
+        return self.history[-1] if self.history else None
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def begin_frame(self):
+        """Start recording a frame (resolves the slot about to be reused)."""
+        if not self._enabled:
+            return
+
+        slot = self._slots[self._frame_index % self.latency]
+        if slot.pending:
+            self._resolve(slot)
+
+        slot.frame = self._frame_index
+        slot.cpu_start = time.perf_counter()
+        slot.records = []
+        slot.used = 0
+        slot.pending = True
+        self._current = slot
+        self._stack = []
+
+    def end_frame(self):
+        """Finish recording the current frame."""
+        if self._current is None:
+            return
+
+        while self._stack:
+            self._end_scope()
+
+        self._current.cpu_end = time.perf_counter()
+        self._current = None
+        self._frame_index += 1
+
+    def scope(self, name: str):
+        """
+        Context manager that profiles the enclosed render commands.
+
+        Returns a no-op context when the profiler is disabled or no frame is
+        being recorded, so call sites can stay unconditional.
+        """
+        if self._current is None:
+            return contextlib.nullcontext()
+        return self._scope(name)
+
+    @contextlib.contextmanager
+    def _scope(self, name: str) -> Iterator[None]:
+        self._begin_scope(name)
+        try:
+            yield
+        finally:
+            self._end_scope()
+
+    def _begin_scope(self, name: str):
+        slot = self._current
+        parent = self._stack[-1] if self._stack else None
+
+        # Pause the parent's query; GL cannot nest elapsed-time queries
+        self._close_query()
+
+        record = _ScopeRecord(name, len(self._stack), parent, time.perf_counter())
+        slot.records.append(record)
+        self._stack.append(len(slot.records) - 1)
+        self._open_segment(record)
+
+    def _end_scope(self):
+        slot = self._current
+        index = self._stack.pop()
+        record = slot.records[index]
+
+        self._close_query()
+        record.cpu_end = time.perf_counter()
+
+        # Resume the parent with a new segment
+        if self._stack:
+            self._open_segment(slot.records[self._stack[-1]])
+
+    def _open_segment(self, record: _ScopeRecord):
+        query = self._current.acquire(self.ctx)
+        query.__enter__()
+        record.queries.append(query)
+        self._open_query = query
+
+    def _close_query(self):
+        if self._open_query is not None:
+            self._open_query.__exit__(None, None, None)
+            self._open_query = None
+
+    # ------------------------------------------------------------------
+    # Resolution
+    # ------------------------------------------------------------------
+    def flush(self):
+        """Resolve every pending frame now (may stall; use for export/shutdown)."""
+        self.end_frame()
+        for offset in range(self.latency):
+            slot = self._slots[(self._frame_index + offset) % self.latency]
+            if slot.pending:
+                self._resolve(slot)
+
+    def reset(self, history_length: Optional[int] = None):
+        """
+        Drop all recorded frames, including ones still waiting on queries.
+
+        Args:
+            history_length: New number of frames kept (default: unchanged)
+        """
+        self.flush()
+        if history_length is None:
+            history_length = self.history.maxlen
+        self.history = deque(maxlen=max(1, int(history_length)))
+
+    def _resolve(self, slot: _FrameSlot):
+        """Read query results for a slot and append a FrameTiming to history."""
+        slot.pending = False
+        passes: List[PassTiming] = []
+        for record in slot.records:
+            gpu_ns = 0
+            samples = 0
+            primitives = 0
+            for query in record.queries:
+                elapsed = query.elapsed
+                # moderngl reads results as 32-bit GLuint; all-ones means the
+                # driver had no valid result (seen on llvmpipe's first query)
+                if elapsed < _INVALID_ELAPSED:
+                    gpu_ns += elapsed
+                samples += query.samples
+                primitives += query.primitives
+            passes.append(
+                PassTiming(
+                    name=record.name,
+                    depth=record.depth,
+                    cpu_start_ms=(record.cpu_start - slot.cpu_start) * 1000.0,
+                    cpu_ms=(record.cpu_end - record.cpu_start) * 1000.0,
+                    gpu_ms=gpu_ns / 1.0e6,
+                    samples=samples,
+                    primitives=primitives,
+                )
+            )
+
+        # Fold children into their parents (deepest first) for inclusive totals
+        for index in range(len(slot.records) - 1, -1, -1):
+            parent = slot.records[index].parent
+            if parent is not None:
+                passes[parent].gpu_ms += passes[index].gpu_ms
+                passes[parent].samples += passes[index].samples
+                passes[parent].primitives += passes[index].primitives
+
+        self.history.append(
+            FrameTiming(
+                frame=slot.frame,
+                cpu_start=slot.cpu_start,
+                cpu_ms=(slot.cpu_end - slot.cpu_start) * 1000.0,
+                passes=passes,
+            )
+        )
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+    def averages(self, frames: Optional[int] = None) -> Dict[str, Dict[str, float]]:
+        """
+        Average per-pass timings over recent frames.
+
+        Args:
+            frames: Number of most recent frames to average (default: all history)
+
+        Returns:
+            Ordered mapping of pass name to averaged cpu_ms, gpu_ms, samples,
+            primitives and depth (first-seen order)
+        """
+        recent = list(self.history)
+        if frames is not None:
+            recent = recent[-frames:]
+        if not recent:
+            return {}
+
+        totals: Dict[str, Dict[str, float]] = {}
+        for frame in recent:
+            for timing in frame.passes:
+                entry = totals.setdefault(
+                    timing.name,
+                    {"cpu_ms": 0.0, "gpu_ms": 0.0, "samples": 0.0, "primitives": 0.0,
+                     "depth": timing.depth},
+                )
+                entry["cpu_ms"] += timing.cpu_ms
+                entry["gpu_ms"] += timing.gpu_ms
+                entry["samples"] += timing.samples
+                entry["primitives"] += timing.primitives
+
+        count = float(len(recent))
+        for entry in totals.values():
+            for key in ("cpu_ms", "gpu_ms", "samples", "primitives"):
+                entry[key] /= count
+        return totals
+
+    def to_chrome_trace(self) -> Dict[str, object]:
+        """
+        Build a Chrome trace (``chrome://tracing`` / Perfetto) from history.
+
+        CPU scopes go on thread "CPU" at their measured timestamps. GPU scopes
+        go on thread "GPU"; elapsed-time queries carry no start timestamp, so
+        top-level GPU passes are laid out back-to-back from the frame start
+        and children are placed sequentially inside their parent.
+        """
+        events: List[Dict[str, object]] = [
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "CPU"}},
+            {"name": "thread_name", "ph": "M", "pid": 1, "tid": 2, "args": {"name": "GPU"}},
+        ]
+        if not self.history:
+            return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+        origin = self.history[0].cpu_start
+        for frame in self.history:
+            frame_us = (frame.cpu_start - origin) * 1.0e6
+            events.append({
+                "name": f"frame {frame.frame}", "cat": "frame", "ph": "X",
+                "pid": 1, "tid": 1, "ts": frame_us, "dur": frame.cpu_ms * 1000.0,
+            })
+
+            gpu_cursor: Dict[int, float] = {0: frame_us}
+            for timing in frame.passes:
+                args = {"samples": timing.samples, "primitives": timing.primitives}
+                events.append({
+                    "name": timing.name, "cat": "cpu", "ph": "X", "pid": 1, "tid": 1,
+                    "ts": frame_us + timing.cpu_start_ms * 1000.0,
+                    "dur": timing.cpu_ms * 1000.0, "args": args,
+                })
+
+                gpu_start = gpu_cursor.get(timing.depth, frame_us)
+                events.append({
+                    "name": timing.name, "cat": "gpu", "ph": "X", "pid": 1, "tid": 2,
+                    "ts": gpu_start, "dur": timing.gpu_ms * 1000.0, "args": args,
+                })
+                gpu_cursor[timing.depth] = gpu_start + timing.gpu_ms * 1000.0
+                gpu_cursor[timing.depth + 1] = gpu_start
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path) -> Path:
+        """
+        Write the recorded history as Chrome-trace JSON.
+
+        Args:
+            path: Output file path
+
+        Returns:
+            Path the trace was written to
+        """
+        self.flush()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
+        return path
+
+    def release(self):
+        """Drop all query objects (moderngl frees them with their context)."""
+        self._close_query()
+        for slot in self._slots:
+            slot.pool = []
+            slot.records = []
+            slot.pending = False
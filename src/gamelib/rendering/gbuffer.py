@@ -6,9 +6,23 @@ The G-Buffer stores geometric and material properties of the scene,
 which are later used in the lighting pass.
 """
 
-from typing import Tuple
+from typing import Dict, Tuple
 import moderngl
 
+from .render_graph import ResourceDesc
+
+
+# Attachment formats, in MRT location order (depth last). Shared with the
+# render graph, which owns the textures when the G-Buffer is graph-managed.
+GBUFFER_ATTACHMENTS: Dict[str, ResourceDesc] = {
+    "position": ResourceDesc(components=3, dtype='f4'),
+    "normal": ResourceDesc(components=3, dtype='f2'),
+    "albedo": ResourceDesc(components=4, dtype='f1'),
+    "material": ResourceDesc(components=2, dtype='f2'),
+    "emissive": ResourceDesc(components=3, dtype='f2'),
+    "depth": ResourceDesc(depth=True),
+}
+
 
 class GBuffer:
     """
@@ -23,25 +37,40 @@ class GBuffer:
     - Depth (DEPTH24_STENCIL8): Depth and stencil information
 
     These textures are written in the geometry pass and read in the lighting pass.
+
+    With ``allocate=False`` the G-Buffer owns no textures; the render graph
+    provides them each frame through attach(), so they can be aliased with
+    later passes once lighting has consumed them.
     """
 
-    def __init__(self, ctx: moderngl.Context, size: Tuple[int, int]):
+    def __init__(self, ctx: moderngl.Context, size: Tuple[int, int], allocate: bool = True):
         """
         Initialize G-Buffer.
 
         Args:
             ctx: ModernGL context
             size: Buffer size (width, height)
+            allocate: Create and own the textures (False = attached externally)
         """
         self.ctx = ctx
         self.size = size
         self.width, self.height = size
+        self.owns_textures = allocate
 
-        # Create textures for geometry data
-        self._create_textures()
+        self.fbo = None
+        self.position_texture = None
+        self.normal_texture = None
+        self.albedo_texture = None
+        self.material_texture = None
+        self.emissive_texture = None
+        self.depth_texture = None
 
-        # Create framebuffer with multiple render targets
-        self._create_framebuffer()
+        if allocate:
+            # Create textures for geometry data
+            self._create_textures()
+
+            # Create framebuffer with multiple render targets
+            self._create_framebuffer()
 
     def _create_textures(self):
         """Create all G-Buffer textures."""
@@ -105,6 +134,24 @@ class GBuffer:
             depth_attachment=self.depth_texture
         )
 
+    def attach(self, textures: Dict[str, moderngl.Texture], fbo: moderngl.Framebuffer):
+        """
+        Use externally owned textures for this frame (graph-managed mode).
+
+        Args:
+            textures: Textures keyed by GBUFFER_ATTACHMENTS name
+            fbo: Framebuffer over the color attachments and depth
+        """
+        self.fbo = fbo
+        self.position_texture = textures["position"]
+        self.normal_texture = textures["normal"]
+        self.albedo_texture = textures["albedo"]
+        self.material_texture = textures["material"]
+        self.emissive_texture = textures["emissive"]
+        self.depth_texture = textures["depth"]
+        self.size = tuple(self.depth_texture.size)
+        self.width, self.height = self.size
+
     def resize(self, size: Tuple[int, int]):
         """
         Resize G-Buffer (called on window resize).
@@ -118,14 +165,12 @@ class GBuffer:
         self.size = size
         self.width, self.height = size
 
+        if not self.owns_textures:
+            # Textures are reallocated by the render graph
+            return
+
         # Release old resources
-        self.fbo.release()
-        self.position_texture.release()
-        self.normal_texture.release()
-        self.albedo_texture.release()
-        self.material_texture.release()
-        self.emissive_texture.release()
-        self.depth_texture.release()
+        self.release()
 
         # Recreate with new size
         self._create_textures()
@@ -161,6 +206,8 @@ class GBuffer:
 
     def release(self):
         """Release all G-Buffer resources."""
+        if not self.owns_textures:
+            return
         self.fbo.release()
         self.position_texture.release()
         self.normal_texture.release()
@@ -8,7 +8,7 @@ Renders simple debug gizmos for lights consisting of:
 
 from __future__ import annotations
 
-from typing import Iterable, Tuple
+from typing import Iterable, Optional, Tuple
 import numpy as np
 import moderngl
 from pyrr import Matrix44
@@ -46,8 +46,14 @@ class LightDebugRenderer:
         self._identity_matrix = Matrix44.identity()
         self._identity_bytes = self._identity_matrix.astype("f4").tobytes()
 
-    def render(self, camera: Camera, lights: Iterable[Light], viewport: Tuple[int, int, int, int]):
-        """Render gizmos for all provided lights."""
+    def render(
+        self,
+        camera: Camera,
+        lights: Iterable[Light],
+        viewport: Tuple[int, int, int, int],
+        target: Optional[moderngl.Framebuffer] = None,
+    ):
+        """Render gizmos for all provided lights (into ``target``, default the screen)."""
         lights = list(lights)
         if not lights:
             return
@@ -66,7 +72,7 @@ class LightDebugRenderer:
         self.program["projection"].write(projection.tobytes())
 
         # Configure state for overlay rendering
-        self.ctx.screen.use()
+        (target or self.ctx.screen).use()
         self.ctx.viewport = viewport
         self.ctx.enable(moderngl.BLEND)
         self.ctx.blend_func = moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA
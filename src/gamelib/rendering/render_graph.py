@@ -0,0 +1,440 @@
+"""
+Render Graph
+
+Declarative description of a frame: passes declare the resources they read
+and write, and the graph works out what actually has to run and which
+textures it needs.
+
+Each frame the graph:
+1. Drops passes whose ``enabled`` predicate is false (e.g. SSAO when disabled)
+2. Culls passes whose outputs nobody reads (walking back from the outputs)
+3. Computes the lifetime of every transient texture over the surviving passes
+4. Aliases transients with matching formats whose lifetimes don't overlap
+   onto the same physical texture
+
+Compilation is cached and only redone when the set of active passes or the
+graph size changes. Transient textures are sized relative to the graph, so
+``resize()`` is the single place render targets get reallocated.
+
+Resources are either *transient* (created and owned by the graph, contents
+only valid between their first write and last read within a frame) or
+*imported* (owned elsewhere and fetched through a getter each frame, e.g.
+the screen or SSAO history).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+import moderngl
+
+
+ResourceList = Union[Iterable[str], Callable[[], Iterable[str]]]
+
+_DTYPE_BYTES = {"f1": 1, "u1": 1, "i1": 1, "f2": 2, "u2": 2, "i2": 2, "f4": 4, "u4": 4, "i4": 4}
+
+
+@dataclass(frozen=True)
+class ResourceDesc:
+    """
+    Format of a transient texture.
+
+    Attributes:
+        components: Channel count (1-4)
+        dtype: moderngl texture dtype ('f1', 'f2', 'f4', ...)
+        scale: Size relative to the graph size (ignored when ``size`` is set)
+        size: Fixed size (width, height)
+        depth: Depth texture instead of a color texture
+        samples: MSAA sample count (0 = single-sampled)
+        filter: (min, mag) filter applied whenever the texture is handed out
+    """
+
+    components: int = 4
+    dtype: str = "f1"
+    scale: float = 1.0
+    size: Optional[Tuple[int, int]] = None
+    depth: bool = False
+    samples: int = 0
+    filter: Tuple[int, int] = (moderngl.NEAREST, moderngl.NEAREST)
+
+    def resolve_size(self, graph_size: Tuple[int, int]) -> Tuple[int, int]:
+        if self.size is not None:
+            return tuple(self.size)
+        width, height = graph_size
+        return (max(1, int(round(width * self.scale))), max(1, int(round(height * self.scale))))
+
+    def alias_key(self, graph_size: Tuple[int, int]) -> tuple:
+        """Textures with equal keys can share memory."""
+        return (self.resolve_size(graph_size), self.components, self.dtype, self.depth, self.samples)
+
+    def byte_size(self, graph_size: Tuple[int, int]) -> int:
+        width, height = self.resolve_size(graph_size)
+        texel = 4 if self.depth else self.components * _DTYPE_BYTES.get(self.dtype, 4)
+        return width * height * texel * max(1, self.samples)
+
+
+@dataclass
+class RenderPass:
+    """
+    A node in the render graph.
+
+    ``reads``/``writes`` are either fixed tuples or callables evaluated once per
+    frame, for passes whose targets depend on runtime state (e.g. rendering to
+    the screen or to an intermediate that gets upscaled).
+    """
+
+    name: str
+    execute: Callable[["PassResources"], None]
+    reads: ResourceList = ()
+    writes: ResourceList = ()
+    enabled: Optional[Callable[[], bool]] = None
+    side_effect: bool = False  # Never culled (e.g. debug drawing to the screen)
+
+    def is_enabled(self) -> bool:
+        return self.enabled is None or bool(self.enabled())
+
+    def resolve(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Current (reads, writes)."""
+        reads = self.reads() if callable(self.reads) else self.reads
+        writes = self.writes() if callable(self.writes) else self.writes
+        return tuple(reads), tuple(writes)
+
+
+@dataclass
+class _CompiledGraph:
+    passes: List[RenderPass]
+    culled: List[str]
+    lifetimes: Dict[str, Tuple[int, int]]
+    allocation: Dict[str, int]                # transient name -> physical slot
+    slot_keys: List[tuple] = field(default_factory=list)
+
+
+class PassResources:
+    """Resource accessor handed to each pass while it executes."""
+
+    def __init__(self, graph: "RenderGraph"):
+        self._graph = graph
+
+    def texture(self, name: str):
+        """Physical texture (transient) or imported object for ``name``."""
+        return self._graph._resolve(name)
+
+    def textures(self, *names: str) -> Dict[str, object]:
+        return {name: self.texture(name) for name in names}
+
+    def framebuffer(self, color: Sequence[str] = (), depth: Optional[str] = None) -> moderngl.Framebuffer:
+        """
+        Framebuffer over transient textures (cached between frames).
+
+        Args:
+            color: Names of color attachments, in location order
+            depth: Optional depth attachment name
+        """
+        return self._graph._framebuffer(tuple(color), depth)
+
+
+class RenderGraph:
+    """
+    Declarative pass/resource graph with culling and transient aliasing.
+
+    Usage:
+        graph = RenderGraph(ctx, (1920, 1080), profiler=profiler)
+        graph.create_texture("gbuffer.albedo", ResourceDesc(components=4))
+        graph.import_resource("screen", lambda: ctx.screen)
+        graph.add_pass("geometry", draw_geometry, writes=["gbuffer.albedo"])
+        graph.add_pass("lighting", draw_lighting, reads=["gbuffer.albedo"], writes=["screen"])
+        graph.set_outputs("screen")
+        graph.execute()
+    """
+
+    def __init__(self, ctx: moderngl.Context, size: Tuple[int, int], profiler=None):
+        """
+        Initialize render graph.
+
+        Args:
+            ctx: ModernGL context
+            size: Reference size for relative transient descs
+            profiler: Optional FrameProfiler; each pass runs in its own scope
+        """
+        self.ctx = ctx
+        self.size = tuple(size)
+        self.profiler = profiler
+
+        self.passes: List[RenderPass] = []
+        self.transients: Dict[str, ResourceDesc] = {}
+        self.imports: Dict[str, Callable[[], object]] = {}
+        self.outputs: Tuple[str, ...] = ()
+
+        self._compiled: Optional[_CompiledGraph] = None
+        self._signature: Optional[tuple] = None
+        self._physical: List[Tuple[tuple, moderngl.Texture]] = []
+        self._framebuffers: Dict[tuple, moderngl.Framebuffer] = {}
+
+    # ------------------------------------------------------------------
+    # Declaration
+    # ------------------------------------------------------------------
+    def create_texture(self, name: str, desc: ResourceDesc):
+        """Declare a graph-owned transient texture."""
+        self._check_new_name(name)
+        self.transients[name] = desc
+        self._invalidate()
+
+    def import_resource(self, name: str, getter: Callable[[], object]):
+        """Declare an externally owned resource fetched through ``getter``."""
+        self._check_new_name(name)
+        self.imports[name] = getter
+        self._invalidate()
+
+    def add_pass(
+        self,
+        name: str,
+        execute: Callable[[PassResources], None],
+        reads: ResourceList = (),
+        writes: ResourceList = (),
+        enabled: Optional[Callable[[], bool]] = None,
+        side_effect: bool = False,
+    ) -> RenderPass:
+        """
+        Append a pass (passes execute in declaration order).
+
+        Args:
+            name: Unique pass name (also used as profiler scope)
+            execute: Callable receiving a PassResources accessor
+            reads: Resource names sampled by the pass (or a callable returning them)
+            writes: Resource names rendered to by the pass (or a callable returning them)
+            enabled: Optional per-frame predicate; disabled passes are skipped
+            side_effect: Keep the pass even if none of its writes are read
+        """
+        if any(p.name == name for p in self.passes):
+            raise ValueError(f"Render pass '{name}' already exists")
+        if not callable(reads):
+            reads = tuple(reads)
+        if not callable(writes):
+            writes = tuple(writes)
+
+        render_pass = RenderPass(name, execute, reads, writes, enabled, side_effect)
+        if not callable(reads) and not callable(writes):
+            self._check_declared(render_pass, *render_pass.resolve())
+        self.passes.append(render_pass)
+        self._invalidate()
+        return render_pass
+
+    def _check_declared(self, render_pass: RenderPass, reads: Tuple[str, ...], writes: Tuple[str, ...]):
+        for resource in (*reads, *writes):
+            if resource not in self.transients and resource not in self.imports:
+                raise KeyError(f"Render pass '{render_pass.name}' uses undeclared resource '{resource}'")
+
+    def set_outputs(self, *names: str):
+        """Resources that must be produced each frame (roots for culling)."""
+        self.outputs = tuple(names)
+        self._invalidate()
+
+    def _check_new_name(self, name: str):
+        if name in self.transients or name in self.imports:
+            raise ValueError(f"Render graph resource '{name}' already declared")
+
+    # ------------------------------------------------------------------
+    # Compilation
+    # ------------------------------------------------------------------
+    def compile(self) -> _CompiledGraph:
+        """Cull, compute lifetimes and alias transients for the current frame."""
+        active = [p for p in self.passes if p.is_enabled()]
+        access = {p.name: p.resolve() for p in active}
+        signature = (self.size, tuple((p.name, access[p.name]) for p in active))
+        if self._compiled is not None and signature == self._signature:
+            return self._compiled
+
+        for render_pass in active:
+            if callable(render_pass.reads) or callable(render_pass.writes):
+                self._check_declared(render_pass, *access[render_pass.name])
+
+        # Cull backwards from the outputs
+        needed = set(self.outputs)
+        kept: List[RenderPass] = []
+        for render_pass in reversed(active):
+            reads, writes = access[render_pass.name]
+            if render_pass.side_effect or needed.intersection(writes):
+                kept.append(render_pass)
+                needed.update(reads)
+        kept.reverse()
+        culled = [p.name for p in active if p not in kept]
+
+        # Transient lifetimes over the surviving passes
+        lifetimes: Dict[str, Tuple[int, int]] = {}
+        for index, render_pass in enumerate(kept):
+            reads, writes = access[render_pass.name]
+            for resource in writes:
+                if resource in self.transients:
+                    first, last = lifetimes.get(resource, (index, index))
+                    lifetimes[resource] = (min(first, index), max(last, index))
+            for resource in reads:
+                if resource not in self.transients:
+                    continue
+                if resource not in lifetimes:
+                    raise RuntimeError(
+                        f"Render pass '{render_pass.name}' reads transient '{resource}' "
+                        "before any pass writes it"
+                    )
+                first, last = lifetimes[resource]
+                lifetimes[resource] = (first, max(last, index))
+
+        # Greedy interval allocation: reuse a slot whose last use ended earlier
+        allocation: Dict[str, int] = {}
+        slot_keys: List[tuple] = []
+        slot_free_after: List[int] = []
+        for name in sorted(lifetimes, key=lambda n: (lifetimes[n][0], n)):
+            first, last = lifetimes[name]
+            key = self.transients[name].alias_key(self.size)
+            for slot, slot_key in enumerate(slot_keys):
+                if slot_key == key and slot_free_after[slot] < first:
+                    allocation[name] = slot
+                    slot_free_after[slot] = last
+                    break
+            else:
+                allocation[name] = len(slot_keys)
+                slot_keys.append(key)
+                slot_free_after.append(last)
+
+        self._compiled = _CompiledGraph(kept, culled, lifetimes, allocation, slot_keys)
+        self._signature = signature
+        self._realize(slot_keys)
+        return self._compiled
+
+    def _realize(self, slot_keys: List[tuple]):
+        """Match physical textures to slots, reusing existing ones by format."""
+        available = list(self._physical)
+        physical: List[Tuple[tuple, moderngl.Texture]] = []
+        for key in slot_keys:
+            for index, (existing_key, texture) in enumerate(available):
+                if existing_key == key:
+                    physical.append(available.pop(index))
+                    break
+            else:
+                physical.append((key, self._create_physical(key)))
+
+        if available:
+            for _, texture in available:
+                texture.release()
+            self._release_framebuffers()
+
+        self._physical = physical
+
+    def _create_physical(self, key: tuple) -> moderngl.Texture:
+        size, components, dtype, depth, samples = key
+        if depth:
+            return self.ctx.depth_texture(size, samples=samples)
+        return self.ctx.texture(size, components, dtype=dtype, samples=samples)
+
+    @property
+    def is_compiled(self) -> bool:
+        """True once the graph has been compiled for the current pass set and size."""
+        return self._compiled is not None
+
+    def _invalidate(self):
+        self._compiled = None
+        self._signature = None
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+    def execute(self):
+        """Compile (if needed) and run all surviving passes in order."""
+        compiled = self.compile()
+        resources = PassResources(self)
+        for render_pass in compiled.passes:
+            if self.profiler is not None:
+                with self.profiler.scope(render_pass.name):
+                    render_pass.execute(resources)
+            else:
+                render_pass.execute(resources)
+
+    def _resolve(self, name: str):
+        if name in self.imports:
+            return self.imports[name]()
+
+        compiled = self._compiled or self.compile()
+        slot = compiled.allocation.get(name)
+        if slot is None:
+            raise RuntimeError(f"Transient '{name}' is not used by any active pass")
+        texture = self._physical[slot][1]
+        desc = self.transients[name]
+        if not desc.samples:
+            texture.filter = desc.filter
+        return texture
+
+    def _framebuffer(self, color: Tuple[str, ...], depth: Optional[str]) -> moderngl.Framebuffer:
+        color_textures = [self._resolve(name) for name in color]
+        depth_texture = self._resolve(depth) if depth is not None else None
+        key = (tuple(t.glo for t in color_textures), depth_texture.glo if depth_texture else None)
+
+        fbo = self._framebuffers.get(key)
+        if fbo is None:
+            fbo = self.ctx.framebuffer(color_attachments=color_textures, depth_attachment=depth_texture)
+            self._framebuffers[key] = fbo
+        return fbo
+
+    # ------------------------------------------------------------------
+    # Resize / stats / cleanup
+    # ------------------------------------------------------------------
+    def resize(self, size: Tuple[int, int]):
+        """Change the reference size; transients are reallocated on next execute."""
+        size = tuple(size)
+        if size == self.size:
+            return
+        self.size = size
+        self._release_physical()
+        self._invalidate()
+
+    def memory_stats(self) -> Dict[str, int]:
+        """
+        VRAM used by graph-owned transients.
+
+        Returns:
+            Dict with ``physical_bytes`` (actually allocated), ``virtual_bytes``
+            (what the active transients would need without aliasing),
+            ``physical_textures`` and ``virtual_textures`` counts
+        """
+        compiled = self._compiled or self.compile()
+        virtual = sum(self.transients[name].byte_size(self.size) for name in compiled.allocation)
+        physical = 0
+        for slot_index, key in enumerate(compiled.slot_keys):
+            # Any transient mapped to the slot describes its format
+            name = next(n for n, s in compiled.allocation.items() if s == slot_index)
+            physical += self.transients[name].byte_size(self.size)
+        return {
+            "physical_bytes": physical,
+            "virtual_bytes": virtual,
+            "physical_textures": len(compiled.slot_keys),
+            "virtual_textures": len(compiled.allocation),
+        }
+
+    def describe(self) -> List[str]:
+        """Human-readable schedule, culling and aliasing summary."""
+        compiled = self._compiled or self.compile()
+        lines = [f"Passes: {' -> '.join(p.name for p in compiled.passes)}"]
+        if compiled.culled:
+            lines.append(f"Culled: {', '.join(compiled.culled)}")
+        slots: Dict[int, List[str]] = {}
+        for name, slot in compiled.allocation.items():
+            slots.setdefault(slot, []).append(name)
+        for slot, names in sorted(slots.items()):
+            if len(names) > 1:
+                lines.append(f"Aliased: {' = '.join(sorted(names))}")
+        return lines
+
+    def _release_framebuffers(self):
+        for fbo in self._framebuffers.values():
+            fbo.release()
+        self._framebuffers = {}
+
+    def _release_physical(self):
+        self._release_framebuffers()
+        for _, texture in self._physical:
+            texture.release()
+        self._physical = []
+
+    def release(self):
+        """Release all graph-owned GPU resources."""
+        self._release_physical()
+        self._invalidate()
@@ -5,14 +5,16 @@ Orchestrates the complete rendering pipeline with shadow mapping.
 Supports both forward and deferred rendering modes.
 """
 
-from typing import List, Tuple
+import math
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 import moderngl
 
 from .shader_manager import ShaderManager
 from .shadow_renderer import ShadowRenderer
 from .main_renderer import MainRenderer
 from .skybox_renderer import SkyboxRenderer
-from .gbuffer import GBuffer
+from .gbuffer import GBuffer, GBUFFER_ATTACHMENTS
 from .geometry_renderer import GeometryRenderer
 from .lighting_renderer import LightingRenderer
 from .ssao_renderer import SSAORenderer
@@ -24,6 +26,9 @@ from .ui_sprite_renderer import UISpriteRenderer
 from .antialiasing_renderer import AntiAliasingRenderer, AAMode
 from .bloom_renderer import BloomRenderer
 from .light_debug_renderer import LightDebugRenderer
+from .frame_profiler import FrameProfiler
+from .render_graph import RenderGraph, ResourceDesc, PassResources
+from .dynamic_resolution import DynamicResolutionController
 from ..core.camera import Camera
 from ..core.light import Light
 from ..core.scene import Scene
@@ -32,13 +37,44 @@ from ..config.settings import (
     WINDOW_SIZE,
     SSAO_ENABLED,
     SSAO_KERNEL_SIZE,
+    SSAO_RESOLUTION_SCALE,
+    SSAO_TEMPORAL_ENABLED,
+    SSAO_TEMPORAL_KERNEL_SIZE,
     UI_FONT_PATH,
     UI_FONT_SIZE,
     PROJECT_ROOT,
     BLOOM_ENABLED,
+    PROFILER_ENABLED,
+    PROFILER_LATENCY_FRAMES,
+    PROFILER_HISTORY_FRAMES,
+    DYNAMIC_RESOLUTION_ENABLED,
+    DYNAMIC_RESOLUTION_TARGET_MS,
+    DYNAMIC_RESOLUTION_MIN_SCALE,
+    DYNAMIC_RESOLUTION_MAX_SCALE,
+    DYNAMIC_RESOLUTION_STEP,
+    DYNAMIC_RESOLUTION_SMOOTHING,
+    DYNAMIC_RESOLUTION_DOWNSCALE_THRESHOLD,
+    DYNAMIC_RESOLUTION_UPSCALE_THRESHOLD,
+    DYNAMIC_RESOLUTION_COOLDOWN_FRAMES,
+    DEFAULT_FOV,
 )
 
 
+GBUFFER_RESOURCES = [f"gbuffer.{name}" for name in GBUFFER_ATTACHMENTS]
+
+
+@dataclass
+class _FrameInputs:
+    """Per-frame state shared by the deferred render graph passes."""
+
+    scene: Scene
+    camera: Camera
+    lights: List[Light]
+    time: Optional[float]
+    skybox: object = None
+    ssao_texture: Optional[moderngl.Texture] = None
+
+
 class RenderPipeline:
     """
     Complete rendering pipeline.
@@ -53,16 +89,19 @@ class RenderPipeline:
     3. Scene rendering (forward or deferred mode)
     """
 
-    def __init__(self, ctx: moderngl.Context, window):
+    def __init__(self, ctx: moderngl.Context, window, target: Optional[moderngl.Framebuffer] = None):
         """
         Initialize rendering pipeline.
 
         Args:
             ctx: ModernGL context
             window: Window instance (for viewport access)
+            target: Framebuffer finished frames are presented into (defaults
+                to the window's default framebuffer, ``ctx.screen``)
         """
         self.ctx = ctx
         self.window = window
+        self.target = target
         self.rendering_mode = RENDERING_MODE
 
         # Load shaders
@@ -96,6 +135,8 @@ class RenderPipeline:
         # SSAO shaders
         self.shader_manager.load_program("ssao", "ssao.vert", "ssao.frag")
         self.shader_manager.load_program("ssao_blur", "ssao_blur.vert", "ssao_blur.frag")
+        self.shader_manager.load_program("ssao_upsample", "ssao.vert", "ssao_upsample.frag")
+        self.shader_manager.load_program("ssao_temporal", "ssao.vert", "ssao_temporal.frag")
 
         # Anti-aliasing shaders
         self.shader_manager.load_program("fxaa", "fxaa.vert", "fxaa.frag")
@@ -126,8 +167,8 @@ class RenderPipeline:
             skybox_renderer=self.skybox_renderer
         )
 
-        # Create deferred rendering pipeline
-        self.gbuffer = GBuffer(ctx, WINDOW_SIZE)
+        # Create deferred rendering pipeline (G-Buffer textures are owned by the render graph)
+        self.gbuffer = GBuffer(ctx, WINDOW_SIZE, allocate=False)
         self.geometry_renderer = GeometryRenderer(
             ctx,
             self.shader_manager.get("geometry"),
@@ -147,7 +188,12 @@ class RenderPipeline:
             ctx,
             WINDOW_SIZE,
             self.shader_manager.get("ssao"),
-            self.shader_manager.get("ssao_blur")
+            self.shader_manager.get("ssao_blur"),
+            upsample_program=self.shader_manager.get("ssao_upsample"),
+            temporal_program=self.shader_manager.get("ssao_temporal"),
+            resolution_scale=SSAO_RESOLUTION_SCALE,
+            kernel_size=SSAO_TEMPORAL_KERNEL_SIZE if SSAO_TEMPORAL_ENABLED else SSAO_KERNEL_SIZE,
+            temporal_enabled=SSAO_TEMPORAL_ENABLED,
         ) if SSAO_ENABLED else None
 
         # Bloom (emissive glow) post-process
@@ -214,6 +260,152 @@ class RenderPipeline:
         )
         self.viewport_size: Tuple[int, int] = tuple(self.window.size)
 
+        # Dynamic resolution: deferred passes render at render_size (GPU frame
+        # time vs. budget) and are upscaled to the backbuffer before the UI
+        self.dynamic_resolution = DynamicResolutionController(
+            target_ms=DYNAMIC_RESOLUTION_TARGET_MS,
+            min_scale=DYNAMIC_RESOLUTION_MIN_SCALE,
+            max_scale=DYNAMIC_RESOLUTION_MAX_SCALE,
+            step=DYNAMIC_RESOLUTION_STEP,
+            smoothing=DYNAMIC_RESOLUTION_SMOOTHING,
+            downscale_threshold=DYNAMIC_RESOLUTION_DOWNSCALE_THRESHOLD,
+            upscale_threshold=DYNAMIC_RESOLUTION_UPSCALE_THRESHOLD,
+            cooldown_frames=DYNAMIC_RESOLUTION_COOLDOWN_FRAMES,
+            enabled=DYNAMIC_RESOLUTION_ENABLED,
+        )
+        self.render_size: Tuple[int, int] = tuple(WINDOW_SIZE)
+        self._last_timed_frame = -1
+
+        # Per-pass CPU/GPU profiler (no-op scopes while disabled). It also
+        # records while dynamic resolution needs GPU timings; show_profiler
+        # only controls whether the results are displayed.
+        self.show_profiler = PROFILER_ENABLED
+        self.profiler = FrameProfiler(
+            ctx,
+            enabled=PROFILER_ENABLED or DYNAMIC_RESOLUTION_ENABLED,
+            latency=PROFILER_LATENCY_FRAMES,
+            history=PROFILER_HISTORY_FRAMES,
+        )
+
+        # Deferred frame as a render graph (transient targets allocated on first use)
+        self._frame: Optional[_FrameInputs] = None
+        self.deferred_graph = self._build_deferred_graph()
+        self._set_render_size(self._target_render_size())
+
+    def _build_deferred_graph(self) -> RenderGraph:
+        """
+        Declare the deferred frame: passes, the resources they touch, and when they run.
+
+        G-Buffer attachments and SMAA intermediates are graph transients, so the
+        SMAA weights reuse the albedo texture once lighting has consumed it, and
+        nothing is allocated for passes that are disabled or culled. The bloom
+        mip chain and SSAO targets stay owned by their renderers and never alias.
+        """
+        graph = RenderGraph(self.ctx, WINDOW_SIZE, profiler=self.profiler)
+
+        for name, desc in GBUFFER_ATTACHMENTS.items():
+            graph.create_texture(f"gbuffer.{name}", desc)
+        linear = (moderngl.LINEAR, moderngl.LINEAR)
+        graph.create_texture("smaa.edges", ResourceDesc(components=2, filter=linear))
+        graph.create_texture("smaa.weights", ResourceDesc(components=4, filter=linear))
+        graph.create_texture("scaled_color", ResourceDesc(components=4, filter=linear))
+        graph.create_texture("scaled_depth", ResourceDesc(depth=True))
+
+        graph.import_resource("ssao", lambda: self.ssao_renderer.get_ssao_texture())
+        graph.import_resource("scene_color", self._scene_color)
+        graph.import_resource("screen", lambda: self.screen)
+
+        graph.add_pass("geometry", self._pass_geometry, writes=GBUFFER_RESOURCES)
+        graph.add_pass(
+            "ssao",
+            self._pass_ssao,
+            reads=["gbuffer.position", "gbuffer.normal"],
+            writes=["ssao"],
+            enabled=self._ssao_active,
+        )
+        graph.add_pass(
+            "lighting",
+            self._pass_lighting,
+            reads=GBUFFER_RESOURCES + ["ssao"],
+            writes=self._scene_resources,
+        )
+        graph.add_pass(
+            "transparent",
+            self._pass_transparent,
+            reads=self._scene_resources,
+            writes=self._scene_resources,
+            enabled=lambda: self._frame.scene.has_transparent_objects(),
+        )
+        graph.add_pass(
+            "aa_resolve",
+            self._pass_aa_resolve,
+            reads=["scene_color"],
+            writes=lambda: [self._present_resource()],
+            enabled=lambda: self.aa_renderer.is_active and not self.aa_renderer.uses_smaa,
+        )
+        graph.add_pass(
+            "smaa_resolve",
+            self._pass_aa_resolve,
+            reads=["scene_color"],
+            writes=lambda: ["smaa.edges", "smaa.weights", self._present_resource()],
+            enabled=lambda: self.aa_renderer.uses_smaa,
+        )
+        graph.add_pass(
+            "upscale",
+            self._pass_upscale,
+            reads=["scaled_color"],
+            writes=["screen"],
+            enabled=lambda: self.is_upscaling,
+        )
+        graph.add_pass(
+            "light_debug",
+            lambda res: self._render_light_debug(self._frame.camera, self._frame.lights),
+            writes=["screen"],
+            enabled=lambda: self._light_debug_active(self._frame.lights),
+        )
+
+        # scene_color is the screen itself when AA is off
+        graph.set_outputs("screen", "scene_color")
+        return graph
+
+    @property
+    def screen(self) -> moderngl.Framebuffer:
+        """Framebuffer the finished frame (and UI) is presented into."""
+        return self.target if self.target is not None else self.ctx.screen
+
+    def _scene_color(self) -> moderngl.Framebuffer:
+        """Where the lit scene goes before the AA resolve (the screen when AA is off)."""
+        return self.aa_renderer.get_render_target() if self.aa_renderer.is_active else self.screen
+
+    @property
+    def is_upscaling(self) -> bool:
+        """True while the deferred passes render below the backbuffer size."""
+        return self.render_size != self.viewport_size
+
+    @property
+    def render_viewport(self) -> Tuple[int, int, int, int]:
+        """Viewport of the internal (possibly scaled) render resolution."""
+        return (0, 0, *self.render_size)
+
+    def _scene_resources(self) -> List[str]:
+        """Resources the lit scene is rendered into this frame."""
+        if self.aa_renderer.is_active:
+            return ["scene_color"]
+        if self.is_upscaling:
+            return ["scaled_color", "scaled_depth"]
+        return ["screen"]
+
+    def _scene_target(self, res: PassResources) -> moderngl.Framebuffer:
+        if self.aa_renderer.is_active:
+            return res.texture("scene_color")
+        if self.is_upscaling:
+            return res.framebuffer(["scaled_color"], depth="scaled_depth")
+        return self.screen
+
+    def _present_resource(self) -> str:
+        """Where the AA resolve writes: the screen, or the buffer that gets upscaled."""
+        return "scaled_color" if self.is_upscaling else "screen"
+
     def initialize_lights(self, lights: List[Light], camera: Camera = None):
         """
         Initialize shadow maps for lights with adaptive resolution.
@@ -254,8 +446,20 @@ class RenderPipeline:
             lights: List of lights
             time: Elapsed time in seconds (used for animated effects)
         """
+        profiler = self.profiler
+        profiler.begin_frame()
+
+        if self.rendering_mode == "deferred" and self.dynamic_resolution.enabled:
+            self._update_dynamic_resolution()
+
+        # Chunked terrain picks its LODs once per frame, from the camera
+        if hasattr(scene, "update_terrain_lod"):
+            projection_scale = self.window.size[1] / (2.0 * math.tan(math.radians(DEFAULT_FOV) / 2.0))
+            scene.update_terrain_lod(camera.position, projection_scale)
+
         # Pass 1: Render shadow maps for all lights (both modes)
-        self.shadow_renderer.render_shadow_maps(lights, scene)
+        with profiler.scope("shadows"):
+            self.shadow_renderer.render_shadow_maps(lights, scene)
 
         # Pass 2+: Render scene (mode-dependent)
         if self.rendering_mode == "deferred":
@@ -264,11 +468,14 @@ class RenderPipeline:
             self._render_forward(scene, camera, lights, time=time)
 
         # Final pass: Render UI overlay
-        if hasattr(self, "icon_manager") and self.icon_manager.has_icons():
-            self.ui_sprite_renderer.render(self.icon_manager, self.window.size)
+        with profiler.scope("ui"):
+            if hasattr(self, "icon_manager") and self.icon_manager.has_icons():
+                self.ui_sprite_renderer.render(self.icon_manager, self.window.size)
+
+            if len(self.text_manager.get_all_layers()) > 0:
+                self.ui_renderer.render(self.text_manager, self.window.size)
 
-        if len(self.text_manager.get_all_layers()) > 0:
-            self.ui_renderer.render(self.text_manager, self.window.size)
+        profiler.end_frame()
 
     def resize(self, size: Tuple[int, int]):
         """Resize internal render targets and update cached viewport size."""
@@ -285,15 +492,7 @@ class RenderPipeline:
         self.ctx.viewport = screen_viewport
         self.shadow_renderer.set_screen_viewport(screen_viewport)
 
-        self.gbuffer.resize(self.viewport_size)
-
-        if self.ssao_renderer is not None:
-            self.ssao_renderer.resize(self.viewport_size)
-
-        self.aa_renderer.resize(self.viewport_size)
-
-        if hasattr(self.transparent_renderer, "resize"):
-            self.transparent_renderer.resize(self.viewport_size)
+        self._set_render_size(self._target_render_size())
 
         if hasattr(self.ui_renderer, "resize"):
             self.ui_renderer.resize(self.viewport_size)
@@ -304,6 +503,41 @@ class RenderPipeline:
         if hasattr(self.text_manager, "refresh_layout_metrics"):
             self.text_manager.refresh_layout_metrics()
 
+    def _target_render_size(self) -> Tuple[int, int]:
+        """Internal render size for the current mode and dynamic-resolution scale."""
+        if self.rendering_mode == "deferred" and self.dynamic_resolution.enabled:
+            return self.dynamic_resolution.render_size(self.viewport_size)
+        return self.viewport_size
+
+    def _set_render_size(self, size: Tuple[int, int]):
+        """Resize every target of the scaled passes to the internal render size."""
+        size = tuple(size)
+        if size == self.render_size:
+            return
+
+        self.render_size = size
+        self.gbuffer.resize(size)
+        self.deferred_graph.resize(size)
+
+        if self.ssao_renderer is not None:
+            self.ssao_renderer.resize(size)
+
+        self.aa_renderer.resize(size)
+
+        if hasattr(self.transparent_renderer, "resize"):
+            self.transparent_renderer.resize(size)
+
+    def _update_dynamic_resolution(self):
+        """Feed the newest resolved GPU frame time to the controller and apply its scale."""
+        latest = self.profiler.latest
+        sample = None
+        if latest is not None and latest.frame != self._last_timed_frame:
+            self._last_timed_frame = latest.frame
+            sample = latest.gpu_ms
+
+        self.dynamic_resolution.update(sample)
+        self._set_render_size(self._target_render_size())
+
     def _render_forward(
         self,
         scene: Scene,
@@ -319,35 +553,43 @@ class RenderPipeline:
             camera: Camera for view
             lights: List of lights
         """
+        profiler = self.profiler
+
         # Get AA render target
-        render_target = self.aa_renderer.get_render_target()
+        render_target = self._scene_color()
         skybox = scene.get_skybox() if hasattr(scene, 'get_skybox') else None
 
         # Check if AA is enabled
-        if render_target == self.ctx.screen:
+        if render_target == self.screen:
             # No AA - render directly to screen (original behavior)
-            self.main_renderer.render(
-                scene,
-                camera,
-                lights,
-                self.window.viewport,
-                skybox=skybox,
-                time=time,
-            )
+            with profiler.scope("forward"):
+                self.main_renderer.render_to_target(
+                    scene,
+                    camera,
+                    lights,
+                    self.window.viewport,
+                    render_target,
+                    skybox=skybox,
+                    time=time,
+                )
         else:
             # AA enabled - render to AA framebuffer then resolve
-            self.main_renderer.render_to_target(
-                scene,
-                camera,
-                lights,
-                self.window.viewport,
-                render_target,
-                skybox=skybox,
-                time=time,
-            )
-            self.aa_renderer.resolve_and_present()
+            with profiler.scope("forward"):
+                self.main_renderer.render_to_target(
+                    scene,
+                    camera,
+                    lights,
+                    self.window.viewport,
+                    render_target,
+                    skybox=skybox,
+                    time=time,
+                )
+            with profiler.scope("aa_resolve"):
+                self.aa_renderer.resolve_and_present(target=self.screen)
 
-        self._render_light_debug(camera, lights)
+        if self._light_debug_active(lights):
+            with profiler.scope("light_debug"):
+                self._render_light_debug(camera, lights)
 
     def _render_deferred(
         self,
@@ -357,119 +599,145 @@ class RenderPipeline:
         time: float | None = None,
     ):
         """
-        Render using deferred rendering.
+        Render using deferred rendering (executes the deferred render graph).
 
         Args:
             scene: Scene to render
             camera: Camera for view
             lights: List of lights
         """
-        # Pass 2: Geometry pass (write to G-Buffer)
-        self.geometry_renderer.render(scene, camera, self.gbuffer)
+        self._frame = _FrameInputs(
+            scene=scene,
+            camera=camera,
+            lights=lights,
+            time=time,
+            skybox=scene.get_skybox() if hasattr(scene, 'get_skybox') else None,
+        )
+        self.deferred_graph.execute()
 
-        # Pass 2.5: SSAO pass (optional, if enabled)
-        ssao_texture = None
+    def _ssao_active(self) -> bool:
         # Import settings dynamically to get current runtime value
         from ..config import settings
-        if self.ssao_renderer is not None and settings.SSAO_ENABLED:
-            aspect_ratio = self.window.size[0] / self.window.size[1]
-            self.ssao_renderer.render(
-                self.gbuffer.position_texture,
-                self.gbuffer.normal_texture,
-                camera.get_projection_matrix(aspect_ratio),
-                radius=settings.SSAO_RADIUS,
-                bias=settings.SSAO_BIAS,
-                intensity=settings.SSAO_INTENSITY
-            )
-            ssao_texture = self.ssao_renderer.get_ssao_texture()
+        return self.ssao_renderer is not None and settings.SSAO_ENABLED
 
-        # Get AA render target
-        render_target = self.aa_renderer.get_render_target()
-        skybox = scene.get_skybox() if hasattr(scene, 'get_skybox') else None
+    def _pass_geometry(self, res: PassResources):
+        """Geometry pass: write scene attributes into the (graph-owned) G-Buffer."""
+        textures = {name: res.texture(f"gbuffer.{name}") for name in GBUFFER_ATTACHMENTS}
+        fbo = res.framebuffer(color=GBUFFER_RESOURCES[:-1], depth="gbuffer.depth")
+        self.gbuffer.attach(textures, fbo)
+        self.geometry_renderer.render(self._frame.scene, self._frame.camera, self.gbuffer)
 
-        # Pass 3: Lighting pass (accumulate all lights from G-Buffer)
-        if render_target == self.ctx.screen:
-            # No AA - render directly to screen (original behavior)
-            apply_post_lighting = None
-            if self.bloom_renderer:
-                target_fbo = self.ctx.screen
+    def _pass_ssao(self, res: PassResources):
+        """SSAO pass: ambient occlusion from G-Buffer position/normal."""
+        from ..config import settings
 
-                def _apply_post_lighting():
+        camera = self._frame.camera
+        self._configure_ssao(settings)
+        aspect_ratio = self.render_size[0] / self.render_size[1]
+        self.ssao_renderer.render(
+            res.texture("gbuffer.position"),
+            res.texture("gbuffer.normal"),
+            camera.get_projection_matrix(aspect_ratio),
+            radius=settings.SSAO_RADIUS,
+            bias=settings.SSAO_BIAS,
+            intensity=settings.SSAO_INTENSITY,
+            view_matrix=camera.get_view_matrix(),
+        )
+        self._frame.ssao_texture = res.texture("ssao")
+
+    def _pass_lighting(self, res: PassResources):
+        """Lighting pass: accumulate all lights (plus bloom) into the scene color target."""
+        target = self._scene_target(res)
+        viewport = self.render_viewport
+        if self.is_upscaling and not self.aa_renderer.is_active:
+            # Graph-owned target: depth is read by the transparent pass
+            target.clear(depth=1.0)
+
+        apply_post_lighting = None
+        if self.bloom_renderer:
+            def apply_post_lighting():
+                with self.profiler.scope("bloom"):
                     self.bloom_renderer.apply(
                         self.gbuffer.emissive_texture,
-                        self.window.viewport,
-                        target_fbo,
+                        viewport,
+                        target,
                     )
 
-                apply_post_lighting = _apply_post_lighting
-
-            self.lighting_renderer.render(
-                lights,
-                self.gbuffer,
-                camera,
-                self.window.viewport,
-                ssao_texture=ssao_texture,
-                skybox=skybox,
-                time=time,
-                apply_post_lighting=apply_post_lighting,
-            )
-
-            # Pass 4: Transparent pass (forward rendering for alpha BLEND objects)
-            if scene.has_transparent_objects():
-                shadow_maps = [light.shadow_map for light in lights]
-                self.transparent_renderer.render(
-                    scene,
-                    camera,
-                    lights,
-                    self.ctx.screen,
-                    shadow_maps,
-                    self.window.size,
-                    time=time,
-                )
-        else:
-            # AA enabled - render to AA framebuffer then resolve
-            apply_post_lighting = None
-            if self.bloom_renderer:
-                target_fbo = render_target
+        frame = self._frame
+        self.lighting_renderer.render_to_target(
+            frame.lights,
+            self.gbuffer,
+            frame.camera,
+            viewport,
+            target,
+            ssao_texture=frame.ssao_texture,
+            skybox=frame.skybox,
+            time=frame.time,
+            apply_post_lighting=apply_post_lighting,
+        )
 
-                def _apply_post_lighting():
-                    self.bloom_renderer.apply(
-                        self.gbuffer.emissive_texture,
-                        self.window.viewport,
-                        target_fbo,
-                    )
+    def _pass_transparent(self, res: PassResources):
+        """Transparent pass: forward-render alpha BLEND objects over the lit scene."""
+        frame = self._frame
+        shadow_maps = [light.shadow_map for light in frame.lights]
+        self.transparent_renderer.render(
+            frame.scene,
+            frame.camera,
+            frame.lights,
+            self._scene_target(res),
+            shadow_maps,
+            self.render_size,
+            time=frame.time,
+        )
 
-                apply_post_lighting = _apply_post_lighting
-
-            self.lighting_renderer.render_to_target(
-                lights,
-                self.gbuffer,
-                camera,
-                self.window.viewport,
-                render_target,
-                ssao_texture=ssao_texture,
-                skybox=skybox,
-                time=time,
-                apply_post_lighting=apply_post_lighting,
+    def _pass_aa_resolve(self, res: PassResources):
+        """Resolve MSAA and apply FXAA/SMAA into the screen (or the upscale source)."""
+        target = res.framebuffer(["scaled_color"]) if self.is_upscaling else self.screen
+        if self.aa_renderer.uses_smaa:
+            self.aa_renderer.resolve_and_present(
+                smaa_edges=(res.texture("smaa.edges"), res.framebuffer(["smaa.edges"])),
+                smaa_weights=(res.texture("smaa.weights"), res.framebuffer(["smaa.weights"])),
+                target=target,
             )
+        else:
+            self.aa_renderer.resolve_and_present(target=target)
+
+    def _pass_upscale(self, res: PassResources):
+        """Bilinear upscale of the scaled scene to the backbuffer."""
+        self.ctx.disable(moderngl.DEPTH_TEST | moderngl.BLEND)
+        self.aa_renderer.present(
+            res.texture("scaled_color"),
+            self.screen,
+            viewport=(0, 0, *self.viewport_size),
+        )
 
-            # Pass 4: Transparent pass (forward rendering for alpha BLEND objects)
-            # Render into AA buffer before resolving
-            if scene.has_transparent_objects():
-                shadow_maps = [light.shadow_map for light in lights]
-                self.transparent_renderer.render(
-                    scene,
-                    camera,
-                    lights,
-                    render_target,
-                    shadow_maps,
-                    self.window.size,
-                    time=time,
-                )
+    def _configure_ssao(self, settings) -> None:
+        """Push the current runtime SSAO quality settings to the SSAO renderer."""
+        temporal = bool(settings.SSAO_TEMPORAL_ENABLED)
+        kernel_size = settings.SSAO_TEMPORAL_KERNEL_SIZE if temporal else settings.SSAO_KERNEL_SIZE
+        self.ssao_renderer.configure(
+            resolution_scale=settings.SSAO_RESOLUTION_SCALE,
+            kernel_size=kernel_size,
+            temporal_enabled=temporal,
+        )
+
+    def cycle_ssao_quality(self) -> str:
+        """Cycle through SSAO_QUALITY_PRESETS (resolution scale + temporal mode)."""
+        from ..config import settings
 
-            self.aa_renderer.resolve_and_present()
+        presets = settings.SSAO_QUALITY_PRESETS
+        current = (settings.SSAO_RESOLUTION_SCALE, bool(settings.SSAO_TEMPORAL_ENABLED))
+        index = -1
+        for i, preset in enumerate(presets):
+            if (preset["resolution_scale"], preset["temporal"]) == current:
+                index = i
+                break
 
-        self._render_light_debug(camera, lights)
+        preset = presets[(index + 1) % len(presets)]
+        settings.SSAO_RESOLUTION_SCALE = preset["resolution_scale"]
+        settings.SSAO_TEMPORAL_ENABLED = preset["temporal"]
+        print(f"SSAO quality: {preset['name']}")
+        return preset["name"]
 
     def get_shader(self, name: str) -> moderngl.Program:
         """
@@ -483,17 +751,18 @@ class RenderPipeline:
         """
         return self.shader_manager.get(name)
 
-    def _render_light_debug(self, camera: Camera, lights: List[Light]) -> None:
-        """Render light gizmos when enabled."""
+    def _light_debug_active(self, lights: List[Light]) -> bool:
+        """True if light gizmos should be drawn this frame."""
         from ..config import settings
 
-        if not getattr(settings, "DEBUG_DRAW_LIGHT_GIZMOS", False):
-            return
-        if not lights:
-            return
-        if not getattr(self, "light_debug_renderer", None):
-            return
+        return bool(
+            getattr(settings, "DEBUG_DRAW_LIGHT_GIZMOS", False)
+            and lights
+            and getattr(self, "light_debug_renderer", None)
+        )
 
+    def _render_light_debug(self, camera: Camera, lights: List[Light]) -> None:
+        """Render light gizmos."""
         width, height = self.window.size
         default_viewport = (0, 0, width, height)
         viewport = getattr(self.window, "viewport", default_viewport)
@@ -502,7 +771,7 @@ class RenderPipeline:
         else:
             target_viewport = default_viewport
 
-        self.light_debug_renderer.render(camera, lights, target_viewport)
+        self.light_debug_renderer.render(camera, lights, target_viewport, target=self.screen)
 
     def cycle_aa_mode(self):
         """Cycle to the next anti-aliasing mode"""
@@ -544,6 +813,48 @@ class RenderPipeline:
             return self.aa_renderer.get_aa_mode_name()
         return "Not Available"
 
+    def _sync_profiler(self):
+        self.profiler.enabled = self.show_profiler or self.dynamic_resolution.enabled
+
+    def toggle_profiler(self) -> bool:
+        """Toggle the per-pass CPU/GPU profiler."""
+        self.show_profiler = not self.show_profiler
+        self._sync_profiler()
+        print(f"Frame profiler {'enabled' if self.show_profiler else 'disabled'}")
+        return self.show_profiler
+
+    def toggle_dynamic_resolution(self) -> bool:
+        """Toggle frame-time driven dynamic resolution (deferred mode only)."""
+        enabled = self.dynamic_resolution.toggle()
+        self._last_timed_frame = -1
+        self._sync_profiler()
+        self._set_render_size(self._target_render_size())
+        print(f"Dynamic resolution {'enabled' if enabled else 'disabled'}")
+        return enabled
+
+    def export_profiler_trace(self, path=None):
+        """
+        Write recorded profiler history as Chrome-trace JSON.
+
+        Args:
+            path: Output path (defaults to PROFILER_TRACE_PATH under PROJECT_ROOT)
+
+        Returns:
+            Path written, or None if nothing has been recorded
+        """
+        from ..config import settings
+
+        self.profiler.flush()
+        if not self.profiler.history:
+            print("Frame profiler: nothing recorded (enable with F10 first)")
+            return None
+
+        if path is None:
+            path = PROJECT_ROOT / settings.PROFILER_TRACE_PATH
+        written = self.profiler.export_chrome_trace(path)
+        print(f"Frame profiler trace written to {written}")
+        return written
+
     def toggle_light_gizmos(self):
         """Toggle debug light gizmo rendering."""
         from ..config import settings
@@ -14,6 +14,7 @@ from ..config.settings import (
     SHADOW_MAP_SIZE_MED,
     SHADOW_MAP_SIZE_HIGH,
     ENABLE_ADAPTIVE_SHADOW_RES,
+    TERRAIN_SHADOW_LOD_BIAS,
 )
 from ..core.light import Light
 from ..core.scene import Scene
@@ -230,4 +231,6 @@ class ShadowRenderer:
             frustum = Frustum(light_matrix)
 
         # Render scene from light's perspective with frustum culling
-        scene.render_all(self.shadow_program, frustum=frustum, debug_label="Shadow Pass")
+        # (chunked terrain drops to coarser LODs for shadows)
+        scene.render_all(self.shadow_program, frustum=frustum, debug_label="Shadow Pass",
+                         lod_bias=TERRAIN_SHADOW_LOD_BIAS)
@@ -7,7 +7,7 @@ A 3-pass technique that provides better quality than FXAA.
 Uses official SMAA 1.0 precomputed lookup textures for professional-grade antialiasing.
 """
 
-from typing import Tuple
+from typing import Optional, Tuple
 import moderngl
 import numpy as np
 from pathlib import Path
@@ -78,8 +78,8 @@ class SMAARenderer:
         # Full-screen quad
         self._create_fullscreen_quad()
         
-        # Create framebuffers and textures
-        self._create_framebuffers()
+        # Intermediate targets are created on first use unless the caller
+        # (the render graph) supplies its own
         self._create_lookup_textures()
     
     def _create_fullscreen_quad(self):
@@ -151,30 +151,44 @@ class SMAARenderer:
         self.search_texture.repeat_x = False
         self.search_texture.repeat_y = False
     
-    def apply_smaa(self, input_texture: moderngl.Texture, output_fbo: moderngl.Framebuffer):
+    def apply_smaa(
+        self,
+        input_texture: moderngl.Texture,
+        output_fbo: moderngl.Framebuffer,
+        edges: Optional[Tuple[moderngl.Texture, moderngl.Framebuffer]] = None,
+        weights: Optional[Tuple[moderngl.Texture, moderngl.Framebuffer]] = None,
+    ):
         """
         Apply SMAA to input texture and render to output framebuffer.
         
         Args:
             input_texture: Input color texture
             output_fbo: Output framebuffer to render final result
+            edges: Optional external (RG texture, framebuffer) for edge detection
+            weights: Optional external (RGBA texture, framebuffer) for blend weights
         """
+        if edges is None or weights is None:
+            if self.edges_fbo is None:
+                self._create_framebuffers()
+            edges = edges or (self.edges_texture, self.edges_fbo)
+            weights = weights or (self.blend_texture, self.blend_fbo)
+
         w, h = self.size
         rt_metrics = (1.0 / w, 1.0 / h, float(w), float(h))
         
         # Pass 1: Edge Detection
-        self._edge_detection_pass(input_texture, rt_metrics)
+        self._edge_detection_pass(input_texture, edges[1], rt_metrics)
         
         # Pass 2: Blending Weight Calculation
-        self._blending_weight_pass(rt_metrics)
+        self._blending_weight_pass(edges[0], weights[1], rt_metrics)
         
         # Pass 3: Neighborhood Blending
-        self._neighborhood_blending_pass(input_texture, output_fbo, rt_metrics)
+        self._neighborhood_blending_pass(input_texture, weights[0], output_fbo, rt_metrics)
     
-    def _edge_detection_pass(self, input_texture: moderngl.Texture, rt_metrics: tuple):
+    def _edge_detection_pass(self, input_texture: moderngl.Texture, edges_fbo: moderngl.Framebuffer, rt_metrics: tuple):
         """Pass 1: Edge Detection"""
-        self.edges_fbo.use()
-        self.edges_fbo.clear(0.0, 0.0, 0.0, 0.0)
+        edges_fbo.use()
+        edges_fbo.clear(0.0, 0.0, 0.0, 0.0)
         
         # Set uniforms
         self.edge_program['SMAA_RT_METRICS'] = rt_metrics
@@ -186,16 +200,16 @@ class SMAARenderer:
         # Render
         self.edge_vao.render()
     
-    def _blending_weight_pass(self, rt_metrics: tuple):
+    def _blending_weight_pass(self, edges_texture: moderngl.Texture, blend_fbo: moderngl.Framebuffer, rt_metrics: tuple):
         """Pass 2: Blending Weight Calculation"""
-        self.blend_fbo.use()
-        self.blend_fbo.clear(0.0, 0.0, 0.0, 0.0)
+        blend_fbo.use()
+        blend_fbo.clear(0.0, 0.0, 0.0, 0.0)
 
         # Note: SMAA_RT_METRICS is only used in the vertex shader,
         # passed to fragment shader via varyings (pixcoord, offset)
 
         # Bind textures
-        self.edges_texture.use(0)
+        edges_texture.use(0)
         self.area_texture.use(1)
         self.search_texture.use(2)
 
@@ -206,7 +220,7 @@ class SMAARenderer:
         # Render
         self.blend_vao.render()
     
-    def _neighborhood_blending_pass(self, input_texture: moderngl.Texture, output_fbo: moderngl.Framebuffer, rt_metrics: tuple):
+    def _neighborhood_blending_pass(self, input_texture: moderngl.Texture, blend_texture: moderngl.Texture, output_fbo: moderngl.Framebuffer, rt_metrics: tuple):
         """Pass 3: Neighborhood Blending"""
         output_fbo.use()
         
@@ -215,7 +229,7 @@ class SMAARenderer:
         
         # Bind textures
         input_texture.use(0)
-        self.blend_texture.use(1)
+        blend_texture.use(1)
         
         self.neighborhood_program['colorTex'] = 0
         self.neighborhood_program['blendTex'] = 1
@@ -232,8 +246,9 @@ class SMAARenderer:
         """
         if size != self.size:
             self.size = size
-            self._cleanup_framebuffers()
-            self._create_framebuffers()
+            if self.edges_fbo is not None:
+                self._cleanup_framebuffers()
+                self._create_framebuffers()
     
     def _cleanup_framebuffers(self):
         """Clean up framebuffers"""
@@ -3,11 +3,18 @@ SSAO Renderer
 
 Implements Screen Space Ambient Occlusion for enhanced depth perception.
 Uses hemisphere sampling in view space to approximate ambient occlusion.
+
+Occlusion can be computed at a reduced internal resolution and brought back
+to full resolution with a depth-aware bilateral upsample. Optional temporal
+accumulation reprojects the previous frame's result so the per-frame kernel
+can be much smaller without adding visible noise.
 """
 
 import numpy as np
 import moderngl
-from typing import Tuple
+from typing import Optional, Tuple
+
+from ..config import settings
 
 
 class SSAORenderer:
@@ -20,12 +27,22 @@ class SSAORenderer:
     Pipeline:
     1. Generate random kernel samples in hemisphere
     2. Generate noise texture for sample rotation
-    3. Render SSAO texture using G-buffer position/normal
-    4. Apply bilateral blur to reduce noise
+    3. Render SSAO texture using G-buffer position/normal (at internal resolution)
+    4. Apply blur to reduce noise
+    5. (Optional) Blend with reprojected history (temporal accumulation)
+    6. (Optional) Bilateral upsample to full resolution
     """
 
+    # Size of the kernel uploaded to the shader (matches `samples[64]` in ssao.frag)
+    MAX_KERNEL_SIZE = 64
+
     def __init__(self, ctx: moderngl.Context, size: Tuple[int, int],
-                 ssao_program: moderngl.Program, blur_program: moderngl.Program):
+                 ssao_program: moderngl.Program, blur_program: moderngl.Program,
+                 upsample_program: Optional[moderngl.Program] = None,
+                 temporal_program: Optional[moderngl.Program] = None,
+                 resolution_scale: float = 1.0,
+                 kernel_size: int = MAX_KERNEL_SIZE,
+                 temporal_enabled: bool = False):
         """
         Initialize SSAO renderer.
 
@@ -34,42 +51,179 @@ class SSAORenderer:
             size: Screen size (width, height)
             ssao_program: Compiled SSAO shader program
             blur_program: Compiled blur shader program
+            upsample_program: Optional bilateral upsample program (needed for
+                resolution_scale < 1.0; falls back to linear filtering without it)
+            temporal_program: Optional temporal accumulation program
+            resolution_scale: Internal SSAO resolution relative to screen (1.0, 0.5, 0.25)
+            kernel_size: Samples evaluated per pixel per frame (<= 64)
+            temporal_enabled: Blend with reprojected history each frame
         """
         self.ctx = ctx
         self.size = size
         self.width, self.height = size
         self.ssao_program = ssao_program
         self.blur_program = blur_program
+        self.upsample_program = upsample_program
+        self.temporal_program = temporal_program
+
+        self.resolution_scale = self._clamp_scale(resolution_scale)
+        self.temporal_enabled = temporal_enabled and temporal_program is not None
+        self.internal_size = self._compute_internal_size()
+
+        # Temporal accumulation state
+        self.temporal_blend = settings.SSAO_TEMPORAL_BLEND
+        self.temporal_depth_tolerance = settings.SSAO_TEMPORAL_DEPTH_TOLERANCE
+        self.upsample_depth_sharpness = settings.SSAO_UPSAMPLE_DEPTH_SHARPNESS
+        self._frame_index = 0
+        self._history_index = 0
+        self._history_valid = False
+        self._prev_view: Optional[np.ndarray] = None
 
         # Create textures and framebuffers
         self._create_textures()
         self._create_framebuffers()
 
         # Generate sample kernel and noise texture
-        self._generate_kernel()
+        self._generate_kernel(self.MAX_KERNEL_SIZE)
+        self.kernel_size = self._clamp_kernel_size(kernel_size)
         self._generate_noise_texture()
 
         # Create fullscreen quad for post-processing
         self._create_fullscreen_quad()
 
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _clamp_scale(scale: float) -> float:
+        return float(min(max(scale, 0.125), 1.0))
+
+    def _clamp_kernel_size(self, kernel_size: int) -> int:
+        return int(min(max(kernel_size, 1), self.MAX_KERNEL_SIZE))
+
+    def _compute_internal_size(self) -> Tuple[int, int]:
+        return (
+            max(1, int(round(self.width * self.resolution_scale))),
+            max(1, int(round(self.height * self.resolution_scale))),
+        )
+
+    @property
+    def is_upsampling(self) -> bool:
+        """True when occlusion is computed below screen resolution."""
+        return self.internal_size != tuple(self.size)
+
+    @property
+    def history_valid(self) -> bool:
+        """True when the next temporal pass will blend with accumulated history."""
+        return self._history_valid
+
+    def set_resolution_scale(self, scale: float):
+        """
+        Change the internal SSAO resolution at runtime.
+
+        Args:
+            scale: Fraction of screen resolution (e.g. 1.0, 0.5, 0.25)
+        """
+        scale = self._clamp_scale(scale)
+        if scale == self.resolution_scale:
+            return
+
+        self.resolution_scale = scale
+        self._recreate_targets()
+
+    def set_kernel_size(self, kernel_size: int):
+        """
+        Change the number of kernel samples evaluated per frame.
+
+        Args:
+            kernel_size: Samples per pixel (clamped to 1-64)
+        """
+        self.kernel_size = self._clamp_kernel_size(kernel_size)
+
+    def set_temporal_enabled(self, enabled: bool):
+        """
+        Enable or disable temporal accumulation.
+
+        Args:
+            enabled: True to blend each frame with reprojected history
+        """
+        enabled = enabled and self.temporal_program is not None
+        if enabled != self.temporal_enabled:
+            self.temporal_enabled = enabled
+            self.reset_history()
+
+    def configure(self, resolution_scale: Optional[float] = None,
+                  kernel_size: Optional[int] = None,
+                  temporal_enabled: Optional[bool] = None):
+        """
+        Apply several quality settings at once (no-op for unchanged values).
+
+        Args:
+            resolution_scale: Internal resolution scale
+            kernel_size: Samples per pixel per frame
+            temporal_enabled: Temporal accumulation toggle
+        """
+        if resolution_scale is not None:
+            self.set_resolution_scale(resolution_scale)
+        if kernel_size is not None:
+            self.set_kernel_size(kernel_size)
+        if temporal_enabled is not None:
+            self.set_temporal_enabled(temporal_enabled)
+
+    def reset_history(self):
+        """Discard accumulated history (e.g. after a camera cut or resize)."""
+        self._history_valid = False
+        self._prev_view = None
+
+    # ------------------------------------------------------------------
+    # Resource management
+    # ------------------------------------------------------------------
     def _create_textures(self):
         """Create SSAO textures."""
-        # SSAO texture (raw occlusion values)
+        # SSAO texture (raw occlusion values, internal resolution)
         self.ssao_texture = self.ctx.texture(
-            self.size,
+            self.internal_size,
             components=1,
             dtype='f4'
         )
         self.ssao_texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
 
-        # Blurred SSAO texture (final result)
+        # Blurred SSAO texture (internal resolution)
         self.ssao_blur_texture = self.ctx.texture(
-            self.size,
+            self.internal_size,
             components=1,
             dtype='f4'
         )
         self.ssao_blur_texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
 
+        # History ping-pong textures (R = occlusion, G = linear view depth)
+        self.history_textures = []
+        if self.temporal_program is not None:
+            for _ in range(2):
+                history = self.ctx.texture(
+                    self.internal_size,
+                    components=2,
+                    dtype='f4'
+                )
+                # Linear filtering smooths sub-texel reprojection offsets
+                history.filter = (moderngl.LINEAR, moderngl.LINEAR)
+                history.repeat_x = False
+                history.repeat_y = False
+                self.history_textures.append(history)
+
+        # Full-resolution upsampled result
+        self.ssao_upsample_texture = None
+        if self.is_upsampling and self.upsample_program is not None:
+            self.ssao_upsample_texture = self.ctx.texture(
+                self.size,
+                components=1,
+                dtype='f4'
+            )
+            self.ssao_upsample_texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+
+        # Texture handed to the lighting pass (updated every render)
+        self._output_texture = self.ssao_blur_texture
+
     def _create_framebuffers(self):
         """Create framebuffers for SSAO passes."""
         # FBO for raw SSAO pass
@@ -82,12 +236,50 @@ class SSAORenderer:
             color_attachments=[self.ssao_blur_texture]
         )
 
+        # FBOs for temporal resolve (one per history texture)
+        self.history_fbos = [
+            self.ctx.framebuffer(color_attachments=[texture])
+            for texture in self.history_textures
+        ]
+
+        # FBO for bilateral upsample
+        self.upsample_fbo = None
+        if self.ssao_upsample_texture is not None:
+            self.upsample_fbo = self.ctx.framebuffer(
+                color_attachments=[self.ssao_upsample_texture]
+            )
+
+    def _release_targets(self):
+        """Release size-dependent textures and framebuffers."""
+        self.ssao_fbo.release()
+        self.blur_fbo.release()
+        self.ssao_texture.release()
+        self.ssao_blur_texture.release()
+        for fbo in self.history_fbos:
+            fbo.release()
+        for texture in self.history_textures:
+            texture.release()
+        if self.upsample_fbo is not None:
+            self.upsample_fbo.release()
+        if self.ssao_upsample_texture is not None:
+            self.ssao_upsample_texture.release()
+
+    def _recreate_targets(self):
+        """Reallocate render targets for the current size and scale."""
+        self._release_targets()
+        self.internal_size = self._compute_internal_size()
+        self._create_textures()
+        self._create_framebuffers()
+        self.reset_history()
+
     def _generate_kernel(self, kernel_size: int = 64):
         """
         Generate sample kernel for SSAO.
 
         Creates random samples in hemisphere oriented along +Z axis.
         Samples are weighted toward the center for better occlusion detection.
+        Sample order is random, so any contiguous run of the kernel is an
+        unbiased subset (used when rotating through it in temporal mode).
 
         Args:
             kernel_size: Number of samples (default 64)
@@ -128,6 +320,7 @@ class SSAORenderer:
         Args:
             noise_size: Size of noise texture (default 4x4)
         """
+        self.noise_size = noise_size
         noise = []
         for _ in range(noise_size * noise_size):
             # Random rotation vectors in tangent space (xy plane)
@@ -172,12 +365,31 @@ class SSAORenderer:
             [(self.quad_vbo, '2f', 'in_position')]
         )
 
+        # Optional temporal / upsample passes
+        self.temporal_vao = None
+        if self.temporal_program is not None:
+            self.temporal_vao = self.ctx.vertex_array(
+                self.temporal_program,
+                [(self.quad_vbo, '2f', 'in_position')]
+            )
+
+        self.upsample_vao = None
+        if self.upsample_program is not None:
+            self.upsample_vao = self.ctx.vertex_array(
+                self.upsample_program,
+                [(self.quad_vbo, '2f', 'in_position')]
+            )
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
     def render(self, position_texture: moderngl.Texture,
                normal_texture: moderngl.Texture,
                projection_matrix: np.ndarray,
                radius: float = 0.5,
                bias: float = 0.025,
-               intensity: float = 1.5):
+               intensity: float = 1.5,
+               view_matrix: Optional[np.ndarray] = None):
         """
         Render SSAO effect.
 
@@ -188,9 +400,14 @@ class SSAORenderer:
             radius: Sample radius in view space (default 0.5)
             bias: Depth bias to prevent self-occlusion (default 0.025)
             intensity: Occlusion intensity multiplier (default 1.5)
+            view_matrix: Camera view matrix (required for temporal accumulation)
         """
+        temporal = bool(self.temporal_enabled and view_matrix is not None and self.history_textures)
+        internal_viewport = (0, 0, *self.internal_size)
+
         # Pass 1: Generate raw SSAO
         self.ssao_fbo.use()
+        self.ctx.viewport = internal_viewport
         self.ssao_fbo.clear(1.0, 1.0, 1.0, 1.0)  # Start with no occlusion
 
         # Bind G-buffer textures
@@ -207,9 +424,9 @@ class SSAORenderer:
         if 'samples' in self.ssao_program:
             self.ssao_program['samples'].write(self.kernel.tobytes())
 
+        proj_matrix_f32 = np.array(projection_matrix, dtype='f4')
         if 'projection' in self.ssao_program:
             # Ensure projection matrix is float32
-            proj_matrix_f32 = np.array(projection_matrix, dtype='f4')
             self.ssao_program['projection'].write(proj_matrix_f32.tobytes())
         if 'radius' in self.ssao_program:
             self.ssao_program['radius'].value = radius
@@ -218,8 +435,26 @@ class SSAORenderer:
         if 'kernelSize' in self.ssao_program:
             self.ssao_program['kernelSize'].value = self.kernel_size
 
+        # Rotate through the kernel and jitter the noise each frame so the
+        # history accumulates different samples; keep both fixed otherwise.
+        if temporal:
+            sample_offset = (self._frame_index * self.kernel_size) % self.MAX_KERNEL_SIZE
+            jitter = self._frame_index % (self.noise_size * self.noise_size)
+            noise_offset = (
+                (jitter % self.noise_size) / self.noise_size,
+                (jitter // self.noise_size) / self.noise_size,
+            )
+        else:
+            sample_offset = 0
+            noise_offset = (0.0, 0.0)
+        if 'sampleOffset' in self.ssao_program:
+            self.ssao_program['sampleOffset'].value = sample_offset
+        if 'noiseOffset' in self.ssao_program:
+            self.ssao_program['noiseOffset'].value = noise_offset
+
         # Noise texture tiling
-        noise_scale = (self.width / 4.0, self.height / 4.0)
+        noise_scale = (self.internal_size[0] / float(self.noise_size),
+                       self.internal_size[1] / float(self.noise_size))
         self.ssao_program['noiseScale'].value = noise_scale
 
         # Render fullscreen quad
@@ -236,6 +471,85 @@ class SSAORenderer:
         # Render fullscreen quad with blur
         self.blur_vao.render(moderngl.TRIANGLE_STRIP)
 
+        resolved_texture = self.ssao_blur_texture
+
+        # Pass 3: Temporal accumulation (internal resolution)
+        if temporal:
+            resolved_texture = self._render_temporal(
+                position_texture,
+                proj_matrix_f32,
+                np.array(view_matrix, dtype='f4'),
+            )
+        else:
+            self.reset_history()
+
+        # Pass 4: Bilateral upsample to full resolution
+        if self.upsample_fbo is not None:
+            self.upsample_fbo.use()
+            self.ctx.viewport = (0, 0, self.width, self.height)
+
+            resolved_texture.use(location=0)
+            position_texture.use(location=1)
+            self.upsample_program['ssaoInput'].value = 0
+            self.upsample_program['gPosition'].value = 1
+            if 'depthSharpness' in self.upsample_program:
+                self.upsample_program['depthSharpness'].value = self.upsample_depth_sharpness
+
+            self.upsample_vao.render(moderngl.TRIANGLE_STRIP)
+            resolved_texture = self.ssao_upsample_texture
+        elif self.is_upsampling:
+            # No upsample program: let the lighting pass filter the low-res result
+            resolved_texture.filter = (moderngl.LINEAR, moderngl.LINEAR)
+
+        self._output_texture = resolved_texture
+        self._frame_index += 1
+
+    def _render_temporal(self, position_texture: moderngl.Texture,
+                         projection_matrix: np.ndarray,
+                         view_matrix: np.ndarray) -> moderngl.Texture:
+        """
+        Blend the blurred occlusion with reprojected history.
+
+        Args:
+            position_texture: G-buffer position texture (view space)
+            projection_matrix: Camera projection matrix (float32)
+            view_matrix: Current camera view matrix (float32)
+
+        Returns:
+            History texture written this frame (R channel = occlusion)
+        """
+        read_index = self._history_index
+        write_index = 1 - read_index
+
+        self.history_fbos[write_index].use()
+
+        self.ssao_blur_texture.use(location=0)
+        self.history_textures[read_index].use(location=1)
+        position_texture.use(location=2)
+
+        program = self.temporal_program
+        program['currentAO'].value = 0
+        program['historyAO'].value = 1
+        program['gPosition'].value = 2
+
+        history_valid = self._history_valid and self._prev_view is not None
+        prev_view = self._prev_view if history_valid else view_matrix
+        inverse_view = np.linalg.inv(view_matrix).astype('f4')
+
+        program['inverseView'].write(inverse_view.tobytes())
+        program['prevView'].write(prev_view.tobytes())
+        program['projection'].write(projection_matrix.tobytes())
+        program['blendFactor'].value = self.temporal_blend
+        program['depthTolerance'].value = self.temporal_depth_tolerance
+        program['historyValid'].value = history_valid
+
+        self.temporal_vao.render(moderngl.TRIANGLE_STRIP)
+
+        self._history_index = write_index
+        self._history_valid = True
+        self._prev_view = view_matrix
+        return self.history_textures[write_index]
+
     def resize(self, size: Tuple[int, int]):
         """
         Resize SSAO buffers.
@@ -249,32 +563,27 @@ class SSAORenderer:
         self.size = size
         self.width, self.height = size
 
-        # Release old resources
-        self.ssao_fbo.release()
-        self.blur_fbo.release()
-        self.ssao_texture.release()
-        self.ssao_blur_texture.release()
-
-        # Recreate with new size
-        self._create_textures()
-        self._create_framebuffers()
+        # Release old resources and recreate with new size
+        self._recreate_targets()
 
     def get_ssao_texture(self) -> moderngl.Texture:
         """
-        Get final blurred SSAO texture.
+        Get final SSAO texture for the lighting pass.
 
         Returns:
-            Blurred SSAO texture (1 component, float)
+            Occlusion texture (1 component, float; full resolution when the
+            upsample pass is available)
         """
-        return self.ssao_blur_texture
+        return self._output_texture
 
     def release(self):
         """Release all SSAO resources."""
-        self.ssao_fbo.release()
-        self.blur_fbo.release()
-        self.ssao_texture.release()
-        self.ssao_blur_texture.release()
+        self._release_targets()
         self.noise_texture.release()
         self.quad_vbo.release()
         self.quad_vao.release()
         self.blur_vao.release()
+        if self.temporal_vao is not None:
+            self.temporal_vao.release()
+        if self.upsample_vao is not None:
+            self.upsample_vao.release()
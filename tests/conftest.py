@@ -0,0 +1,57 @@
+"""Shared fixtures for the physics tests"""
+
+from types import SimpleNamespace
+
+import pytest
+from pyrr import Vector3
+
+from src.gamelib.loaders.model import Model
+from src.gamelib.physics import PhysicsBodyConfig, PhysicsWorld, PhysicsWorldSettings
+
+
+@pytest.fixture
+def physics():
+    world = PhysicsWorld()
+    yield world
+    world.shutdown()
+
+
+@pytest.fixture
+def add_box(physics):
+    """Add a static box to the ``physics`` world."""
+
+    def add(position, half_extents=(2.0, 0.5, 2.0)):
+        config = PhysicsBodyConfig(body_type="static", shape="box", half_extents=half_extents)
+        return physics.create_body(SimpleNamespace(position=Vector3(position)), config)
+
+    return add
+
+
+@pytest.fixture
+def crate_world():
+    """
+    Build worlds with a ground box and ``count`` unit crates at staggered heights.
+
+    Call with the crate count and PhysicsWorldSettings keyword arguments;
+    returns (world, crate models, crate body ids). Worlds are shut down on teardown.
+    """
+
+    worlds = []
+
+    def build(count, **settings):
+        world = PhysicsWorld(PhysicsWorldSettings(**settings))
+        worlds.append(world)
+        world.create_body(SimpleNamespace(position=Vector3([0.0, -0.5, 0.0])), PhysicsBodyConfig(
+            body_type="static", shape="box", half_extents=(20.0, 0.5, 20.0)))
+        crates, body_ids = [], []
+        for index in range(count):
+            crate = Model([], position=Vector3([index * 2.0, 1.0 + index * 0.5, 0.0]), name=f"crate{index}")
+            handle = world.create_body(crate, PhysicsBodyConfig(
+                body_type="dynamic", shape="box", half_extents=(0.5, 0.5, 0.5), mass=1.0))
+            crates.append(crate)
+            body_ids.append(handle.body_id)
+        return world, crates, body_ids
+
+    yield build
+    for world in worlds:
+        world.shutdown()
@@ -0,0 +1,74 @@
+"""Tests for convex decompositions of collision meshes"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pybullet
+from pyrr import Vector3
+
+from src.gamelib.physics import PhysicsBodyConfig, PhysicsWorld
+from src.gamelib.physics.collision_meshes import resolve_collision_mesh
+from src.gamelib.physics.mesh_io import write_collision_mesh
+
+_BOX_FACES = np.array([(0, 1, 3), (0, 3, 2), (4, 6, 7), (4, 7, 5), (0, 4, 5), (0, 5, 1),
+                       (2, 3, 7), (2, 7, 6), (0, 2, 6), (0, 6, 4), (1, 5, 7), (1, 7, 3)])
+
+
+def export_u_shape(out_path):
+    """A base slab with a pillar at each end: concave, with a notch 4 m wide."""
+
+    vertices, faces = [], []
+    for center, half in (((0, 0.5, 0), (3, 0.5, 1)), ((-2.5, 2, 0), (0.5, 1, 1)), ((2.5, 2, 0), (0.5, 1, 1))):
+        corners = np.array([(x, y, z) for x in (-1, 1) for y in (-1, 1) for z in (-1, 1)])
+        faces.append(_BOX_FACES + 8 * len(vertices))
+        vertices.append(corners * half + center)
+    write_collision_mesh(out_path, np.concatenate(vertices), np.concatenate(faces))
+
+
+def _definition(tmp_path, **extra):
+    if extra.get("decomposition"):
+        extra.setdefault("decomposition_params", {})
+        extra["decomposition_params"].setdefault("resolution", 20000)
+    return {
+        "type": "generator",
+        "generator": "tests.test_collision_decomposition:export_u_shape",
+        "output": str(tmp_path / "u_shape.npz"),
+        **extra,
+    }
+
+
+def _hull_count(path):
+    return sum(line.startswith("o ") for line in path.read_text().splitlines())
+
+
+def test_decompositions_are_cached_by_mtime_and_parameters(tmp_path):
+    plain = resolve_collision_mesh(_definition(tmp_path))
+    assert not plain.convex
+
+    decomposed = resolve_collision_mesh(_definition(tmp_path, decomposition="vhacd"))
+    assert decomposed.rebuilt and decomposed.convex and decomposed.path.suffix == ".obj"
+    assert _hull_count(decomposed.path) >= 3
+    assert not resolve_collision_mesh(_definition(tmp_path, decomposition="vhacd")).rebuilt
+
+    hull = resolve_collision_mesh(_definition(tmp_path, decomposition="hull",
+                                              decomposition_params={"max_hull_vertices": 12}))
+    assert hull.path != decomposed.path and _hull_count(hull.path) == 1
+    assert sum(line.startswith("v ") for line in hull.path.read_text().splitlines()) <= 12
+
+
+def test_decomposed_meshes_keep_concavities(tmp_path):
+    world = PhysicsWorld()
+    try:
+        static = world.create_body(SimpleNamespace(position=Vector3()), PhysicsBodyConfig(
+            body_type="static", shape="mesh", collision_mesh=_definition(tmp_path, decomposition="vhacd")))
+        assert static.config.mesh_convex
+        hit = world.ray_test((0.0, 10.0, 0.0), (0.0, -10.0, 0.0))
+        # A single hull would be hit at the pillar tops (y = 3), not the notch floor (y = 1)
+        assert hit is not None and hit["hit_position"][1] < 1.5
+
+        dynamic = world.create_body(SimpleNamespace(position=Vector3([0.0, 10.0, 0.0])), PhysicsBodyConfig(
+            body_type="dynamic", shape="mesh", mass=5.0, collision_mesh=_definition(tmp_path, decomposition="vhacd")))
+        shapes = pybullet.getCollisionShapeData(dynamic.body_id, -1, physicsClientId=world._client)
+        assert len(shapes) >= 3
+    finally:
+        world.shutdown()
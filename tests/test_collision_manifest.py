@@ -0,0 +1,95 @@
+"""Tests for content-hashed, parallel collision mesh builds"""
+
+import json
+import os
+
+from src.gamelib.physics.collision_meshes import (
+    MANIFEST_NAME,
+    collision_mesh_needs_build,
+    prebuild_collision_meshes,
+    resolve_collision_mesh,
+    resolve_collision_meshes,
+)
+from src.gamelib.physics.mesh_io import write_collision_mesh
+
+
+def export_counted(out_path, *, log_path, size=1.0):
+    """Triangle mesh generator that logs every build."""
+
+    with open(log_path, "a", encoding="utf-8") as handle:
+        handle.write(f"{out_path.name}\n")
+    write_collision_mesh(out_path, [(0, 0, 0), (size, 0, 0), (0, 0, size)], [(0, 1, 2)])
+
+
+def _definition(tmp_path, name, *, dependency=None, size=1.0):
+    definition = {
+        "type": "generator",
+        "generator": "tests.test_collision_manifest:export_counted",
+        "output": str(tmp_path / f"{name}.npz"),
+        "params": {"log_path": str(tmp_path / "builds.log"), "size": size},
+    }
+    if dependency is not None:
+        definition["dependencies"] = [str(dependency)]
+    return definition
+
+
+def _builds(tmp_path):
+    log = tmp_path / "builds.log"
+    return log.read_text(encoding="utf-8").split() if log.exists() else []
+
+
+def _touch_later(path, seconds=10):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+def test_touched_inputs_rebuild_only_when_content_changes(tmp_path):
+    source = tmp_path / "source.txt"
+    source.write_text("v1", encoding="utf-8")
+    definition = _definition(tmp_path, "mesh", dependency=source)
+
+    assert resolve_collision_mesh(definition).rebuilt
+    assert (tmp_path / MANIFEST_NAME).exists()
+
+    _touch_later(source)
+    assert not resolve_collision_mesh(definition).rebuilt
+    assert not collision_mesh_needs_build(definition)
+
+    source.write_text("v2", encoding="utf-8")
+    _touch_later(source, 20)
+    assert resolve_collision_mesh(definition).rebuilt
+
+    # A changed recipe rebuilds even with untouched inputs
+    assert resolve_collision_mesh(_definition(tmp_path, "mesh", dependency=source, size=2.0)).rebuilt
+    assert _builds(tmp_path) == ["mesh.npz"] * 3
+
+
+def test_parallel_resolution_builds_each_output_once(tmp_path):
+    definitions = [_definition(tmp_path, name) for name in ("a", "b", "a", "c")]
+    results = resolve_collision_meshes([(definition, None) for definition in definitions], jobs=2)
+
+    assert [result.path.name for result in results] == ["a.npz", "b.npz", "a.npz", "c.npz"]
+    assert all(result.rebuilt for result in results)
+    assert sorted(_builds(tmp_path)) == ["a.npz", "b.npz", "c.npz"]
+
+    again = resolve_collision_meshes([(definition, None) for definition in definitions], jobs=2)
+    assert not any(result.rebuilt for result in again)
+
+
+def test_parallel_builds_record_every_output(tmp_path):
+    names = [f"mesh{index}" for index in range(16)]
+    resolve_collision_meshes([(_definition(tmp_path, name), None) for name in names], jobs=8)
+
+    entries = json.loads((tmp_path / MANIFEST_NAME).read_text(encoding="utf-8"))["entries"]
+    assert sorted(entries) == sorted(f"{name}.npz" for name in names)
+
+
+def test_prebuild_starts_only_stale_builds(tmp_path):
+    requests = [(_definition(tmp_path, name), None) for name in ("a", "b")]
+    resolve_collision_mesh(requests[0][0])
+
+    future = prebuild_collision_meshes(requests, jobs=1)
+    assert future is not None
+    assert [result.path.name for result in future.result()] == ["b.npz"]
+    assert prebuild_collision_meshes(requests, jobs=1) is None
+    assert _builds(tmp_path) == ["a.npz", "b.npz"]
@@ -0,0 +1,111 @@
+"""Tests for collision mesh files: block-written OBJ and the binary .npz format"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pyrr import Vector3
+
+from src.gamelib.core.geometry_utils import grid_indices
+from src.gamelib.physics import PhysicsBodyConfig, PhysicsWorld
+from src.gamelib.physics.collision_meshes import resolve_collision_mesh
+from src.gamelib.physics.mesh_io import (
+    MAX_MESH_VERTICES,
+    load_collision_mesh,
+    save_collision_mesh,
+    write_obj,
+)
+
+
+def _bumpy_grid(rows, cols, spacing=1.0):
+    rng = np.random.default_rng(7)
+    heights = rng.random((rows, cols))
+    grid_x, grid_z = np.meshgrid(np.arange(rows) * spacing, np.arange(cols) * spacing, indexing="ij")
+    vertices = np.stack([grid_x, heights, grid_z], axis=-1).reshape(-1, 3)
+    return vertices, grid_indices(rows, cols).reshape(-1, 3)
+
+
+def test_obj_writer_matches_per_line_format(tmp_path):
+    vertices, indices = _bumpy_grid(5, 4)
+    write_obj(tmp_path / "grid.obj", vertices, indices)
+
+    lines = [line for line in (tmp_path / "grid.obj").read_text().splitlines() if not line.startswith("#")]
+    expected = [f"v {x:.6f} {y:.6f} {z:.6f}" for x, y, z in vertices]
+    expected += [f"f {a + 1} {b + 1} {c + 1}" for a, b, c in indices]
+    assert lines == expected
+
+
+def test_npz_roundtrip_and_validation(tmp_path):
+    vertices, indices = _bumpy_grid(6, 6)
+    save_collision_mesh(tmp_path / "grid.npz", vertices, indices)
+
+    loaded_vertices, loaded_indices = load_collision_mesh(tmp_path / "grid.npz")
+    assert loaded_vertices.dtype == np.float32 and loaded_indices.dtype == np.uint32
+    np.testing.assert_allclose(loaded_vertices, vertices, atol=1e-6)
+    np.testing.assert_array_equal(loaded_indices, indices)
+
+    with pytest.raises(ValueError):
+        save_collision_mesh(tmp_path / "bad.npz", vertices, indices + len(vertices))
+
+
+@pytest.mark.parametrize("rows", [16, 370])
+def test_npz_mesh_collides_like_obj(tmp_path, rows):
+    # The larger grid is over PyBullet's in-memory mesh limit and goes through an OBJ
+    vertices, indices = _bumpy_grid(rows, rows)
+    save_collision_mesh(tmp_path / "grid.npz", vertices, indices)
+    write_obj(tmp_path / "reference.obj", vertices, indices)
+    assert (len(vertices) > MAX_MESH_VERTICES) == (rows == 370)
+
+    points = np.random.default_rng(1).uniform(0.5, 14.5, (40, 2))
+    heights = {}
+    for name in ("grid.npz", "reference.obj"):
+        world = PhysicsWorld()
+        try:
+            config = PhysicsBodyConfig(body_type="static", shape="mesh", mesh_path=str(tmp_path / name))
+            world.create_body(SimpleNamespace(position=Vector3()), config)
+            hits = [world.ray_test((x, 10.0, z), (x, -10.0, z)) for x, z in points]
+            heights[name] = np.array([hit["hit_position"][1] for hit in hits])
+        finally:
+            world.shutdown()
+    assert (tmp_path / "grid.obj").exists() == (rows == 370)
+    np.testing.assert_allclose(heights["grid.npz"], heights["reference.obj"], atol=1e-4)
+
+
+def test_generator_definitions_can_request_npz(tmp_path):
+    definition = {
+        "type": "generator",
+        "generator": "src.gamelib.physics.collision_primitives:export_cone_collision",
+        "format": "npz",
+        "output": str(tmp_path / "cone.npz"),
+        "params": {"segments": 8},
+    }
+    result = resolve_collision_mesh(definition)
+    assert result.rebuilt and result.path.suffix == ".npz"
+    vertices, indices = load_collision_mesh(result.path)
+    assert vertices.shape == (10, 3) and indices.shape == (16, 3)
+
+
+@pytest.mark.parametrize("name", ["cube.npz", "cube.obj"])
+def test_dynamic_npz_mesh_is_a_convex_hull(tmp_path, name):
+    corners = np.array([[x, y, z] for x in (-0.5, 0.5) for y in (-0.5, 0.5) for z in (-0.5, 0.5)])
+    faces = np.array([[0, 1, 3], [0, 3, 2], [4, 6, 7], [4, 7, 5], [0, 4, 5], [0, 5, 1],
+                      [2, 3, 7], [2, 7, 6], [0, 2, 6], [0, 6, 4], [1, 5, 7], [1, 7, 3]])
+    save_collision_mesh(tmp_path / "cube.npz", corners, faces)
+    write_obj(tmp_path / "cube.obj", corners, faces)
+    # Flat static trimesh ground; Bullet has no concave-vs-concave collision
+    ground, ground_faces = _bumpy_grid(11, 11)
+    ground[:, 1] = 0.0
+    save_collision_mesh(tmp_path / "ground.npz", ground, ground_faces)
+
+    world = PhysicsWorld()
+    try:
+        world.create_body(SimpleNamespace(position=Vector3((-5.0, 0.0, -5.0))),
+                          PhysicsBodyConfig(body_type="static", shape="mesh", mesh_path=str(tmp_path / "ground.npz")))
+        cube = world.create_body(SimpleNamespace(position=Vector3((0.0, 2.0, 0.0))),
+                                 PhysicsBodyConfig(body_type="dynamic", shape="mesh", mass=1.0,
+                                                   mesh_path=str(tmp_path / name)))
+        for _ in range(240):
+            world.step_simulation(1.0 / 60.0)
+        assert cube.scene_object.position.y == pytest.approx(0.5, abs=0.05)
+    finally:
+        world.shutdown()
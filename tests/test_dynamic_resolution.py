@@ -0,0 +1,90 @@
+"""Tests for DynamicResolutionController"""
+
+import pytest
+
+from src.gamelib.rendering.dynamic_resolution import DynamicResolutionController
+
+
+def _controller(**kwargs):
+    options = dict(target_ms=10.0, smoothing=1.0, cooldown_frames=1, enabled=True)
+    options.update(kwargs)
+    return DynamicResolutionController(**options)
+
+
+def _gpu_ms(full_res_ms, scale):
+    """GPU cost model: proportional to pixel count."""
+    return full_res_ms * scale * scale
+
+
+def test_disabled_controller_holds_full_scale():
+    controller = _controller(enabled=False)
+    assert controller.update(50.0) == 1.0
+
+
+def test_over_budget_drops_to_predicted_fit():
+    controller = _controller()
+    # 20ms at full res -> sqrt(10/20) = 0.707 -> quantized down to 0.70
+    assert controller.update(20.0) == pytest.approx(0.70)
+
+
+def test_scale_is_clamped_to_minimum():
+    controller = _controller(min_scale=0.6)
+    assert controller.update(1000.0) == pytest.approx(0.6)
+
+
+def test_dead_band_keeps_scale():
+    controller = _controller()
+    controller.update(20.0)
+    scale = controller.scale
+    # Inside [0.85, 1.05] x budget nothing changes
+    for ms in (9.0, 10.4, 8.6, 10.0):
+        assert controller.update(ms) == scale
+
+
+def test_converges_without_oscillating():
+    controller = _controller(smoothing=0.5, cooldown_frames=5)
+    scales = []
+    for _ in range(400):
+        scale = controller.update(_gpu_ms(18.0, controller.scale))
+        scales.append(scale)
+
+    tail = scales[-200:]
+    assert len(set(tail)) == 1
+    assert _gpu_ms(18.0, tail[0]) <= 10.0 * controller.downscale_threshold
+
+
+def test_upscale_only_when_predicted_to_fit():
+    controller = _controller()
+    controller.update(40.0)
+    low = controller.scale
+    # Cheap frames let the scale climb back one step at a time
+    assert controller.update(1.0) == pytest.approx(low + controller.step)
+
+    # At 0.5x, 8.4ms is below the upscale threshold but 0.55x would cost
+    # 8.4 * 1.21 = 10.2ms, over budget, so the scale is held
+    controller = _controller()
+    controller.update(1000.0)
+    assert controller.scale == pytest.approx(0.5)
+    assert controller.update(8.4) == pytest.approx(0.5)
+
+
+def test_cooldown_delays_changes():
+    controller = _controller(cooldown_frames=3)
+    assert controller.update(30.0) == 1.0
+    assert controller.update(30.0) == 1.0
+    assert controller.update(30.0) < 1.0
+
+
+def test_render_size_is_even_and_exact_at_full_scale():
+    controller = _controller()
+    assert controller.render_size((1921, 1081), 1.0) == (1921, 1081)
+    width, height = controller.render_size((1920, 1080), 0.55)
+    assert width % 2 == 0 and height % 2 == 0
+    assert (width, height) == (1056, 594)
+
+
+def test_invalid_thresholds_raise():
+    with pytest.raises(ValueError):
+        DynamicResolutionController(upscale_threshold=1.1, downscale_threshold=1.05)
+    with pytest.raises(ValueError):
+        DynamicResolutionController(min_scale=0.8, max_scale=0.5)
@@ -0,0 +1,129 @@
+"""Tests for FrameProfiler"""
+
+import json
+
+from src.gamelib.rendering.frame_profiler import FrameProfiler
+
+
+class FakeQuery:
+    """Stands in for moderngl.Query; reports a fixed cost per segment."""
+
+    active = 0
+
+    def __init__(self):
+        self.elapsed = 0
+        self.samples = 0
+        self.primitives = 0
+
+    def __enter__(self):
+        assert FakeQuery.active == 0, "GL time queries cannot nest"
+        FakeQuery.active += 1
+        return self
+
+    def __exit__(self, *args):
+        FakeQuery.active -= 1
+        self.elapsed = 1_000_000  # 1 ms
+        self.samples = 10
+        self.primitives = 2
+
+
+class FakeContext:
+    def __init__(self):
+        self.created = 0
+
+    def query(self, samples=False, time=False, primitives=False):
+        self.created += 1
+        return FakeQuery()
+
+
+def _record_frame(profiler):
+    profiler.begin_frame()
+    with profiler.scope("shadows"):
+        pass
+    with profiler.scope("lighting"):
+        with profiler.scope("bloom"):
+            pass
+    profiler.end_frame()
+
+
+def test_disabled_profiler_is_noop():
+    ctx = FakeContext()
+    profiler = FrameProfiler(ctx, enabled=False)
+    _record_frame(profiler)
+    assert ctx.created == 0
+    assert profiler.latest is None
+
+
+def test_results_are_read_with_latency():
+    profiler = FrameProfiler(FakeContext(), enabled=True, latency=2)
+
+    _record_frame(profiler)
+    _record_frame(profiler)
+    assert profiler.latest is None  # Nothing resolved yet
+
+    _record_frame(profiler)
+    assert profiler.latest.frame == 0
+
+
+def test_nested_scopes_report_inclusive_gpu_time():
+    profiler = FrameProfiler(FakeContext(), enabled=True, latency=1)
+    _record_frame(profiler)
+    profiler.flush()
+
+    passes = {p.name: p for p in profiler.latest.passes}
+    assert passes["shadows"].gpu_ms == 1.0
+    # Lighting = two own segments (before/after bloom) + bloom
+    assert passes["bloom"].gpu_ms == 1.0
+    assert passes["lighting"].gpu_ms == 3.0
+    assert passes["bloom"].depth == 1
+    assert profiler.latest.gpu_ms == 4.0
+
+
+def test_queries_are_reused_between_frames():
+    ctx = FakeContext()
+    profiler = FrameProfiler(ctx, enabled=True, latency=2)
+    for _ in range(10):
+        _record_frame(profiler)
+    # 4 segments per frame, one pool per slot
+    assert ctx.created == 8
+
+
+def test_chrome_trace_export(tmp_path):
+    profiler = FrameProfiler(FakeContext(), enabled=True, latency=2)
+    for _ in range(3):
+        _record_frame(profiler)
+
+    path = profiler.export_chrome_trace(tmp_path / "trace.json")
+    trace = json.loads(path.read_text())
+
+    events = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    gpu_events = [e for e in events if e["cat"] == "gpu"]
+    assert len([e for e in events if e["cat"] == "frame"]) == 3
+    assert {e["name"] for e in gpu_events} == {"shadows", "lighting", "bloom"}
+    assert all(e["dur"] > 0 for e in gpu_events)
+
+
+def test_averages():
+    profiler = FrameProfiler(FakeContext(), enabled=True, latency=1)
+    for _ in range(4):
+        _record_frame(profiler)
+    profiler.flush()
+
+    averages = profiler.averages()
+    assert list(averages) == ["shadows", "lighting", "bloom"]
+    assert averages["lighting"]["gpu_ms"] == 3.0
+    assert averages["lighting"]["primitives"] == 6.0
+
+
+def test_reset_drops_pending_and_resolved_frames():
+    profiler = FrameProfiler(FakeContext(), enabled=True, latency=2, history=10)
+    for _ in range(3):
+        _record_frame(profiler)
+
+    profiler.reset(history_length=2)
+    assert profiler.latest is None and profiler.history.maxlen == 2
+
+    for _ in range(5):
+        _record_frame(profiler)
+    profiler.flush()
+    assert [frame.frame for frame in profiler.history] == [6, 7]
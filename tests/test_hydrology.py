@@ -0,0 +1,95 @@
+"""Tests for depression filling, flow routing and river carving"""
+
+import heapq
+
+import numpy as np
+import pytest
+
+from src.gamelib.fractal_perlin.hydrology import (
+    distance_to_mask,
+    fill_depressions,
+    flow_accumulation,
+    flow_directions,
+    river_channels,
+)
+
+
+def _rough_terrain(shape=(40, 56), seed=4):
+    rng = np.random.default_rng(seed)
+    return rng.random(shape) + np.linspace(0.0, 2.0, shape[1])[None, :]
+
+
+def _priority_flood(heights, epsilon):
+    """Reference Priority-Flood+epsilon with a heap."""
+    rows, cols = heights.shape
+    filled = heights.copy()
+    closed = np.zeros(heights.shape, dtype=bool)
+    heap = []
+    for r in range(rows):
+        for c in range(cols):
+            if r in (0, rows - 1) or c in (0, cols - 1):
+                heapq.heappush(heap, (filled[r, c], r, c))
+                closed[r, c] = True
+    while heap:
+        level, r, c = heapq.heappop(heap)
+        for dy in (-1, 0, 1):
+            for dx in (-1, 0, 1):
+                y, x = r + dy, c + dx
+                if 0 <= y < rows and 0 <= x < cols and not closed[y, x]:
+                    closed[y, x] = True
+                    filled[y, x] = max(filled[y, x], level + epsilon)
+                    heapq.heappush(heap, (filled[y, x], y, x))
+    return filled
+
+
+def test_fill_matches_priority_flood_and_drains_everywhere():
+    heights = _rough_terrain()
+    filled = fill_depressions(heights, epsilon=1e-5)
+    np.testing.assert_allclose(filled, _priority_flood(heights, 1e-5), atol=1e-12)
+
+    # Only edge cells are outlets once every pit is filled
+    receivers = flow_directions(filled)
+    interior = receivers[1:-1, 1:-1]
+    assert np.all(interior >= 0)
+
+
+def test_accumulation_counts_every_upstream_cell():
+    receivers = flow_directions(fill_depressions(_rough_terrain()))
+    accumulation = flow_accumulation(receivers)
+
+    flat = receivers.ravel()
+    expected = np.zeros(flat.size)
+    for start in range(flat.size):
+        cell = start
+        while cell >= 0:
+            expected[cell] += 1
+            cell = flat[cell]
+    np.testing.assert_array_equal(accumulation.ravel(), expected)
+
+
+def test_distance_to_mask_is_exact_within_reach():
+    rng = np.random.default_rng(1)
+    mask = rng.random((30, 45)) > 0.97
+    distance = distance_to_mask(mask, 6.0)
+
+    points = np.argwhere(mask)
+    grid = np.indices(mask.shape).reshape(2, -1).T
+    expected = np.sqrt(((grid[:, None, :] - points[None, :, :]) ** 2).sum(-1)).min(axis=1).reshape(mask.shape)
+    expected[expected > 6.0] = np.inf
+    np.testing.assert_allclose(distance, expected)
+
+
+def test_rivers_follow_the_largest_basins(monkeypatch):
+    monkeypatch.syspath_prepend("src/gamelib/fractal_perlin")
+    from terrain_advanced import AdvancedTerrain
+
+    terrain = AdvancedTerrain(96, 96, seed=3)
+    terrain.terrain = _rough_terrain((96, 96), seed=3) / 3.0
+    original = terrain.terrain.copy()
+    channels, _ = river_channels(original, num_rivers=2)
+
+    carved, rivers = terrain.add_rivers(num_rivers=2, river_depth=0.1, river_width=3.0)
+    assert rivers[channels].all()
+    assert np.all(carved <= original)
+    np.testing.assert_allclose(carved[channels], np.clip(original[channels] - 0.1, 0, 1))
+    assert terrain.flow_accumulation.max() > 96
@@ -0,0 +1,73 @@
+"""Tests for filtered, cached contact queries"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pyrr import Vector3
+
+from src.gamelib.physics import CONTACT_DTYPE, PhysicsBodyConfig, PhysicsWorld
+from src.gamelib.physics import physics_world as physics_module
+
+
+@pytest.fixture
+def stacked():
+    world = PhysicsWorld()
+    floor = world.create_body(SimpleNamespace(position=Vector3([0.0, -0.5, 0.0])), PhysicsBodyConfig(
+        body_type="static", shape="box", half_extents=(5.0, 0.5, 5.0)))
+    balls = [
+        world.create_body(SimpleNamespace(position=Vector3(position)), PhysicsBodyConfig(
+            body_type="dynamic", shape="sphere", radius=0.5, mass=1.0))
+        for position in ([0.0, 0.5, 0.0], [0.0, 1.5, 0.0], [2.0, 0.5, 0.0])
+    ]
+    for _ in range(5):
+        world.step_simulation(world.settings.fixed_time_step)
+    yield world, floor.body_id, [ball.body_id for ball in balls]
+    world.shutdown()
+
+
+def test_body_filter_orients_contacts(stacked):
+    world, floor, (bottom, top, side) = stacked
+    pairs = {frozenset((c["body_a"], c["body_b"])) for c in world.get_contacts()}
+    assert pairs == {frozenset((floor, bottom)), frozenset((bottom, top)), frozenset((floor, side))}
+
+    contacts = world.get_contacts(body_id=bottom)
+    assert sorted(c["body_b"] for c in contacts) == sorted([floor, top])
+    assert all(c["body_a"] == bottom for c in contacts)
+    # Normals point towards the queried body
+    by_other = {c["body_b"]: c["normal_on_b"][1] for c in contacts}
+    assert by_other[floor] > 0.9 and by_other[top] < -0.9
+
+    assert [c["body_b"] for c in world.get_contacts(body_id=top, other_body_id=bottom)] == [bottom]
+    assert world.get_contacts(body_id=top, other_body_id=side) == []
+    assert {c["body_a"] for c in world.get_contacts(other_body_id=side)} == {side}
+
+
+def test_array_contacts_match_dicts(stacked):
+    world, _, (bottom, top, side) = stacked
+    array = world.get_contacts(body_id=bottom, as_array=True)
+    dicts = world.get_contacts(body_id=bottom)
+    assert array.dtype == CONTACT_DTYPE and len(array) == len(dicts)
+    for row, contact in zip(array, dicts):
+        for name in CONTACT_DTYPE.names:
+            np.testing.assert_allclose(row[name], contact[name])
+    assert world.get_contacts(body_id=top, other_body_id=side, as_array=True).shape == (0,)
+
+
+def test_contacts_are_cached_until_the_next_step(stacked, monkeypatch):
+    world, _, (bottom, _, _) = stacked
+    calls = []
+    original = physics_module._pb.getContactPoints
+
+    def counting(*args, **kwargs):
+        calls.append(kwargs.get("bodyA"))
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(physics_module._pb, "getContactPoints", counting)
+    first = world.get_contacts(body_id=bottom)
+    assert world.get_contacts(body_id=bottom, as_array=True)["body_b"].tolist() == [c["body_b"] for c in first]
+    assert calls == [bottom]
+
+    world.step_simulation(world.settings.fixed_time_step)
+    world.get_contacts(body_id=bottom)
+    assert calls == [bottom, bottom]
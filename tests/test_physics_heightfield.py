@@ -0,0 +1,70 @@
+"""Tests for heightfield colliders"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pyrr import Quaternion, Vector3
+
+from src.gamelib.core.geometry_utils import grid_indices
+from src.gamelib.fractal_perlin import generate_noise_grid, save_heightmap
+from src.gamelib.physics import PhysicsBodyConfig, PhysicsWorld
+
+
+def _drop_rays(world, points):
+    hits = [world.ray_test((x, 500.0, z), (x, -500.0, z)) for x, z in points]
+    return np.array([hit["hit_position"][1] if hit else np.nan for hit in hits])
+
+
+def test_heightfield_matches_triangle_mesh(physics):
+    rng = np.random.default_rng(3)
+    heights = rng.random((33, 17)).cumsum(axis=0).cumsum(axis=1) / 10.0
+    spacing, origin = 1.5, (3.0, -2.0)
+    placed = SimpleNamespace(position=Vector3([5.0, 1.0, 7.0]), rotation=Quaternion.from_y_rotation(0.7))
+
+    physics.create_body(placed, PhysicsBodyConfig(
+        body_type="static", shape="heightfield", heightfield_data=heights,
+        heightfield_spacing=spacing, heightfield_origin=origin,
+    ))
+    points = rng.uniform(-10.0, 20.0, (300, 2))
+    from_heightfield = _drop_rays(physics, points)
+
+    mesh_world = PhysicsWorld()
+    try:
+        grid_x, grid_z = np.meshgrid(origin[0] + np.arange(33) * spacing, origin[1] + np.arange(17) * spacing,
+                                     indexing="ij")
+        vertices = np.stack([grid_x, heights, grid_z], axis=-1).reshape(-1, 3)
+        mesh_world.create_body(placed, PhysicsBodyConfig(
+            body_type="static", shape="mesh", mesh_vertices=vertices, mesh_indices=grid_indices(33, 17),
+        ))
+        from_mesh = _drop_rays(mesh_world, points)
+    finally:
+        mesh_world.shutdown()
+
+    hit = ~np.isnan(from_mesh)
+    assert hit.sum() > 50
+    np.testing.assert_array_equal(np.isnan(from_heightfield), ~hit)
+    np.testing.assert_allclose(from_heightfield[hit], from_mesh[hit], atol=1e-4)
+
+
+def test_heightfield_from_npz_with_downsampling(tmp_path, physics):
+    path = tmp_path / "hills.npz"
+    heights, meta = generate_noise_grid(65, world_size=128.0, preset="rolling", seed=5)
+    save_heightmap(str(path), heights, meta)
+
+    config = PhysicsBodyConfig.from_dict({"type": "static", "shape": "heightfield",
+                                          "heightfield_path": "hills.npz", "heightfield_downsample": 4})
+    physics.create_body(SimpleNamespace(position=Vector3([0.0, 10.0, 0.0])), config, resource_base=tmp_path)
+
+    # Every 4th sample is kept exactly, centred on the object like heightmap_terrain
+    rows = np.arange(0, 65, 4)
+    points = [(-64.0 + i * 2.0, -64.0 + j * 2.0) for i in rows[1:-1] for j in rows[1:-1:3]]
+    expected = [heights[i, j] + 10.0 for i in rows[1:-1] for j in rows[1:-1:3]]
+    np.testing.assert_allclose(_drop_rays(physics, points), expected, atol=1e-4)
+
+
+def test_heightfield_must_be_static(physics):
+    config = PhysicsBodyConfig(body_type="dynamic", mass=1.0, shape="heightfield",
+                               heightfield_data=np.zeros((4, 4)), heightfield_spacing=1.0)
+    with pytest.raises(ValueError):
+        physics.create_body(SimpleNamespace(position=Vector3()), config)
@@ -0,0 +1,105 @@
+"""Tests for named collision layers"""
+
+from types import SimpleNamespace
+
+import pytest
+from pyrr import Vector3
+
+from src.gamelib.physics import CollisionLayers, PhysicsBodyConfig, PhysicsWorld
+from src.gamelib.physics import physics_world as physics_module
+
+DT = 1.0 / 60.0
+
+LAYERS = {
+    "layers": {
+        "terrain": {},
+        "props": {"sleep_threshold": 0.05},
+        "debris": {"sleep_threshold": 0.3},
+        "player": {"enable_sleeping": False},
+    },
+    "defaults": {"static": "terrain", "dynamic": "props", "kinematic": "player"},
+    "ignore": [["debris", "player"], ["debris", "debris"]],
+    "report": True,
+}
+
+
+def _box(position, body_type="dynamic", half_extents=(0.5, 0.5, 0.5), **kwargs):
+    config = PhysicsBodyConfig(body_type=body_type, shape="box", half_extents=half_extents,
+                               mass=1.0 if body_type == "dynamic" else None, **kwargs)
+    return SimpleNamespace(position=Vector3(position)), config
+
+
+def test_matrix_becomes_group_and_mask_bits():
+    layers = CollisionLayers.from_metadata(LAYERS)
+    terrain, props, debris, player = (layers.layer(name) for name in ("terrain", "props", "debris", "player"))
+
+    assert not layers.collides("player", "debris") and not layers.collides("debris", "debris")
+    assert layers.layer_for(None, "kinematic") is player and layers.layer_for("debris", "static") is debris
+
+    group, mask = layers.filter_bits("debris", static=False)
+    assert group == debris.dynamic_bit
+    assert mask == terrain.dynamic_bit | terrain.static_bit | props.dynamic_bit | props.static_bit
+
+    # Static bodies only ever pair with dynamic ones
+    group, mask = layers.filter_bits("terrain", static=True)
+    assert group == terrain.static_bit
+    assert mask == terrain.dynamic_bit | props.dynamic_bit | debris.dynamic_bit | player.dynamic_bit
+
+    with pytest.raises(ValueError, match="Unknown collision layer"):
+        CollisionLayers.from_metadata({"layers": ["a"], "ignore": [["a", "b"]]})
+
+
+def test_ignored_pairs_fall_through_and_are_reported():
+    world = PhysicsWorld()
+    try:
+        world.configure_from_metadata({"collision_layers": LAYERS})
+        world.create_body(*_box((0.0, -0.5, 0.0), body_type="static", half_extents=(20.0, 0.5, 20.0)))
+        # Overlapping static bodies still produce no contacts
+        world.create_body(*_box((0.0, -0.5, 0.0), body_type="static"))
+        debris = [world.create_body(*_box((0.0, 1.0 + 1.5 * index, 0.0), collision_layer="debris"))
+                  for index in range(3)]
+        prop = world.create_body(*_box((5.0, 1.0, 0.0)))
+        assert prop.config.collision_layer == "props"
+
+        for _ in range(120):
+            world.step_simulation(DT)
+        # The debris passed through each other and all rest on the ground
+        assert all(handle.scene_object.position.y < 0.6 for handle in debris)
+
+        report = {(entry.layer_a, entry.layer_b): entry for entry in world.layer_contact_report()}
+        assert report[("terrain", "debris")].contact_points > 0
+        assert report[("terrain", "props")].steps > 0
+        assert report[("terrain", "terrain")].contact_points == 0
+        assert report[("debris", "debris")].contact_points == 0 and not report[("debris", "debris")].enabled
+        lines = CollisionLayers.format_report(report.values())
+        assert lines[0].split()[:3] == ["terrain", "x", "debris"]
+        assert any("props x props" in " ".join(line.split()) for line in lines)
+
+        world.reset()
+        assert world.collision_layers is None and world.layer_contact_report() == []
+    finally:
+        world.shutdown()
+
+
+def test_layers_set_sleeping_unless_the_body_does(monkeypatch):
+    calls = []
+    change = physics_module._pb.changeDynamics
+
+    def recording(body_id, link, **kwargs):
+        calls.append((body_id, kwargs))
+        return change(body_id, link, **kwargs)
+
+    monkeypatch.setattr(physics_module._pb, "changeDynamics", recording)
+    world = PhysicsWorld()
+    try:
+        world.configure_from_metadata({"collision_layers": LAYERS})
+        debris = world.create_body(*_box((0.0, 1.0, 0.0), collision_layer="debris"))
+        custom = world.create_body(*_box((2.0, 1.0, 0.0), collision_layer="debris", sleep_threshold=0.01))
+        player = world.create_body(*_box((4.0, 1.0, 0.0), body_type="kinematic"))
+
+        thresholds = {body_id: kwargs["sleepThreshold"] for body_id, kwargs in calls if "sleepThreshold" in kwargs}
+        assert thresholds == {debris.body_id: 0.3, custom.body_id: 0.01}
+        assert not player.config.enable_sleeping
+    finally:
+        monkeypatch.undo()
+        world.shutdown()
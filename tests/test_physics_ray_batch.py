@@ -0,0 +1,54 @@
+"""Tests for batched ray casting"""
+
+import numpy as np
+import pytest
+
+
+def test_batch_matches_single_rays(physics, add_box):
+    add_box((0.0, 0.0, 0.0))
+    add_box((3.0, 2.0, 0.0), (0.5, 0.5, 0.5))
+    rng = np.random.default_rng(5)
+    starts = np.column_stack([rng.uniform(-4.0, 4.0, 200), np.full(200, 10.0), rng.uniform(-4.0, 4.0, 200)])
+    ends = starts - (0.0, 20.0, 0.0)
+
+    batch = physics.ray_test_batch(starts, ends)
+    assert len(batch) == 200 and batch.hit.any() and not batch.hit.all()
+    for index, (start, end) in enumerate(zip(starts, ends)):
+        single = physics.ray_test(tuple(start), tuple(end))
+        if single is None:
+            assert batch.as_dict(index) is None
+            assert batch.body_ids[index] == -1 and batch.fractions[index] == 1.0
+        else:
+            assert batch.body_ids[index] == single["body_id"]
+            assert batch.fractions[index] == pytest.approx(single["hit_fraction"])
+            np.testing.assert_allclose(batch.positions[index], single["hit_position"], atol=1e-6)
+
+
+def test_ignore_body_and_closest(physics, add_box):
+    floor = add_box((0.0, 0.0, 0.0))
+    crate = add_box((0.0, 2.0, 0.0), (0.5, 0.5, 0.5))
+    starts = [(0.0, 10.0, 0.0), (1.5, 10.0, 0.0)]
+    ends = [(0.0, -10.0, 0.0), (1.5, -10.0, 0.0)]
+
+    batch = physics.ray_test_batch(starts, ends)
+    assert batch.body_ids.tolist() == [crate.body_id, floor.body_id]
+    assert batch.closest() == 0
+
+    ignored = physics.ray_test_batch(starts, ends, ignore_body=crate.body_id)
+    assert ignored.body_ids.tolist() == [-1, floor.body_id]
+    assert ignored.fractions[0] == 1.0 and ignored.closest() == 1
+
+
+def test_large_batches_are_split(physics, add_box):
+    add_box((0.0, 0.0, 0.0), (50.0, 0.5, 50.0))
+    count = 40000
+    xs = np.linspace(-60.0, 60.0, count)
+    starts = np.column_stack([xs, np.full(count, 5.0), np.zeros(count)])
+    ends = starts - (0.0, 10.0, 0.0)
+
+    batch = physics.ray_test_batch(starts, ends, num_threads=0)
+    assert len(batch) == count
+    inside = np.abs(xs) < 49.9
+    assert batch.hit[inside].all()
+    assert not batch.hit[np.abs(xs) > 50.1].any()
+    np.testing.assert_allclose(batch.positions[inside, 1], 0.5, atol=1e-4)
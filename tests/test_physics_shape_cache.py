@@ -0,0 +1,93 @@
+"""Tests for shared collision shapes and batched body creation"""
+
+import os
+from types import SimpleNamespace
+
+import numpy as np
+from pyrr import Quaternion, Vector3
+
+from src.gamelib.loaders.model import Model
+from src.gamelib.physics import PhysicsBodyConfig, PhysicsWorld
+from src.gamelib.physics import physics_world as physics_module
+from src.gamelib.physics.mesh_io import write_obj
+
+
+def _count_shapes(monkeypatch):
+    calls = []
+    create = physics_module._pb.createCollisionShape
+
+    def counting(*args, **kwargs):
+        calls.append(args[0])
+        return create(*args, **kwargs)
+
+    monkeypatch.setattr(physics_module._pb, "createCollisionShape", counting)
+    return calls
+
+
+def _crate(half_extent=0.5):
+    return PhysicsBodyConfig(body_type="dynamic", shape="box", half_extents=(half_extent,) * 3, mass=1.0)
+
+
+def test_identical_colliders_share_a_shape(monkeypatch, tmp_path):
+    calls = _count_shapes(monkeypatch)
+    mesh = tmp_path / "ramp.obj"
+    write_obj(mesh, [(0, 0, 0), (4, 0, 0), (0, 1, 4), (4, 1, 4)], [(0, 2, 1), (1, 2, 3)])
+
+    world = PhysicsWorld()
+    try:
+        for index in range(5):
+            world.create_body(Model([], position=Vector3([index * 2.0, 1.0, 0.0])), _crate())
+        world.create_body(Model([], position=Vector3([0.0, 5.0, 0.0])), _crate(0.25))
+        for _ in range(3):
+            world.create_body(SimpleNamespace(position=Vector3()), PhysicsBodyConfig(
+                body_type="static", shape="mesh", mesh_path=str(mesh)))
+        assert len(calls) == 3
+
+        # A rebuilt mesh file gets a new shape
+        stat = mesh.stat()
+        os.utime(mesh, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        world.create_body(SimpleNamespace(position=Vector3()), PhysicsBodyConfig(
+            body_type="static", shape="mesh", mesh_path=str(mesh)))
+        assert len(calls) == 4
+
+        world.reset()
+        world.create_body(Model([], position=Vector3([0.0, 1.0, 0.0])), _crate())
+        assert len(calls) == 5
+    finally:
+        world.shutdown()
+
+
+def test_batch_creation_matches_one_by_one():
+    results = []
+    for batched in (False, True):
+        world = PhysicsWorld()
+        try:
+            world.create_body(SimpleNamespace(position=Vector3([0.0, -0.5, 0.0])), PhysicsBodyConfig(
+                body_type="static", shape="box", half_extents=(20.0, 0.5, 20.0)))
+            crates, bodies = [], []
+            for index in range(6):
+                crate = Model([], position=Vector3([index * 2.0 - 5.0, 1.0 + index, 0.0]), name=f"crate{index}")
+                if index % 2:
+                    crate.orientation = Quaternion.from_y_rotation(0.3 * index)
+                config = _crate(0.5 if index < 4 else 0.3)
+                crates.append(crate)
+                bodies.append((crate, config))
+            if batched:
+                handles = world.create_bodies(bodies)
+            else:
+                handles = [world.create_body(*body) for body in bodies]
+            assert [handle.scene_object for handle in handles] == crates
+
+            placed = [
+                world.get_body_position(handle.body_id) + world.get_body_orientation(handle.body_id)
+                for handle in handles
+            ]
+            for _ in range(60):
+                world.step_simulation(1.0 / 60.0)
+            results.append((placed, [np.array(crate.position) for crate in crates]))
+        finally:
+            world.shutdown()
+
+    (serial_placed, serial_final), (batch_placed, batch_final) = results
+    np.testing.assert_allclose(batch_placed, serial_placed, atol=1e-9)
+    np.testing.assert_allclose(batch_final, serial_final, atol=1e-6)
@@ -0,0 +1,78 @@
+"""Tests for capsule sweeps and the character controller built on them"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pyrr import Quaternion, Vector3
+
+from src.gamelib.config.settings import PLAYER_CAPSULE_HEIGHT, PLAYER_COLLISION_MARGIN
+from src.gamelib.gameplay.player_character import PlayerCharacter
+from src.gamelib.physics import PhysicsBodyConfig
+
+
+def test_capsule_sweep_time_of_impact(physics, add_box):
+    floor = add_box((0.0, -0.5, 0.0), (10.0, 0.5, 10.0))
+    wall = add_box((5.0, 2.0, 0.0), (0.01, 2.0, 3.0))
+
+    drop = physics.sweep_capsule((0.0, 5.0, 0.0), (0.0, -5.0, 0.0), 0.4, 1.8)
+    assert drop.body_id == floor.body_id
+    assert drop.position[1] == pytest.approx(0.9, abs=2e-3)
+    assert drop.fraction == pytest.approx(0.41, abs=2e-4)
+    np.testing.assert_allclose(drop.normal, (0.0, 1.0, 0.0), atol=1e-6)
+
+    # A thin wall in the middle of a long sweep is not skipped, and the
+    # floor the capsule is resting on does not block sliding along it
+    slide = physics.sweep_capsule((0.0, 0.95, 0.0), (20.0, 0.95, 0.0), 0.4, 1.8)
+    assert slide.body_id == wall.body_id
+    assert slide.position[0] == pytest.approx(4.99 - 0.4, abs=2e-3)
+    np.testing.assert_allclose(slide.normal, (-1.0, 0.0, 0.0), atol=1e-6)
+
+    assert physics.sweep_capsule((0.0, 0.95, 0.0), (-5.0, 0.95, 0.0), 0.4, 1.8) is None
+    ignored = physics.sweep_capsule((0.0, 5.0, 0.0), (0.0, -5.0, 0.0), 0.4, 1.8, ignore_body=floor.body_id)
+    assert ignored is None
+
+
+def test_capsule_sweep_onto_heightfield(physics):
+    heights = np.random.default_rng(2).random((24, 24))
+    physics.create_body(SimpleNamespace(position=Vector3()), PhysicsBodyConfig(
+        body_type="static", shape="heightfield", heightfield_data=heights, heightfield_spacing=0.5,
+    ))
+
+    for x, z in ((3.0, 4.0), (-2.8, 1.7), (0.6, -4.1)):
+        hit = physics.sweep_capsule((x, 5.0, z), (x, -5.0, z), 0.4, 1.8)
+        assert hit is not None and hit.fraction > 0.0
+        # Resting on the surface: touching it, and no lower point is free
+        assert physics.sweep_capsule(hit.position, (x, hit.position[1] - 0.01, z), 0.4, 1.8).fraction < 0.1
+        assert physics.sweep_capsule((x, hit.position[1] + 0.01, z), (x, 5.0, z), 0.4, 1.8) is None
+
+
+def test_player_steps_up_and_stops_at_walls(physics, add_box):
+    add_box((0.0, -0.5, 0.0), (50.0, 0.5, 50.0))
+    add_box((6.0, 0.15, 0.0), (1.0, 0.15, 3.0))  # 0.3 m step from x = 5 to 7
+    add_box((14.0, 2.0, 0.0), (0.01, 2.0, 3.0))   # Thin wall at x = 14
+
+    model = SimpleNamespace(position=Vector3([0.0, 2.0, 0.0]), rotation=Quaternion())
+    player = PlayerCharacter(model, physics, Vector3([0.0, 2.0, 0.0]))
+    player.set_yaw(0.0)
+
+    def run(frames):
+        heights = []
+        for _ in range(frames):
+            player.update(1 / 60)
+            physics.step_simulation(1 / 60)
+            player.update_post_physics(1 / 60)
+            heights.append(player.get_position().y)
+        return heights
+
+    run(60)
+    assert player.is_grounded
+    assert player.get_position().y == pytest.approx(PLAYER_CAPSULE_HEIGHT / 2.0, abs=0.1)
+
+    player.set_movement_intent(1.0, 0.0)
+    on_step = PLAYER_CAPSULE_HEIGHT / 2.0 + 0.3 + PLAYER_COLLISION_MARGIN
+    assert max(run(90)) == pytest.approx(on_step, abs=0.1)
+
+    player.set_sprint(True)
+    run(120)
+    assert 13.0 < player.get_position().x < 13.99 - 0.4
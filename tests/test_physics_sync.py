@@ -0,0 +1,95 @@
+"""Tests for physics-to-scene transform sync"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pyrr import Quaternion, Vector3
+
+from src.gamelib.loaders.model import Model
+from src.gamelib.physics import PhysicsBodyConfig, PhysicsWorld
+from src.gamelib.physics import physics_world as physics_module
+
+
+def test_sync_writes_moved_bodies_in_place(crate_world):
+    world, crates, _ = crate_world(3, interpolate=False)
+    try:
+        positions = [crate.position for crate in crates]
+        world.step_simulation(world.settings.fixed_time_step)
+        assert all(crate.position is position for crate, position in zip(crates, positions))
+
+        ids, transforms = world.get_body_transforms()
+        assert transforms.shape == (3, 7) and not transforms.flags.writeable
+        for crate, row in zip(crates, transforms):
+            np.testing.assert_allclose(np.asarray(crate.position), row[:3])
+            np.testing.assert_allclose(np.asarray(crate.orientation), row[3:])
+    finally:
+        world.shutdown()
+
+
+def test_resting_bodies_are_skipped_until_moved(crate_world):
+    world, crates, _ = crate_world(4, interpolate=True)
+    try:
+        for _ in range(600):  # Fall, settle and go to sleep
+            world.step_simulation(1 / 60)
+        assert world.sync_to_scene() == 0
+
+        ids, _ = world.get_body_transforms()
+        world.set_body_transform(int(ids[2]), position=(4.0, 3.0, 0.0))
+        assert world.sync_to_scene() == 1
+        np.testing.assert_allclose(np.asarray(crates[2].position), (4.0, 3.0, 0.0))
+
+        # A new body gets a row; existing rows keep their synced state
+        world.create_body(Model([], position=Vector3([9.0, 5.0, 0.0])), PhysicsBodyConfig(
+            body_type="dynamic", shape="sphere", radius=0.5, mass=1.0))
+        assert world.sync_to_scene() == 1
+        assert len(world.get_body_transforms()[0]) == 5
+    finally:
+        world.shutdown()
+
+
+def test_scene_blends_last_two_steps():
+    world = PhysicsWorld()
+    try:
+        ball = Model([], position=Vector3([0.0, 10.0, 0.0]))
+        body = world.create_body(ball, PhysicsBodyConfig(body_type="dynamic", shape="sphere", radius=0.5, mass=1.0))
+        step = world.settings.fixed_time_step
+
+        world.step_simulation(step * 1.25)  # One step, a quarter of the next one left over
+        assert world.interpolation_alpha == pytest.approx(0.25)
+        simulated = world.get_body_transforms()[1][0, 1]
+        assert simulated < 10.0
+        assert ball.position.y == pytest.approx(10.0 + (simulated - 10.0) * 0.25)
+
+        world.step_simulation(step * 0.5)  # No step; the blend moves on
+        assert ball.position.y == pytest.approx(10.0 + (simulated - 10.0) * 0.75)
+
+        # Teleports snap instead of blending
+        world.set_body_transform(body.body_id, position=(3.0, 4.0, 5.0))
+        world.sync_to_scene()
+        np.testing.assert_allclose(np.asarray(ball.position), (3.0, 4.0, 5.0))
+    finally:
+        world.shutdown()
+
+
+def test_kinematic_bodies_pushed_only_when_changed(monkeypatch):
+    world = PhysicsWorld()
+    try:
+        platform = SimpleNamespace(position=Vector3([0.0, 1.0, 0.0]), rotation=Quaternion())
+        world.create_body(platform, PhysicsBodyConfig(
+            body_type="kinematic", shape="box", half_extents=(1.0, 0.1, 1.0)))
+
+        pushes = []
+        original = physics_module._pb.resetBasePositionAndOrientation
+        monkeypatch.setattr(physics_module._pb, "resetBasePositionAndOrientation",
+                            lambda *args, **kwargs: (pushes.append(args[1]), original(*args, **kwargs)))
+        step = world.settings.fixed_time_step
+        world.step_simulation(step * 3)
+        world.step_simulation(step)
+        assert len(pushes) == 1
+
+        platform.position = Vector3([0.0, 2.0, 0.0])
+        world.step_simulation(step)
+        assert pushes[-1] == (0.0, 2.0, 0.0) and len(pushes) == 2
+    finally:
+        world.shutdown()
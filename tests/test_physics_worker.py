@@ -0,0 +1,175 @@
+"""Tests for stepping physics on a worker thread"""
+
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from pyrr import Vector3
+
+from src.gamelib.loaders.model import Model
+from src.gamelib.physics import PhysicsBodyConfig
+from src.gamelib.physics import physics_world as physics_module
+
+DT = 1.0 / 60.0
+
+
+def test_threaded_scene_lags_single_threaded_by_one_frame(crate_world):
+    serial, serial_crates, _ = crate_world(3, threaded=False)
+    threaded, threaded_crates, _ = crate_world(3, threaded=True)
+    try:
+        assert threaded.worker is not None
+        history = []
+        for _ in range(30):
+            serial.step_simulation(DT)
+            threaded.step_simulation(DT)
+            history.append([np.array(crate.position) for crate in serial_crates])
+            if len(history) > 1:
+                for crate, expected in zip(threaded_crates, history[-2]):
+                    np.testing.assert_allclose(np.asarray(crate.position), expected, atol=1e-9)
+
+        # Stopping applies the in-flight step, catching the scene up
+        threaded.stop_worker()
+        for crate, expected in zip(threaded_crates, history[-1]):
+            np.testing.assert_allclose(np.asarray(crate.position), expected, atol=1e-9)
+        assert threaded.worker is None
+    finally:
+        serial.shutdown()
+        threaded.shutdown()
+
+
+def test_impulses_are_queued_for_the_next_step(crate_world):
+    positions = []
+    for threaded in (False, True):
+        world, crates, (body_id,) = crate_world(1, threaded=threaded)
+        try:
+            world.step_simulation(DT)
+            world.apply_central_impulse(body_id, (0.0, 0.0, 300.0))
+            for _ in range(10):
+                world.step_simulation(DT)
+            world.stop_worker()
+            positions.append(np.array(crates[0].position))
+        finally:
+            world.shutdown()
+    assert positions[0][2] > 0.05
+    np.testing.assert_allclose(positions[1], positions[0], atol=1e-9)
+
+
+def test_bodies_can_change_while_stepping(crate_world):
+    world, crates, body_ids = crate_world(2, threaded=True)
+    try:
+        world.start_worker(capture_contacts=True)
+        for _ in range(5):
+            world.step_simulation(DT)
+        world.remove_body(body_ids[0])
+        removed_position = np.array(crates[0].position)
+
+        # PyBullet may hand the removed body's id to the new one
+        extra = Model([], position=Vector3([5.0, 3.0, 0.0]), name="extra")
+        world.create_body(extra, PhysicsBodyConfig(
+            body_type="dynamic", shape="box", half_extents=(0.5, 0.5, 0.5), mass=1.0))
+        world.step_simulation(DT)
+        world.step_simulation(DT)
+        assert extra.position.y > 2.9
+        for _ in range(30):
+            world.step_simulation(DT)
+
+        snapshot = world.worker.snapshot
+        assert len(snapshot.body_ids) == 2
+        assert snapshot.contacts is not None and len(snapshot.contacts) > 0
+        assert extra.position.y < 2.9
+        np.testing.assert_allclose(np.asarray(crates[0].position), removed_position)
+    finally:
+        world.shutdown()
+
+
+def test_reset_drops_the_in_flight_step(crate_world):
+    world, _, (old_id,) = crate_world(1, threaded=True)
+    try:
+        for _ in range(5):
+            world.step_simulation(DT)
+        world.apply_central_impulse(old_id, (300.0, 0.0, 0.0))
+        world.reset()
+
+        # PyBullet hands the old ids to the new bodies
+        ground = Model([], position=Vector3([0.0, -0.5, 0.0]), name="ground")
+        world.create_body(ground, PhysicsBodyConfig(body_type="static", shape="box", half_extents=(20.0, 0.5, 20.0)))
+        crate = Model([], position=Vector3([5.0, 3.0, 0.0]), name="crate")
+        handle = world.create_body(crate, PhysicsBodyConfig(
+            body_type="dynamic", shape="box", half_extents=(0.5, 0.5, 0.5), mass=1.0))
+        assert handle.body_id == old_id
+
+        for _ in range(3):
+            world.step_simulation(DT)
+            np.testing.assert_allclose(np.asarray(crate.position)[[0, 2]], (5.0, 0.0), atol=1e-6)
+            assert crate.position.y > 2.9
+        np.testing.assert_allclose(np.asarray(ground.position), (0.0, -0.5, 0.0))
+    finally:
+        world.shutdown()
+
+
+@pytest.mark.parametrize("warmup", [20, 21])
+def test_threaded_teleports_are_not_interpolated(crate_world, warmup):
+    world, (crate,), (body_id,) = crate_world(1, threaded=True, interpolate=True)
+    try:
+        # Half-length frames alternate between zero and one fixed step
+        frame = world.settings.fixed_time_step / 2.0
+        for _ in range(warmup):
+            world.step_simulation(frame)
+        world.set_body_transform(body_id, position=(10.0, 1.0, 0.0))
+        for _ in range(4):
+            world.step_simulation(frame)
+            assert crate.position.x < 1e-6 or crate.position.x > 10.0 - 1e-6
+        assert crate.position.x > 10.0 - 1e-6
+    finally:
+        world.shutdown()
+
+
+def test_main_thread_never_uses_the_client_during_a_step(crate_world, monkeypatch):
+    world, crates, body_ids = crate_world(3, threaded=True)
+    overlapping = []
+    for name in ("getBasePositionAndOrientation", "resetBasePositionAndOrientation", "getBaseVelocity",
+                 "resetBaseVelocity", "getClosestPoints", "getOverlappingObjects", "getContactPoints",
+                 "applyExternalForce", "rayTest"):
+        def wrapped(*args, _call=getattr(physics_module._pb, name), _name=name, **kwargs):
+            if threading.current_thread() is threading.main_thread() and not world.worker._done.is_set():
+                overlapping.append(_name)
+            return _call(*args, **kwargs)
+
+        monkeypatch.setattr(physics_module._pb, name, wrapped)
+    try:
+        # The calls a kinematic player makes each frame
+        player = world.create_body(SimpleNamespace(position=Vector3([-4.0, 1.0, 0.0])), PhysicsBodyConfig(
+            body_type="kinematic", shape="capsule", radius=0.4, height=1.8))
+        for frame in range(30):
+            position = (-4.0, 1.0, frame * 0.1)
+            world.sweep_capsule((-4.0, 1.0, frame * 0.1 - 0.1), position, 0.4, 1.8, ignore_body=player.body_id)
+            world.set_body_transform(player.body_id, position=position)
+            world.set_linear_velocity(player.body_id, (0.0, 0.0, 6.0))
+            world.get_contacts(body_id=player.body_id, as_array=True)
+            world.apply_central_impulse(body_ids[0], (0.0, 1.0, 0.0))
+            world.step_simulation(DT)
+            world.set_body_transform(player.body_id, orientation=(0.0, 0.0, 0.0, 1.0))
+
+        assert overlapping == []
+        # Queries see queued writes
+        world.set_body_transform(body_ids[1], position=(3.0, 4.0, 5.0))
+        np.testing.assert_allclose(world.get_body_position(body_ids[1]), (3.0, 4.0, 5.0))
+    finally:
+        monkeypatch.undo()
+        world.shutdown()
+
+
+def test_worker_errors_surface_on_the_main_thread(crate_world, monkeypatch):
+    world, _, _ = crate_world(1, threaded=True)
+    try:
+        def fail(*args, **kwargs):
+            raise RuntimeError("step failed")
+
+        monkeypatch.setattr(world, "_advance", fail)
+        world.step_simulation(DT)
+        with pytest.raises(RuntimeError, match="step failed"):
+            world.step_simulation(DT)
+    finally:
+        monkeypatch.undo()
+        world.shutdown()
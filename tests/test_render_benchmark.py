@@ -0,0 +1,82 @@
+"""Tests for the render benchmark report helpers"""
+
+import pytest
+
+from src.gamelib.debug.render_benchmark import (
+    CameraKeyframe,
+    CameraPath,
+    build_report,
+    compare_reports,
+    summarize,
+)
+from src.gamelib.rendering.frame_profiler import FrameTiming, PassTiming
+
+
+def _frame(index, shadows_gpu, lighting_gpu):
+    return FrameTiming(
+        frame=index,
+        cpu_start=0.0,
+        cpu_ms=2.0,
+        passes=[
+            PassTiming("shadows", 0, 0.0, 0.5, gpu_ms=shadows_gpu, primitives=100),
+            PassTiming("lighting", 0, 0.5, 1.0, gpu_ms=lighting_gpu, samples=10),
+        ],
+    )
+
+
+def test_summarize_percentiles():
+    summary = summarize(list(range(1, 101)))
+    assert summary["mean"] == pytest.approx(50.5)
+    assert summary["min"] == 1 and summary["max"] == 100
+    assert summary["p50"] == pytest.approx(50.5)
+    assert summary["p99"] == pytest.approx(99.01)
+    assert summarize([])["p95"] == 0.0
+
+
+def test_camera_path_interpolates_keyframes():
+    path = CameraPath([
+        CameraKeyframe((0.0, 0.0, 0.0), (0.0, 0.0, -1.0)),
+        CameraKeyframe((10.0, 0.0, 0.0), (10.0, 0.0, -1.0)),
+        CameraKeyframe((10.0, 10.0, 0.0), (10.0, 10.0, -1.0)),
+    ])
+    assert path.sample(0.25).position == pytest.approx((5.0, 0.0, 0.0))
+    assert path.sample(0.75).position == pytest.approx((10.0, 5.0, 0.0))
+    assert path.sample(2.0) == path.keyframes[-1]
+
+
+def test_orbit_closes_the_loop():
+    path = CameraPath.orbit((1.0, 0.0, 1.0), radius=5.0, height=2.0, segments=8)
+    assert path.sample(0.0).position == pytest.approx(path.sample(1.0).position)
+    assert path.sample(0.5).position == pytest.approx((1.0, 2.0, -4.0))
+    assert all(frame.target == (1.0, 0.0, 1.0) for frame in path.keyframes)
+
+
+def test_build_report_aggregates_frames():
+    timings = [_frame(0, 1.0, 3.0), _frame(1, 2.0, 5.0)]
+    culling = [{"Main": {"total": 10, "rendered": 6, "culled": 4}},
+               {"Main": {"total": 10, "rendered": 8, "culled": 2}}]
+    report = build_report(timings, [4.0, 6.0], [12, 14], culling, warmup=3)
+
+    assert report["frames"] == 2 and report["warmup"] == 3
+    assert report["frame_ms"]["wall"]["mean"] == pytest.approx(5.0)
+    assert report["frame_ms"]["gpu"]["mean"] == pytest.approx(5.5)
+    assert list(report["passes"]) == ["shadows", "lighting"]
+    assert report["passes"]["lighting"]["gpu_ms"]["max"] == pytest.approx(5.0)
+    assert report["passes"]["shadows"]["primitives"] == pytest.approx(100.0)
+    assert report["draw_calls"]["mean"] == pytest.approx(13.0)
+    assert report["culling"]["Main"] == {"total": 10.0, "rendered": 7.0, "culled": 3.0}
+
+
+def test_compare_reports_flags_regressions_only():
+    baseline = build_report([_frame(0, 1.0, 3.0)] * 4, [5.0] * 4, [10] * 4, [])
+
+    assert compare_reports(baseline, baseline) == []
+
+    slower = build_report([_frame(0, 1.0, 4.0)] * 4, [5.02] * 4, [10] * 4, [])
+    regressions = compare_reports(baseline, slower)
+    # Lighting and the GPU frame total slowed by 1 ms; the 0.02 ms wall-time
+    # change is under the absolute floor
+    assert any(line.startswith("pass lighting gpu p50") for line in regressions)
+    assert any(line.startswith("frame gpu p50") for line in regressions)
+    assert not any(line.startswith("frame wall") for line in regressions)
+    assert not any("shadows" in line for line in regressions)
@@ -0,0 +1,250 @@
+"""Tests for RenderGraph"""
+
+from contextlib import nullcontext
+
+import pytest
+
+from src.gamelib.rendering.render_graph import RenderGraph, ResourceDesc
+
+
+class FakeTexture:
+    _next_glo = 1
+
+    def __init__(self, size, components, dtype="f1", samples=0, depth=False):
+        self.size = size
+        self.components = components
+        self.dtype = dtype
+        self.samples = samples
+        self.depth = depth
+        self.filter = None
+        self.released = False
+        self.glo = FakeTexture._next_glo
+        FakeTexture._next_glo += 1
+
+    def release(self):
+        self.released = True
+
+
+class FakeFramebuffer:
+    def __init__(self, color, depth):
+        self.color = color
+        self.depth = depth
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+
+class FakeContext:
+    def __init__(self):
+        self.textures = []
+        self.framebuffers = []
+
+    def texture(self, size, components, dtype="f1", samples=0):
+        texture = FakeTexture(size, components, dtype, samples)
+        self.textures.append(texture)
+        return texture
+
+    def depth_texture(self, size, samples=0):
+        texture = FakeTexture(size, 1, "f4", samples, depth=True)
+        self.textures.append(texture)
+        return texture
+
+    def framebuffer(self, color_attachments=(), depth_attachment=None):
+        fbo = FakeFramebuffer(list(color_attachments), depth_attachment)
+        self.framebuffers.append(fbo)
+        return fbo
+
+
+def _live(ctx):
+    return [t for t in ctx.textures if not t.released]
+
+
+def _graph(ctx, ssao_enabled=lambda: True):
+    """G-Buffer -> (SSAO) -> lighting -> post chain, mirroring the deferred frame."""
+    graph = RenderGraph(ctx, (100, 50))
+    log = []
+    rgba = ResourceDesc(components=4)
+    graph.create_texture("albedo", rgba)
+    graph.create_texture("depth", ResourceDesc(depth=True))
+    graph.create_texture("ao", ResourceDesc(components=1, dtype="f4", scale=0.5))
+    graph.create_texture("post", rgba)
+    graph.create_texture("unused", rgba)
+    graph.import_resource("screen", lambda: "screen")
+
+    def record(name):
+        return lambda res: log.append(name)
+
+    graph.add_pass("geometry", record("geometry"), writes=["albedo", "depth"])
+    graph.add_pass("ssao", record("ssao"), reads=["depth"], writes=["ao"], enabled=ssao_enabled)
+    graph.add_pass("lighting", record("lighting"), reads=["albedo", "depth"], writes=["screen"])
+    graph.add_pass("orphan", record("orphan"), reads=["albedo"], writes=["unused"])
+    graph.add_pass("post", record("post"), reads=["screen"], writes=["post", "screen"])
+    graph.set_outputs("screen")
+    return graph, log
+
+
+def test_unread_passes_are_culled():
+    ctx = FakeContext()
+    graph, log = _graph(ctx)
+    graph.execute()
+
+    # SSAO output is never read and the orphan writes an unused transient
+    assert log == ["geometry", "lighting", "post"]
+    assert "ssao" in graph.describe()[1] and "orphan" in graph.describe()[1]
+
+
+def test_disabled_pass_is_skipped_and_recompiled():
+    ctx = FakeContext()
+    enabled = {"ssao": False}
+    graph, log = _graph(ctx, ssao_enabled=lambda: enabled["ssao"])
+
+    graph.add_pass(
+        "consume_ao",
+        lambda res: log.append("consume_ao"),
+        reads=["ao"],
+        writes=["screen"],
+        enabled=lambda: enabled["ssao"],
+    )
+    graph.execute()
+    assert "ssao" not in log
+    assert not any(t.size == (50, 25) for t in _live(ctx))
+
+    log.clear()
+    enabled["ssao"] = True
+    graph.execute()
+    assert log == ["geometry", "ssao", "lighting", "post", "consume_ao"]
+    assert any(t.size == (50, 25) for t in _live(ctx))
+
+
+def test_reading_unwritten_transient_raises():
+    graph = RenderGraph(FakeContext(), (8, 8))
+    graph.create_texture("color", ResourceDesc())
+    graph.import_resource("screen", lambda: None)
+    graph.add_pass("blit", lambda res: None, reads=["color"], writes=["screen"])
+    graph.set_outputs("screen")
+    with pytest.raises(RuntimeError):
+        graph.compile()
+
+
+def test_undeclared_resource_raises():
+    graph = RenderGraph(FakeContext(), (8, 8))
+    with pytest.raises(KeyError):
+        graph.add_pass("blit", lambda res: None, writes=["screen"])
+
+
+def test_non_overlapping_transients_share_memory():
+    ctx = FakeContext()
+    graph, _ = _graph(ctx)
+    seen = {}
+
+    graph.passes[0].execute = lambda res: seen.update(albedo=res.texture("albedo"))
+    graph.passes[-1].execute = lambda res: seen.update(post=res.texture("post"))
+    graph.execute()
+
+    # albedo dies after lighting, post is born afterwards with the same format
+    assert seen["albedo"] is seen["post"]
+    stats = graph.memory_stats()
+    assert stats["virtual_textures"] == 3
+    assert stats["physical_textures"] == 2
+    assert stats["virtual_bytes"] - stats["physical_bytes"] == 100 * 50 * 4
+
+
+def test_overlapping_transients_do_not_alias():
+    ctx = FakeContext()
+    graph = RenderGraph(ctx, (8, 8))
+    graph.create_texture("a", ResourceDesc())
+    graph.create_texture("b", ResourceDesc())
+    graph.import_resource("screen", lambda: None)
+    seen = {}
+    graph.add_pass("write_a", lambda res: seen.update(a=res.texture("a")), writes=["a"])
+    graph.add_pass("write_b", lambda res: seen.update(b=res.texture("b")), reads=["a"], writes=["b"])
+    graph.add_pass("combine", lambda res: None, reads=["a", "b"], writes=["screen"])
+    graph.set_outputs("screen")
+    graph.execute()
+
+    assert seen["a"] is not seen["b"]
+
+
+def test_filter_is_applied_per_resource():
+    ctx = FakeContext()
+    graph = RenderGraph(ctx, (8, 8))
+    graph.create_texture("nearest", ResourceDesc(filter=(1, 1)))
+    graph.create_texture("linear", ResourceDesc(filter=(2, 2)))
+    graph.import_resource("screen", lambda: None)
+    filters = []
+    graph.add_pass("a", lambda res: filters.append(res.texture("nearest").filter), writes=["nearest"])
+    graph.add_pass("b", lambda res: None, reads=["nearest"], writes=["screen"])
+    graph.add_pass("c", lambda res: filters.append(res.texture("linear").filter), writes=["linear"])
+    graph.add_pass("d", lambda res: None, reads=["linear"], writes=["screen"])
+    graph.set_outputs("screen")
+    graph.execute()
+
+    assert filters == [(1, 1), (2, 2)]
+
+
+def test_framebuffers_are_cached_and_resize_reallocates():
+    ctx = FakeContext()
+    graph, _ = _graph(ctx)
+    fbos = []
+    graph.passes[0].execute = lambda res: fbos.append(res.framebuffer(["albedo"], depth="depth"))
+
+    graph.execute()
+    graph.execute()
+    assert fbos[0] is fbos[1]
+    created = len(ctx.textures)
+
+    graph.resize((200, 100))
+    graph.execute()
+    assert fbos[0].released
+    assert fbos[2] is not fbos[0]
+    assert len(ctx.textures) == created * 2
+    assert all(t.size == (200, 100) for t in _live(ctx))
+
+
+def test_profiler_scope_per_pass():
+    class Profiler:
+        def __init__(self):
+            self.scopes = []
+
+        def scope(self, name):
+            self.scopes.append(name)
+            return nullcontext()
+
+    ctx = FakeContext()
+    graph, _ = _graph(ctx)
+    graph.profiler = Profiler()
+    graph.execute()
+    assert graph.profiler.scopes == ["geometry", "lighting", "post"]
+
+
+def test_dynamic_writes_reroute_and_recompile():
+    ctx = FakeContext()
+    graph = RenderGraph(ctx, (8, 8))
+    graph.create_texture("scaled", ResourceDesc())
+    graph.import_resource("screen", lambda: None)
+    state = {"upscale": False}
+    log = []
+    graph.add_pass(
+        "lighting",
+        lambda res: log.append("lighting"),
+        writes=lambda: ["scaled"] if state["upscale"] else ["screen"],
+    )
+    graph.add_pass(
+        "upscale",
+        lambda res: log.append("upscale"),
+        reads=["scaled"],
+        writes=["screen"],
+        enabled=lambda: state["upscale"],
+    )
+    graph.set_outputs("screen")
+
+    graph.execute()
+    assert log == ["lighting"]
+    assert graph.memory_stats()["physical_textures"] == 0
+
+    log.clear()
+    state["upscale"] = True
+    graph.execute()
+    assert log == ["lighting", "upscale"]
+    assert graph.memory_stats()["physical_textures"] == 1
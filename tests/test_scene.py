@@ -90,3 +90,18 @@ def test_scene_object_apply_physics_transform():
     # 90 degree rotation around Z swaps X and Y axes
     assert np.isclose(matrix[0, 1], -1.0, atol=1e-6)
     assert np.isclose(matrix[1, 0], 1.0, atol=1e-6)
+
+
+def test_physics_transform_with_integer_inputs():
+    """Integer positions/rotations are copied to float64 and never aliased."""
+    from src.gamelib.loaders.model import Model
+
+    position = Vector3([0, 5, 0])
+    obj = SceneObject(None, position, (1.0, 1.0, 1.0), rotation=(0, 0, 0))
+    model = Model([], position=position, rotation=Vector3([0, 0, 0]))
+
+    for target in (obj, model):
+        target.apply_physics_transform((0.25, 4.5, -1.75), (0.0, 0.0, 0.0, 2.0))
+        assert np.allclose(np.asarray(target.position), (0.25, 4.5, -1.75))
+    assert np.allclose(np.asarray(obj.rotation), (0.0, 0.0, 0.0, 1.0))
+    assert list(position) == [0, 5, 0]
@@ -0,0 +1,126 @@
+"""Tests for SSAORenderer resolution scaling and temporal history"""
+
+import moderngl
+import numpy as np
+import pytest
+from pyrr import Matrix44
+
+from src.gamelib.rendering.shader_manager import ShaderManager
+from src.gamelib.rendering.ssao_renderer import SSAORenderer
+
+SIZE = (320, 180)
+
+
+@pytest.fixture(scope="module")
+def ctx():
+    try:
+        context = moderngl.create_context(standalone=True, backend="egl")
+    except Exception as exc:  # No headless GL driver
+        pytest.skip(f"Headless OpenGL context unavailable: {exc}")
+    yield context
+    context.release()
+
+
+@pytest.fixture(scope="module")
+def programs(ctx):
+    shaders = ShaderManager(ctx)
+    return {
+        "ssao": shaders.load_program("ssao", "ssao.vert", "ssao.frag"),
+        "blur": shaders.load_program("ssao_blur", "ssao_blur.vert", "ssao_blur.frag"),
+        "upsample": shaders.load_program("ssao_upsample", "ssao.vert", "ssao_upsample.frag"),
+        "temporal": shaders.load_program("ssao_temporal", "ssao.vert", "ssao_temporal.frag"),
+    }
+
+
+def _renderer(ctx, programs, scale, temporal=True):
+    return SSAORenderer(
+        ctx, SIZE, programs["ssao"], programs["blur"],
+        upsample_program=programs["upsample"],
+        temporal_program=programs["temporal"],
+        resolution_scale=scale,
+        kernel_size=16,
+        temporal_enabled=temporal,
+    )
+
+
+def _gbuffer(ctx, size):
+    """View-space G-buffer of a floor seen from above, with a box standing on it."""
+    width, height = size
+    xs, ys = np.meshgrid(np.linspace(-4.0, 4.0, width), np.linspace(-2.0, 2.0, height))
+    depth = np.where((np.abs(xs) < 1.0) & (np.abs(ys) < 1.0), -4.0, -5.0)
+    positions = np.stack([xs, ys, depth, np.ones_like(xs)], axis=-1).astype("f4")
+    normals = np.zeros_like(positions)
+    normals[..., 2] = 1.0
+    position = ctx.texture(size, 4, positions.tobytes(), dtype="f4")
+    normal = ctx.texture(size, 4, normals.tobytes(), dtype="f4")
+    return position, normal
+
+
+def _render(renderer, textures, view=None):
+    projection = Matrix44.perspective_projection(60.0, SIZE[0] / SIZE[1], 0.1, 100.0)
+    view = Matrix44.identity() if view is None else view
+    renderer.render(*textures, projection, view_matrix=view)
+
+
+@pytest.mark.parametrize("scale, internal", [(1.0, (320, 180)), (0.5, (160, 90)), (0.25, (80, 45))])
+def test_internal_targets_follow_resolution_scale(ctx, programs, scale, internal):
+    renderer = _renderer(ctx, programs, scale)
+    try:
+        assert renderer.internal_size == internal
+        assert renderer.ssao_texture.size == internal
+        assert all(texture.size == internal for texture in renderer.history_textures)
+        assert renderer.is_upsampling == (scale < 1.0)
+        assert (renderer.ssao_upsample_texture is not None) == (scale < 1.0)
+    finally:
+        renderer.release()
+
+
+def test_history_is_dropped_on_resize_and_preset_change(ctx, programs):
+    renderer = _renderer(ctx, programs, 0.5)
+    textures = _gbuffer(ctx, SIZE)
+    try:
+        _render(renderer, textures)
+        assert renderer.history_valid
+
+        renderer.resize((160, 90))
+        assert not renderer.history_valid and renderer.internal_size == (80, 45)
+        renderer.resize(SIZE)
+
+        _render(renderer, textures)
+        renderer.configure(resolution_scale=0.25, kernel_size=16, temporal_enabled=True)
+        assert not renderer.history_valid
+
+        _render(renderer, textures)
+        renderer.configure(temporal_enabled=False)
+        assert not renderer.history_valid
+
+        # Unchanged settings keep the history
+        renderer.configure(temporal_enabled=True)
+        _render(renderer, textures)
+        renderer.configure(resolution_scale=0.25, kernel_size=16, temporal_enabled=True)
+        assert renderer.history_valid
+    finally:
+        for texture in textures:
+            texture.release()
+        renderer.release()
+
+
+@pytest.mark.parametrize("scale", [0.5, 0.25])
+def test_upsampled_output_matches_screen(ctx, programs, scale):
+    renderer = _renderer(ctx, programs, scale)
+    textures = _gbuffer(ctx, SIZE)
+    try:
+        for _ in range(3):
+            _render(renderer, textures)
+        output = renderer.get_ssao_texture()
+        assert output.size == SIZE
+
+        occlusion = np.frombuffer(output.read(), dtype="f4").reshape(SIZE[1], SIZE[0])
+        assert np.isfinite(occlusion).all()
+        assert occlusion.min() >= 0.0 and occlusion.max() <= 1.0
+        # The floor around the box is occluded, open floor far from it is not
+        assert occlusion.min() < 0.95 and occlusion.max() > 0.95
+    finally:
+        for texture in textures:
+            texture.release()
+        renderer.release()
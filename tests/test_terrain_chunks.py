@@ -0,0 +1,92 @@
+"""Tests for quadtree terrain chunking, LOD selection and chunk culling"""
+
+import numpy as np
+from pyrr import Matrix44
+
+from src.gamelib.core.frustum import Frustum
+from src.gamelib.core.terrain_chunks import ChunkedTerrain
+from src.gamelib.core.terrain_generation import generate_donut_height_data
+
+
+def _terrain(resolution=129, **kwargs):
+    rng = np.random.default_rng(2)
+    heights = rng.random((resolution, resolution)).cumsum(axis=0).cumsum(axis=1) / resolution
+    return ChunkedTerrain(heights, 1.0, chunk_size=16, **kwargs)
+
+
+def _coverage(terrain, chunks):
+    covered = np.zeros(np.subtract(terrain.heights.shape, 1), dtype=int)
+    for chunk in chunks:
+        covered[chunk.rows[0]:chunk.rows[-1], chunk.cols[0]:chunk.cols[-1]] += 1
+    return covered
+
+
+def test_quadtree_covers_every_cell_once():
+    terrain = ChunkedTerrain(generate_donut_height_data(100), 2.0, chunk_size=16)
+    assert np.all(_coverage(terrain, terrain.leaves) == 1)
+    for chunk in terrain.chunks:
+        assert len(chunk.rows) <= 17 and len(chunk.cols) <= 17
+        assert all(child.error <= chunk.error for child in chunk.children)
+    assert all(leaf.error == 0.0 for leaf in terrain.leaves)
+
+
+def test_lod_refines_near_camera_and_coarsens_for_shadows():
+    terrain = _terrain()
+    terrain.update_lod((-64.0, 5.0, -64.0), projection_scale=100.0)
+
+    chunks = terrain.select_chunks()
+    assert np.all(_coverage(terrain, chunks) == 1)
+    assert any(chunk.is_leaf for chunk in chunks)
+    assert len({chunk.level for chunk in chunks}) > 1
+
+    # The chunk under the camera is full resolution, the far corner is not
+    near = [c for c in chunks if c.rows[0] == 0 and c.cols[0] == 0][0]
+    far = [c for c in chunks if c.rows[-1] == 128 and c.cols[-1] == 128][0]
+    assert near.is_leaf and far.level < near.level
+
+    shadow_chunks = terrain.select_chunks(lod_bias=4.0)
+    assert np.all(_coverage(terrain, shadow_chunks) == 1)
+    assert len(shadow_chunks) < len(chunks)
+
+    terrain.update_lod((0.0, 1e6, 0.0), projection_scale=500.0)
+    assert terrain.select_chunks() == [terrain.root]
+
+
+def test_chunk_mesh_has_skirt_below_border():
+    terrain = _terrain(resolution=33)
+    chunk = terrain.root.children[0]
+    vertex_data, indices = chunk.mesh_data()
+    vertices = vertex_data.reshape(-1, 6)
+
+    grid_count = len(chunk.rows) * len(chunk.cols)
+    border_count = 2 * (len(chunk.rows) + len(chunk.cols)) - 4
+    assert len(vertices) == grid_count + border_count
+    assert indices.max() == len(vertices) - 1
+
+    ring_heights = vertices[grid_count:, 1] + chunk.skirt_depth
+    block = terrain.heights[np.ix_(chunk.rows, chunk.cols)]
+    border = np.concatenate([block[0, :], block[1:, -1], block[-1, -2::-1], block[-2:0:-1, 0]])
+    np.testing.assert_allclose(ring_heights, border, atol=1e-5)
+    assert chunk.skirt_depth >= terrain.root.error
+
+
+def test_chunk_culling_uses_world_boxes():
+    terrain = _terrain(position=(1000.0, 0.0, 0.0))
+    projection = Matrix44.perspective_projection(60.0, 1.0, 0.1, 500.0)
+    view = Matrix44.look_at((1000.0, 50.0, -100.0), (1000.0, 0.0, 100.0), (0.0, 1.0, 0.0))
+    frustum = Frustum(projection * view)
+
+    visible = frustum.contains_aabbs(terrain._world_mins, terrain._world_maxs)
+    expected = [frustum.contains_aabb(lo, hi) for lo, hi in zip(terrain._world_mins, terrain._world_maxs)]
+    assert list(visible) == expected
+
+    rendered = []
+    for chunk in terrain.chunks:
+        chunk.render = rendered.append
+    drawn, culled = terrain.render_chunks(program=None, frustum=frustum)
+    assert drawn == len(rendered) and drawn > 0 and culled > 0
+    assert drawn + culled == len(terrain.leaves)
+
+    # Nothing is drawn once the terrain is moved out of view
+    terrain.position[0] = -1000.0
+    assert terrain.render_chunks(program=None, frustum=frustum)[0] == 0
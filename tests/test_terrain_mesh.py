@@ -0,0 +1,74 @@
+"""Tests for the vectorized terrain mesh builders and the heightmap mesh cache"""
+
+import numpy as np
+
+from src.gamelib.core import geometry_utils
+from src.gamelib.core.geometry_utils import _grid_mesh_data, heightmap_mesh_data
+from src.gamelib.fractal_perlin import generate_noise_grid, save_heightmap
+
+
+def _reference_mesh(heights, spacing, offset):
+    """Per-vertex loop the builders used before vectorization."""
+    resolution = heights.shape[0]
+    vertices, normals, indices = [], [], []
+    for x in range(resolution):
+        for z in range(resolution):
+            vertices.append([(x * spacing) - offset, heights[x][z], (z * spacing) - offset])
+            dx = dz = 0.0
+            if 0 < x < resolution - 1:
+                dx = (heights[x + 1][z] - heights[x - 1][z]) / (2 * spacing)
+            elif x > 0:
+                dx = (heights[x][z] - heights[x - 1][z]) / spacing
+            else:
+                dx = (heights[x + 1][z] - heights[x][z]) / spacing
+            if 0 < z < resolution - 1:
+                dz = (heights[x][z + 1] - heights[x][z - 1]) / (2 * spacing)
+            elif z > 0:
+                dz = (heights[x][z] - heights[x][z - 1]) / spacing
+            else:
+                dz = (heights[x][z + 1] - heights[x][z]) / spacing
+            normal = np.array([-dx, 1.0, -dz], dtype='f4')
+            normals.append(normal / np.linalg.norm(normal))
+    for x in range(resolution - 1):
+        for z in range(resolution - 1):
+            v0, v1 = x * resolution + z, (x + 1) * resolution + z
+            indices.extend([v0, v0 + 1, v1, v1, v0 + 1, v1 + 1])
+    return np.array(vertices, dtype='f4'), np.array(normals, dtype='f4'), np.array(indices, dtype='i4')
+
+
+def test_grid_mesh_matches_per_vertex_loop():
+    rng = np.random.default_rng(4)
+    for dtype in ('f4', 'f8'):
+        heights = (rng.random((17, 17)) * 20.0).astype(dtype)
+        vertex_data, indices = _grid_mesh_data(heights, 2.5, 20.0)
+        vertices, normals, ref_indices = _reference_mesh(heights, 2.5, 20.0)
+
+        vertex_data = vertex_data.reshape(-1, 6)
+        np.testing.assert_array_equal(vertex_data[:, :3], vertices)
+        np.testing.assert_allclose(vertex_data[:, 3:], normals, atol=2e-7)
+        np.testing.assert_array_equal(indices, ref_indices)
+
+
+def test_heightmap_mesh_cache_is_reused_and_invalidated(tmp_path, monkeypatch):
+    path = tmp_path / "hills.npz"
+    heights, meta = generate_noise_grid(33, world_size=64.0, preset="rolling", seed=1)
+    save_heightmap(str(path), heights, meta)
+
+    vertex_data, indices, loaded_meta = heightmap_mesh_data(path)
+    assert (tmp_path / "hills.mesh.npz").exists()
+    assert loaded_meta["preset"] == "rolling"
+
+    # A second load comes from the cache without rebuilding
+    calls = []
+    build = geometry_utils._grid_mesh_data
+    monkeypatch.setattr(geometry_utils, "_grid_mesh_data", lambda *a: calls.append(a) or build(*a))
+    cached_vertices, cached_indices, _ = heightmap_mesh_data(path)
+    assert calls == []
+    np.testing.assert_array_equal(cached_vertices, vertex_data)
+    np.testing.assert_array_equal(cached_indices, indices)
+
+    # Changing the heightmap changes its hash and forces a rebuild
+    save_heightmap(str(path), heights + 1.0, meta)
+    rebuilt, _, _ = heightmap_mesh_data(path)
+    assert len(calls) == 1
+    np.testing.assert_allclose(rebuilt.reshape(-1, 6)[:, 1], vertex_data.reshape(-1, 6)[:, 1] + 1.0, atol=1e-5)
@@ -0,0 +1,57 @@
+"""Tests for the cached terrain stage graph"""
+
+import numpy as np
+
+from src.gamelib.fractal_perlin.terrain_stages import TerrainStagePipeline, resolve_params
+
+
+def _params(**overrides):
+    return resolve_params('mountain_range', hydraulic_iterations=2000, **overrides)
+
+
+def _statuses(reports):
+    return {report.name: report.status for report in reports}
+
+
+def test_changing_erosion_reuses_noise_and_warp(tmp_path):
+    pipeline = TerrainStagePipeline(64, 48, seed=5, cache_dir=tmp_path)
+    first, reports = pipeline.run(_params())
+    assert _statuses(reports) == {'noise': 'miss', 'warp': 'miss', 'erosion': 'miss',
+                                  'terraces': 'off', 'rivers': 'off'}
+    assert first.shape == (48, 64)
+
+    tuned, reports = pipeline.run(_params(erosion_rate=0.4))
+    assert _statuses(reports)['warp'] == 'hit' and _statuses(reports)['erosion'] == 'miss'
+
+    # Same result as an uncached run, and deterministic
+    fresh, _ = TerrainStagePipeline(64, 48, seed=5).run(_params(erosion_rate=0.4))
+    np.testing.assert_array_equal(tuned, fresh)
+    assert not np.array_equal(tuned, first)
+
+    again, reports = pipeline.run(_params(erosion_rate=0.4))
+    assert _statuses(reports)['erosion'] == 'hit'
+    np.testing.assert_array_equal(again, tuned)
+
+
+def test_keys_chain_through_upstream_stages(tmp_path):
+    pipeline = TerrainStagePipeline(32, 32, seed=1, cache_dir=tmp_path)
+    base = pipeline.stage_keys(_params(num_rivers=2))
+    assert pipeline.stage_keys(_params(num_rivers=2, scale=100)) == base  # 100 == 100.0
+
+    changed = pipeline.stage_keys(_params(num_rivers=2, warp_strength=0.2))
+    assert changed[0] == base[0]
+    assert all(a != b for a, b in zip(changed[1:], base[1:]) if a is not None)
+    assert changed[3] is None  # Terraces off
+
+    assert TerrainStagePipeline(32, 32, seed=2).stage_keys(_params())[0] != base[0]
+
+
+def test_late_stages_build_on_cached_output(tmp_path):
+    pipeline = TerrainStagePipeline(64, 64, seed=3, cache_dir=tmp_path)
+    pipeline.run(_params())
+    carved, reports = pipeline.run(_params(terrace_levels=6, num_rivers=2))
+    assert _statuses(reports) == {'noise': 'reused', 'warp': 'reused', 'erosion': 'hit',
+                                  'terraces': 'miss', 'rivers': 'miss'}
+    fresh, _ = TerrainStagePipeline(64, 64, seed=3).run(_params(terrace_levels=6, num_rivers=2))
+    np.testing.assert_array_equal(carved, fresh)
+    assert 0.0 <= carved.min() and carved.max() <= 1.0
@@ -0,0 +1,114 @@
+"""Tests for streamed terrain tiles: sources, seams, LRU eviction and tile colliders"""
+
+import time
+
+import numpy as np
+import pytest
+
+from src.gamelib.core.scene import Scene
+from src.gamelib.core.terrain_streaming import (
+    HeightmapTileSource,
+    ProceduralTileSource,
+    TerrainStreamer,
+    build_tile,
+)
+from src.gamelib.fractal_perlin import generate_noise_grid
+from src.gamelib.fractal_perlin.tile_baker import BakeSettings, TileBaker
+from src.gamelib.physics import PhysicsWorld
+
+
+def _settle(streamer, focus, frames=200):
+    """Update until no tile builds are pending."""
+    for _ in range(frames):
+        streamer.update(focus)
+        if not streamer._pending:
+            return
+        time.sleep(0.01)
+    raise AssertionError("tile builds did not finish")
+
+
+def test_heightmap_tiles_read_the_memory_mapped_map(tmp_path):
+    baker = TileBaker(tmp_path / "world.npy", BakeSettings(resolution=81, world_size=160.0, tile_size=40),
+                      workers=1)
+    baker.bake()
+    heights = np.asarray(baker.load())
+
+    source = HeightmapTileSource(baker.path, tile_size=32)
+    assert source.spacing == pytest.approx(2.0)
+    assert source.tile_counts == (3, 3)
+    assert source.tile_shape((2, 1)) == (17, 33)
+    np.testing.assert_array_equal(source.read((1, 2)), heights[32:65, 64:81])
+
+    # The apron repeats edge samples past the border of the map
+    padded = source.read((0, 0), apron=1)
+    np.testing.assert_array_equal(padded[1:-1, 1:-1], heights[0:33, 0:33])
+    np.testing.assert_array_equal(padded[0, 1:-1], heights[0, 0:33])
+
+    # Tiles land where the whole map would be drawn
+    tile = build_tile(source, (1, 2))
+    x0, z0 = source.sample_origin((1, 2))
+    assert (x0, z0) == pytest.approx((-16.0, 48.0))
+    assert tile.position[0] + tile.coords[0] == pytest.approx(x0)
+    assert tile.position[2] + tile.coords[0] == pytest.approx(z0)
+
+
+def test_procedural_tiles_are_seamless_and_match_the_noise_grid():
+    source = ProceduralTileSource("rolling", seed=3, spacing=2.0, tile_size=16)
+    expected, _ = generate_noise_grid(33, world_size=64.0, preset="rolling", seed=3)
+    np.testing.assert_allclose(source.read((-1, -1)), expected[:17, :17], atol=1e-4)
+
+    left, right = build_tile(source, (0, 0)), build_tile(source, (1, 0))
+    np.testing.assert_array_equal(left.heights[-1], right.heights[0])
+    np.testing.assert_allclose(left.normals[-1], right.normals[0], atol=1e-6)
+
+
+def test_streamer_keeps_tiles_around_focus_within_budget():
+    source = ProceduralTileSource("rolling", seed=1, spacing=4.0, tile_size=8)
+    scene = Scene(ctx=None)
+    streamer = TerrainStreamer(scene, source, view_radius=40.0, vram_budget_mb=1.0, max_cached_tiles=4,
+                               workers=1, chunk_size=8)
+
+    _settle(streamer, (0.0, 0.0, 0.0))
+    wanted = set(streamer.tiles_within(0.0, 0.0, 40.0))
+    assert set(streamer.tiles) == wanted
+    assert {obj.name for obj in scene.objects} == {f"TerrainTile_{i}_{j}" for i, j in wanted}
+
+    # Pretend the near tiles were drawn so they hold VRAM
+    for tile in streamer.tiles.values():
+        for chunk in tile.terrain.chunks:
+            chunk.nbytes = 200_000
+
+    # Moving away drops the old tiles from the scene; the cache is trimmed to the budget
+    _settle(streamer, (1000.0, 0.0, 0.0))
+    moved = set(streamer.tiles_within(1000.0, 0.0, 40.0))
+    assert {obj.name for obj in scene.objects} == {f"TerrainTile_{i}_{j}" for i, j in moved}
+    cached = [key for key in streamer.tiles if key not in moved]
+    assert len(cached) <= 4
+    assert streamer.gpu_bytes() <= streamer.vram_budget
+
+    streamer.shutdown()
+    assert scene.objects == [] and not streamer.tiles
+
+
+def test_streamer_creates_colliders_near_focus_only():
+    physics = PhysicsWorld()
+    try:
+        source = ProceduralTileSource("rolling", seed=2, spacing=2.0, tile_size=16)
+        streamer = TerrainStreamer(Scene(ctx=None), source, physics_world=physics, view_radius=100.0,
+                                   collision_radius=10.0, workers=1, chunk_size=8)
+
+        streamer.update((16.0, 0.0, 16.0), wait_for_collision=True)
+        assert [key for key, tile in streamer.tiles.items() if tile.body_id is not None] == [(0, 0)]
+
+        # A ray down onto the tile hits the streamed collider at the noise height
+        hit = physics.ray_test((16.0, 500.0, 16.0), (16.0, -500.0, 16.0))
+        expected = build_tile(source, (0, 0)).heights[8, 8]
+        assert hit is not None and hit["hit_position"][1] == pytest.approx(expected, abs=1e-3)
+
+        _settle(streamer, (112.0, 0.0, 16.0))
+        assert streamer.tiles[(0, 0)].body_id is None
+        assert [key for key, tile in streamer.tiles.items() if tile.body_id is not None] == [(3, 0)]
+        assert physics.ray_test((16.0, 500.0, 16.0), (16.0, -500.0, 16.0)) is None
+        streamer.shutdown()
+    finally:
+        physics.shutdown()
@@ -0,0 +1,69 @@
+"""Tests for the tiled terrain baker"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.gamelib.fractal_perlin import generate_noise_grid
+from src.gamelib.fractal_perlin.tile_baker import BakeSettings, TileBaker
+
+
+def test_noise_tiles_match_full_grid(tmp_path):
+    baker = TileBaker(tmp_path / "noise.npy", BakeSettings(resolution=80, world_size=400.0, tile_size=32),
+                      workers=1)
+    baker.bake()
+
+    expected, _ = generate_noise_grid(80, world_size=400.0, preset="mountainous", seed=42)
+    np.testing.assert_allclose(baker.load(), expected, atol=1e-4)
+    assert baker.load_manifest()["complete"]
+
+
+def test_erosion_is_seamless_and_worker_independent(tmp_path):
+    settings = BakeSettings(resolution=128, world_size=128.0, tile_size=32, erosion_density=0.15)
+    tiled = TileBaker(tmp_path / "tiled.npy", settings, workers=1)
+    pooled = TileBaker(tmp_path / "pooled.npy", settings, workers=2)
+    tiled.bake()
+    pooled.bake()
+    heights = np.asarray(tiled.load())
+    np.testing.assert_array_equal(heights, pooled.load())
+
+    noise = TileBaker(tmp_path / "noise.npy", BakeSettings(resolution=128, world_size=128.0, tile_size=128),
+                      workers=1)
+    noise.bake()
+    assert np.abs(heights - noise.load()).max() > 0.1
+
+    # Steps across tile borders look like steps anywhere else
+    steps = np.abs(np.diff(heights, axis=1))
+    seams = steps[:, 31::32]
+    assert seams.mean() < steps.mean() * 1.2
+    assert seams.max() <= steps.max()
+
+
+def test_resume_bakes_only_missing_tiles(tmp_path):
+    settings = BakeSettings(resolution=64, world_size=64.0, tile_size=32, erosion_density=0.1)
+    baker = TileBaker(tmp_path / "world.npy", settings, workers=1)
+    baker.bake()
+    expected = np.array(baker.load())
+
+    # Simulate a crash after three tiles: one tile lost, never recorded
+    manifest = baker.load_manifest()
+    del manifest["tiles"]["1_0"]
+    manifest["complete"] = False
+    baker.manifest_path.write_text(json.dumps(manifest))
+    heightmap = np.load(baker.path, mmap_mode="r+")
+    heightmap[32:64, 0:32] = 0.0
+    heightmap.flush()
+    del heightmap
+
+    assert baker.pending_tiles() == [(1, 0)]
+    calls = []
+    TileBaker(tmp_path / "world.npy", settings, workers=1).bake(progress=lambda done, total: calls.append(done))
+    assert calls == [4]
+    np.testing.assert_array_equal(baker.load(), expected)
+
+
+def test_resume_with_different_settings_raises(tmp_path):
+    TileBaker(tmp_path / "world.npy", BakeSettings(resolution=32, tile_size=16), workers=1).bake()
+    with pytest.raises(ValueError):
+        TileBaker(tmp_path / "world.npy", BakeSettings(resolution=32, tile_size=16, seed=1), workers=1).bake()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Bake a large fractal heightmap in tiles across worker processes.
+
+Writes a memory-mapped ``.npy`` heightmap plus a ``.json`` manifest beside
+it. Re-running the same command after an interruption resumes from the
+tiles recorded in the manifest.
+
+    python tools/bake_terrain.py --resolution 8192 --world-size 8192 \\
+        --erosion-density 0.1 --out assets/heightmaps/world_8k.npy
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+import sys
+from typing import Sequence
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.gamelib.fractal_perlin import PRESETS  # noqa: E402
+from src.gamelib.fractal_perlin.tile_baker import BakeSettings, TileBaker  # noqa: E402
+
+
+def cli(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Tiled, resumable multi-process heightmap bake.")
+    parser.add_argument("--out", type=Path, required=True, help="Output heightmap (.npy).")
+    parser.add_argument("--resolution", type=int, default=4096, help="Samples per axis.")
+    parser.add_argument("--world-size", type=float, default=4096.0, help="World extent in units.")
+    parser.add_argument("--preset", default="mountainous", choices=list(PRESETS.keys()))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--tile-size", type=int, default=512, help="Tile edge in samples.")
+    parser.add_argument(
+        "--erosion-density",
+        type=float,
+        default=0.0,
+        help="Hydraulic erosion droplets per sample (0 disables erosion).",
+    )
+    parser.add_argument("--erosion-rate", type=float, default=0.3)
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count).")
+    parser.add_argument("--npz", type=Path, default=None, help="Also export a save_heightmap .npz.")
+    args = parser.parse_args(argv)
+
+    settings = BakeSettings(
+        resolution=args.resolution,
+        world_size=args.world_size,
+        preset=args.preset,
+        seed=args.seed,
+        tile_size=args.tile_size,
+        erosion_density=args.erosion_density,
+        erosion_rate=args.erosion_rate,
+    )
+    baker = TileBaker(args.out, settings, workers=args.workers)
+
+    try:
+        pending = len(baker.pending_tiles())
+        total = len(baker.tiles())
+        if pending < total:
+            print(f"Resuming bake: {total - pending}/{total} tiles already done.")
+
+        start = time.perf_counter()
+
+        def progress(done: int, count: int):
+            print(f"[{done}/{count}] tiles baked ({time.perf_counter() - start:.1f}s)")
+
+        path = baker.bake(progress=progress)
+    except ValueError as exc:
+        parser.error(str(exc))
+        return 2
+
+    print(f"Wrote heightmap: {path}")
+    if args.npz is not None:
+        print(f"Wrote heightmap: {baker.export_npz(args.npz)}")
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI-compatible entry point."""
+
+    return cli(argv)
+
+
+if __name__ == "__main__":
+    raise SystemExit(cli())
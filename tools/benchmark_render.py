@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Benchmark the render pipeline headlessly.
+
+Loads a scene JSON into an offscreen (EGL by default) context, flies a scripted
+camera path for a fixed number of frames and prints a JSON report with
+frame-time percentiles, per-pass CPU/GPU timings, draw calls and culling stats.
+No window or vsync is involved, so it runs in CI on Mesa llvmpipe.
+
+    python tools/benchmark_render.py --frames 300 --output bench.json
+    python tools/benchmark_render.py --compare bench.json   # exit 1 on regression
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+from pathlib import Path
+import sys
+from typing import Sequence, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+DEFAULT_SCENE = ROOT / "assets" / "scenes" / "default_scene.json"
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+class _HeadlessWindow:
+    """The parts of the moderngl_window window RenderPipeline reads."""
+
+    def __init__(self, size: Tuple[int, int]):
+        self.size = tuple(size)
+        self.viewport = (0, 0, *self.size)
+
+
+def _parse_size(value: str) -> Tuple[int, int]:
+    try:
+        width, height = (int(part) for part in value.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected WIDTHxHEIGHT, got '{value}'")
+    return width, height
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def _create_context(size: Tuple[int, int], backend: str | None):
+    """Create and activate a headless moderngl_window context and its offscreen framebuffer."""
+    import moderngl_window as mglw
+    from moderngl_window.context.headless import Window
+
+    from src.gamelib import GL_VERSION
+
+    window = Window(size=size, gl_version=GL_VERSION, backend=backend)
+    mglw.activate_context(window=window)
+    window.fbo.use()
+    return window, window.ctx, window.fbo
+
+
+def cli(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Render a scene headlessly along a camera path and report timings as JSON.",
+    )
+    parser.add_argument("--scene", type=Path, default=DEFAULT_SCENE, help="Scene JSON to load.")
+    parser.add_argument("--frames", type=int, default=300, help="Timed frames to render.")
+    parser.add_argument("--warmup", type=int, default=30, help="Untimed frames rendered first.")
+    parser.add_argument("--size", type=_parse_size, default=None, help="Render size, e.g. 1280x720.")
+    parser.add_argument("--aa", default=None, help="Anti-aliasing mode (AAMode name, e.g. FXAA).")
+    parser.add_argument(
+        "--camera-path",
+        type=Path,
+        default=None,
+        help="JSON keyframes {\"keyframes\": [{\"position\": [...], \"target\": [...]}]}"
+             " (default: orbit around the scene camera target).",
+    )
+    parser.add_argument("--no-skybox", action="store_true", help="Skip the aurora skybox.")
+    parser.add_argument(
+        "--backend",
+        default="egl",
+        help="moderngl context backend ('egl'; pass 'default' for the platform default).",
+    )
+    parser.add_argument("--output", type=Path, default=None, help="Write the report here instead of stdout.")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline report to check for regressions.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="Relative slowdown that counts as a regression (default 0.10).",
+    )
+    args = parser.parse_args(argv)
+
+    from src.gamelib.config import settings
+
+    size = args.size or tuple(settings.WINDOW_SIZE)
+    backend = None if args.backend == "default" else args.backend
+    _window, ctx, framebuffer = _create_context(size, backend)
+
+    import numpy as np
+    from pyrr import Vector3
+
+    from src.gamelib.core.camera import Camera
+    from src.gamelib.core.skybox import Skybox
+    from src.gamelib.debug.render_benchmark import CameraPath, RenderBenchmark, compare_reports
+    from src.gamelib.loaders.scene_loader import SceneLoader
+    from src.gamelib.rendering.antialiasing_renderer import AAMode
+    from src.gamelib.rendering.render_pipeline import RenderPipeline
+
+    # Standalone contexts have no default framebuffer, so frames are
+    # presented into the headless window's offscreen one
+    pipeline = RenderPipeline(ctx, _HeadlessWindow(settings.WINDOW_SIZE), target=framebuffer)
+    # Fixed resolution keeps reports comparable between runs
+    pipeline.dynamic_resolution.enabled = False
+    pipeline.resize(size)
+    if args.aa:
+        try:
+            pipeline.aa_renderer.set_aa_mode(AAMode[args.aa.upper()])
+        except KeyError:
+            parser.error(f"Unknown AA mode '{args.aa}' (choose from {', '.join(m.name for m in AAMode)})")
+
+    result = SceneLoader(ctx).load_scene(args.scene)
+    scene, lights = result.scene, result.lights
+    if not args.no_skybox:
+        skybox = Skybox.aurora(ctx, name="Aurora Skybox")
+        skybox.intensity = 1.0
+        scene.set_skybox(skybox)
+
+    target = np.array(result.camera_target if result.camera_target is not None else (0.0, 0.0, 0.0))
+    start = np.array(result.camera_position if result.camera_position is not None else (0.0, 5.0, 10.0))
+    if args.camera_path is not None:
+        path = CameraPath.load(args.camera_path)
+    else:
+        offset = start - target
+        path = CameraPath.orbit(target, radius=float(np.hypot(offset[0], offset[2])), height=float(offset[1]))
+
+    camera = Camera(Vector3(start), target=Vector3(target))
+    pipeline.initialize_lights(lights, camera)
+
+    report = RenderBenchmark(pipeline, scene, lights, camera, path).run(args.frames, warmup=args.warmup)
+    scene_path = args.scene.resolve()
+    report["scene"] = str(scene_path.relative_to(ROOT)) if scene_path.is_relative_to(ROOT) else str(scene_path)
+    report["config"] = {
+        "size": list(size),
+        "render_size": list(pipeline.render_size),
+        "rendering_mode": pipeline.rendering_mode,
+        "aa_mode": pipeline.aa_renderer.aa_mode.name,
+        "ssao": pipeline.ssao_renderer is not None and settings.SSAO_ENABLED,
+        "shadow_map_size": settings.SHADOW_MAP_SIZE,
+        "camera_path": str(args.camera_path) if args.camera_path else "orbit",
+    }
+    report["environment"] = {
+        "commit": _git_commit(),
+        "gl_renderer": ctx.info.get("GL_RENDERER"),
+        "gl_vendor": ctx.info.get("GL_VENDOR"),
+        "gl_version": ctx.info.get("GL_VERSION"),
+        "python": platform.python_version(),
+    }
+
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if baseline.get("config") != report["config"]:
+            print("warning: baseline was recorded with a different configuration", file=sys.stderr)
+        regressions = compare_reports(baseline, report, threshold=args.threshold)
+        for line in regressions:
+            print(f"[regression] {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print("No regressions against baseline.", file=sys.stderr)
+
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI-compatible entry point."""
+
+    return cli(argv)
+
+
+if __name__ == "__main__":
+    raise SystemExit(cli())
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Benchmark terrain generation.
+
+Times ``FractalTerrain.generate_fractal_noise`` at several grid sizes. With
+``--reference`` it also times the original per-cell Python loop over
+``PerlinNoise._grad`` (on sizes up to ``--reference-max-size``; it takes
+minutes at 2048²), checks the outputs are bit-for-bit identical and reports
+the speedup.
+
+``--erosion N`` additionally times batched hydraulic erosion with N droplets
+on each generated map; with ``--reference`` the serial droplet loop is timed
+too and the eroded volumes are compared.
+
+    python tools/benchmark_terrain.py --sizes 512 2048 --reference
+    python tools/benchmark_terrain.py --sizes 512 --erosion 30000 --reference
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+import sys
+from typing import Callable, Sequence, Tuple
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from src.gamelib.fractal_perlin.fractal_terrain import (  # noqa: E402
+    FractalTerrain,
+    PerlinNoise,
+    TerrainErosion,
+)
+
+
+class _ScalarPerlinNoise(PerlinNoise):
+    """PerlinNoise evaluating gradients and lerps one cell at a time (reference)."""
+
+    def noise(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        xi = np.floor(x).astype(int) & 255
+        yi = np.floor(y).astype(int) & 255
+        xf = x - np.floor(x)
+        yf = y - np.floor(y)
+        u = self._fade(xf)
+        v = self._fade(yf)
+
+        aa = self.permutation[self.permutation[xi] + yi]
+        ab = self.permutation[self.permutation[xi] + yi + 1]
+        ba = self.permutation[self.permutation[xi + 1] + yi]
+        bb = self.permutation[self.permutation[xi + 1] + yi + 1]
+
+        result = np.zeros_like(x)
+        for i in range(x.shape[0]):
+            for j in range(x.shape[1]):
+                g_aa = self._grad(aa[i, j], xf[i, j], yf[i, j])
+                g_ba = self._grad(ba[i, j], xf[i, j] - 1, yf[i, j])
+                g_ab = self._grad(ab[i, j], xf[i, j], yf[i, j] - 1)
+                g_bb = self._grad(bb[i, j], xf[i, j] - 1, yf[i, j] - 1)
+                x1 = self._lerp(u[i, j], g_aa, g_ba)
+                x2 = self._lerp(u[i, j], g_ab, g_bb)
+                result[i, j] = self._lerp(v[i, j], x1, x2)
+        return result
+
+
+def _time(build: Callable[[], np.ndarray], repeat: int) -> Tuple[float, np.ndarray]:
+    """Best wall time in seconds over ``repeat`` runs and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = build()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _fractal(size: int, seed: int, octaves: int, noise_cls=PerlinNoise) -> Callable[[], np.ndarray]:
+    def build() -> np.ndarray:
+        terrain = FractalTerrain(size, size, seed)
+        terrain.perlin = noise_cls(seed)
+        return terrain.generate_fractal_noise(octaves=octaves)
+    return build
+
+
+def _erosion(heights: np.ndarray, droplets: int, seed: int, method: str, **kwargs) -> Callable[[], np.ndarray]:
+    def build() -> np.ndarray:
+        np.random.seed(seed)
+        return getattr(TerrainErosion(heights), method)(iterations=droplets, **kwargs)
+    return build
+
+
+def _eroded_volume(before: np.ndarray, after: np.ndarray) -> float:
+    delta = after - before
+    return float(-delta[delta < 0].sum())
+
+
+def cli(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Time fractal terrain generation.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[512, 2048], help="Grid edge lengths.")
+    parser.add_argument("--octaves", type=int, default=6, help="Noise octaves.")
+    parser.add_argument("--seed", type=int, default=42, help="Noise seed.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per size (best time is reported).")
+    parser.add_argument(
+        "--reference",
+        action="store_true",
+        help="Also time the per-cell reference loop and verify identical output.",
+    )
+    parser.add_argument(
+        "--reference-max-size",
+        type=int,
+        default=512,
+        help="Largest size the reference loop is run at (default 512).",
+    )
+    parser.add_argument(
+        "--erosion",
+        type=int,
+        default=0,
+        metavar="DROPLETS",
+        help="Also time batched hydraulic erosion with this many droplets.",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Processes for tiled erosion.")
+    parser.add_argument("--tile-size", type=int, default=None, help="Tile size for multi-process erosion.")
+    args = parser.parse_args(argv)
+
+    mismatches = 0
+    for size in args.sizes:
+        seconds, heights = _time(_fractal(size, args.seed, args.octaves), args.repeat)
+        line = f"{size:>5}² x{args.octaves} octaves: vectorized {seconds * 1000.0:9.1f} ms"
+
+        if args.reference and size <= args.reference_max_size:
+            ref_seconds, ref_heights = _time(
+                _fractal(size, args.seed, args.octaves, _ScalarPerlinNoise), 1,
+            )
+            identical = ref_heights.tobytes() == heights.tobytes()
+            mismatches += not identical
+            line += (
+                f" | reference {ref_seconds * 1000.0:10.1f} ms"
+                f" | speedup {ref_seconds / seconds:6.1f}x"
+                f" | {'identical' if identical else 'MISMATCH'}"
+            )
+        print(line)
+
+        if args.erosion > 0:
+            batched = _erosion(
+                heights, args.erosion, args.seed, "hydraulic_erosion_batched",
+                tile_size=args.tile_size, workers=args.workers,
+            )
+            seconds, eroded = _time(batched, args.repeat)
+            line = f"{size:>5}² x{args.erosion} droplets: batched {seconds * 1000.0:9.1f} ms"
+            if args.reference and size <= args.reference_max_size:
+                ref_seconds, ref_eroded = _time(
+                    _erosion(heights, args.erosion, args.seed, "hydraulic_erosion"), 1,
+                )
+                ratio = _eroded_volume(heights, eroded) / max(_eroded_volume(heights, ref_eroded), 1e-12)
+                line += (
+                    f" | serial {ref_seconds * 1000.0:10.1f} ms"
+                    f" | speedup {ref_seconds / seconds:6.1f}x"
+                    f" | eroded volume {ratio:.3f}x serial"
+                )
+            print(line)
+
+    return 1 if mismatches else 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI-compatible entry point."""
+
+    return cli(argv)
+
+
+if __name__ == "__main__":
+    raise SystemExit(cli())
@@ -2,21 +2,35 @@
 """
 Generate collision meshes for complex scene assets.
 
-Creates OBJ files under ``assets/collision`` for:
+Creates collision meshes under ``assets/collision`` for:
 * Donut terrain (heightfield mesh)
 * GLTF-based props that should participate in physics
+
+Outputs ending in ``.npz`` are written in the indexed binary format of
+``gamelib.physics.mesh_io``, which the physics layer loads without parsing
+text; anything else is written as OBJ.
+
+Definitions with a ``decomposition`` ("vhacd" or "hull") are additionally
+approximated by convex hulls with ``pybullet.vhacd`` (see
+export_convex_decomposition).
+
+Meshes are built in parallel processes (``--jobs``); a mesh whose inputs
+were touched but not changed is not rebuilt (see collision_meshes).
 """
 
 from __future__ import annotations
 
 import argparse
 import base64
+from contextlib import contextmanager
 import json
 import math
+import os
 import struct
+import tempfile
 from pathlib import Path
 import sys
-from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
 
 import numpy as np
 
@@ -52,16 +66,35 @@ def _ensure_collision_dir() -> None:
     COLLISION_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _write_obj(path: Path, vertices: Sequence[Iterable[float]], faces: Sequence[Iterable[int]]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="ascii") as handle:
-        handle.write("# Generated collision mesh\n")
-        handle.write(f"# Vertices: {len(vertices)}\n")
-        handle.write(f"# Faces: {len(faces)}\n")
-        for vx, vy, vz in vertices:
-            handle.write(f"v {vx:.6f} {vy:.6f} {vz:.6f}\n")
-        for a, b, c in faces:
-            handle.write(f"f {a} {b} {c}\n")
+def _write_mesh(path: Path, vertices: np.ndarray, faces: np.ndarray) -> None:
+    """Write zero-based triangles in the format given by the path suffix."""
+
+    from gamelib.physics.mesh_io import write_collision_mesh
+
+    write_collision_mesh(path, vertices, faces)
+
+
+# Height grids -------------------------------------------------------------------
+
+def _grid_mesh(heights: np.ndarray, spacing: float, offset: float, *, flip: bool) -> Tuple[np.ndarray, np.ndarray]:
+    """Vertices and zero-based triangles of a height grid centred on the origin.
+
+    Vertex ``i * cols + j`` sits at (i * spacing - offset, heights[i, j], j * spacing - offset).
+    ``flip`` selects the diagonal and winding of the heightmap exporter rather than the donut one.
+    """
+
+    rows, cols = heights.shape
+    grid_x, grid_z = np.meshgrid(np.arange(rows) * spacing - offset, np.arange(cols) * spacing - offset,
+                                 indexing="ij")
+    vertices = np.stack([grid_x, heights, grid_z], axis=-1).reshape(-1, 3)
+
+    v0 = (np.arange(rows - 1)[:, None] * cols + np.arange(cols - 1)[None, :]).ravel()
+    v1, v2, v3 = v0 + cols, v0 + cols + 1, v0 + 1  # (i+1, j), (i+1, j+1), (i, j+1)
+    if flip:
+        triangles = np.stack([np.stack([v0, v2, v1], 1), np.stack([v0, v3, v2], 1)], axis=1)
+    else:
+        triangles = np.stack([np.stack([v0, v3, v1], 1), np.stack([v1, v3, v2], 1)], axis=1)
+    return vertices, triangles.reshape(-1, 3)
 
 
 # Donut terrain -----------------------------------------------------------------
@@ -76,7 +109,7 @@ def export_donut_collision(
     rim_width: float = 40.0,
     seed: int = 42,
 ) -> None:
-    """Export the procedurally generated donut terrain to an OBJ mesh."""
+    """Export the procedurally generated donut terrain to a collision mesh (OBJ, or ``.npz`` by suffix)."""
 
     from gamelib.core.terrain_generation import generate_donut_height_data
 
@@ -93,34 +126,7 @@ def export_donut_collision(
     spacing = world_size / (resolution - 1)
     offset = world_size / 2
 
-    vertices: List[Tuple[float, float, float]] = []
-    for x in range(resolution):
-        for z in range(resolution):
-            world_x = (x * spacing) - offset
-            world_z = (z * spacing) - offset
-            world_y = float(heights[x][z])
-            vertices.append((world_x, world_y, world_z))
-
-    faces: List[Tuple[int, int, int]] = []
-    for x in range(resolution - 1):
-        for z in range(resolution - 1):
-            top_left = x * resolution + z
-            top_right = (x + 1) * resolution + z
-            bottom_left = x * resolution + (z + 1)
-            bottom_right = (x + 1) * resolution + (z + 1)
-
-            faces.append((
-                top_left + 1,
-                bottom_left + 1,
-                top_right + 1,
-            ))
-            faces.append((
-                top_right + 1,
-                bottom_left + 1,
-                bottom_right + 1,
-            ))
-
-    _write_obj(out_path, vertices, faces)
+    _write_mesh(out_path, *_grid_mesh(np.asarray(heights, dtype=np.float64), spacing, offset, flip=False))
 
 
 def export_heightmap_collision(
@@ -128,10 +134,8 @@ def export_heightmap_collision(
     *,
     heightmap_path: str,
 ) -> None:
-    """Export a heightmap terrain to an OBJ collision mesh."""
+    """Export a heightmap terrain to a collision mesh (OBJ, or ``.npz`` by suffix)."""
 
-    import numpy as np
-    
     # Resolve heightmap path relative to project root
     hmap_path = Path(heightmap_path)
     if not hmap_path.is_absolute():
@@ -142,46 +146,14 @@ def export_heightmap_collision(
     
     # Load heightmap data
     data = np.load(str(hmap_path))
-    heights = data['heights']
     meta = json.loads(str(data['meta']))
     
     resolution = meta['resolution']
     world_size = meta['world_size']
+    heights = np.asarray(data['heights'], dtype=np.float64).reshape(resolution, resolution)
     
-    # Calculate spacing
-    dx = world_size / (resolution - 1)
-    dz = world_size / (resolution - 1)
-    offset = world_size / 2.0
-    
-    # Build vertices
-    vertices: List[Tuple[float, float, float]] = []
-    for i in range(resolution):
-        for j in range(resolution):
-            x = -offset + i * dx
-            z = -offset + j * dz
-            y = float(heights[i, j])
-            vertices.append((x, y, z))
-    
-    # Build faces (two triangles per quad)
-    # Using counter-clockwise winding when viewed from above
-    faces: List[Tuple[int, int, int]] = []
-    
-    def idx(i, j):
-        return i * resolution + j + 1  # OBJ indices are 1-based
-    
-    for i in range(resolution - 1):
-        for j in range(resolution - 1):
-            v0 = idx(i, j)
-            v1 = idx(i + 1, j)
-            v2 = idx(i + 1, j + 1)
-            v3 = idx(i, j + 1)
-            
-            # Triangle 1: v0, v2, v1 (counter-clockwise from above)
-            faces.append((v0, v2, v1))
-            # Triangle 2: v0, v3, v2 (counter-clockwise from above)
-            faces.append((v0, v3, v2))
-    
-    _write_obj(out_path, vertices, faces)
+    spacing = world_size / (resolution - 1)
+    _write_mesh(out_path, *_grid_mesh(heights, spacing, world_size / 2.0, flip=True))
 
 
 # GLTF extraction ---------------------------------------------------------------
@@ -297,8 +269,9 @@ def _traverse_nodes(data: Dict) -> List[Tuple[int, np.ndarray]]:
 def export_gltf_collision(source: Path, destination: Path) -> None:
     data, buffers = _load_gltf(source)
 
-    vertices: List[Tuple[float, float, float]] = []
-    faces: List[Tuple[int, int, int]] = []
+    vertex_blocks: List[np.ndarray] = []
+    face_blocks: List[np.ndarray] = []
+    vertex_count = 0
 
     node_transforms = dict(_traverse_nodes(data))
 
@@ -316,26 +289,99 @@ def export_gltf_collision(source: Path, destination: Path) -> None:
 
             positions = _read_accessor(data, buffers, attributes["POSITION"])
             homogenous = np.c_[positions, np.ones(len(positions))]
-            transformed = (world @ homogenous.T).T[:, :3]
-
-            base_index = len(vertices)
-            vertices.extend(map(tuple, transformed.tolist()))
+            vertex_blocks.append((world @ homogenous.T).T[:, :3])
 
             if "indices" in primitive:
                 indices = _read_accessor(data, buffers, primitive["indices"]).astype(np.int64).flatten()
             else:
                 indices = np.arange(len(positions), dtype=np.int64)
+            face_blocks.append(indices[:len(indices) // 3 * 3].reshape(-1, 3) + vertex_count)
+            vertex_count += len(positions)
 
-            for i in range(0, len(indices), 3):
-                a = base_index + int(indices[i]) + 1
-                b = base_index + int(indices[i + 1]) + 1
-                c = base_index + int(indices[i + 2]) + 1
-                faces.append((a, b, c))
-
-    if not vertices:
+    if not vertex_count:
         raise ValueError(f"No mesh data found in {source}")
 
-    _write_obj(destination, vertices, faces)
+    _write_mesh(destination, np.concatenate(vertex_blocks), np.concatenate(face_blocks))
+
+
+# Convex decomposition ------------------------------------------------------------
+
+# pybullet.vhacd keyword for each decomposition parameter accepted in definitions
+VHACD_PARAMETERS: Dict[str, str] = {
+    "resolution": "resolution",
+    "concavity": "concavity",
+    "depth": "depth",
+    "max_hull_vertices": "maxNumVerticesPerCH",
+    "min_hull_volume": "minVolumePerCH",
+    "plane_downsampling": "planeDownsampling",
+    "convexhull_downsampling": "convexhullDownsampling",
+    "alpha": "alpha",
+    "beta": "beta",
+    "gamma": "gamma",
+    "pca": "pca",
+    "mode": "mode",
+}
+
+DECOMPOSITION_METHODS = ("vhacd", "hull")
+
+
+@contextmanager
+def _silenced_stdout():
+    """Swallow output written straight to file descriptor 1 (V-HACD prints its progress)."""
+
+    sys.stdout.flush()
+    saved = os.dup(1)
+    try:
+        with open(os.devnull, "w") as devnull:
+            os.dup2(devnull.fileno(), 1)
+            yield
+    finally:
+        os.dup2(saved, 1)
+        os.close(saved)
+
+
+def export_convex_decomposition(source: Path, destination: Path, *, method: str = "vhacd", **params: Any) -> None:
+    """
+    Approximate a collision mesh by convex hulls and write them as one OBJ.
+
+    PyBullet loads every object (``o``) of the OBJ as one convex hull of a
+    compound shape, which is far cheaper in narrowphase than a concave
+    trimesh and, unlike a mesh's implicit single hull, keeps concavities.
+
+    Args:
+        source: Input mesh (OBJ, or ``.npz`` from save_collision_mesh)
+        destination: Output OBJ path
+        method: ``"vhacd"`` for a decomposition into several hulls, or
+            ``"hull"`` for one simplified hull (``max_hull_vertices``, default 32)
+        **params: V-HACD parameters, keys of VHACD_PARAMETERS
+    """
+
+    import pybullet
+
+    if method not in DECOMPOSITION_METHODS:
+        raise ValueError(f"Unsupported decomposition method: {method}")
+    unknown = set(params) - set(VHACD_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Unknown decomposition parameters: {sorted(unknown)}")
+    if method == "hull":
+        params = {"max_hull_vertices": 32, **params, "concavity": 1.0}  # A single hull
+    kwargs = {VHACD_PARAMETERS[name]: value for name, value in params.items()}
+
+    source = Path(source)
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    destination.unlink(missing_ok=True)
+    with tempfile.TemporaryDirectory() as scratch:
+        if source.suffix.lower() == ".npz":
+            from gamelib.physics.mesh_io import load_collision_mesh, write_obj
+
+            obj_source = Path(scratch) / "source.obj"
+            write_obj(obj_source, *load_collision_mesh(source))
+            source = obj_source
+        with _silenced_stdout():
+            pybullet.vhacd(str(source), str(destination), str(Path(scratch) / "vhacd.log"), **kwargs)
+    if not destination.exists() or destination.stat().st_size == 0:
+        raise ValueError(f"Convex decomposition of {source} produced no hulls")
 
 
 # Entry point -------------------------------------------------------------------
@@ -391,10 +437,17 @@ def cli(argv: Sequence[str] | None = None) -> int:
         action="store_true",
         help="Suppress logs for meshes that are already up-to-date.",
     )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Build meshes in this many processes (default: one per CPU).",
+    )
     args = parser.parse_args(argv)
 
     try:
-        from gamelib.physics.collision_meshes import resolve_collision_mesh
+        from gamelib.physics.collision_meshes import resolve_collision_meshes
     except ImportError as exc:  # pragma: no cover - handled at runtime
         parser.error(f"Unable to import collision resolver: {exc}")
         return 2
@@ -405,20 +458,29 @@ def cli(argv: Sequence[str] | None = None) -> int:
             print("No scenes found.")
         return 0
 
+    requests = [
+        (scene_path, base_path, definition, obj_name)
+        for scene_path in scenes
+        for base_path, definition, obj_name in _iter_collision_definitions(scene_path)
+    ]
+    results = resolve_collision_meshes(
+        [(definition, base_path) for _, base_path, definition, _ in requests],
+        jobs=max(args.jobs, 1),
+        force_rebuild=args.force,
+    )
+
     processed = 0
     rebuilt = 0
     up_to_date = 0
-    for scene_path in scenes:
-        for base_path, definition, obj_name in _iter_collision_definitions(scene_path):
-            result = resolve_collision_mesh(definition, base_path=base_path, force_rebuild=args.force)
-            processed += 1
-            relative_output = result.path.relative_to(ROOT)
-            if result.rebuilt:
-                rebuilt += 1
-                print(f"[rebuilt] {relative_output}  <- {scene_path.name}:{obj_name}")
-            elif not args.quiet:
-                up_to_date += 1
-                print(f"[ok]      {relative_output}")
+    for (scene_path, _, _, obj_name), result in zip(requests, results):
+        processed += 1
+        relative_output = result.path.relative_to(ROOT)
+        if result.rebuilt:
+            rebuilt += 1
+            print(f"[rebuilt] {relative_output}  <- {scene_path.name}:{obj_name}")
+        elif not args.quiet:
+            up_to_date += 1
+            print(f"[ok]      {relative_output}")
 
     if not args.quiet:
         print(f"Processed {processed} collision mesh request(s); rebuilt {rebuilt}, up-to-date {up_to_date}.")